@@ -1864,15 +1864,17 @@ def create_forecast(payload: ForecastRequest) -> ForecastResult:
     else:
         index_computer = BehaviorIndexComputer()
 
-    # Get harmonized DataFrame from metadata if available (for component extraction)
+    # Get the details bundle from metadata if available (for component extraction)
+    # and materialize its DataFrame view once for this response
     harmonized_df = None
     # Get a reference to the actual metadata dict (not a copy)
     if "metadata" in result:
         result_metadata = result["metadata"]
-        if "_harmonized_df" in result_metadata:
-            harmonized_df = result_metadata["_harmonized_df"]
+        if "_details_bundle" in result_metadata:
             # Remove from metadata immediately (it's not JSON-serializable)
-            del result_metadata["_harmonized_df"]
+            details_bundle = result_metadata.pop("_details_bundle")
+            if details_bundle is not None and len(details_bundle) > 0:
+                harmonized_df = details_bundle.to_frame()
     else:
         result_metadata = {}
 
@@ -2796,61 +2798,34 @@ class StateComparisonResponse(BaseModel):
 @app.get("/api/visual/heatmap", response_model=HeatmapResponse, tags=["visualization"])
 def get_heatmap(
     region_name: Optional[str] = Query(None, description="Specific region to include"),
+    region_ids: Optional[List[str]] = Query(
+        None, description="Optional list of region IDs to include"
+    ),
+    region_group: Optional[str] = Query(
+        None, description="Optional region group filter (e.g., US_STATES)"
+    ),
     include_forecast: bool = Query(False, description="Include forecast data"),
 ) -> HeatmapResponse:
     """
     Get heatmap data for all states and indices.
 
+    Reads the materialized heatmap snapshot that the background refresher keeps
+    current for all US states, DC and global cities; no forecasts run here.
+
     Returns visualization-ready data for heatmap rendering.
     """
-    from app.core.prediction import BehavioralForecaster
+    from app.core.heatmap_store import get_heatmap_store
     from app.services.visual.heatmap_engine import HeatmapEngine
 
     heatmap_engine = HeatmapEngine()
-    forecaster = BehavioralForecaster()
-
-    # Get data for all US states (simplified - in production, cache this)
-    # For now, generate for a few key states
-    key_states = [
-        ("Minnesota", 46.7296, -94.6859),
-        ("California", 36.7783, -119.4179),
-        ("Texas", 31.9686, -99.9018),
-        ("New York", 42.1657, -74.9481),
-        ("Florida", 27.7663, -81.6868),
-    ]
-
-    state_data = {}
-    for state_name, lat, lon in key_states:
-        if region_name and state_name != region_name:
-            continue
+    snapshot = get_heatmap_store().snapshot()
 
-        try:
-            result = forecaster.forecast(
-                latitude=lat,
-                longitude=lon,
-                region_name=state_name,
-                days_back=30,
-                forecast_horizon=7,
-            )
-
-            if result.get("history"):
-                latest = result["history"][-1]
-                state_indices = {
-                    "behavior_index": latest.get("behavior_index", 0.5),
-                    "economic_stress": latest.get("economic_stress", 0.5),
-                    "environmental_stress": latest.get("environmental_stress", 0.5),
-                    "mobility_activity": latest.get("mobility_activity", 0.5),
-                    "digital_attention": latest.get("digital_attention", 0.5),
-                    "public_health_stress": latest.get("public_health_stress", 0.5),
-                    "political_stress": latest.get("political_stress"),
-                    "crime_stress": latest.get("crime_stress"),
-                    "misinformation_stress": latest.get("misinformation_stress"),
-                    "social_cohesion_stress": latest.get("social_cohesion_stress"),
-                }
-                state_data[state_name] = state_indices
-        except Exception as e:
-            logger.warning(f"Failed to get data for {state_name}", error=str(e))
-            continue
+    rows = snapshot.select_rows(
+        region_ids=region_ids,
+        region_name=region_name,
+        region_group=region_group,
+    )
+    state_data = snapshot.to_state_data(rows)
 
     if not state_data:
         raise HTTPException(status_code=404, detail="No state data available")
@@ -2864,6 +2839,11 @@ def get_heatmap(
     response_metadata = {
         "states_count": len(state_data),
         "timestamp": datetime.now().isoformat(),
+        "snapshot_version": snapshot.version,
+        "snapshot_updated_at": (
+            snapshot.updated_at.isoformat() if snapshot.updated_at else None
+        ),
+        "regions_available": snapshot.populated_count,
         **heatmap_metadata,
     }
 
@@ -3189,23 +3169,48 @@ def get_state_comparison(
     comparison_engine = StateComparisonEngine()
     forecaster = BehavioralForecaster()
 
-    # Get data for state A
-    result_a = forecaster.forecast(
-        latitude=state_a_lat,
-        longitude=state_a_lon,
-        region_name=state_a_name,
-        days_back=30,
-        forecast_horizon=7,
+    # Fetch both states concurrently (latency ~ max of the two, not the sum)
+    batch = forecaster.forecast_many(
+        {
+            "a": {
+                "latitude": state_a_lat,
+                "longitude": state_a_lon,
+                "region_name": state_a_name,
+                "days_back": 30,
+                "forecast_horizon": 7,
+            },
+            "b": {
+                "latitude": state_b_lat,
+                "longitude": state_b_lon,
+                "region_name": state_b_name,
+                "days_back": 30,
+                "forecast_horizon": 7,
+            },
+        }
     )
 
-    # Get data for state B
-    result_b = forecaster.forecast(
-        latitude=state_b_lat,
-        longitude=state_b_lon,
-        region_name=state_b_name,
-        days_back=30,
-        forecast_horizon=7,
-    )
+    # Upstream failures are not missing data: report them before the 404 check
+    names = {"a": state_a_name, "b": state_b_name}
+    if batch["errors"]:
+        for key, error in batch["errors"].items():
+            logger.error(
+                "State comparison forecast failed", state=names[key], error=error
+            )
+        # Do not leak internal error details to clients
+        raise HTTPException(
+            status_code=502,
+            detail="Failed fetching data for: "
+            + ", ".join(names[key] for key in batch["errors"]),
+        )
+    if batch["timed_out"]:
+        raise HTTPException(
+            status_code=504,
+            detail="Timed out fetching data for: "
+            + ", ".join(names[key] for key in batch["timed_out"]),
+        )
+
+    result_a = batch["results"].get("a", {})
+    result_b = batch["results"].get("b", {})
 
     if not result_a.get("history") or not result_b.get("history"):
         raise HTTPException(
@@ -217,6 +217,10 @@ def get_models() -> List[ModelInfo]:
                 "forecasting with trend and seasonality"
             ),
             "arima": "ARIMA model for time series forecasting with autoregressive and moving average components",
+            "batch_ets": (
+                "Batched additive Holt-Winters for fitting many aligned region "
+                "series at once (bulk refresh jobs)"
+            ),
         }
 
         # Map model names to parameter info
@@ -253,6 +257,16 @@ def get_models() -> List[ModelInfo]:
                     "order": (1, 1, 1),
                 },
             },
+            "batch_ets": {
+                "parameters": {
+                    "seasonal_period": "integer (default: 7 for weekly)",
+                    "refine_rounds": "integer coordinate search rounds",
+                },
+                "default_parameters": {
+                    "seasonal_period": 7,
+                    "refine_rounds": 3,
+                },
+            },
         }
 
         for model_name in registry.list():
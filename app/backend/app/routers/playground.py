@@ -1,12 +1,17 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Playground endpoints for interactive scenario exploration."""
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 
 import structlog
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
-from app.core.playground import compare_regions
+from app.core.playground import (
+    RISK_TIER_NAMES,
+    compare_regions,
+    load_latest_sub_indices,
+    sweep_scenarios,
+)
 
 logger = structlog.get_logger("routers.playground")
 
@@ -163,3 +168,134 @@ def compare_forecasts(payload: PlaygroundCompareRequest) -> PlaygroundCompareRes
             status_code=500,
             detail="Failed to generate playground comparison. Please try again later.",
         ) from e
+
+
+class OffsetRange(BaseModel):
+    """Range of offsets to sweep for one sub-index."""
+
+    min: float = Field(-0.2, ge=-1.0, le=1.0, description="Lowest offset")
+    max: float = Field(0.2, ge=-1.0, le=1.0, description="Highest offset")
+    steps: int = Field(
+        5, ge=1, le=101, description="Grid points between min and max (grid only)"
+    )
+
+
+class PlaygroundSweepRequest(BaseModel):
+    """Request for a scenario grid / Latin-hypercube sweep."""
+
+    regions: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="List of region IDs to evaluate (e.g., ['us_dc', 'us_mn'])",
+    )
+    offsets: Dict[str, OffsetRange] = Field(
+        ...,
+        min_length=1,
+        description="Offset range per sub-index (e.g., {'economic_stress': "
+        "{'min': -0.2, 'max': 0.2, 'steps': 5}})",
+    )
+    method: Literal["grid", "lhs"] = Field(
+        default="grid",
+        description="'grid' evaluates the cartesian grid, 'lhs' a Latin-hypercube "
+        "sample",
+    )
+    samples: int = Field(
+        default=256, ge=1, le=10000, description="Number of samples for 'lhs'"
+    )
+    seed: Optional[int] = Field(default=None, description="Random seed for 'lhs'")
+    historical_days: int = Field(
+        default=30,
+        ge=7,
+        le=365,
+        description="History window for regions not yet materialized",
+    )
+
+
+class PlaygroundSweepResponse(BaseModel):
+    """Response from the scenario sweep endpoint."""
+
+    config: Dict
+    axes: List[str]
+    offsets: List[List[float]]
+    grid_shape: Optional[List[int]] = None
+    tier_names: List[str]
+    results: List[Dict]
+    errors: List[Dict] = Field(default_factory=list)
+
+
+@router.post("/sweep", response_model=PlaygroundSweepResponse, tags=["playground"])
+def sweep_forecasts(payload: PlaygroundSweepRequest) -> PlaygroundSweepResponse:
+    """
+    Evaluate a grid of what-if scenarios across many regions in one request.
+
+    Each sub-index listed in ``offsets`` becomes an axis of the scenario design.
+    The whole design is applied to the latest sub-indices of every requested
+    region at once, returning behavior index surfaces, risk tiers per scenario
+    and the smallest single-axis offsets that move each region to another tier.
+
+    Example:
+        POST /api/playground/sweep
+        {
+            "regions": ["us_dc", "us_mn"],
+            "offsets": {
+                "economic_stress": {"min": -0.2, "max": 0.2, "steps": 9},
+                "digital_attention": {"min": 0.0, "max": 0.3, "steps": 4}
+            }
+        }
+    """
+    offset_ranges = {
+        name: (spec.min, spec.max, spec.steps) for name, spec in payload.offsets.items()
+    }
+
+    try:
+        base, errors = load_latest_sub_indices(
+            payload.regions, historical_days=payload.historical_days
+        )
+        if not base:
+            raise ValueError("No sub-index data available for the requested regions")
+
+        sweep = sweep_scenarios(
+            base,
+            offset_ranges,
+            method=payload.method,
+            samples=payload.samples,
+            seed=payload.seed,
+        )
+    except ValueError as e:
+        # ValueError messages are user-actionable (e.g., invalid ranges)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Failed to run scenario sweep", error=str(e), exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to run scenario sweep. Please try again later.",
+        ) from e
+
+    results = []
+    for row, region_id in enumerate(sweep["region_ids"]):
+        results.append(
+            {
+                "region_id": region_id,
+                "baseline_behavior_index": float(sweep["baseline_behavior_index"][row]),
+                "baseline_tier": RISK_TIER_NAMES[int(sweep["baseline_tiers"][row])],
+                "behavior_index": sweep["behavior_index"][row].round(6).tolist(),
+                "tiers": sweep["tiers"][row].tolist(),
+                "tier_change_fraction": float(sweep["tier_change_fraction"][row]),
+                "boundaries": sweep["boundaries"][row],
+            }
+        )
+
+    return PlaygroundSweepResponse(
+        config={
+            "method": payload.method,
+            "scenarios": len(sweep["offsets"]),
+            "regions": len(results),
+        },
+        axes=sweep["axes"],
+        offsets=sweep["offsets"].round(6).tolist(),
+        grid_shape=list(sweep["grid_shape"]) if sweep["grid_shape"] else None,
+        tier_names=RISK_TIER_NAMES,
+        results=results,
+        errors=errors,
+    )
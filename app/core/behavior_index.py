@@ -5,8 +5,9 @@ This module computes a composite Behavior Index from multiple human behavior
 dimensions, each represented by a normalized sub-index.
 """
 import math
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -196,6 +197,136 @@ EXTENDED_GROUP_SPEC = {
     ],
 }
 
+# Raw harmonized inputs that get_subindex_details reads back as component values
+COMPONENT_SOURCE_COLUMNS = [
+    "stress_index",
+    "fred_consumer_sentiment",
+    "fred_unemployment",
+    "fred_jobless_claims",
+    "fuel_stress",
+    "discomfort_score",
+    "mobility_index",
+    "search_interest_score",
+    "health_risk_index",
+    "owid_health_stress",
+    "usgs_earthquake_intensity",
+    "gdelt_tone_score",
+]
+
+
+def get_detail_columns(columns: Iterable[str]) -> List[str]:
+    """
+    Columns needed to extract sub-index and component details from a frame.
+
+    Args:
+        columns: Columns of a frame produced by compute_behavior_index
+
+    Returns:
+        The subset (in frame order) read by get_sub_indices_dict and
+        get_subindex_details
+    """
+    needed = {"timestamp", "behavior_index", *PARENT_INDEX_KEYS}
+    needed.update(COMPONENT_SOURCE_COLUMNS)
+    for spec in (CHILD_INDEX_SPEC, EXTENDED_GROUP_SPEC):
+        for children in spec.values():
+            needed.update(children)
+    return [col for col in columns if col in needed]
+
+
+class SubIndexDetailsBundle:
+    """
+    Columnar store of the values needed for sub-index detail extraction.
+
+    Holds one NumPy array per detail column (see get_detail_columns) plus the
+    component metadata from the computed frame's attrs. It is built once per
+    forecast and cached in place of the harmonized DataFrame; a DataFrame view
+    is only materialized by to_frame when details are actually requested.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], attrs: Dict[str, Any]):
+        """
+        Initialize bundle.
+
+        Args:
+            columns: Column name -> 1-D array (all the same length)
+            attrs: Component metadata (the computed frame's attrs)
+        """
+        self.columns = columns
+        self.attrs = attrs
+        self._length = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_frame(
+        cls, df: pd.DataFrame, dtype: str = "float64"
+    ) -> "SubIndexDetailsBundle":
+        """
+        Build a bundle from a frame produced by compute_behavior_index.
+
+        Args:
+            df: Computed frame (sub-indices, components, attrs)
+            dtype: Storage dtype for float columns (float32 halves the size)
+
+        Returns:
+            SubIndexDetailsBundle with only the detail columns
+        """
+        columns = {}
+        for col in get_detail_columns(df.columns):
+            series = df[col]
+            if pd.api.types.is_float_dtype(series):
+                columns[col] = series.to_numpy(dtype=dtype)
+            else:
+                columns[col] = series.to_numpy()
+        return cls(columns, dict(df.attrs))
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return self._length
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays."""
+        return int(sum(values.nbytes for values in self.columns.values()))
+
+    def row(self, row_idx: int) -> Dict[str, Any]:
+        """
+        Values of one row as a dictionary (negative indices allowed).
+
+        Args:
+            row_idx: Row position
+
+        Returns:
+            Column name -> value mapping usable with get_sub_indices_dict
+        """
+        return {col: values[row_idx] for col, values in self.columns.items()}
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Materialize a DataFrame for get_subindex_details.
+
+        Returns:
+            DataFrame with the detail columns and component metadata in attrs
+        """
+        frame = pd.DataFrame(self.columns)
+        frame.attrs = dict(self.attrs)
+        return frame
+
+
+def compact_detail_frame(df: pd.DataFrame, dtype: str = "float32") -> pd.DataFrame:
+    """
+    Build a narrow copy of a computed frame for detail extraction.
+
+    Keeps only get_detail_columns, stores float columns as dtype and carries
+    over the component metadata in attrs.
+
+    Args:
+        df: Frame produced by compute_behavior_index
+        dtype: Float dtype for stored values (default: float32)
+
+    Returns:
+        Compact DataFrame usable with get_subindex_details
+    """
+    return SubIndexDetailsBundle.from_frame(df, dtype=dtype).to_frame()
+
 
 class BehaviorIndexComputer:
     """
@@ -331,6 +462,7 @@ class BehaviorIndexComputer:
     def compute_sub_indices(
         self,
         harmonized_data: pd.DataFrame,
+        inplace: bool = False,
     ) -> pd.DataFrame:
         """
         Compute all sub-indices from harmonized data.
@@ -343,6 +475,8 @@ class BehaviorIndexComputer:
                 - mobility_index (0.0-1.0, higher = more activity) [optional]
                 - search_interest_score (0.0-1.0, higher = more attention) [optional]
                 - health_risk_index (0.0-1.0, higher = more health stress) [optional]
+            inplace: Add columns to harmonized_data instead of a copy (for
+                callers that own the frame)
 
         Returns:
             DataFrame with added columns:
@@ -352,7 +486,7 @@ class BehaviorIndexComputer:
                 - digital_attention (0.0-1.0, higher = more attention)
                 - public_health_stress (0.0-1.0, higher = more health stress)
         """
-        df = harmonized_data.copy()
+        df = harmonized_data if inplace else harmonized_data.copy()
 
         # ECONOMIC_STRESS: Combine market stress_index with FRED indicators
         # Market stress_index is already normalized 0.0-1.0 (higher = more stress)
@@ -1990,6 +2124,7 @@ class BehaviorIndexComputer:
     def compute_behavior_index(
         self,
         harmonized_data: pd.DataFrame,
+        inplace: bool = False,
     ) -> pd.DataFrame:
         """
         Compute the overall Behavior Index from harmonized data with sub-indices.
@@ -2009,6 +2144,7 @@ class BehaviorIndexComputer:
                 - timestamp (datetime)
                 - stress_index, discomfort_score, and optional
                     mobility/search/health indices
+            inplace: Add columns to harmonized_data instead of a copy
 
         Returns:
             DataFrame with added columns:
@@ -2016,7 +2152,7 @@ class BehaviorIndexComputer:
                 - behavior_index (0.0-1.0, overall behavioral disruption measure)
         """
         # Compute sub-indices first
-        df = self.compute_sub_indices(harmonized_data)
+        df = self.compute_sub_indices(harmonized_data, inplace=inplace)
 
         # Compute overall Behavior Index
         # Higher stress indices and lower activity indices = higher behavior index
@@ -0,0 +1,283 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Deadline-bounded fetch orchestration for the forecast pipeline.
+
+Blocking fetcher calls run on a per-forecast worker pool and are awaited from
+an asyncio loop against absolute per-priority deadlines. A source that misses
+its deadline is served from its last good value (if one is cached) instead of
+holding the forecast for its full retry schedule; the still-running call is
+left to finish in the background and refresh the fetcher's own cache.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+import structlog
+
+from app.core.forecast_cache import ForecastCache
+
+logger = structlog.get_logger("core.fetch_orchestrator")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = None
+
+# Priority classes: lower values are submitted first and get a larger share
+# of the deadline
+PRIORITY_CORE = 0
+PRIORITY_STANDARD = 1
+PRIORITY_OPTIONAL = 2
+
+# Fraction of the total deadline each priority class may wait
+PRIORITY_DEADLINE_FRACTIONS = {
+    PRIORITY_CORE: 1.0,
+    PRIORITY_STANDARD: float(os.getenv("FORECAST_FETCH_STANDARD_FRACTION", "0.85")),
+    PRIORITY_OPTIONAL: float(os.getenv("FORECAST_FETCH_OPTIONAL_FRACTION", "0.7")),
+}
+
+FORECAST_FETCH_DEADLINE_SECONDS = float(
+    os.getenv("FORECAST_FETCH_DEADLINE_SECONDS", "25")
+)
+FORECAST_FETCH_MAX_WORKERS = int(os.getenv("FORECAST_FETCH_MAX_WORKERS", "10"))
+# Last good values kept for deadline fallbacks
+FETCH_FALLBACK_MAX_BYTES = int(
+    os.getenv("FETCH_FALLBACK_MAX_BYTES", str(64 * 1024 * 1024))
+)
+FETCH_FALLBACK_TTL_SECONDS = float(os.getenv("FETCH_FALLBACK_TTL_SECONDS", "86400"))
+
+if PROMETHEUS_AVAILABLE:
+    fetch_outcomes_counter = Counter(
+        "forecast_fetch_outcomes_total",
+        "Forecast source fetch outcomes (ok, error, stale, missing)",
+        ["source", "outcome"],
+    )
+else:
+    fetch_outcomes_counter = None
+
+
+@dataclass
+class FetchTask:
+    """A blocking fetch call with its priority class."""
+
+    key: str
+    fn: Callable[[], Any]
+    priority: int = PRIORITY_STANDARD
+
+
+def has_data(value: Any) -> bool:
+    """
+    Whether a fetch result is worth keeping as a last good value.
+
+    Args:
+        value: DataFrame, (DataFrame, status) tuple or other result
+
+    Returns:
+        True for non-empty frames (status tuples must also be ok)
+    """
+    if isinstance(value, tuple) and value:
+        status = value[1] if len(value) > 1 else None
+        if status is not None and getattr(status, "ok", True) is False:
+            return False
+        value = value[0]
+    if isinstance(value, pd.DataFrame):
+        return not value.empty
+    return value is not None
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy DataFrames (also inside tuples) so cached values stay pristine."""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy_result(item) for item in value)
+    return value
+
+
+# Process-wide store of last good values (created on first use). Forecasters
+# build their own orchestrator, so a per-instance store would start empty on
+# every request and never have a fallback to serve.
+_fallback_cache: Optional[ForecastCache] = None
+_fallback_cache_lock = threading.Lock()
+
+
+def get_fetch_fallback_cache() -> ForecastCache:
+    """
+    Get the last-good store shared by all FetchOrchestrator instances.
+
+    Returns:
+        Shared ForecastCache bounded by FETCH_FALLBACK_MAX_BYTES
+    """
+    global _fallback_cache
+    with _fallback_cache_lock:
+        if _fallback_cache is None:
+            _fallback_cache = ForecastCache(
+                max_bytes=FETCH_FALLBACK_MAX_BYTES,
+                default_ttl_seconds=FETCH_FALLBACK_TTL_SECONDS,
+                name="fetch_fallback",
+            )
+        return _fallback_cache
+
+
+def reset_fetch_fallback_cache() -> None:
+    """Drop the shared last-good store (recreated on next use)."""
+    global _fallback_cache
+    with _fallback_cache_lock:
+        if _fallback_cache is not None:
+            _fallback_cache.clear()
+        _fallback_cache = None
+
+
+class FetchOrchestrator:
+    """
+    Runs fetch tasks concurrently under a total per-forecast deadline.
+
+    Outcomes per task:
+    - ok: finished in time
+    - error: raised (no result; caller supplies its fallback)
+    - stale: missed its deadline, served from the last good value
+    - missing: missed its deadline with no last good value
+    """
+
+    def __init__(
+        self,
+        deadline_seconds: float = FORECAST_FETCH_DEADLINE_SECONDS,
+        max_workers: int = FORECAST_FETCH_MAX_WORKERS,
+        priority_fractions: Optional[Dict[int, float]] = None,
+        fallback_cache: Optional[ForecastCache] = None,
+    ):
+        """
+        Initialize orchestrator.
+
+        Args:
+            deadline_seconds: Total fetch budget per forecast
+            max_workers: Concurrent blocking fetches per forecast
+            priority_fractions: Deadline fraction per priority class
+            fallback_cache: Store for last good values (shared store if None)
+        """
+        self.deadline_seconds = deadline_seconds
+        self.max_workers = max_workers
+        self.priority_fractions = priority_fractions or dict(
+            PRIORITY_DEADLINE_FRACTIONS
+        )
+        self._last_good = (
+            fallback_cache if fallback_cache is not None else get_fetch_fallback_cache()
+        )
+
+    def run(
+        self, tasks: List[FetchTask], scope: str = ""
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        Run tasks from synchronous code.
+
+        Uses a private event loop; when called from a thread that is already
+        running a loop (e.g. an async endpoint), the loop runs on a helper
+        thread so the caller's loop is not re-entered.
+
+        Args:
+            tasks: Fetch tasks
+            scope: Namespace for last good values (e.g. the region)
+
+        Returns:
+            Tuple of (results by key, outcome report by key). Keys with outcome
+            error or missing are absent from results.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run_async(tasks, scope))
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, self.run_async(tasks, scope)).result()
+
+    async def run_async(
+        self, tasks: List[FetchTask], scope: str = ""
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        Run tasks from async code (see run).
+
+        Args:
+            tasks: Fetch tasks
+            scope: Namespace for last good values
+
+        Returns:
+            Tuple of (results by key, outcome report by key)
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        ordered = sorted(tasks, key=lambda task: task.priority)
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="forecast-fetch"
+        )
+        results: Dict[str, Any] = {}
+        report: Dict[str, Dict[str, Any]] = {}
+        try:
+            pending = {
+                task.key: loop.run_in_executor(executor, task.fn) for task in ordered
+            }
+            for task in ordered:
+                deadline = start + self.deadline_seconds * self.priority_fractions.get(
+                    task.priority, 1.0
+                )
+                try:
+                    value = await asyncio.wait_for(
+                        pending[task.key], timeout=max(deadline - loop.time(), 0.0)
+                    )
+                except asyncio.TimeoutError:
+                    report[task.key] = self._serve_last_good(task, scope, results)
+                except Exception as e:
+                    report[task.key] = {"outcome": "error", "error": str(e)[:200]}
+                else:
+                    results[task.key] = value
+                    report[task.key] = {"outcome": "ok"}
+                    if has_data(value):
+                        self._last_good.put(
+                            f"{scope}|{task.key}",
+                            (_copy_result(value), datetime.now().isoformat()),
+                        )
+                report[task.key]["priority"] = task.priority
+                report[task.key]["elapsed_seconds"] = round(loop.time() - start, 3)
+                self._count(task.key, report[task.key]["outcome"])
+        finally:
+            # Do not join stragglers: they finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        late = [
+            key
+            for key, entry in report.items()
+            if entry["outcome"] in ("stale", "missing")
+        ]
+        if late:
+            logger.warning(
+                "Sources missed forecast fetch deadline",
+                scope=scope,
+                sources=late,
+                deadline_seconds=self.deadline_seconds,
+            )
+        return results, report
+
+    def reset(self) -> None:
+        """Drop all last good values."""
+        self._last_good.clear()
+
+    def _serve_last_good(
+        self, task: FetchTask, scope: str, results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        cached = self._last_good.get(f"{scope}|{task.key}")
+        if cached is None:
+            return {"outcome": "missing", "last_good_at": None}
+        value, fetched_at = cached
+        results[task.key] = _copy_result(value)
+        return {"outcome": "stale", "last_good_at": fetched_at}
+
+    @staticmethod
+    def _count(source: str, outcome: str) -> None:
+        if fetch_outcomes_counter is not None:
+            fetch_outcomes_counter.labels(source=source, outcome=outcome).inc()
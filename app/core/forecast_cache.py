@@ -0,0 +1,399 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Byte-bounded LRU cache with per-entry TTL for fitted forecasts.
+
+Entries are sized on insert (DataFrames by deep memory usage, arrays and
+bundles by nbytes, containers recursively) so the cache holds a predictable
+amount of memory regardless of region count. Expired entries are dropped on
+access; least recently used entries are evicted when the byte or entry
+budget is exceeded.
+"""
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+import structlog
+
+logger = structlog.get_logger("core.forecast_cache")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter, Gauge
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = Gauge = None
+
+FORECAST_CACHE_MAX_BYTES = int(
+    os.getenv("FORECAST_CACHE_MAX_BYTES", str(256 * 1024 * 1024))
+)
+FORECAST_CACHE_MIN_TTL_SECONDS = int(os.getenv("FORECAST_CACHE_MIN_TTL_SECONDS", "900"))
+FORECAST_CACHE_MAX_TTL_SECONDS = int(
+    os.getenv("FORECAST_CACHE_MAX_TTL_SECONDS", "21600")
+)
+
+if PROMETHEUS_AVAILABLE:
+    forecast_cache_requests_counter = Counter(
+        "forecast_cache_requests_total",
+        "Forecast cache lookups by result",
+        ["cache", "result"],
+    )
+    forecast_cache_evictions_counter = Counter(
+        "forecast_cache_evictions_total",
+        "Forecast cache evictions by reason",
+        ["cache", "reason"],
+    )
+    forecast_cache_bytes_gauge = Gauge(
+        "forecast_cache_bytes",
+        "Estimated bytes held by the forecast cache",
+        ["cache"],
+    )
+    forecast_cache_entries_gauge = Gauge(
+        "forecast_cache_entries",
+        "Number of entries in the forecast cache",
+        ["cache"],
+    )
+else:
+    forecast_cache_requests_counter = None
+    forecast_cache_evictions_counter = None
+    forecast_cache_bytes_gauge = None
+    forecast_cache_entries_gauge = None
+
+
+def estimate_nbytes(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value.
+
+    Args:
+        value: DataFrame, array-like with nbytes, container or scalar
+
+    Returns:
+        Estimated size in bytes
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class _CacheEntry:
+    """Cached value with its size and expiry time."""
+
+    __slots__ = ("value", "nbytes", "expires_at")
+
+    def __init__(self, value: Any, nbytes: int, expires_at: Optional[float]):
+        self.value = value
+        self.nbytes = nbytes
+        self.expires_at = expires_at
+
+
+class ForecastCache:
+    """
+    Thread-safe LRU cache bounded by bytes (and optionally entry count).
+
+    Supports the mapping operations the forecaster and tests rely on
+    (len, in, iteration in LRU order, item get/set, pop, clear); lookups via
+    get() count hits and misses and refresh recency.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = FORECAST_CACHE_MAX_BYTES,
+        max_entries: Optional[int] = None,
+        default_ttl_seconds: Optional[float] = FORECAST_CACHE_MAX_TTL_SECONDS,
+        name: str = "forecaster",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Byte budget across all entries
+            max_entries: Optional entry-count limit
+            default_ttl_seconds: TTL for entries stored without one (None = no TTL)
+            name: Label for metrics and logs
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_bytes = max_bytes
+        self._max_entries = max_entries
+        self.default_ttl_seconds = default_ttl_seconds
+        self.name = name
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        """Entry-count limit (None = bytes only)."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: Optional[int]) -> None:
+        with self._lock:
+            self._max_entries = value
+            self._enforce_budget()
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes currently held."""
+        return self._bytes
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a live entry and mark it most recently used.
+
+        Args:
+            key: Cache key
+            default: Returned on miss or expiry
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                self._record_request("miss")
+                return default
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            self._record_request("hit")
+            return entry.value
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        nbytes: Optional[int] = None,
+    ) -> bool:
+        """
+        Insert or replace an entry, evicting LRU entries over budget.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Entry TTL (default: default_ttl_seconds)
+            nbytes: Precomputed size (estimated when None)
+
+        Returns:
+            False if the value alone exceeds the byte budget (not cached)
+        """
+        size = estimate_nbytes(value) if nbytes is None else nbytes
+        ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = self._clock() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                self._count_eviction("oversize")
+                logger.warning(
+                    "Forecast too large for cache budget",
+                    cache=self.name,
+                    key=key,
+                    nbytes=size,
+                    max_bytes=self.max_bytes,
+                )
+                self._update_gauges()
+                return False
+            self._entries[key] = _CacheEntry(value, size, expires_at)
+            self._bytes += size
+            self._enforce_budget()
+            return key in self._entries
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove an entry and return its value (default if absent)."""
+        with self._lock:
+            entry = self._remove(key)
+            return default if entry is None else entry.value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._update_gauges()
+
+    def purge_expired(self) -> int:
+        """
+        Drop all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            now = self._clock()
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if entry.expires_at is not None and entry.expires_at <= now
+            ]
+            for key in expired:
+                self._remove(key)
+                self._count_eviction("ttl")
+            return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self._max_entries,
+            }
+
+    def keys(self) -> List[str]:
+        """Keys in LRU order (least recently used first)."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                raise KeyError(key)
+            return entry.value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if self._remove(key) is None:
+                raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return self._live_entry(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def _live_entry(self, key: Any) -> Optional[_CacheEntry]:
+        """Return the entry for key, dropping it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self._stats["expired"] += 1
+            self._count_eviction("ttl")
+            return None
+        return entry
+
+    def _remove(self, key: str) -> Optional[_CacheEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.nbytes
+            self._update_gauges()
+        return entry
+
+    def _enforce_budget(self) -> None:
+        """Evict least recently used entries until within budget."""
+        while self._entries and (
+            self._bytes > self.max_bytes
+            or (
+                self._max_entries is not None and len(self._entries) > self._max_entries
+            )
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._count_eviction("lru")
+        self._update_gauges()
+
+    def _count_eviction(self, reason: str) -> None:
+        self._stats["evictions"] += 1
+        if forecast_cache_evictions_counter is not None:
+            forecast_cache_evictions_counter.labels(
+                cache=self.name, reason=reason
+            ).inc()
+
+    def _record_request(self, result: str) -> None:
+        if forecast_cache_requests_counter is not None:
+            forecast_cache_requests_counter.labels(cache=self.name, result=result).inc()
+
+    def _update_gauges(self) -> None:
+        if forecast_cache_bytes_gauge is not None:
+            forecast_cache_bytes_gauge.labels(cache=self.name).set(self._bytes)
+            forecast_cache_entries_gauge.labels(cache=self.name).set(len(self._entries))
+
+
+# Process-wide cache of fitted forecasts (created on first use). The API builds
+# a forecaster per request, so a per-instance cache would never be hit.
+_forecast_cache: Optional[ForecastCache] = None
+_forecast_cache_lock = threading.Lock()
+
+
+def get_forecast_cache() -> ForecastCache:
+    """
+    Get the forecast cache shared by all BehavioralForecaster instances.
+
+    The entry limit is read from FORECASTER_CACHE_MAX_SIZE when the cache is
+    created (unset = byte budget only).
+
+    Returns:
+        Shared ForecastCache
+    """
+    global _forecast_cache
+    with _forecast_cache_lock:
+        if _forecast_cache is None:
+            cache_size_env = os.environ.get("FORECASTER_CACHE_MAX_SIZE")
+            _forecast_cache = ForecastCache(
+                max_entries=int(cache_size_env) if cache_size_env else None,
+                name="forecaster",
+            )
+        return _forecast_cache
+
+
+def reset_forecast_cache() -> None:
+    """Drop the shared forecast cache (recreated from the environment on next use)."""
+    global _forecast_cache
+    with _forecast_cache_lock:
+        if _forecast_cache is not None:
+            _forecast_cache.clear()
+        _forecast_cache = None
+
+
+def source_freshness_ttl(
+    cache_durations_minutes: List[Optional[float]],
+    min_ttl_seconds: float = FORECAST_CACHE_MIN_TTL_SECONDS,
+    max_ttl_seconds: float = FORECAST_CACHE_MAX_TTL_SECONDS,
+) -> float:
+    """
+    TTL for a forecast built from sources with the given cache durations.
+
+    A forecast is no fresher than its most frequently refreshed input, so the
+    TTL is the shortest source cache duration, clamped to [min, max].
+
+    Args:
+        cache_durations_minutes: Source cache durations (None entries ignored)
+        min_ttl_seconds: Lower bound
+        max_ttl_seconds: Upper bound (also used when no durations are known)
+
+    Returns:
+        TTL in seconds
+    """
+    durations = [d * 60.0 for d in cache_durations_minutes if d is not None]
+    ttl = min(durations) if durations else max_ttl_seconds
+    return float(min(max(ttl, min_ttl_seconds), max_ttl_seconds))
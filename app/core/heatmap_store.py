@@ -0,0 +1,236 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Materialized heatmap snapshot maintained by the background refresher.
+
+The heatmap endpoint used to run several full forecasts per request. This
+module keeps a compact region-by-index matrix that the live monitor updates
+whenever it refreshes a region, so the endpoint only has to read memory.
+"""
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import structlog
+
+from app.core.regions import Region, get_all_regions
+
+logger = structlog.get_logger("core.heatmap_store")
+
+# Column order of the materialized matrix
+HEATMAP_INDICES = [
+    "behavior_index",
+    "economic_stress",
+    "environmental_stress",
+    "mobility_activity",
+    "digital_attention",
+    "public_health_stress",
+    "political_stress",
+    "crime_stress",
+    "misinformation_stress",
+    "social_cohesion_stress",
+]
+
+
+class HeatmapSnapshot:
+    """Immutable, versioned view of the heatmap matrix."""
+
+    def __init__(
+        self,
+        region_ids: List[str],
+        region_names: List[str],
+        region_groups: List[Optional[str]],
+        indices: List[str],
+        values: np.ndarray,
+        populated: np.ndarray,
+        version: int,
+        updated_at: Optional[datetime],
+    ):
+        """
+        Initialize a heatmap snapshot.
+
+        Args:
+            region_ids: Row labels (region identifiers)
+            region_names: Human-readable names aligned with region_ids
+            region_groups: Region groups aligned with region_ids
+            indices: Column labels (index names)
+            values: float32 matrix of shape (regions, indices); NaN when missing
+            populated: Boolean mask of rows that have been refreshed at least once
+            version: Monotonic version stamp of the store when taken
+            updated_at: Time of the last row update
+        """
+        self.region_ids = region_ids
+        self.region_names = region_names
+        self.region_groups = region_groups
+        self.indices = indices
+        self.values = values
+        self.populated = populated
+        self.version = version
+        self.updated_at = updated_at
+
+    @property
+    def populated_count(self) -> int:
+        """Number of regions with data in this snapshot."""
+        return int(self.populated.sum())
+
+    def select_rows(
+        self,
+        region_ids: Optional[Iterable[str]] = None,
+        region_name: Optional[str] = None,
+        region_group: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Return row positions matching the filters (populated rows only).
+
+        Args:
+            region_ids: Optional region IDs to include
+            region_name: Optional exact region name to include
+            region_group: Optional region group (e.g., "US_STATES")
+
+        Returns:
+            Array of row positions
+        """
+        mask = self.populated.copy()
+        if region_ids is not None:
+            wanted = set(region_ids)
+            mask &= np.array([rid in wanted for rid in self.region_ids], dtype=bool)
+        if region_name is not None:
+            mask &= np.array([name == region_name for name in self.region_names])
+        if region_group is not None:
+            mask &= np.array([group == region_group for group in self.region_groups])
+        return np.flatnonzero(mask)
+
+    def to_state_data(self, rows: Optional[np.ndarray] = None) -> Dict[str, Dict]:
+        """
+        Convert selected rows to the mapping consumed by HeatmapEngine.
+
+        Args:
+            rows: Row positions to include (default: all populated rows)
+
+        Returns:
+            Dictionary mapping region names to {index_name: value or None}
+        """
+        if rows is None:
+            rows = np.flatnonzero(self.populated)
+
+        state_data: Dict[str, Dict] = {}
+        for row in rows:
+            row_values = self.values[row]
+            state_data[self.region_names[row]] = {
+                name: (None if np.isnan(value) else float(value))
+                for name, value in zip(self.indices, row_values)
+            }
+        return state_data
+
+
+class HeatmapStore:
+    """
+    Thread-safe region-by-index matrix with a version stamp.
+
+    Rows are allocated once for every known region, so an update is a single
+    row write and reads copy a matrix of a few kilobytes.
+    """
+
+    def __init__(
+        self,
+        regions: Optional[List[Region]] = None,
+        indices: Optional[List[str]] = None,
+    ):
+        """
+        Initialize the heatmap store.
+
+        Args:
+            regions: Regions to materialize (default: all known regions, which
+                covers the 50 US states, DC and the global cities)
+            indices: Index columns to store (default: HEATMAP_INDICES)
+        """
+        regions = regions if regions is not None else get_all_regions()
+        self._indices = list(indices or HEATMAP_INDICES)
+        self._region_ids = [r.id for r in regions]
+        self._region_names = [r.name for r in regions]
+        self._region_groups = [r.region_group for r in regions]
+        self._row_by_id = {rid: i for i, rid in enumerate(self._region_ids)}
+
+        self._values = np.full(
+            (len(self._region_ids), len(self._indices)), np.nan, dtype=np.float32
+        )
+        self._populated = np.zeros(len(self._region_ids), dtype=bool)
+        self._version = 0
+        self._updated_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Current version stamp (incremented on every row update)."""
+        return self._version
+
+    def update_region(self, region_id: str, latest: Dict[str, Any]) -> bool:
+        """
+        Write the latest index values for a region.
+
+        Args:
+            region_id: Region identifier
+            latest: Latest history record (flat index_name -> value mapping)
+
+        Returns:
+            True if the region is tracked and the row was written
+        """
+        row = self._row_by_id.get(region_id)
+        if row is None:
+            return False
+
+        row_values = np.empty(len(self._indices), dtype=np.float32)
+        for col, index_name in enumerate(self._indices):
+            value = latest.get(index_name)
+            try:
+                value = float(value) if value is not None else np.nan
+            except (TypeError, ValueError):
+                value = np.nan
+            row_values[col] = value if np.isfinite(value) else np.nan
+
+        with self._lock:
+            self._values[row] = row_values
+            self._populated[row] = True
+            self._version += 1
+            self._updated_at = datetime.now()
+
+        return True
+
+    def snapshot(self) -> HeatmapSnapshot:
+        """Return a consistent copy of the current matrix."""
+        with self._lock:
+            return HeatmapSnapshot(
+                region_ids=self._region_ids,
+                region_names=self._region_names,
+                region_groups=self._region_groups,
+                indices=self._indices,
+                values=self._values.copy(),
+                populated=self._populated.copy(),
+                version=self._version,
+                updated_at=self._updated_at,
+            )
+
+    def reset(self) -> None:
+        """Clear all materialized rows (used in tests and reset paths)."""
+        with self._lock:
+            self._values.fill(np.nan)
+            self._populated.fill(False)
+            self._version = 0
+            self._updated_at = None
+
+
+# Global instance (singleton pattern)
+_heatmap_store_instance: Optional[HeatmapStore] = None
+
+
+def get_heatmap_store() -> HeatmapStore:
+    """Get or create the global HeatmapStore instance."""
+    global _heatmap_store_instance
+    if _heatmap_store_instance is None:
+        _heatmap_store_instance = HeatmapStore()
+    return _heatmap_store_instance
+
+
+def reset_heatmap_store() -> None:
+    """Reset the global HeatmapStore singleton instance."""
+    global _heatmap_store_instance
+    _heatmap_store_instance = None
@@ -4,19 +4,40 @@
 This module maintains a rolling window of behavior index snapshots per region
 and detects major events that could impact human behavior scores.
 """
+import os
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+import numpy as np
+import pandas as pd
 import structlog
 
 from app.core.explanations import generate_explanation
+from app.core.heatmap_store import get_heatmap_store
+from app.core.online_forecast import OnlineHoltWinters
 from app.core.prediction import BehavioralForecaster
 from app.core.regions import get_all_regions, get_region_by_id
+from app.services.forecast.monitor import ForecastMonitor
 from app.services.risk.classifier import RiskClassifier
 from app.services.shocks.detector import ShockDetector
 
 logger = structlog.get_logger("core.live_monitor")
 
+# Full pipeline refit cadence; between refits new points are absorbed online
+LIVE_MONITOR_REFIT_MINUTES = int(os.getenv("LIVE_MONITOR_REFIT_MINUTES", "1440"))
+LIVE_MONITOR_DRIFT_THRESHOLD = float(os.getenv("LIVE_MONITOR_DRIFT_THRESHOLD", "0.15"))
+LIVE_MONITOR_DRIFT_WINDOW = 14
+LIVE_FORECAST_HORIZON = 7
+DRIFT_COLUMNS = [
+    "behavior_index",
+    "economic_stress",
+    "environmental_stress",
+    "mobility_activity",
+    "digital_attention",
+    "public_health_stress",
+]
+
 
 class LiveSnapshot:
     """Represents a single snapshot of behavior index data for a region."""
@@ -30,6 +51,7 @@ class LiveSnapshot:
         sources: List[str],
         explanation_summary: Optional[str] = None,
         event_flags: Optional[Dict[str, bool]] = None,
+        forecast: Optional[Dict[str, List[float]]] = None,
     ):
         """
         Initialize a live snapshot.
@@ -42,6 +64,7 @@ class LiveSnapshot:
             sources: List of data sources used
             explanation_summary: Optional human-readable summary
             event_flags: Optional flags for major events detected
+            forecast: Optional forecast path with prediction intervals
         """
         self.region_id = region_id
         self.timestamp = timestamp
@@ -50,6 +73,7 @@ class LiveSnapshot:
         self.sources = sources
         self.explanation_summary = explanation_summary
         self.event_flags = event_flags or {}
+        self.forecast = forecast
 
     def to_dict(self) -> Dict:
         """Convert snapshot to dictionary for API responses."""
@@ -61,6 +85,7 @@ class LiveSnapshot:
             "sources": self.sources,
             "explanation_summary": self.explanation_summary,
             "event_flags": self.event_flags,
+            "forecast": self.forecast,
         }
 
 
@@ -71,6 +96,8 @@ class LiveMonitor:
     This class provides:
     - In-memory storage of recent snapshots (rolling window)
     - Background refresh mechanism
+    - Online Holt-Winters state per region so refreshes between full refits
+      absorb new records in O(1) instead of refitting the model
     - Major event detection
     - Query interface for live data
     """
@@ -81,6 +108,7 @@ class LiveMonitor:
         refresh_interval_minutes: int = 30,
         historical_days: int = 30,
         max_regions: Optional[int] = None,
+        refit_interval_minutes: Optional[int] = None,
     ):
         """
         Initialize the live monitor.
@@ -90,14 +118,19 @@ class LiveMonitor:
             refresh_interval_minutes: How often to refresh data (in minutes)
             historical_days: Number of historical days to use for forecasts
             max_regions: Optional maximum number of regions to track
+            refit_interval_minutes: How often to run the full forecast pipeline
+                per region (default: LIVE_MONITOR_REFIT_MINUTES)
         """
         self.max_snapshots_per_region = max_snapshots_per_region
         self.refresh_interval_minutes = refresh_interval_minutes
         self.historical_days = historical_days
+        self.refit_interval_minutes = (
+            refit_interval_minutes
+            if refit_interval_minutes is not None
+            else LIVE_MONITOR_REFIT_MINUTES
+        )
 
         # Read max_regions from env var if not explicitly set
-        import os
-
         if max_regions is None:
             max_regions_env = os.environ.get("LIVE_MONITOR_MAX_REGIONS")
             max_regions = int(max_regions_env) if max_regions_env else None
@@ -121,13 +154,31 @@ class LiveMonitor:
         self._forecaster = BehavioralForecaster()
         self._risk_classifier = RiskClassifier()
         self._shock_detector = ShockDetector()
+        self._forecast_monitor = ForecastMonitor(
+            drift_threshold=LIVE_MONITOR_DRIFT_THRESHOLD
+        )
+
+        # Online forecaster state per region (model, latest record, drift window)
+        self._online_states: Dict[str, Dict] = {}
 
-    def refresh_region(self, region_id: str) -> Optional[LiveSnapshot]:
+    def refresh_region(
+        self, region_id: str, observation: Optional[Dict] = None
+    ) -> Optional[LiveSnapshot]:
         """
         Refresh data for a single region and create a new snapshot.
 
+        The online Holt-Winters state is refitted from the full history only
+        when the region has no online state, the refit interval has elapsed,
+        or drift was detected. Otherwise the new observations are absorbed
+        into the online state, which produces the forecast path without a
+        refit. Without an explicit observation, the newest history is pulled
+        from the forecaster (cache-served until its sources refresh) and the
+        records added since the last refresh are absorbed.
+
         Args:
             region_id: Region to refresh
+            observation: Optional new history record (behavior_index and
+                sub-index values) to absorb instead of pulling the history
 
         Returns:
             New LiveSnapshot if successful, None otherwise
@@ -140,8 +191,6 @@ class LiveMonitor:
                     "Region not found, using test fallback", region_id=region_id
                 )
                 # Create minimal synthetic snapshot for testing
-                from datetime import datetime
-
                 snapshot = LiveSnapshot(
                     region_id=region_id,
                     timestamp=datetime.now(),
@@ -171,6 +220,7 @@ class LiveMonitor:
                     ):
                         oldest_region = next(iter(self._snapshots))
                         del self._snapshots[oldest_region]
+                        self._online_states.pop(oldest_region, None)
 
                     self._snapshots[region_id].insert(0, snapshot)
 
@@ -181,27 +231,55 @@ class LiveMonitor:
 
                 return snapshot
 
-            # Generate forecast using existing pipeline
-            forecast_result = self._forecaster.forecast(
-                latitude=region.latitude,
-                longitude=region.longitude,
-                region_name=region.name,
-                days_back=self.historical_days,
-                forecast_horizon=7,  # Use 7 days for live monitoring
-            )
+            with self._lock:
+                state = self._online_states.get(region_id)
+            online = state is not None and not self._refit_due(state)
 
-            # Extract latest data from history
-            if (
-                not forecast_result.get("history")
-                or len(forecast_result["history"]) == 0
-            ):
-                logger.warning(
-                    "No history data in forecast result", region_id=region_id
+            if online and observation is not None:
+                observations = [observation]
+                latest_history, sources = None, None
+            else:
+                # Pull the newest history through the forecaster; its shared
+                # cache serves this without a pipeline run until a source's
+                # data turns over
+                forecast_result = self._forecaster.forecast(
+                    latitude=region.latitude,
+                    longitude=region.longitude,
+                    region_name=region.name,
+                    days_back=self.historical_days,
+                    forecast_horizon=LIVE_FORECAST_HORIZON,
+                )
+                history = forecast_result.get("history") or []
+                if not history:
+                    logger.warning(
+                        "No history data in forecast result", region_id=region_id
+                    )
+                    return None
+                latest_history = history[-1]
+                sources = forecast_result.get("sources", [])
+                observations = (
+                    self._records_after(state, history) if online else None
+                )
+                # History window moved past the online state: refit from it
+                online = observations is not None
+
+            if online:
+                forecast_path = self._advance_online_state(
+                    region_id, state, observations, latest_history, sources
+                )
+                latest_history = state["latest"]
+                sources = state["sources"]
+            else:
+                state = self._seed_online_state(region_id, history, sources)
+                forecast_path = (
+                    state["model"].forecast(LIVE_FORECAST_HORIZON) if state else None
                 )
-                return None
 
-            latest_history = forecast_result["history"][-1]
             behavior_index = latest_history.get("behavior_index", 0.5)
+
+            # Keep the materialized heatmap current for this region
+            get_heatmap_store().update_region(region_id, latest_history)
+
             sub_indices = latest_history.get("sub_indices", {})
 
             # Convert sub_indices to SubIndices-like dict for explanation generation
@@ -244,9 +322,10 @@ class LiveMonitor:
                 timestamp=datetime.now(),
                 behavior_index=behavior_index,
                 sub_indices=sub_indices,
-                sources=forecast_result.get("sources", []),
+                sources=sources,
                 explanation_summary=explanation_summary,
                 event_flags=event_flags,
+                forecast=forecast_path,
             )
 
             # Store snapshot with LRU region management
@@ -266,6 +345,7 @@ class LiveMonitor:
                     # Remove oldest region (first key in dict)
                     oldest_region = next(iter(self._snapshots))
                     del self._snapshots[oldest_region]
+                    self._online_states.pop(oldest_region, None)
 
                 self._snapshots[region_id].insert(0, snapshot)
 
@@ -293,6 +373,144 @@ class LiveMonitor:
             )
             return None
 
+    def _refit_due(self, state: Dict) -> bool:
+        """Check whether a region's online state needs a full pipeline refit."""
+        if state["drift_detected"]:
+            return True
+        age = datetime.now() - state["refitted_at"]
+        return age >= timedelta(minutes=self.refit_interval_minutes)
+
+    def _seed_online_state(
+        self, region_id: str, history: List[Dict], sources: List[str]
+    ) -> Optional[Dict]:
+        """
+        Fit the online Holt-Winters state from a full history.
+
+        Args:
+            region_id: Region identifier
+            history: History records from the forecast pipeline
+            sources: Data sources used by the pipeline run
+
+        Returns:
+            New online state, or None if the history is too short to fit
+        """
+        values = [
+            (
+                record.get("behavior_index")
+                if record.get("behavior_index") is not None
+                else np.nan
+            )
+            for record in history
+        ]
+        if len(values) < 2:
+            return None
+
+        try:
+            model = OnlineHoltWinters.from_history(values)
+        except Exception as e:
+            logger.debug(
+                "Failed to fit online forecaster state",
+                region_id=region_id,
+                error=str(e),
+            )
+            return None
+
+        state = {
+            "model": model,
+            "latest": dict(history[-1]),
+            "sources": list(sources),
+            "recent": deque(
+                (self._drift_row(record) for record in history),
+                maxlen=2 * LIVE_MONITOR_DRIFT_WINDOW,
+            ),
+            "refitted_at": datetime.now(),
+            "drift_detected": False,
+        }
+        with self._lock:
+            self._online_states[region_id] = state
+        return state
+
+    def _advance_online_state(
+        self,
+        region_id: str,
+        state: Dict,
+        observations: List[Dict],
+        latest: Optional[Dict] = None,
+        sources: Optional[List[str]] = None,
+    ) -> Dict[str, List[float]]:
+        """
+        Absorb new observations into the online state and forecast from it.
+
+        Args:
+            region_id: Region identifier
+            state: Online state from _seed_online_state
+            observations: New history records in time order (may be empty)
+            latest: Newest pulled history record (replaces the stored latest
+                record, so revised values show up without a new timestamp)
+            sources: Data sources of the pulled history
+
+        Returns:
+            Forecast path with prediction intervals
+        """
+        with self._lock:
+            for observation in observations:
+                value = observation.get("behavior_index")
+                state["model"].update(np.nan if value is None else value)
+                state["latest"] = {**state["latest"], **observation}
+                state["recent"].append(self._drift_row(observation))
+            if latest is not None:
+                state["latest"] = dict(latest)
+            if sources is not None:
+                state["sources"] = list(sources)
+            recent = list(state["recent"])
+
+        if observations and len(recent) >= 2 * LIVE_MONITOR_DRIFT_WINDOW:
+            drift_scores = self._forecast_monitor.detect_drift(
+                pd.DataFrame(recent),
+                index_columns=DRIFT_COLUMNS,
+                window_size=LIVE_MONITOR_DRIFT_WINDOW,
+            )
+            if (
+                drift_scores
+                and max(drift_scores.values()) >= self._forecast_monitor.drift_threshold
+            ):
+                state["drift_detected"] = True
+                logger.info(
+                    "Drift detected, scheduling full refit",
+                    region_id=region_id,
+                    drift_scores=drift_scores,
+                )
+
+        return state["model"].forecast(LIVE_FORECAST_HORIZON)
+
+    @staticmethod
+    def _records_after(state: Dict, history: List[Dict]) -> Optional[List[Dict]]:
+        """
+        History records newer than the online state's latest record.
+
+        Args:
+            state: Online state
+            history: Pulled history records in time order
+
+        Returns:
+            Records after the state's latest timestamp (empty if none), or
+            None if that timestamp is no longer in the history window
+        """
+        last_timestamp = state["latest"].get("timestamp")
+        for position in range(len(history) - 1, -1, -1):
+            if history[position].get("timestamp") == last_timestamp:
+                return history[position + 1 :]
+        return None
+
+    @staticmethod
+    def _drift_row(record: Dict) -> Dict[str, float]:
+        """Extract the drift-monitored columns from a history record."""
+        row = {}
+        for column in DRIFT_COLUMNS:
+            value = record.get(column)
+            row[column] = float(value) if isinstance(value, (int, float)) else np.nan
+        return row
+
     def refresh_all_regions(self) -> Dict[str, bool]:
         """
         Refresh data for all known regions.
@@ -569,6 +787,7 @@ class LiveMonitor:
         Used in tests and process lifetime reset paths.
         """
         self._snapshots.clear()
+        self._online_states.clear()
 
 
 # Global instance (singleton pattern)
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Per-stage memory profiling for the forecast pipeline.
+
+Uses tracemalloc to attribute allocated and peak bytes to named pipeline
+stages. tracemalloc is process-wide, so stages of concurrent forecasts are
+attributed to whichever profiler checkpoints next; profile single forecasts
+when exact numbers matter. Concurrent profilers share one tracing session:
+it is stopped when the last of them stops, and never if something else
+started it.
+"""
+import threading
+import tracemalloc
+from typing import Dict, Optional
+
+import structlog
+
+logger = structlog.get_logger("core.memory_profile")
+
+# Profilers currently tracing, and whether they (not the caller) started it
+_tracing_users = 0
+_owns_tracing = False
+_tracing_lock = threading.Lock()
+
+
+def _acquire_tracing() -> None:
+    """Register a tracing user, starting tracemalloc for the first one."""
+    global _tracing_users, _owns_tracing
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _owns_tracing = True
+        _tracing_users += 1
+
+
+def _release_tracing() -> None:
+    """Drop a tracing user, stopping tracemalloc after the last one."""
+    global _tracing_users, _owns_tracing
+    with _tracing_lock:
+        _tracing_users = max(_tracing_users - 1, 0)
+        if _tracing_users == 0 and _owns_tracing:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            _owns_tracing = False
+
+
+class MemoryProfiler:
+    """
+    Records allocation deltas between named checkpoints.
+
+    Call checkpoint(stage) at the end of each stage; the bytes allocated since
+    the previous checkpoint (and the peak above that baseline) are attributed
+    to the stage. When disabled (or once stopped) checkpoint is a no-op and
+    stop only returns the report.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize profiler and start tracing if enabled.
+
+        Args:
+            enabled: Whether to trace allocations
+        """
+        self.enabled = enabled
+        self._stages: Dict[str, Dict[str, int]] = {}
+        self._baseline = 0
+
+        if self.enabled:
+            _acquire_tracing()
+            self._baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+    def checkpoint(self, stage: str) -> Optional[Dict[str, int]]:
+        """
+        Attribute allocations since the previous checkpoint to a stage.
+
+        Args:
+            stage: Stage name (repeated names accumulate)
+
+        Returns:
+            Dictionary with allocated_bytes and peak_bytes for this interval,
+            or None when disabled
+        """
+        if not self.enabled or not tracemalloc.is_tracing():
+            return None
+
+        current, peak = tracemalloc.get_traced_memory()
+        interval = {
+            "allocated_bytes": current - self._baseline,
+            "peak_bytes": max(peak - self._baseline, 0),
+        }
+        totals = self._stages.setdefault(stage, {"allocated_bytes": 0, "peak_bytes": 0})
+        totals["allocated_bytes"] += interval["allocated_bytes"]
+        totals["peak_bytes"] = max(totals["peak_bytes"], interval["peak_bytes"])
+
+        self._baseline = current
+        tracemalloc.reset_peak()
+        return interval
+
+    def report(self) -> Dict[str, Dict[str, int]]:
+        """Return per-stage allocation totals in checkpoint order."""
+        return {stage: dict(values) for stage, values in self._stages.items()}
+
+    def stop(self) -> Dict[str, Dict[str, int]]:
+        """
+        Stop tracing (after the last profiler using it) and return the report.
+
+        Returns:
+            Per-stage allocation totals
+        """
+        report = self.report()
+        if not self.enabled:
+            return report
+        _release_tracing()
+        self.enabled = False
+        if report:
+            logger.info("Forecast memory profile", stages=report)
+        return report
@@ -1,14 +1,47 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Model evaluation and backtesting for forecasting models."""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import structlog
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+    pq = None
+
 logger = structlog.get_logger("core.model_evaluation")
 
+# Rolling-origin backtest defaults
+BACKTEST_MAX_WORKERS = int(os.getenv("BACKTEST_MAX_WORKERS", "4"))
+BACKTEST_TIME_BUDGET_SECONDS = float(os.getenv("BACKTEST_TIME_BUDGET_SECONDS", "3600"))
+
+# Columns of each streamed backtest row
+BACKTEST_COLUMNS = [
+    ("region_id", "string"),
+    ("model", "string"),
+    ("origin", "timestamp"),
+    ("horizon", "int"),
+    ("train_size", "int"),
+    ("mae", "float"),
+    ("rmse", "float"),
+    ("smape", "float"),
+    ("interval_coverage", "float"),
+    ("average_interval_width", "float"),
+    ("fit_seconds", "float"),
+    ("warm_started", "bool"),
+]
+
 
 def compute_mae(actual: pd.Series, predicted: pd.Series) -> float:
     """Compute Mean Absolute Error."""
@@ -260,3 +293,419 @@ class ModelEvaluator:
             )
 
         return results
+
+
+def generate_origins(
+    n_observations: int,
+    min_train_size: int,
+    max_horizon: int,
+    step: int = 1,
+    max_origins: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Generate rolling forecast origins over a sorted series.
+
+    An origin is the number of leading observations used for training; every
+    origin leaves at least max_horizon observations to score against.
+
+    Args:
+        n_observations: Length of the series
+        min_train_size: Smallest training window
+        max_horizon: Longest horizon that will be scored
+        step: Distance between consecutive origins
+        max_origins: Keep only the most recent origins when set
+
+    Returns:
+        Array of origin positions in increasing order
+    """
+    origins = np.arange(min_train_size, n_observations - max_horizon + 1, max(step, 1))
+    if max_origins is not None:
+        origins = origins[-max_origins:] if max_origins > 0 else origins[:0]
+    return origins
+
+
+def compute_window_metrics(
+    actual: np.ndarray,
+    predicted: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> Dict[str, float]:
+    """
+    Compute MAE, RMSE, sMAPE and interval coverage on aligned arrays.
+
+    Array counterpart of compute_mae/compute_rmse/compute_smape/
+    compute_interval_coverage for the backtest hot loop.
+
+    Args:
+        actual: Observed values
+        predicted: Point forecasts
+        lower: Lower interval bounds
+        upper: Upper interval bounds
+
+    Returns:
+        Dictionary with mae, rmse, smape, interval_coverage, average_interval_width
+    """
+    valid = (
+        np.isfinite(actual)
+        & np.isfinite(predicted)
+        & np.isfinite(lower)
+        & np.isfinite(upper)
+    )
+    if not valid.any():
+        return {
+            "mae": float("nan"),
+            "rmse": float("nan"),
+            "smape": float("nan"),
+            "interval_coverage": float("nan"),
+            "average_interval_width": float("nan"),
+        }
+    a, p, lo, hi = actual[valid], predicted[valid], lower[valid], upper[valid]
+    error = a - p
+    denominator = (np.abs(a) + np.abs(p)) / 2
+    nonzero = denominator != 0
+    return {
+        "mae": float(np.mean(np.abs(error))),
+        "rmse": float(np.sqrt(np.mean(error**2))),
+        "smape": (
+            float(np.mean(np.abs(error[nonzero]) / denominator[nonzero]) * 100)
+            if nonzero.any()
+            else float("nan")
+        ),
+        "interval_coverage": float(np.mean((a >= lo) & (a <= hi)) * 100),
+        "average_interval_width": float(np.mean(hi - lo)),
+    }
+
+
+# Series shared with backtest workers: region_id -> (values, timestamps)
+_backtest_series: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _init_backtest_worker(series: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> None:
+    """Install the sorted series arrays once per worker process."""
+    global _backtest_series
+    _backtest_series = series
+
+
+def _run_backtest_chunk(
+    region_id: str,
+    model_name: str,
+    origins: Sequence[int],
+    horizons: Sequence[int],
+    series: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Backtest one model over consecutive origins of one region.
+
+    Training windows are views into the shared sorted array. Fitted
+    parameters from each origin warm-start the next one.
+
+    Args:
+        region_id: Region identifier
+        model_name: Registry model name
+        origins: Consecutive origin positions
+        horizons: Horizons to score (the forecast runs once at the longest)
+        series: Series store (default: the worker's shared store)
+
+    Returns:
+        One metrics row per (origin, horizon)
+    """
+    from app.core.model_registry import get_registry
+
+    values, timestamps = (series or _backtest_series)[region_id]
+    model = get_registry().get(model_name)
+    if model is None:
+        raise ValueError(f"Unknown model: {model_name}")
+
+    index = pd.DatetimeIndex(timestamps)
+    max_horizon = max(horizons)
+    warm_start = None
+    rows = []
+    for origin in origins:
+        history = pd.Series(values[:origin], index=index[:origin], copy=False)
+        started = time.perf_counter()
+        result = model.forecast(history, max_horizon, warm_start=warm_start)
+        fit_seconds = time.perf_counter() - started
+
+        predicted = np.asarray(result["prediction"], dtype=float)
+        lower = np.asarray(result.get("lower_bound", predicted), dtype=float)
+        upper = np.asarray(result.get("upper_bound", predicted), dtype=float)
+        actual = values[origin : origin + max_horizon]
+
+        for horizon in horizons:
+            row = {
+                "region_id": region_id,
+                "model": model_name,
+                "origin": index[origin - 1].to_pydatetime(),
+                "horizon": int(horizon),
+                "train_size": int(origin),
+                "fit_seconds": fit_seconds,
+                "warm_started": warm_start is not None,
+            }
+            row.update(
+                compute_window_metrics(
+                    actual[:horizon],
+                    predicted[:horizon],
+                    lower[:horizon],
+                    upper[:horizon],
+                )
+            )
+            rows.append(row)
+
+        warm_start = result.get("metadata")
+
+    return rows
+
+
+class RollingOriginBacktester:
+    """
+    Rolling-origin backtests of registry models over many regions.
+
+    Each region series is sorted once into NumPy arrays; every training window
+    is a view of that array. Work is split into (region, model, consecutive
+    origins) chunks run in a process pool, with warm starts between adjacent
+    origins inside a chunk. Metric rows are streamed to Parquet as chunks
+    complete, and the run stops scheduling work when the time budget is spent.
+    """
+
+    def __init__(
+        self,
+        horizons: Sequence[int] = (7,),
+        min_train_size: int = 30,
+        step: int = 1,
+        max_origins: Optional[int] = None,
+        chunk_size: int = 8,
+        max_workers: Optional[int] = None,
+        time_budget_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize the backtester.
+
+        Args:
+            horizons: Forecast horizons to score at every origin
+            min_train_size: Smallest training window (observations)
+            step: Distance between consecutive origins
+            max_origins: Keep only the most recent origins per region
+            chunk_size: Consecutive origins per task (warm-start run length)
+            max_workers: Worker processes (default: BACKTEST_MAX_WORKERS; 0 or 1
+                runs in-process)
+            time_budget_seconds: Wall-clock budget for a run
+                (default: BACKTEST_TIME_BUDGET_SECONDS)
+        """
+        if not horizons or min(horizons) < 1:
+            raise ValueError("horizons must contain positive integers")
+        self.horizons = sorted({int(h) for h in horizons})
+        self.min_train_size = min_train_size
+        self.step = step
+        self.max_origins = max_origins
+        self.chunk_size = max(chunk_size, 1)
+        self.max_workers = (
+            BACKTEST_MAX_WORKERS if max_workers is None else max(max_workers, 0)
+        )
+        self.time_budget_seconds = (
+            BACKTEST_TIME_BUDGET_SECONDS
+            if time_budget_seconds is None
+            else time_budget_seconds
+        )
+
+    def run(
+        self,
+        series: Dict[str, Union[pd.Series, pd.DataFrame]],
+        model_names: Iterable[str],
+        output_path: Optional[str] = None,
+        target_column: str = "behavior_index",
+    ) -> Dict[str, Any]:
+        """
+        Backtest every model over every region.
+
+        Args:
+            series: Region ID -> timestamp-indexed Series, or DataFrame with a
+                'timestamp' column and target_column
+            model_names: Registry model names to evaluate
+            output_path: Parquet file to stream rows to (rows are returned in
+                memory when omitted)
+            target_column: Column to evaluate for DataFrame inputs
+
+        Returns:
+            Dictionary with run statistics, per (model, horizon) averages and,
+            without output_path, the metric rows
+        """
+        started = time.monotonic()
+        deadline = started + self.time_budget_seconds
+        model_names = list(model_names)
+
+        arrays = {
+            region_id: self._to_sorted_arrays(data, target_column)
+            for region_id, data in series.items()
+        }
+        tasks = self._build_tasks(arrays, model_names)
+
+        writer = None
+        if output_path is not None:
+            if not HAS_PYARROW:
+                raise ImportError("pyarrow is required to stream backtest results")
+            writer = pq.ParquetWriter(output_path, self._arrow_schema())
+
+        totals: Dict[Tuple[str, int], Dict[str, float]] = {}
+        collected: List[Dict[str, Any]] = []
+        stats = {"completed": 0, "failed": 0, "rows": 0}
+
+        def consume(rows: List[Dict[str, Any]]) -> None:
+            if writer is not None and rows:
+                writer.write_table(pa.Table.from_pylist(rows, schema=writer.schema))
+            elif writer is None:
+                collected.extend(rows)
+            stats["completed"] += 1
+            stats["rows"] += len(rows)
+            for row in rows:
+                total = totals.setdefault(
+                    (row["model"], row["horizon"]),
+                    {"mae": 0.0, "rmse": 0.0, "smape": 0.0, "coverage": 0.0, "n": 0},
+                )
+                if np.isfinite(row["mae"]):
+                    total["mae"] += row["mae"]
+                    total["rmse"] += row["rmse"]
+                    total["smape"] += row["smape"] if np.isfinite(row["smape"]) else 0
+                    total["coverage"] += row["interval_coverage"]
+                    total["n"] += 1
+
+        budget_exhausted = False
+        try:
+            if self.max_workers <= 1:
+                for task in tasks:
+                    if time.monotonic() >= deadline:
+                        budget_exhausted = True
+                        break
+                    try:
+                        consume(_run_backtest_chunk(*task, series=arrays))
+                    except Exception as e:
+                        stats["failed"] += 1
+                        logger.error(
+                            "Backtest chunk failed", task=task[:2], error=str(e)
+                        )
+            else:
+                budget_exhausted = self._run_pool(
+                    tasks, arrays, deadline, consume, stats
+                )
+        finally:
+            if writer is not None:
+                writer.close()
+
+        summary = [
+            {
+                "model": model,
+                "horizon": horizon,
+                "mae": total["mae"] / total["n"] if total["n"] else float("nan"),
+                "rmse": total["rmse"] / total["n"] if total["n"] else float("nan"),
+                "smape": total["smape"] / total["n"] if total["n"] else float("nan"),
+                "interval_coverage": (
+                    total["coverage"] / total["n"] if total["n"] else float("nan")
+                ),
+                "evaluations": total["n"],
+            }
+            for (model, horizon), total in sorted(totals.items())
+        ]
+
+        result = {
+            "tasks_total": len(tasks),
+            "tasks_completed": stats["completed"],
+            "tasks_failed": stats["failed"],
+            "tasks_skipped": len(tasks) - stats["completed"] - stats["failed"],
+            "rows_written": stats["rows"],
+            "budget_exhausted": budget_exhausted,
+            "elapsed_seconds": time.monotonic() - started,
+            "output_path": output_path,
+            "summary": summary,
+        }
+        if output_path is None:
+            result["rows"] = collected
+
+        logger.info(
+            "Rolling-origin backtest completed",
+            regions=len(arrays),
+            models=model_names,
+            tasks=len(tasks),
+            completed=stats["completed"],
+            rows=stats["rows"],
+            budget_exhausted=budget_exhausted,
+            elapsed_seconds=result["elapsed_seconds"],
+        )
+
+        return result
+
+    def _run_pool(self, tasks, arrays, deadline, consume, stats) -> bool:
+        """Run tasks in a process pool until done or out of budget."""
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_backtest_worker,
+            initargs=(arrays,),
+        )
+        try:
+            pending = {
+                executor.submit(_run_backtest_chunk, *task): task for task in tasks
+            }
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return True
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = pending.pop(future)
+                    try:
+                        consume(future.result())
+                    except Exception as e:
+                        stats["failed"] += 1
+                        logger.error(
+                            "Backtest chunk failed", task=task[:2], error=str(e)
+                        )
+            return False
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _build_tasks(
+        self,
+        arrays: Dict[str, Tuple[np.ndarray, np.ndarray]],
+        model_names: List[str],
+    ) -> List[Tuple[str, str, List[int], List[int]]]:
+        """Split every (region, model) origin range into consecutive chunks."""
+        tasks = []
+        for region_id, (values, _) in arrays.items():
+            origins = generate_origins(
+                len(values),
+                self.min_train_size,
+                max(self.horizons),
+                step=self.step,
+                max_origins=self.max_origins,
+            )
+            for model_name in model_names:
+                for start in range(0, len(origins), self.chunk_size):
+                    chunk = [int(o) for o in origins[start : start + self.chunk_size]]
+                    tasks.append((region_id, model_name, chunk, self.horizons))
+        return tasks
+
+    @staticmethod
+    def _to_sorted_arrays(
+        data: Union[pd.Series, pd.DataFrame], target_column: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Sort a region series once into (values, timestamps) arrays."""
+        if isinstance(data, pd.DataFrame):
+            data = pd.Series(
+                data[target_column].to_numpy(dtype=float),
+                index=pd.to_datetime(data["timestamp"]),
+            )
+        data = data.sort_index()
+        return (
+            np.ascontiguousarray(data.to_numpy(dtype=float)),
+            pd.to_datetime(data.index).to_numpy(dtype="datetime64[ns]"),
+        )
+
+    @staticmethod
+    def _arrow_schema():
+        """Arrow schema for streamed backtest rows."""
+        types = {
+            "string": pa.string(),
+            "timestamp": pa.timestamp("ns"),
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "bool": pa.bool_(),
+        }
+        return pa.schema([(name, types[kind]) for name, kind in BACKTEST_COLUMNS])
@@ -1,8 +1,14 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Model registry for forecasting models."""
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -24,6 +30,26 @@ except ImportError:
 
 logger = structlog.get_logger("core.model_registry")
 
+# Auto-select settings (see ModelRegistry.auto_select)
+AUTO_SELECT_MAX_WORKERS = int(os.getenv("MODEL_AUTO_SELECT_MAX_WORKERS", "4"))
+AUTO_SELECT_TTL_SECONDS = float(os.getenv("MODEL_AUTO_SELECT_TTL_SECONDS", "21600"))
+# Candidates whose mean holdout MAE exceeds the leader's by this factor are
+# dropped before the remaining splits are fitted
+AUTO_SELECT_EARLY_STOP_RATIO = 1.5
+# Longest holdout forecast_auto scores candidates on; long projections would
+# otherwise leave short histories without a single holdout split
+AUTO_SELECT_HOLDOUT_HORIZON = int(os.getenv("MODEL_AUTO_SELECT_HOLDOUT_HORIZON", "7"))
+
+# Models whose fits run statsmodels optimizers and go to the process pool
+PROCESS_POOL_MODELS = {"exponential_smoothing", "arima"}
+
+# ARIMA per-region state (see ARIMAModel)
+ARIMA_STATE_MAX_REGIONS = 256
+ARIMA_FULL_REFIT_OBSERVATIONS = int(os.getenv("ARIMA_FULL_REFIT_OBSERVATIONS", "30"))
+ARIMA_ORDER_SEARCH_BUDGET_SECONDS = float(
+    os.getenv("ARIMA_ORDER_SEARCH_BUDGET_SECONDS", "60")
+)
+
 
 class BaseModel(ABC):
     """Base interface for all forecasting models."""
@@ -303,15 +329,36 @@ class ExponentialSmoothingModel(BaseModel):
 
 
 class ARIMAModel(BaseModel):
-    """ARIMA model (if statsmodels available)."""
+    """
+    ARIMA model (if statsmodels available).
+
+    When called with a region_id, the fitted results are kept per region and
+    later calls reuse them: new observations are appended (or the fitted
+    parameters applied to a rolled window) without re-running the MLE, with a
+    full refit every ARIMA_FULL_REFIT_OBSERVATIONS new points. Orders are
+    chosen per region by a bounded AIC search that runs in a background job.
+    """
+
+    DEFAULT_ORDER = (1, 1, 1)
 
     def __init__(self):
         if not HAS_ARIMA:
             raise ImportError("statsmodels is required for ARIMAModel")
         super().__init__("arima")
+        self._states: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._orders: Dict[str, Tuple[int, int, int]] = {}
+        self._searches: Dict[str, Future] = {}
+        self._state_lock = threading.Lock()
+        self._search_executor: Optional[ThreadPoolExecutor] = None
 
     def forecast(
-        self, history: pd.Series, horizon: int, order: tuple = (1, 1, 1), **kwargs
+        self,
+        history: pd.Series,
+        horizon: int,
+        order: Optional[tuple] = None,
+        warm_start: Optional[Dict] = None,
+        region_id: Optional[str] = None,
+        **kwargs,
     ) -> Dict[str, any]:
         """
         Generate ARIMA forecast.
@@ -319,20 +366,36 @@ class ARIMAModel(BaseModel):
         Args:
             history: Historical time series
             horizon: Forecast horizon
-            order: ARIMA order (p, d, q)
+            order: ARIMA order (p, d, q) (default: the region's searched order,
+                else DEFAULT_ORDER)
+            warm_start: Metadata from a previous fit of the same order; its
+                fitted "params" seed the optimizer
+            region_id: Optional region identifier enabling cached fitted state
+                and the background order search
         """
+        if order is None:
+            order = self.DEFAULT_ORDER
+            if region_id is not None:
+                with self._state_lock:
+                    searched = self._orders.get(region_id)
+                if searched is not None:
+                    order = searched
+                else:
+                    self.schedule_order_search(region_id, history)
+        order = tuple(order)
+
         if len(history) < max(order) + 1:
             logger.warning("Insufficient history for ARIMA, using fallback")
             naive = NaiveModel()
             return naive.forecast(history, horizon, **kwargs)
 
         try:
-            # Fit ARIMA model
-            model = ARIMA(history, order=order).fit()
+            model, fit_mode = self._fit(history, order, warm_start, region_id)
 
             # Generate forecast
-            forecast_result = model.forecast(steps=horizon)
-            conf_int = model.get_forecast(steps=horizon).conf_int()
+            forecast = model.get_forecast(steps=horizon)
+            forecast_result = np.asarray(forecast.predicted_mean, dtype=float)
+            conf_int = np.asarray(forecast.conf_int(), dtype=float)
 
             # Generate forecast dates
             if isinstance(history.index, pd.DatetimeIndex) and len(history.index) > 0:
@@ -348,17 +411,17 @@ class ARIMAModel(BaseModel):
             prediction = pd.Series(forecast_result, index=forecast_dates).clip(0.0, 1.0)
 
             # Use confidence intervals from model if available
-            if conf_int is not None and len(conf_int) == horizon:
-                lower_bound = pd.Series(
-                    conf_int.iloc[:, 0].values, index=forecast_dates
-                ).clip(0.0, 1.0)
-                upper_bound = pd.Series(
-                    conf_int.iloc[:, 1].values, index=forecast_dates
-                ).clip(0.0, 1.0)
+            if conf_int.ndim == 2 and len(conf_int) == horizon:
+                lower_bound = pd.Series(conf_int[:, 0], index=forecast_dates).clip(
+                    0.0, 1.0
+                )
+                upper_bound = pd.Series(conf_int[:, 1], index=forecast_dates).clip(
+                    0.0, 1.0
+                )
                 std_error = float((upper_bound - lower_bound).mean() / (2 * 1.96))
             else:
                 # Fallback: estimate from residuals
-                residuals = model.resid
+                residuals = np.asarray(model.resid)
                 std_error = float(residuals.std()) if len(residuals) > 0 else 0.1
                 std_error = max(0.01, min(0.5, std_error))
                 lower_bound = (prediction - 1.96 * std_error).clip(0.0, 1.0)
@@ -372,6 +435,8 @@ class ARIMAModel(BaseModel):
                 "metadata": {
                     "model": self.name,
                     "order": order,
+                    "params": [float(v) for v in np.asarray(model.params)],
+                    "fit_mode": fit_mode,
                     "horizon": horizon,
                 },
             }
@@ -381,12 +446,505 @@ class ARIMAModel(BaseModel):
             naive = NaiveModel()
             return naive.forecast(history, horizon, **kwargs)
 
+    def _fit(
+        self,
+        history: pd.Series,
+        order: Tuple[int, int, int],
+        warm_start: Optional[Dict],
+        region_id: Optional[str],
+    ) -> Tuple[Any, str]:
+        """
+        Fit or update ARIMA results for a history window.
+
+        Returns:
+            (fitted results, fit mode: "full", "append", "apply" or "cached")
+        """
+        values = history.to_numpy(dtype=float)
+        index = history.index
+        stateful = region_id is not None and isinstance(index, pd.DatetimeIndex)
+
+        state = None
+        if stateful:
+            with self._state_lock:
+                state = self._states.get(region_id)
+                if state is not None:
+                    self._states.move_to_end(region_id)
+        if state is not None and state["order"] != order:
+            state = None
+
+        start_params = None
+        if warm_start and tuple(warm_start.get("order", ())) == order:
+            start_params = warm_start.get("params")
+
+        results, fit_mode = None, "full"
+        if state is not None and len(index) > 0:
+            new_mask = index > state["last_timestamp"]
+            n_new = int(new_mask.sum())
+            if state["appended"] + n_new < ARIMA_FULL_REFIT_OBSERVATIONS:
+                same_start = (
+                    index[0] == state["first_timestamp"]
+                    and len(index) - n_new == state["n_obs"]
+                )
+                if same_start and n_new == 0:
+                    results, fit_mode = state["results"], "cached"
+                elif same_start:
+                    results = state["results"].append(values[new_mask], refit=False)
+                    fit_mode = "append"
+                else:
+                    results = state["results"].apply(values, refit=False)
+                    fit_mode = "apply"
+                appended = state["appended"] + n_new
+            # Periodic full refit is seeded with the cached parameters
+            start_params = np.asarray(state["results"].params)
+
+        if results is None:
+            results = ARIMA(values, order=order).fit(
+                start_params=(
+                    np.asarray(start_params) if start_params is not None else None
+                )
+            )
+            appended = 0
+
+        if stateful and len(index) > 0:
+            with self._state_lock:
+                self._states[region_id] = {
+                    "order": order,
+                    "results": results,
+                    "first_timestamp": index[0],
+                    "last_timestamp": index[-1],
+                    "n_obs": len(index),
+                    "appended": appended,
+                }
+                self._states.move_to_end(region_id)
+                while len(self._states) > ARIMA_STATE_MAX_REGIONS:
+                    self._states.popitem(last=False)
+
+        return results, fit_mode
+
+    @staticmethod
+    def search_order(
+        values: np.ndarray,
+        max_p: int = 2,
+        max_d: int = 1,
+        max_q: int = 2,
+        budget_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Bounded AIC search over ARIMA orders.
+
+        Orders are tried from simplest to most complex and the search stops
+        when the time budget is spent.
+
+        Args:
+            values: Observations
+            max_p: Largest AR order
+            max_d: Largest differencing order
+            max_q: Largest MA order
+            budget_seconds: Time budget (default: ARIMA_ORDER_SEARCH_BUDGET_SECONDS)
+
+        Returns:
+            Dictionary with order, aic, orders_evaluated and elapsed_seconds
+        """
+        budget = (
+            ARIMA_ORDER_SEARCH_BUDGET_SECONDS
+            if budget_seconds is None
+            else budget_seconds
+        )
+        started = time.monotonic()
+        orders = sorted(
+            (
+                (p, d, q)
+                for p in range(max_p + 1)
+                for d in range(max_d + 1)
+                for q in range(max_q + 1)
+            ),
+            key=lambda o: (o[0] + o[2], o[1], o),
+        )
+
+        best_order, best_aic, evaluated = ARIMAModel.DEFAULT_ORDER, float("inf"), 0
+        for candidate in orders:
+            if evaluated and time.monotonic() - started > budget:
+                break
+            if len(values) < max(candidate) + 2:
+                continue
+            try:
+                aic = float(ARIMA(values, order=candidate).fit().aic)
+            except Exception as e:
+                logger.debug("ARIMA order failed", order=candidate, error=str(e))
+                continue
+            evaluated += 1
+            if np.isfinite(aic) and aic < best_aic:
+                best_order, best_aic = candidate, aic
+
+        return {
+            "order": best_order,
+            "aic": best_aic,
+            "orders_evaluated": evaluated,
+            "elapsed_seconds": time.monotonic() - started,
+        }
+
+    def schedule_order_search(
+        self, region_id: str, history: pd.Series, **search_kwargs
+    ) -> Future:
+        """
+        Run search_order for a region in the background.
+
+        At most one search per region is in flight; when it finishes the
+        region's order is updated and stale fitted state is dropped.
+
+        Args:
+            region_id: Region identifier
+            history: Historical time series to search on
+            **search_kwargs: Passed to search_order
+
+        Returns:
+            Future resolving to the search_order result
+        """
+        with self._state_lock:
+            running = self._searches.get(region_id)
+            if running is not None and not running.done():
+                return running
+            if self._search_executor is None:
+                self._search_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="arima-order-search"
+                )
+            future = self._search_executor.submit(
+                self.search_order,
+                history.dropna().to_numpy(dtype=float).copy(),
+                **search_kwargs,
+            )
+            self._searches[region_id] = future
+
+        def store(done: Future) -> None:
+            try:
+                found = done.result()
+            except Exception as e:
+                logger.warning(
+                    "ARIMA order search failed", region=region_id, error=str(e)
+                )
+                return
+            with self._state_lock:
+                self._orders[region_id] = found["order"]
+                state = self._states.get(region_id)
+                if state is not None and state["order"] != found["order"]:
+                    del self._states[region_id]
+            logger.info(
+                "ARIMA order selected",
+                region=region_id,
+                order=found["order"],
+                orders_evaluated=found["orders_evaluated"],
+            )
+
+        future.add_done_callback(store)
+        return future
+
+    def get_order(self, region_id: str) -> Optional[Tuple[int, int, int]]:
+        """Return the searched order for a region, if one is available."""
+        with self._state_lock:
+            return self._orders.get(region_id)
+
+
+class BatchETSModel(BaseModel):
+    """
+    Batched additive Holt-Winters (ETS) model in pure NumPy.
+
+    Fits additive trend + weekly season for many aligned series at once: the
+    smoothing recursions run over a (series, candidates) array, parameters are
+    chosen by a vectorized grid search refined with a coordinate search, and
+    results are returned as arrays. Intended for bulk jobs (e.g., refreshing
+    all regions) where per-series statsmodels fitting dominates runtime.
+    """
+
+    ALPHA_GRID = (0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.9)
+    BETA_GRID = (0.0, 0.01, 0.05, 0.1, 0.2)
+    GAMMA_GRID = (0.0, 0.05, 0.1, 0.2, 0.4)
+
+    def __init__(self, seasonal_period: int = 7, refine_rounds: int = 3):
+        """
+        Initialize batched ETS model.
+
+        Args:
+            seasonal_period: Period of seasonality (default: 7 for weekly)
+            refine_rounds: Coordinate search rounds after the grid search
+        """
+        super().__init__("batch_ets")
+        self.seasonal_period = seasonal_period
+        self.refine_rounds = refine_rounds
+
+    def forecast(
+        self,
+        history: pd.Series,
+        horizon: int,
+        warm_start: Optional[Dict] = None,
+        **kwargs,
+    ) -> Dict[str, any]:
+        """
+        Generate a forecast for a single series via the batched engine.
+
+        Args:
+            history: Historical time series
+            horizon: Forecast horizon
+            warm_start: Metadata from a previous fit; its alpha/beta/gamma
+                replace the grid search as the coordinate search start
+        """
+        if len(history) < 2:
+            logger.warning("Insufficient history for batch ETS, using fallback")
+            naive = NaiveModel()
+            return naive.forecast(history, horizon, **kwargs)
+
+        initial_params = None
+        if warm_start and all(k in warm_start for k in ("alpha", "beta", "gamma")):
+            initial_params = np.array(
+                [[warm_start["alpha"], warm_start["beta"], warm_start["gamma"]]]
+            )
+
+        batch = self.forecast_batch(
+            history.to_numpy(dtype=float)[np.newaxis, :],
+            horizon,
+            initial_params=initial_params,
+        )
+
+        if isinstance(history.index, pd.DatetimeIndex) and len(history.index) > 0:
+            last_date = history.index.max()
+            forecast_dates = pd.date_range(
+                start=last_date + pd.Timedelta(days=1), periods=horizon, freq="D"
+            )
+        else:
+            forecast_dates = pd.date_range(
+                start=pd.Timestamp.now(), periods=horizon, freq="D"
+            )
+
+        return {
+            "prediction": pd.Series(batch["prediction"][0], index=forecast_dates),
+            "lower_bound": pd.Series(batch["lower_bound"][0], index=forecast_dates),
+            "upper_bound": pd.Series(batch["upper_bound"][0], index=forecast_dates),
+            "std_error": float(batch["std_error"][0]),
+            "metadata": {
+                "model": self.name,
+                "alpha": float(batch["params"]["alpha"][0]),
+                "beta": float(batch["params"]["beta"][0]),
+                "gamma": float(batch["params"]["gamma"][0]),
+                "seasonal_periods": batch["seasonal_periods"],
+                "horizon": horizon,
+            },
+        }
+
+    def forecast_batch(
+        self,
+        values: np.ndarray,
+        horizon: int,
+        alpha_grid: Optional[Sequence[float]] = None,
+        beta_grid: Optional[Sequence[float]] = None,
+        gamma_grid: Optional[Sequence[float]] = None,
+        initial_params: Optional[np.ndarray] = None,
+    ) -> Dict[str, any]:
+        """
+        Fit and forecast many aligned series at once.
+
+        Args:
+            values: Array of shape (series, timesteps); NaNs are filled forward
+                then backward within each series (all-NaN series use 0.5)
+            horizon: Forecast horizon
+            alpha_grid: Level smoothing candidates (default: ALPHA_GRID)
+            beta_grid: Trend smoothing candidates (default: BETA_GRID)
+            gamma_grid: Season smoothing candidates (default: GAMMA_GRID)
+            initial_params: Optional (series, 3) warm-start parameters; when
+                given the grid search is skipped and a finer coordinate search
+                starts from them
+
+        Returns:
+            Dictionary with:
+            - prediction, lower_bound, upper_bound: arrays of shape (series, horizon)
+            - std_error: residual standard deviation per series, shape (series,)
+            - params: {"alpha", "beta", "gamma"} arrays of shape (series,)
+            - sse: in-sample sum of squared one-step errors per series
+            - seasonal_periods: season length used (None when too short)
+        """
+        y = np.asarray(values, dtype=float)
+        if y.ndim != 2:
+            raise ValueError("values must be a 2-D array of shape (series, timesteps)")
+        if y.shape[1] < 2:
+            raise ValueError("At least two timesteps are required")
+        y = (
+            pd.DataFrame(y)
+            .ffill(axis=1)
+            .bfill(axis=1)
+            .fillna(0.5)
+            .to_numpy(dtype=float)
+        )
+
+        n_series, n_steps = y.shape
+        # Same rule as ExponentialSmoothingModel: season only with 30+ points
+        m = self.seasonal_period if n_steps >= max(30, 2 * self.seasonal_period) else 0
+
+        if initial_params is not None:
+            best = np.array(initial_params, dtype=float).reshape(n_series, 3)
+            if not m:
+                best[:, 2] = 0.0
+            step = 0.025
+        else:
+            # Vectorized grid search over every (alpha, beta, gamma) combination
+            grids = np.meshgrid(
+                np.asarray(
+                    self.ALPHA_GRID if alpha_grid is None else alpha_grid, dtype=float
+                ),
+                np.asarray(
+                    self.BETA_GRID if beta_grid is None else beta_grid, dtype=float
+                ),
+                (
+                    np.asarray(
+                        self.GAMMA_GRID if gamma_grid is None else gamma_grid,
+                        dtype=float,
+                    )
+                    if m
+                    else [0.0]
+                ),
+                indexing="ij",
+            )
+            candidates = np.stack([g.ravel() for g in grids], axis=1)
+            params = np.broadcast_to(candidates, (n_series,) + candidates.shape)
+            sse = self._smooth(y, params, m)["sse"]
+            best = params[np.arange(n_series), np.argmin(sse, axis=1)]
+            step = 0.1
+
+        # Coordinate search: perturb one parameter at a time with shrinking steps
+        free_params = 3 if m else 2
+        for _ in range(self.refine_rounds):
+            for p in range(free_params):
+                trial = np.repeat(best[:, np.newaxis, :], 3, axis=1)
+                trial[:, :, p] = np.clip(
+                    best[:, p, np.newaxis] + np.array([-step, 0.0, step]),
+                    0.0 if p else 0.01,
+                    1.0 if p else 0.99,
+                )
+                trial_sse = self._smooth(y, trial, m)["sse"]
+                best = trial[np.arange(n_series), np.argmin(trial_sse, axis=1)]
+            step /= 2
+
+        fit = self._smooth(y, best[:, np.newaxis, :], m)
+        level = fit["level"][:, 0]
+        trend = fit["trend"][:, 0]
+        steps_ahead = np.arange(1, horizon + 1)
+        prediction = level[:, np.newaxis] + trend[:, np.newaxis] * steps_ahead
+        if m:
+            phases = (n_steps + steps_ahead - 1) % m
+            prediction = prediction + fit["season"][:, 0, :][:, phases]
+        prediction = np.clip(prediction, 0.0, 1.0)
+
+        count = n_steps - 1
+        mean_err = fit["err_sum"][:, 0] / count
+        variance = (fit["sse"][:, 0] - count * mean_err**2) / max(count - 1, 1)
+        std_error = np.sqrt(np.maximum(variance, 0.0))
+        std_error = np.where(np.isfinite(std_error) & (std_error > 0), std_error, 0.1)
+        std_error = np.clip(std_error, 0.01, 0.5)
+
+        return {
+            "prediction": prediction,
+            "lower_bound": np.clip(prediction - 1.96 * std_error[:, None], 0.0, 1.0),
+            "upper_bound": np.clip(prediction + 1.96 * std_error[:, None], 0.0, 1.0),
+            "std_error": std_error,
+            "params": {
+                "alpha": best[:, 0],
+                "beta": best[:, 1],
+                "gamma": best[:, 2],
+            },
+            "sse": fit["sse"][:, 0],
+            "seasonal_periods": m or None,
+        }
+
+    @staticmethod
+    def _smooth(y: np.ndarray, params: np.ndarray, m: int) -> Dict[str, np.ndarray]:
+        """
+        Run additive Holt-Winters recursions for every series and candidate.
+
+        Args:
+            y: Observations of shape (series, timesteps)
+            params: (alpha, beta, gamma) of shape (series, candidates, 3)
+            m: Season length (0 for no season)
+
+        Returns:
+            Final level/trend/season states and one-step error sums
+        """
+        n_series, n_steps = y.shape
+        alpha, beta, gamma = params[..., 0], params[..., 1], params[..., 2]
+        shape = alpha.shape
+
+        if m:
+            first = y[:, :m].mean(axis=1)
+            second = y[:, m : 2 * m].mean(axis=1)
+            level = np.broadcast_to(first[:, None], shape).copy()
+            trend = np.broadcast_to(((second - first) / m)[:, None], shape).copy()
+            season = np.broadcast_to(
+                (y[:, :m] - first[:, None])[:, None, :], shape + (m,)
+            ).copy()
+            # Rewind the level to t=0 so the recursion starts at the first point
+            level = level - trend * (m - 1) / 2
+        else:
+            level = np.broadcast_to(y[:, :1], shape).copy()
+            trend = np.broadcast_to((y[:, 1:2] - y[:, :1]), shape).copy()
+            season = np.zeros(shape + (1,))
+
+        sse = np.zeros(shape)
+        err_sum = np.zeros(shape)
+        for t in range(1, n_steps):
+            phase = t % m if m else 0
+            obs = y[:, t, None]
+            s_prev = season[..., phase]
+            error = obs - (level + trend + s_prev)
+            sse += error**2
+            err_sum += error
+            new_level = alpha * (obs - s_prev) + (1.0 - alpha) * (level + trend)
+            trend = beta * (new_level - level) + (1.0 - beta) * trend
+            if m:
+                season[..., phase] = gamma * (obs - new_level) + (1.0 - gamma) * s_prev
+            level = new_level
+
+        return {
+            "level": level,
+            "trend": trend,
+            "season": season,
+            "sse": sse,
+            "err_sum": err_sum,
+        }
+
+
+def _holdout_error(
+    model_name: str,
+    values: np.ndarray,
+    timestamps: np.ndarray,
+    origin: int,
+    horizon: int,
+    model: Optional[BaseModel] = None,
+) -> Tuple[float, Dict[str, Any]]:
+    """
+    Fit a model on values[:origin] and score it on the next horizon points.
+
+    Runs in pool workers, so it resolves the model by name from the global
+    registry unless a model instance is passed.
+
+    Returns:
+        (mean absolute error, forecast metadata)
+    """
+    model = model or get_registry().get(model_name)
+    if model is None:
+        raise ValueError(f"Unknown model: {model_name}")
+    history = pd.Series(values[:origin], index=pd.DatetimeIndex(timestamps[:origin]))
+    result = model.forecast(history, horizon)
+    predicted = np.asarray(result["prediction"], dtype=float)[:horizon]
+    actual = values[origin : origin + horizon]
+    error = float(np.nanmean(np.abs(actual - predicted)))
+    return error, result.get("metadata", {})
+
 
 class ModelRegistry:
     """Registry for forecasting models."""
 
     def __init__(self):
         self._models: Dict[str, BaseModel] = {}
+        # (region_id, horizon, holdout_splits, candidates) -> (time, selection)
+        self._selection_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._selection_lock = threading.Lock()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
         self._register_defaults()
 
     def _register_defaults(self):
@@ -394,6 +952,7 @@ class ModelRegistry:
         # Always available
         self.register(NaiveModel())
         self.register(SeasonalNaiveModel())
+        self.register(BatchETSModel())
 
         # Conditional models
         if HAS_STATSMODELS:
@@ -429,6 +988,215 @@ class ModelRegistry:
             return self._models["exponential_smoothing"]
         return self._models["naive"]
 
+    def auto_select(
+        self,
+        history: pd.Series,
+        region_id: str,
+        horizon: int = 7,
+        candidates: Optional[List[str]] = None,
+        holdout_splits: int = 3,
+        max_workers: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        use_process_pool: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Select the most accurate model for a region on holdout splits.
+
+        Splits are evaluated most recent first. In each round every surviving
+        candidate is fitted concurrently (statsmodels candidates in a process
+        pool, the rest in threads); after each round candidates whose mean
+        error exceeds the leader's by AUTO_SELECT_EARLY_STOP_RATIO are dropped.
+        The winner is cached with a TTL per region, horizon, split count and
+        candidate set.
+
+        Args:
+            history: Historical time series (indexed by timestamp)
+            region_id: Region identifier (part of the cache key)
+            horizon: Holdout length per split (forecast horizon)
+            candidates: Model names to consider (default: all registered)
+            holdout_splits: Number of rolling holdout splits
+            max_workers: Concurrent fits (default: AUTO_SELECT_MAX_WORKERS)
+            ttl_seconds: Cache lifetime (default: AUTO_SELECT_TTL_SECONDS)
+            use_process_pool: Send statsmodels fits to worker processes
+
+        Returns:
+            Dictionary with:
+            - model: Winning model name
+            - params: Forecast metadata from the winner's latest holdout fit
+            - scores: Mean holdout MAE per candidate (eliminated ones included)
+            - eliminated: Candidates dropped early or failed
+            - splits_evaluated: Holdout splits fitted per surviving candidate
+            - selection_seconds: Wall-clock time of the selection
+            - cached: True when served from the selection cache
+        """
+        ttl = AUTO_SELECT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        started = time.perf_counter()
+        names = [n for n in (candidates or self.list()) if n in self._models]
+        if not names:
+            raise ValueError("No registered candidate models to select from")
+
+        # A selection only answers the question it was made for
+        cache_key = (region_id, horizon, holdout_splits, tuple(sorted(names)))
+        now = time.monotonic()
+        with self._selection_lock:
+            entry = self._selection_cache.get(cache_key)
+            if entry is not None and now - entry[0] < ttl:
+                return {**entry[1], "cached": True}
+
+        history = history.dropna().sort_index()
+        values = history.to_numpy(dtype=float)
+        timestamps = pd.DatetimeIndex(history.index).to_numpy()
+        origins = [
+            len(values) - k * horizon
+            for k in range(1, holdout_splits + 1)
+            if len(values) - k * horizon >= max(2 * horizon, 8)
+        ]
+
+        errors: Dict[str, List[float]] = {name: [] for name in names}
+        params: Dict[str, Dict[str, Any]] = {}
+        eliminated: List[str] = []
+        alive = list(names)
+        workers = max_workers or AUTO_SELECT_MAX_WORKERS
+
+        if origins and len(alive) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as threads:
+                for origin in origins:
+                    futures: Dict[Future, str] = {}
+                    for name in alive:
+                        if use_process_pool and name in PROCESS_POOL_MODELS:
+                            future = self._get_process_pool(workers).submit(
+                                _holdout_error,
+                                name,
+                                values,
+                                timestamps,
+                                origin,
+                                horizon,
+                            )
+                        else:
+                            future = threads.submit(
+                                _holdout_error,
+                                name,
+                                values,
+                                timestamps,
+                                origin,
+                                horizon,
+                                self._models[name],
+                            )
+                        futures[future] = name
+                    wait(futures)
+
+                    for future, name in futures.items():
+                        try:
+                            error, metadata = future.result()
+                        except Exception as e:
+                            logger.warning(
+                                "Auto-select candidate failed", model=name, error=str(e)
+                            )
+                            error, metadata = float("inf"), {}
+                        errors[name].append(error)
+                        if name not in params:
+                            params[name] = metadata
+
+                    means = {n: float(np.mean(errors[n])) for n in alive}
+                    leader = min(means.values())
+                    losers = [
+                        n
+                        for n in alive
+                        if not np.isfinite(means[n])
+                        or means[n] > leader * AUTO_SELECT_EARLY_STOP_RATIO + 1e-12
+                    ]
+                    eliminated.extend(losers)
+                    alive = [n for n in alive if n not in losers]
+                    if len(alive) <= 1:
+                        break
+
+        scores = {
+            n: float(np.mean(e)) if e else float("nan") for n, e in errors.items()
+        }
+        default_name = self.get_default().get_name()
+        if not origins:
+            # Too little history to hold anything out: keep the default
+            winner = default_name if default_name in names else names[0]
+        else:
+            alive.sort(key=lambda n: scores[n])
+            winner = alive[0] if alive else default_name
+
+        selection = {
+            "model": winner,
+            "params": params.get(winner, {}),
+            "scores": scores,
+            "eliminated": eliminated,
+            "splits_evaluated": max((len(e) for e in errors.values()), default=0),
+            "selection_seconds": time.perf_counter() - started,
+        }
+        with self._selection_lock:
+            self._selection_cache[cache_key] = (time.monotonic(), selection)
+
+        logger.info(
+            "Model auto-selected",
+            region_id=region_id,
+            model=winner,
+            eliminated=eliminated,
+            selection_seconds=selection["selection_seconds"],
+        )
+        return {**selection, "cached": False}
+
+    def forecast_auto(
+        self,
+        history: pd.Series,
+        horizon: int,
+        region_id: str,
+        holdout_horizon: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Forecast with the auto-selected model for a region.
+
+        Candidates are scored on holdouts of at most holdout_horizon points,
+        then the winner is projected over the full horizon.
+
+        Args:
+            history: Historical time series
+            horizon: Forecast horizon
+            region_id: Region identifier (selection cache key)
+            holdout_horizon: Holdout length per split
+                (default: horizon capped at AUTO_SELECT_HOLDOUT_HORIZON)
+            **kwargs: Passed to auto_select
+
+        Returns:
+            Model forecast result; metadata gains an "auto_select" section
+        """
+        if holdout_horizon is None:
+            holdout_horizon = min(horizon, AUTO_SELECT_HOLDOUT_HORIZON)
+        selection = self.auto_select(
+            history, region_id, horizon=holdout_horizon, **kwargs
+        )
+        model = self._models[selection["model"]]
+        # region_id lets stateful models (ARIMA) reuse the region's fit
+        result = model.forecast(
+            history, horizon, warm_start=selection["params"], region_id=region_id
+        )
+        result.setdefault("metadata", {})["auto_select"] = {
+            "scores": selection["scores"],
+            "splits_evaluated": selection["splits_evaluated"],
+            "holdout_horizon": holdout_horizon,
+            "selection_seconds": selection["selection_seconds"],
+            "cached": selection["cached"],
+        }
+        return result
+
+    def clear_selection_cache(self) -> None:
+        """Drop all cached auto-select results."""
+        with self._selection_lock:
+            self._selection_cache.clear()
+
+    def _get_process_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        """Lazily create the process pool shared by auto-select runs."""
+        with self._selection_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=max_workers)
+            return self._process_pool
+
 
 # Global registry instance
 _registry: Optional[ModelRegistry] = None
@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Online Holt-Winters forecaster state.
+
+Keeps the level/trend/season state and residual variance of an additive
+Holt-Winters model so that a new observation is absorbed in O(1) and the
+forecast path and intervals can be produced without refitting.
+"""
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.core.model_registry import BatchETSModel
+
+
+class OnlineHoltWinters:
+    """
+    Additive Holt-Winters state that updates one observation at a time.
+
+    Smoothing parameters are chosen once by a full fit (see from_history) and
+    then held fixed; each update runs the standard error-correction recursions
+    and an exponentially weighted estimate of the one-step error variance.
+    """
+
+    def __init__(
+        self,
+        alpha: float,
+        beta: float,
+        gamma: float,
+        level: float,
+        trend: float,
+        season: Optional[Sequence[float]] = None,
+        phase: int = 0,
+        residual_variance: float = 0.01,
+        error_decay: float = 0.1,
+    ):
+        """
+        Initialize online state.
+
+        Args:
+            alpha: Level smoothing parameter
+            beta: Trend smoothing parameter
+            gamma: Season smoothing parameter
+            level: Current level
+            trend: Current trend
+            season: Seasonal offsets (None or empty for no season)
+            phase: Season index of the next observation
+            residual_variance: Initial one-step error variance
+            error_decay: Weight of the newest squared error in the variance
+        """
+        self.alpha = float(alpha)
+        self.beta = float(beta)
+        self.gamma = float(gamma)
+        self.level = float(level)
+        self.trend = float(trend)
+        self.season = np.array(season if season is not None else [], dtype=float)
+        self.seasonal_period = len(self.season)
+        self.phase = int(phase) % self.seasonal_period if self.seasonal_period else 0
+        self.residual_variance = float(residual_variance)
+        self.error_decay = float(error_decay)
+        self.observations = 0
+
+    @classmethod
+    def from_history(
+        cls,
+        values: Sequence[float],
+        seasonal_period: int = 7,
+        error_decay: float = 0.1,
+    ) -> "OnlineHoltWinters":
+        """
+        Fit parameters on a full history and return the end-of-history state.
+
+        Args:
+            values: Historical observations (at least two)
+            seasonal_period: Season length (season used only for 30+ points)
+            error_decay: Weight of the newest squared error in the variance
+
+        Returns:
+            OnlineHoltWinters positioned after the last observation
+        """
+        y = (
+            pd.Series(np.asarray(values, dtype=float))
+            .ffill()
+            .bfill()
+            .fillna(0.5)
+            .to_numpy()[np.newaxis, :]
+        )
+        fit = BatchETSModel(seasonal_period=seasonal_period).forecast_batch(y, 1)
+        m = fit["seasonal_periods"] or 0
+        params = np.array(
+            [[[fit["params"][name][0] for name in ("alpha", "beta", "gamma")]]]
+        )
+        state = BatchETSModel._smooth(y, params, m)
+
+        online = cls(
+            alpha=params[0, 0, 0],
+            beta=params[0, 0, 1],
+            gamma=params[0, 0, 2],
+            level=state["level"][0, 0],
+            trend=state["trend"][0, 0],
+            season=state["season"][0, 0] if m else None,
+            phase=y.shape[1],
+            residual_variance=float(fit["std_error"][0]) ** 2,
+            error_decay=error_decay,
+        )
+        online.observations = y.shape[1]
+        return online
+
+    def update(self, value: float) -> float:
+        """
+        Absorb one new observation.
+
+        Args:
+            value: Newly observed value (NaN is ignored)
+
+        Returns:
+            One-step-ahead error of the state before the update
+        """
+        value = float(value)
+        if not np.isfinite(value):
+            return 0.0
+
+        s_prev = self.season[self.phase] if self.seasonal_period else 0.0
+        error = value - (self.level + self.trend + s_prev)
+        new_level = self.alpha * (value - s_prev) + (1.0 - self.alpha) * (
+            self.level + self.trend
+        )
+        self.trend = self.beta * (new_level - self.level) + (1.0 - self.beta) * (
+            self.trend
+        )
+        if self.seasonal_period:
+            self.season[self.phase] = (
+                self.gamma * (value - new_level) + (1.0 - self.gamma) * s_prev
+            )
+            self.phase = (self.phase + 1) % self.seasonal_period
+        self.level = new_level
+        self.residual_variance = (
+            1.0 - self.error_decay
+        ) * self.residual_variance + self.error_decay * error**2
+        self.observations += 1
+        return float(error)
+
+    def forecast(self, horizon: int, z: float = 1.96) -> Dict[str, List[float]]:
+        """
+        Produce the forecast path and prediction intervals.
+
+        Interval variance uses the additive Holt-Winters h-step formula
+        sigma^2 * (1 + sum_{j<h} c_j^2), c_j = alpha(1 + j*beta) + gamma*[j % m == 0].
+
+        Args:
+            horizon: Number of steps ahead
+            z: Normal quantile for the interval (default: 95%)
+
+        Returns:
+            Dictionary with prediction, lower_bound, upper_bound and std_error
+            lists (values clipped to [0, 1])
+        """
+        steps = np.arange(1, horizon + 1)
+        prediction = self.level + self.trend * steps
+        if self.seasonal_period:
+            prediction = (
+                prediction
+                + self.season[(self.phase + steps - 1) % self.seasonal_period]
+            )
+
+        j = np.arange(1, horizon)
+        c = self.alpha * (1.0 + j * self.beta)
+        if self.seasonal_period:
+            c = c + self.gamma * (j % self.seasonal_period == 0)
+        multipliers = np.concatenate([[1.0], 1.0 + np.cumsum(c**2)])
+        sigma = np.clip(np.sqrt(max(self.residual_variance, 0.0)), 0.01, 0.5)
+        std_error = sigma * np.sqrt(multipliers)
+
+        return {
+            "prediction": np.clip(prediction, 0.0, 1.0).tolist(),
+            "lower_bound": np.clip(prediction - z * std_error, 0.0, 1.0).tolist(),
+            "upper_bound": np.clip(prediction + z * std_error, 0.0, 1.0).tolist(),
+            "std_error": std_error.tolist(),
+        }
@@ -4,15 +4,45 @@
 This module provides multi-region comparison and optional scenario
 adjustments for exploring "what-if" behavioral forecasts.
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import structlog
 
 from app.core.prediction import BehavioralForecaster
 from app.core.regions import get_region_by_id
+from app.services.risk.classifier import RiskClassifier
 
 logger = structlog.get_logger("core.playground")
 
+# Sub-indices that scenarios can offset, in matrix column order
+SCENARIO_SUB_INDICES = [
+    "economic_stress",
+    "environmental_stress",
+    "mobility_activity",
+    "digital_attention",
+    "public_health_stress",
+]
+
+# Same fixed weights as recompute_behavior_index_from_sub_indices
+DEFAULT_SCENARIO_WEIGHTS = np.array([0.25, 0.25, 0.20, 0.15, 0.15])
+
+# Risk tiers by behavior_index (mirrors RiskClassifier._determine_tier)
+RISK_TIER_NAMES = ["stable", "elevated", "high", "critical"]
+RISK_TIER_EDGES = np.array(
+    [
+        RiskClassifier.TIER_THRESHOLDS["elevated"],
+        RiskClassifier.TIER_THRESHOLDS["high"],
+        RiskClassifier.TIER_THRESHOLDS["critical"],
+    ]
+)
+
+# Upper bound on regions x scenarios evaluated by a single sweep
+MAX_SWEEP_POINTS = 500_000
+
+# Resolution of the one-axis line search used for tier boundaries
+BOUNDARY_RESOLUTION = 201
+
 
 def apply_scenario(
     sub_indices: Dict[str, float],
@@ -118,22 +148,454 @@ def recompute_behavior_index_from_sub_indices(
     return max(0.0, min(1.0, behavior_index))
 
 
+def _build_compare_entry(
+    region_id: str,
+    region_name: str,
+    forecast_result: Dict,
+    include_explanations: bool,
+    scenario: Optional[Dict],
+) -> Dict:
+    """
+    Build the compare_regions result entry for one region's forecast.
+
+    Args:
+        region_id: Region identifier
+        region_name: Human-readable region name
+        forecast_result: Raw result from BehavioralForecaster.forecast()
+        include_explanations: Whether to include explanation objects
+        scenario: Optional scenario configuration with sub-index offsets
+
+    Returns:
+        Result entry dictionary
+    """
+    # Extract latest sub-indices for scenario adjustment if needed
+    # Note: forecast_result from BehavioralForecaster.forecast()
+    # returns raw dict
+    # History contains dict records with behavior_index and optional sub_indices
+    latest_sub_indices = None
+    if forecast_result.get("history") and len(forecast_result["history"]) > 0:
+        latest_history = forecast_result["history"][-1]
+        if isinstance(latest_history, dict) and "sub_indices" in latest_history:
+            sub_indices_data = latest_history["sub_indices"]
+            if isinstance(sub_indices_data, dict):
+                latest_sub_indices = {
+                    "economic_stress": sub_indices_data.get("economic_stress", 0.5),
+                    "environmental_stress": sub_indices_data.get(
+                        "environmental_stress", 0.5
+                    ),
+                    "mobility_activity": sub_indices_data.get("mobility_activity", 0.5),
+                    "digital_attention": sub_indices_data.get("digital_attention", 0.5),
+                    "public_health_stress": sub_indices_data.get(
+                        "public_health_stress", 0.5
+                    ),
+                }
+
+    # Apply scenario adjustments if provided
+    scenario_applied = False
+    scenario_description = None
+    if scenario and latest_sub_indices:
+        adjusted_sub_indices = apply_scenario(latest_sub_indices, scenario)
+
+        # Recompute behavior index with adjusted sub-indices
+        adjusted_behavior_index = recompute_behavior_index_from_sub_indices(
+            adjusted_sub_indices
+        )
+
+        # Update the latest history entry with adjusted values
+        # Note: We're modifying the dict in-place for scenario exploration
+        if forecast_result.get("history") and len(forecast_result["history"]) > 0:
+            latest_history = forecast_result["history"][-1]
+            if isinstance(latest_history, dict):
+                latest_history["behavior_index"] = adjusted_behavior_index
+                if "sub_indices" in latest_history and isinstance(
+                    latest_history["sub_indices"], dict
+                ):
+                    for key, value in adjusted_sub_indices.items():
+                        latest_history["sub_indices"][key] = value
+
+        scenario_applied = True
+        scenario_description = (
+            "Hypothetical what-if adjustment applied to sub-indices "
+            "for exploration purposes. This is not a forecast change "
+            "but a scenario exploration."
+        )
+
+    # Remove non-serializable objects from metadata before returning
+    # The _details_bundle is used internally but should not be serialized
+    if (
+        "metadata" in forecast_result
+        and "_details_bundle" in forecast_result["metadata"]
+    ):
+        forecast_result["metadata"] = {
+            k: v
+            for k, v in forecast_result["metadata"].items()
+            if k != "_details_bundle"
+        }
+
+    # Prepare result entry
+    result_entry = {
+        "region_id": region_id,
+        "region_name": region_name,
+        "forecast": forecast_result,
+    }
+
+    # Include explanations if requested
+    if include_explanations and "explanations" in forecast_result:
+        result_entry["explanations"] = forecast_result["explanations"]
+
+    # Add scenario metadata if applied
+    if scenario_applied:
+        result_entry["scenario_applied"] = True
+        result_entry["scenario_description"] = scenario_description
+
+    return result_entry
+
+
+def recompute_behavior_index_batch(
+    sub_index_matrix: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Vectorized recompute_behavior_index_from_sub_indices.
+
+    Mobility is inverted (lower activity = higher disruption), so the weighted
+    sum is evaluated as one matrix product with a signed weight vector plus a
+    constant term.
+
+    Args:
+        sub_index_matrix: Array of shape (..., 5) in SCENARIO_SUB_INDICES order
+        weights: Optional weights in the same order
+            (default: DEFAULT_SCENARIO_WEIGHTS)
+
+    Returns:
+        Behavior index array of shape (...), clipped to [0.0, 1.0]
+    """
+    if weights is None:
+        weights = DEFAULT_SCENARIO_WEIGHTS
+    mobility_col = SCENARIO_SUB_INDICES.index("mobility_activity")
+    signed = np.asarray(weights, dtype=float).copy()
+    constant = signed[mobility_col]
+    signed[mobility_col] = -signed[mobility_col]
+    return np.clip(sub_index_matrix @ signed + constant, 0.0, 1.0)
+
+
+def classify_tiers(behavior_index: np.ndarray) -> np.ndarray:
+    """
+    Map behavior index values to risk tier positions in RISK_TIER_NAMES.
+
+    Args:
+        behavior_index: Array of behavior index values
+
+    Returns:
+        Integer array of the same shape
+    """
+    return np.searchsorted(RISK_TIER_EDGES, behavior_index, side="right")
+
+
+def build_scenario_offsets(
+    offset_ranges: Dict[str, Sequence[float]],
+    method: str = "grid",
+    samples: int = 256,
+    seed: Optional[int] = None,
+) -> Tuple[List[str], np.ndarray, Optional[Tuple[int, ...]]]:
+    """
+    Build the scenario design as a matrix of sub-index offsets.
+
+    Args:
+        offset_ranges: Mapping of sub-index name to (min, max, steps); steps is
+            only used by the cartesian grid
+        method: "grid" for the full cartesian grid, "lhs" for a Latin-hypercube
+            sample
+        samples: Number of Latin-hypercube samples
+        seed: Optional random seed for reproducible samples
+
+    Returns:
+        Tuple of (axes, offsets, grid_shape) where offsets has shape
+        (scenarios, len(axes)) and grid_shape is None for "lhs"
+    """
+    if not offset_ranges:
+        raise ValueError("At least one offset range must be provided")
+
+    axes = []
+    bounds = []
+    for name, spec in offset_ranges.items():
+        if name not in SCENARIO_SUB_INDICES:
+            raise ValueError(f"Unknown sub-index for scenario sweep: {name}")
+        low, high = float(spec[0]), float(spec[1])
+        steps = int(spec[2]) if len(spec) > 2 else 5
+        if not (-1.0 <= low <= high <= 1.0):
+            raise ValueError(
+                f"Offset range for {name} must satisfy -1.0 <= min <= max <= 1.0"
+            )
+        if steps < 1:
+            raise ValueError(f"Offset steps for {name} must be at least 1")
+        axes.append(name)
+        bounds.append((low, high, steps))
+
+    if method == "grid":
+        grid_shape = tuple(steps for _, _, steps in bounds)
+        if int(np.prod(grid_shape)) > MAX_SWEEP_POINTS:
+            raise ValueError(
+                f"Scenario grid has {int(np.prod(grid_shape))} points; "
+                f"maximum is {MAX_SWEEP_POINTS}"
+            )
+        axis_values = [np.linspace(low, high, steps) for low, high, steps in bounds]
+        mesh = np.meshgrid(*axis_values, indexing="ij")
+        offsets = np.stack([m.ravel() for m in mesh], axis=1)
+        return axes, offsets, grid_shape
+
+    if method == "lhs":
+        if samples < 1 or samples > MAX_SWEEP_POINTS:
+            raise ValueError(f"samples must be between 1 and {MAX_SWEEP_POINTS}")
+        rng = np.random.default_rng(seed)
+        offsets = np.empty((samples, len(axes)))
+        for col, (low, high, _) in enumerate(bounds):
+            # One sample per stratum, strata shuffled independently per axis
+            strata = (rng.permutation(samples) + rng.random(samples)) / samples
+            offsets[:, col] = low + strata * (high - low)
+        return axes, offsets, None
+
+    raise ValueError(f"Unknown sweep method: {method} (expected 'grid' or 'lhs')")
+
+
+def _tier_boundaries(
+    base: np.ndarray,
+    baseline_tiers: np.ndarray,
+    axes: List[str],
+    offsets: np.ndarray,
+) -> List[Dict[str, Dict]]:
+    """
+    Find, per region and axis, the smallest offsets that change the risk tier.
+
+    Each axis is searched on its own (other offsets held at zero) along a fine
+    line in both directions, evaluated for all regions at once.
+    """
+    boundaries: List[Dict[str, Dict]] = [{} for _ in range(base.shape[0])]
+    for axis_pos, name in enumerate(axes):
+        col = SCENARIO_SUB_INDICES.index(name)
+        low = min(0.0, float(offsets[:, axis_pos].min()))
+        high = max(0.0, float(offsets[:, axis_pos].max()))
+
+        found = {}
+        for direction, limit in (("increase", high), ("decrease", low)):
+            if limit == 0.0:
+                found[direction] = (np.zeros(base.shape[0], dtype=bool), None, None)
+                continue
+            line = np.linspace(0.0, limit, BOUNDARY_RESOLUTION)[1:]
+            points = np.repeat(base[:, None, :], len(line), axis=1)
+            points[:, :, col] = np.clip(base[:, col, None] + line[None, :], 0.0, 1.0)
+            tiers = classify_tiers(recompute_behavior_index_batch(points))
+            changed = tiers != baseline_tiers[:, None]
+            first = changed.argmax(axis=1)
+            found[direction] = (
+                changed.any(axis=1),
+                line[first],
+                tiers[np.arange(base.shape[0]), first],
+            )
+
+        for row in range(base.shape[0]):
+            entry = {}
+            for direction in ("increase", "decrease"):
+                has, values, to_tiers = found[direction]
+                entry[direction] = (
+                    {
+                        "offset": float(values[row]),
+                        "to_tier": RISK_TIER_NAMES[int(to_tiers[row])],
+                    }
+                    if has[row]
+                    else None
+                )
+            boundaries[row][name] = entry
+    return boundaries
+
+
+def sweep_scenarios(
+    base_sub_indices: Dict[str, Dict[str, float]],
+    offset_ranges: Dict[str, Sequence[float]],
+    method: str = "grid",
+    samples: int = 256,
+    seed: Optional[int] = None,
+) -> Dict:
+    """
+    Evaluate a whole scenario design against many regions in one pass.
+
+    Instead of one apply_scenario/recompute call per (region, scenario), the
+    latest sub-index vectors of all regions are stacked into a matrix, every
+    scenario offset is broadcast onto it, and the behavior index surface is
+    computed as a single weighted matrix product.
+
+    Args:
+        base_sub_indices: Mapping of region_id to latest sub-index values
+        offset_ranges: Mapping of sub-index name to (min, max, steps)
+        method: "grid" (cartesian) or "lhs" (Latin-hypercube sample)
+        samples: Number of samples for "lhs"
+        seed: Optional random seed for "lhs"
+
+    Returns:
+        Dictionary with numpy arrays:
+        - region_ids: Row order of the per-region arrays
+        - axes: Sub-indices that vary, in offsets column order
+        - offsets: (scenarios, axes) offsets
+        - grid_shape: Shape of the cartesian grid, or None for "lhs"
+        - baseline_behavior_index / baseline_tiers: (regions,)
+        - behavior_index / tiers: (regions, scenarios) surfaces
+        - tier_change_fraction: (regions,) share of scenarios changing tier
+        - boundaries: per region, per axis smallest tier-changing offsets
+    """
+    if not base_sub_indices:
+        raise ValueError("At least one region must be provided")
+
+    axes, offsets, grid_shape = build_scenario_offsets(
+        offset_ranges, method=method, samples=samples, seed=seed
+    )
+
+    region_ids = list(base_sub_indices)
+    if len(region_ids) * len(offsets) > MAX_SWEEP_POINTS:
+        raise ValueError(
+            f"Sweep of {len(region_ids)} regions x {len(offsets)} scenarios "
+            f"exceeds {MAX_SWEEP_POINTS} points"
+        )
+
+    base = np.array(
+        [
+            [
+                float(base_sub_indices[region_id].get(name, 0.5))
+                for name in SCENARIO_SUB_INDICES
+            ]
+            for region_id in region_ids
+        ]
+    )
+
+    # Scatter the varying axes into full-width offset vectors
+    full_offsets = np.zeros((len(offsets), len(SCENARIO_SUB_INDICES)))
+    for axis_pos, name in enumerate(axes):
+        full_offsets[:, SCENARIO_SUB_INDICES.index(name)] = offsets[:, axis_pos]
+
+    adjusted = np.clip(base[:, None, :] + full_offsets[None, :, :], 0.0, 1.0)
+    behavior_index = recompute_behavior_index_batch(adjusted)
+    baseline_behavior_index = recompute_behavior_index_batch(base)
+
+    tiers = classify_tiers(behavior_index)
+    baseline_tiers = classify_tiers(baseline_behavior_index)
+
+    logger.info(
+        "Scenario sweep evaluated",
+        regions=len(region_ids),
+        scenarios=len(offsets),
+        method=method,
+    )
+
+    return {
+        "region_ids": region_ids,
+        "axes": axes,
+        "offsets": offsets,
+        "grid_shape": grid_shape,
+        "baseline_behavior_index": baseline_behavior_index,
+        "baseline_tiers": baseline_tiers,
+        "behavior_index": behavior_index,
+        "tiers": tiers,
+        "tier_change_fraction": (tiers != baseline_tiers[:, None]).mean(axis=1),
+        "boundaries": _tier_boundaries(base, baseline_tiers, axes, offsets),
+    }
+
+
+def load_latest_sub_indices(
+    region_ids: List[str],
+    historical_days: int = 30,
+) -> Tuple[Dict[str, Dict[str, float]], List[Dict]]:
+    """
+    Collect the latest sub-index vector for each region.
+
+    Regions already materialized by the background refresher are read from the
+    heatmap store; the rest are forecast concurrently.
+
+    Args:
+        region_ids: Region identifiers
+        historical_days: History window for regions that must be forecast
+
+    Returns:
+        Tuple of (region_id -> sub-index values, errors)
+    """
+    from app.core.heatmap_store import get_heatmap_store
+
+    base: Dict[str, Dict[str, float]] = {}
+    errors: List[Dict] = []
+
+    snapshot = get_heatmap_store().snapshot()
+    materialized = snapshot.to_state_data(snapshot.select_rows(region_ids=region_ids))
+    names_to_ids = {}
+
+    requests = {}
+    for region_id in region_ids:
+        region = get_region_by_id(region_id)
+        if region is None:
+            errors.append(
+                {"region_id": region_id, "error": f"Region not found: {region_id}"}
+            )
+            continue
+        names_to_ids[region.name] = region_id
+        if region.name in materialized:
+            continue
+        requests[region_id] = {
+            "latitude": region.latitude,
+            "longitude": region.longitude,
+            "region_name": region.name,
+            "days_back": historical_days,
+            "forecast_horizon": 7,
+        }
+
+    for region_name, values in materialized.items():
+        base[names_to_ids[region_name]] = {
+            name: values[name]
+            for name in SCENARIO_SUB_INDICES
+            if values.get(name) is not None
+        }
+
+    if requests:
+        batch = BehavioralForecaster().forecast_many(requests)
+        for region_id in requests:
+            history = batch["results"].get(region_id, {}).get("history") or []
+            if not history:
+                errors.append(
+                    {"region_id": region_id, "error": "No history data available"}
+                )
+                continue
+            latest = history[-1]
+            base[region_id] = {
+                name: float(latest[name])
+                for name in SCENARIO_SUB_INDICES
+                if latest.get(name) is not None
+            }
+
+    # Preserve request order
+    return {rid: base[rid] for rid in region_ids if rid in base}, errors
+
+
 def compare_regions(
     region_ids: List[str],
     historical_days: int = 30,
     forecast_horizon_days: int = 7,
     include_explanations: bool = True,
     scenario: Optional[Dict] = None,
+    max_workers: Optional[int] = None,
+    region_timeout_seconds: Optional[float] = None,
 ) -> Dict:
     """
     Generate forecasts for multiple regions and optionally apply scenario adjustments.
 
+    Regions are forecast concurrently through BehavioralForecaster.forecast_many,
+    so the comparison takes roughly the slowest region's latency. Regions that
+    fail or exceed the per-region timeout are reported in errors while the
+    remaining results are still returned.
+
     Args:
         region_ids: List of region IDs (e.g., ["us_dc", "us_mn", "city_nyc"])
         historical_days: Number of historical days to use (default: 30)
         forecast_horizon_days: Number of days to forecast ahead (default: 7)
         include_explanations: Whether to include explanation objects (default: True)
         scenario: Optional scenario configuration with sub-index offsets
+        max_workers: Optional bound on concurrent region forecasts
+        region_timeout_seconds: Optional per-region timeout in seconds
 
     Returns:
         Dictionary with:
@@ -148,118 +610,69 @@ def compare_regions(
     results = []
     errors = []
 
+    regions = {}
+    requests = {}
     for region_id in region_ids:
-        try:
-            region = get_region_by_id(region_id)
-            if region is None:
-                errors.append(
-                    {
-                        "region_id": region_id,
-                        "error": f"Region not found: {region_id}",
-                    }
-                )
-                continue
+        region = get_region_by_id(region_id)
+        if region is None:
+            continue
+        regions[region_id] = region
+        requests[region_id] = {
+            "latitude": region.latitude,
+            "longitude": region.longitude,
+            "region_name": region.name,
+            "days_back": historical_days,
+            "forecast_horizon": forecast_horizon_days,
+        }
+
+    # Generate forecasts using existing pipeline, all regions concurrently
+    batch = forecaster.forecast_many(
+        requests,
+        max_workers=max_workers,
+        timeout_seconds=region_timeout_seconds,
+    )
 
-            # Generate forecast using existing pipeline
-            forecast_result = forecaster.forecast(
-                latitude=region.latitude,
-                longitude=region.longitude,
-                region_name=region.name,
-                days_back=historical_days,
-                forecast_horizon=forecast_horizon_days,
+    # Assemble output in request order
+    for region_id in region_ids:
+        region = regions.get(region_id)
+        if region is None:
+            errors.append(
+                {
+                    "region_id": region_id,
+                    "error": f"Region not found: {region_id}",
+                }
             )
+            continue
 
-            # Extract latest sub-indices for scenario adjustment if needed
-            # Note: forecast_result from BehavioralForecaster.forecast()
-            # returns raw dict
-            # History contains dict records with behavior_index and optional sub_indices
-            latest_sub_indices = None
-            if forecast_result.get("history") and len(forecast_result["history"]) > 0:
-                latest_history = forecast_result["history"][-1]
-                if isinstance(latest_history, dict) and "sub_indices" in latest_history:
-                    sub_indices_data = latest_history["sub_indices"]
-                    if isinstance(sub_indices_data, dict):
-                        latest_sub_indices = {
-                            "economic_stress": sub_indices_data.get(
-                                "economic_stress", 0.5
-                            ),
-                            "environmental_stress": sub_indices_data.get(
-                                "environmental_stress", 0.5
-                            ),
-                            "mobility_activity": sub_indices_data.get(
-                                "mobility_activity", 0.5
-                            ),
-                            "digital_attention": sub_indices_data.get(
-                                "digital_attention", 0.5
-                            ),
-                            "public_health_stress": sub_indices_data.get(
-                                "public_health_stress", 0.5
-                            ),
-                        }
-
-            # Apply scenario adjustments if provided
-            scenario_applied = False
-            scenario_description = None
-            if scenario and latest_sub_indices:
-                adjusted_sub_indices = apply_scenario(latest_sub_indices, scenario)
-
-                # Recompute behavior index with adjusted sub-indices
-                adjusted_behavior_index = recompute_behavior_index_from_sub_indices(
-                    adjusted_sub_indices
-                )
-
-                # Update the latest history entry with adjusted values
-                # Note: We're modifying the dict in-place for scenario exploration
-                if (
-                    forecast_result.get("history")
-                    and len(forecast_result["history"]) > 0
-                ):
-                    latest_history = forecast_result["history"][-1]
-                    if isinstance(latest_history, dict):
-                        latest_history["behavior_index"] = adjusted_behavior_index
-                        if "sub_indices" in latest_history and isinstance(
-                            latest_history["sub_indices"], dict
-                        ):
-                            for key, value in adjusted_sub_indices.items():
-                                latest_history["sub_indices"][key] = value
-
-                scenario_applied = True
-                scenario_description = (
-                    "Hypothetical what-if adjustment applied to sub-indices "
-                    "for exploration purposes. This is not a forecast change "
-                    "but a scenario exploration."
-                )
-
-            # Remove non-serializable DataFrames from metadata before returning
-            # The _harmonized_df is used internally but should not be serialized
-            if (
-                "metadata" in forecast_result
-                and "_harmonized_df" in forecast_result["metadata"]
-            ):
-                forecast_result["metadata"] = {
-                    k: v
-                    for k, v in forecast_result["metadata"].items()
-                    if k != "_harmonized_df"
+        if region_id in batch["timed_out"]:
+            errors.append(
+                {
+                    "region_id": region_id,
+                    "error": "Forecast timed out",
+                    "timed_out": True,
                 }
+            )
+            continue
 
-            # Prepare result entry
-            result_entry = {
-                "region_id": region_id,
-                "region_name": region.name,
-                "forecast": forecast_result,
-            }
-
-            # Include explanations if requested
-            if include_explanations and "explanations" in forecast_result:
-                result_entry["explanations"] = forecast_result["explanations"]
-
-            # Add scenario metadata if applied
-            if scenario_applied:
-                result_entry["scenario_applied"] = True
-                result_entry["scenario_description"] = scenario_description
-
-            results.append(result_entry)
+        if region_id in batch["errors"]:
+            errors.append(
+                {
+                    "region_id": region_id,
+                    "error": batch["errors"][region_id],
+                }
+            )
+            continue
 
+        try:
+            results.append(
+                _build_compare_entry(
+                    region_id=region_id,
+                    region_name=region.name,
+                    forecast_result=batch["results"][region_id],
+                    include_explanations=include_explanations,
+                    scenario=scenario,
+                )
+            )
         except Exception as e:
             logger.error(
                 "Failed to generate forecast for region",
@@ -1,8 +1,13 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Behavioral forecasting engine using real-world public data."""
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import copy
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 import structlog
@@ -15,6 +20,22 @@ except ImportError:
     HAS_STATSMODELS = False
     ExponentialSmoothing = None
 
+from app.core.behavior_index import SubIndexDetailsBundle
+from app.core.fetch_orchestrator import (
+    PRIORITY_CORE,
+    PRIORITY_OPTIONAL,
+    PRIORITY_STANDARD,
+    FetchOrchestrator,
+    FetchTask,
+)
+from app.core.forecast_cache import (
+    FORECAST_CACHE_MIN_TTL_SECONDS,
+    ForecastCache,
+    get_forecast_cache,
+    source_freshness_ttl,
+)
+from app.core.memory_profile import MemoryProfiler
+from app.core.single_flight import get_single_flight
 from app.services.ingestion import (
     CISAKEVFetcher,
     CrimeSafetyStressFetcher,
@@ -46,6 +67,79 @@ logger = structlog.get_logger("core.prediction")
 # - Return an explicit "insufficient_history" flag in metadata
 MIN_HISTORY_DAYS = 14  # Minimum days of history required for stable forecasts
 
+# Multi-region forecasting defaults (see BehavioralForecaster.forecast_many)
+MULTI_FORECAST_MAX_WORKERS = int(os.getenv("FORECAST_MULTI_MAX_WORKERS", "4"))
+MULTI_FORECAST_TIMEOUT_SECONDS = float(
+    os.getenv("FORECAST_REGION_TIMEOUT_SECONDS", "60")
+)
+# Budget for batch preparation (GDELT planning and weather prefetch) before
+# any region starts; capped at a quarter of the per-region timeout
+MULTI_FORECAST_PREPARE_TIMEOUT_SECONDS = float(
+    os.getenv("FORECAST_MULTI_PREPARE_TIMEOUT_SECONDS", "5")
+)
+
+# Every fit projects at least this many days; cached fits serve any horizon up
+# to this length by slicing the stored path instead of re-running the pipeline
+MAX_PROJECTION_HORIZON = 30
+
+# Memory-lean pipeline: compute sub-indices in place and cache a narrow float32
+# detail frame instead of a full copy of the harmonized frame, with float32
+# sub-index columns in the cached history
+FORECAST_MEMORY_LEAN = os.getenv("FORECAST_MEMORY_LEAN", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Per-stage tracemalloc profiling (adds overhead; enable for diagnostics only)
+FORECAST_MEMORY_PROFILE = os.getenv("FORECAST_MEMORY_PROFILE", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Auto-select mode: fit the registry's candidate models on holdout splits and
+# forecast with the most accurate one per region (selection cached with a TTL)
+FORECAST_AUTO_SELECT = os.getenv("FORECAST_AUTO_SELECT", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Followers of an in-flight identical forecast wait at most this long for it
+FORECAST_SINGLE_FLIGHT_TIMEOUT_SECONDS = float(
+    os.getenv("FORECAST_SINGLE_FLIGHT_TIMEOUT_SECONDS", "120")
+)
+
+# Fetch priority classes (unlisted sources are PRIORITY_STANDARD). Core
+# sources wait for the full fetch deadline; optional ones give up earliest.
+FETCH_PRIORITIES = {
+    "market": PRIORITY_CORE,
+    "fred_consumer_sentiment": PRIORITY_CORE,
+    "fred_unemployment": PRIORITY_CORE,
+    "fred_jobless_claims": PRIORITY_CORE,
+    "fred_gdp_growth": PRIORITY_CORE,
+    "fred_cpi_inflation": PRIORITY_CORE,
+    "weather": PRIORITY_CORE,
+    "openstates": PRIORITY_OPTIONAL,
+    "cisa_kev": PRIORITY_OPTIONAL,
+    "owid": PRIORITY_OPTIONAL,
+    "usgs": PRIORITY_OPTIONAL,
+    "legislative": PRIORITY_OPTIONAL,
+    "enforcement": PRIORITY_OPTIONAL,
+    "political": PRIORITY_OPTIONAL,
+    "crime": PRIORITY_OPTIONAL,
+    "misinformation": PRIORITY_OPTIONAL,
+    "social_cohesion": PRIORITY_OPTIONAL,
+}
+
+# sources_status keys for fetch keys whose status entry is named differently
+FETCH_STATUS_KEYS = {
+    "search": "search_trends",
+    "openfema": "openfema_emergency_management",
+    "openstates": "openstates_legislative",
+    "mobility": "mobility_patterns",
+    "legislative": "gdelt_legislative",
+    "enforcement": "gdelt_enforcement",
+}
+
 
 class BehavioralForecaster:
     """
@@ -72,6 +166,11 @@ class BehavioralForecaster:
         misinformation_fetcher: Optional[MisinformationStressFetcher] = None,
         social_cohesion_fetcher: Optional[SocialCohesionStressFetcher] = None,
         harmonizer: Optional[DataHarmonizer] = None,
+        memory_lean: Optional[bool] = None,
+        memory_profile_hook: Optional[Callable[[str, Dict], None]] = None,
+        fetch_orchestrator: Optional[FetchOrchestrator] = None,
+        forecast_cache: Optional[ForecastCache] = None,
+        auto_select: Optional[bool] = None,
     ):
         """
         Initialize the behavioral forecaster.
@@ -95,7 +194,22 @@ class BehavioralForecaster:
             social_cohesion_fetcher: Social cohesion stress fetcher instance
                 (creates new if None)
             harmonizer: Data harmonizer instance (creates new if None)
+            memory_lean: Use the memory-lean pipeline (default:
+                FORECAST_MEMORY_LEAN)
+            memory_profile_hook: Optional callable receiving (region_name,
+                per-stage allocation report); enables tracemalloc profiling
+                (also enabled by FORECAST_MEMORY_PROFILE)
+            fetch_orchestrator: Deadline-bounded source fetch orchestrator
+                (creates new if None)
+            forecast_cache: Cache of fitted forecasts (default: the
+                process-wide cache shared by all forecasters)
+            auto_select: Forecast with the model auto-selected per region
+                from the model registry (default: FORECAST_AUTO_SELECT)
         """
+        self.memory_lean = FORECAST_MEMORY_LEAN if memory_lean is None else memory_lean
+        self.auto_select = FORECAST_AUTO_SELECT if auto_select is None else auto_select
+        self._memory_profile_hook = memory_profile_hook
+        self.fetch_orchestrator = fetch_orchestrator or FetchOrchestrator()
         self.market_fetcher = market_fetcher or MarketSentimentFetcher()
         self.fred_fetcher = fred_fetcher or FREDEconomicFetcher()
         self.weather_fetcher = weather_fetcher or EnvironmentalImpactFetcher()
@@ -139,28 +253,67 @@ class BehavioralForecaster:
         self.risk_classifier = RiskClassifier()
         self.forecast_monitor = ForecastMonitor()
         self.correlation_engine = CorrelationEngine()
-        # Use dict for LRU cache (Python 3.7+ dicts maintain insertion order)
-        self._cache: Dict[str, Tuple[pd.DataFrame, pd.DataFrame, Dict]] = {}
-
-        # Read cache size from env var if set
-        import os
-
-        cache_size_env = os.environ.get("FORECASTER_CACHE_MAX_SIZE")
-        self._max_cache_size: Optional[int] = (
-            int(cache_size_env) if cache_size_env else None
+        # Byte-bounded LRU cache; entries expire with their freshest source.
+        # Shared across instances so per-request forecasters reuse fits.
+        self._cache = (
+            forecast_cache if forecast_cache is not None else get_forecast_cache()
         )
 
         self._cache_lock = __import__("threading").Lock()
+        # Concurrent misses for the same cache key run the pipeline once,
+        # across instances as the cache is shared
+        self._inflight = get_single_flight("forecast")
+
+    @property
+    def _max_cache_size(self) -> Optional[int]:
+        """Entry-count limit of the forecast cache (None = byte budget only)."""
+        return self._cache.max_entries
+
+    @_max_cache_size.setter
+    def _max_cache_size(self, value: Optional[int]) -> None:
+        self._cache.max_entries = value
 
     def reset_cache(self) -> None:
         """
-        Reset all in-memory forecast caches used by this BehavioralForecaster.
+        Reset the forecast cache used by this BehavioralForecaster.
 
-        Intended for tests and process-lifetime reset paths.
+        The default cache is process-wide, so this drops cached fits for all
+        forecasters. Intended for tests and process-lifetime reset paths.
         """
         with self._cache_lock:
             self._cache.clear()
 
+    def _forecast_cache_ttl(
+        self, fetch_report: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> float:
+        """
+        TTL for a cached forecast, tied to the freshness of its inputs.
+
+        Args:
+            fetch_report: Per-source fetch outcomes of the forecast
+
+        Returns:
+            Seconds until the shortest-lived source cache turns over
+            (clamped to the forecast cache TTL bounds), or the minimum TTL
+            when a source missed the fetch deadline so the degraded result
+            is replaced soon
+        """
+        if fetch_report and any(
+            report["outcome"] in ("stale", "missing")
+            for report in fetch_report.values()
+        ):
+            return FORECAST_CACHE_MIN_TTL_SECONDS
+        return source_freshness_ttl(
+            [
+                duration
+                for duration in (
+                    getattr(fetcher, "cache_duration_minutes", None)
+                    for fetcher in vars(self).values()
+                )
+                if isinstance(duration, (int, float))
+            ]
+        )
+
     def _is_us_state(self, region_name: str) -> bool:
         """Check if region_name is a US state."""
         us_states = {
@@ -248,43 +401,131 @@ class BehavioralForecaster:
             - sources: List of public APIs used
             - metadata: Additional information about the forecast
         """
+        # Fitted state depends only on the data window; the horizon is applied
+        # by projecting the cached forecast path. region_id selects the state
+        # code for state-level sources, so it is part of the window.
         cache_key = (
-            f"{latitude:.4f},{longitude:.4f},{region_name},"
-            f"{days_back},{forecast_horizon}"
+            f"{latitude:.4f},{longitude:.4f},{region_name},{days_back},"
+            f"{region_id or ''}"
         )
 
+        cached = self._cached_forecast(cache_key, forecast_horizon)
+        if cached is not None:
+            return cached
+
+        def _generate() -> Dict:
+            return self._generate_forecast(
+                cache_key,
+                latitude,
+                longitude,
+                region_name,
+                days_back,
+                forecast_horizon,
+                region_id,
+            )
+
+        try:
+            result, is_leader = self._inflight.do(
+                cache_key, _generate, timeout=FORECAST_SINGLE_FLIGHT_TIMEOUT_SECONDS
+            )
+        except FutureTimeoutError:
+            logger.warning(
+                "Timed out waiting for in-flight forecast",
+                cache_key=cache_key,
+                timeout_seconds=FORECAST_SINGLE_FLIGHT_TIMEOUT_SECONDS,
+            )
+            return {
+                "history": [],
+                "forecast": [],
+                "sources": [],
+                "metadata": {
+                    "region_name": region_name,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "error": "Timed out waiting for in-flight forecast",
+                },
+                **self._empty_intelligence_data(),
+            }
+        if is_leader:
+            return result
+
+        # The leader cached its fit; serve this caller's horizon from it.
+        # Without a cache entry (failed or uncacheable fit) share the leader's
+        # result if it answers the same horizon, otherwise run our own.
+        cached = self._cached_forecast(cache_key, forecast_horizon)
+        if cached is not None:
+            return cached
+        if result.get("metadata", {}).get("forecast_horizon", forecast_horizon) == (
+            forecast_horizon
+        ):
+            return {**result, "metadata": dict(result.get("metadata", {}))}
+        return _generate()
+
+    def _cached_forecast(self, cache_key: str, forecast_horizon: int) -> Optional[Dict]:
+        """
+        Serve a forecast from the cache by projecting the cached path.
+
+        Args:
+            cache_key: Forecast cache key
+            forecast_horizon: Number of days to forecast ahead
+
+        Returns:
+            Forecast result dictionary, or None on a miss (or a cached path
+            shorter than the horizon)
+        """
         # Check cache with LRU access pattern
         with self._cache_lock:
-            if cache_key in self._cache:
-                logger.info("Using cached forecast", cache_key=cache_key)
-                # LRU: move accessed item to end (most recent)
-                history, forecast, metadata = self._cache.pop(cache_key)
-                self._cache[cache_key] = (history, forecast, metadata)
-                # Convert timestamps to ISO strings for API response
-                history_dict = history.copy()
-                if not history.empty and "timestamp" in history_dict.columns:
-                    history_dict["timestamp"] = history_dict["timestamp"].dt.strftime(
-                        "%Y-%m-%dT%H:%M:%S"
-                    )
-                forecast_dict = forecast.copy()
-                if not forecast.empty and "timestamp" in forecast_dict.columns:
-                    forecast_dict["timestamp"] = forecast_dict["timestamp"].dt.strftime(
-                        "%Y-%m-%dT%H:%M:%S"
-                    )
-                # Preserve harmonized_df in metadata for component extraction
-                # (will be removed in API layer)
-                return {
-                    "history": (
-                        history_dict.to_dict("records") if not history.empty else []
-                    ),
-                    "forecast": (
-                        forecast_dict.to_dict("records") if not forecast.empty else []
-                    ),
-                    "sources": metadata.get("sources", []),
-                    "metadata": metadata,
-                }
+            cached = self._cache.get(cache_key)
+            if cached is None or len(cached[1]) < forecast_horizon:
+                return None
+            logger.info(
+                "Using cached forecast",
+                cache_key=cache_key,
+                forecast_horizon=forecast_horizon,
+            )
+            history, forecast_path, metadata, intelligence_data = cached
+            forecast = self._project_forecast(forecast_path, forecast_horizon)
+            metadata = {**metadata, "forecast_horizon": forecast_horizon}
+            # Preserve the details bundle in metadata for component
+            # extraction (will be removed in API layer)
+            return {
+                "history": self._to_api_records(history),
+                "forecast": self._to_api_records(forecast),
+                "sources": metadata.get("sources", []),
+                "metadata": metadata,
+                # Callers may mutate the nested intelligence structures
+                **copy.deepcopy(intelligence_data),
+            }
 
+    def _generate_forecast(
+        self,
+        cache_key: str,
+        latitude: float,
+        longitude: float,
+        region_name: str,
+        days_back: int,
+        forecast_horizon: int,
+        region_id: Optional[str],
+    ) -> Dict:
+        """
+        Run the fetch, harmonize and fit pipeline and cache the fitted path.
+
+        Args:
+            cache_key: Forecast cache key for the fitted result
+            latitude: Latitude coordinate (-90 to 90)
+            longitude: Longitude coordinate (-180 to 180)
+            region_name: Human-readable region name
+            days_back: Number of historical days to use
+            forecast_horizon: Number of days to forecast ahead
+            region_id: Optional region identifier
+
+        Returns:
+            Forecast result dictionary (see forecast)
+        """
         sources = []
+        profiler = MemoryProfiler(
+            enabled=FORECAST_MEMORY_PROFILE or self._memory_profile_hook is not None
+        )
 
         try:
             logger.info(
@@ -309,264 +550,247 @@ class BehavioralForecaster:
                 else "United States"
             )
 
-            # Parallel fetch independent data sources using ThreadPoolExecutor
-            # This reduces latency from sequential network calls
+            # Fetch independent data sources concurrently under the per-forecast
+            # deadline; sources that miss it are served from their last good
+            # value (core sources get the full budget, optional ones less)
             fetch_results = {}
+            tasks: List[FetchTask] = []
 
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {}
+            def add_task(key: str, fn: Callable, *args, **kwargs) -> None:
+                priority = FETCH_PRIORITIES.get(key, PRIORITY_STANDARD)
+                tasks.append(FetchTask(key, partial(fn, *args, **kwargs), priority))
 
-                # Submit all independent fetch tasks
-                futures[
-                    executor.submit(
-                        self.market_fetcher.fetch_stress_index, days_back=days_back
-                    )
-                ] = "market"
-                futures[
-                    executor.submit(
-                        self.fred_fetcher.fetch_consumer_sentiment, days_back=days_back
-                    )
-                ] = "fred_consumer_sentiment"
-                futures[
-                    executor.submit(
-                        self.fred_fetcher.fetch_unemployment_rate, days_back=days_back
-                    )
-                ] = "fred_unemployment"
-                futures[
-                    executor.submit(
-                        self.fred_fetcher.fetch_jobless_claims, days_back=days_back
-                    )
-                ] = "fred_jobless_claims"
-                futures[
-                    executor.submit(self.fred_fetcher.fetch_gdp_growth, days_back=365)
-                ] = "fred_gdp_growth"
-                futures[
-                    executor.submit(
-                        self.fred_fetcher.fetch_cpi_inflation, days_back=365
-                    )
-                ] = "fred_cpi_inflation"
-                futures[
-                    executor.submit(
-                        self.weather_fetcher.fetch_regional_comfort,
-                        latitude,
-                        longitude,
-                        days_back,
-                    )
-                ] = "weather"
-                futures[
-                    executor.submit(
-                        self.search_fetcher.fetch_search_interest,
-                        "behavioral patterns",
-                        days_back,
-                        region_name,
-                    )
-                ] = "search"
-                futures[
-                    executor.submit(
-                        self.health_fetcher.fetch_health_risk_index,
-                        region_code_for_health,
-                        days_back,
-                    )
-                ] = "health"
-                futures[
-                    executor.submit(
-                        self.mobility_fetcher.fetch_mobility_index,
-                        latitude,
-                        longitude,
-                        region_code_for_mobility,
-                        days_back,
-                    )
-                ] = "mobility"
-                futures[
-                    executor.submit(
-                        self.gdelt_fetcher.fetch_event_tone, days_back=days_back
-                    )
-                ] = "gdelt"
-                futures[
-                    executor.submit(
-                        self.openfema_fetcher.fetch_disaster_declarations,
-                        region_name,
-                        days_back,
-                    )
-                ] = "openfema"
-                futures[
-                    executor.submit(
-                        self.openstates_fetcher.fetch_legislative_activity,
-                        region_name,
-                        days_back,
-                    )
-                ] = "openstates"
-                futures[
-                    executor.submit(
-                        self.nws_alerts_fetcher.fetch_weather_alerts,
-                        latitude,
-                        longitude,
-                        days_back,
-                    )
-                ] = "nws_alerts"
-                futures[
-                    executor.submit(
-                        self.cisa_kev_fetcher.fetch_kev_catalog, days_back=days_back
-                    )
-                ] = "cisa_kev"
-                futures[
-                    executor.submit(
-                        self.owid_fetcher.fetch_health_stress_index,
-                        country_name,
-                        days_back,
-                    )
-                ] = "owid"
-                futures[
-                    executor.submit(
-                        self.usgs_fetcher.fetch_earthquake_intensity,
-                        days_back=days_back,
-                    )
-                ] = "usgs"
-
-                # Additional fetchers that were sequential - add to parallel pool
-                # Determine state code for conditional fetchers
-                state_code = None
-                is_us_state = self._is_us_state(region_name)
-                if region_id and "_" in region_id:
-                    parts = region_id.split("_")
-                    if (
-                        len(parts) >= 2
-                        and parts[0].lower() == "us"
-                        and len(parts[1]) == 2
-                    ):
-                        state_code = parts[1].upper()
-                        is_us_state = True
-
-                # OpenAQ air quality
-                futures[
-                    executor.submit(
-                        self.openaq_fetcher.fetch_air_quality,
-                        latitude,
-                        longitude,
-                        50,
-                        days_back,
-                    )
-                ] = "air_quality"
-
-                # GDELT legislative and enforcement (additional calls)
-                futures[
-                    executor.submit(
-                        self.gdelt_fetcher.fetch_legislative_attention,
-                        region_name,
-                        days_back,
+            # Submit all independent fetch tasks
+            add_task(
+                "market", self.market_fetcher.fetch_stress_index, days_back=days_back
+            )
+            add_task(
+                "fred_consumer_sentiment",
+                self.fred_fetcher.fetch_consumer_sentiment,
+                days_back=days_back,
+            )
+            add_task(
+                "fred_unemployment",
+                self.fred_fetcher.fetch_unemployment_rate,
+                days_back=days_back,
+            )
+            add_task(
+                "fred_jobless_claims",
+                self.fred_fetcher.fetch_jobless_claims,
+                days_back=days_back,
+            )
+            add_task(
+                "fred_gdp_growth", self.fred_fetcher.fetch_gdp_growth, days_back=365
+            )
+            add_task(
+                "fred_cpi_inflation",
+                self.fred_fetcher.fetch_cpi_inflation,
+                days_back=365,
+            )
+            add_task(
+                "weather",
+                self.weather_fetcher.fetch_regional_comfort,
+                latitude,
+                longitude,
+                days_back,
+            )
+            add_task(
+                "search",
+                self.search_fetcher.fetch_search_interest,
+                "behavioral patterns",
+                days_back,
+                region_name,
+            )
+            add_task(
+                "health",
+                self.health_fetcher.fetch_health_risk_index,
+                region_code_for_health,
+                days_back,
+            )
+            add_task(
+                "mobility",
+                self.mobility_fetcher.fetch_mobility_index,
+                latitude,
+                longitude,
+                region_code_for_mobility,
+                days_back,
+            )
+            add_task("gdelt", self.gdelt_fetcher.fetch_event_tone, days_back=days_back)
+
+            # Determine state code for conditional fetchers
+            state_code = None
+            is_us_state = self._is_us_state(region_name)
+            if region_id and "_" in region_id:
+                parts = region_id.split("_")
+                if len(parts) >= 2 and parts[0].lower() == "us" and len(parts[1]) == 2:
+                    state_code = parts[1].upper()
+                    is_us_state = True
+
+            add_task(
+                "openfema",
+                self.openfema_fetcher.fetch_disaster_declarations,
+                region_name,
+                days_back,
+            )
+            add_task(
+                "openstates",
+                self.openstates_fetcher.fetch_legislative_activity,
+                region_name,
+                days_back,
+            )
+            add_task(
+                "nws_alerts",
+                self.nws_alerts_fetcher.fetch_weather_alerts,
+                latitude,
+                longitude,
+                days_back,
+                # US states read the nationwide alerts index (national feed mode)
+                state_code=state_code,
+            )
+            add_task(
+                "cisa_kev", self.cisa_kev_fetcher.fetch_kev_catalog, days_back=days_back
+            )
+            add_task(
+                "owid",
+                self.owid_fetcher.fetch_health_stress_index,
+                country_name,
+                days_back,
+            )
+            add_task(
+                "usgs",
+                self.usgs_fetcher.fetch_earthquake_intensity,
+                days_back=days_back,
+                # Regional radius query over the cached global feed
+                latitude=latitude,
+                longitude=longitude,
+            )
+
+            # Additional fetchers that were sequential - add to parallel pool
+            # OpenAQ air quality
+            add_task(
+                "air_quality",
+                self.openaq_fetcher.fetch_air_quality,
+                latitude,
+                longitude,
+                50,
+                days_back,
+            )
+
+            # GDELT legislative and enforcement (additional calls)
+            add_task(
+                "legislative",
+                self.gdelt_fetcher.fetch_legislative_attention,
+                region_name,
+                days_back,
+            )
+            add_task(
+                "enforcement",
+                self.gdelt_fetcher.fetch_enforcement_attention,
+                region_name,
+                days_back,
+            )
+
+            # State-specific fetchers (if US state)
+            if is_us_state and state_code:
+                add_task(
+                    "eia_fuel",
+                    self.eia_fuel_fetcher.fetch_fuel_stress_index,
+                    state_code,
+                    days_back,
+                )
+                add_task(
+                    "drought",
+                    self.drought_fetcher.fetch_drought_stress_index,
+                    state_code,
+                    days_back,
+                )
+                add_task(
+                    "storm",
+                    self.storm_fetcher.fetch_storm_stress_indices,
+                    region_name,
+                    days_back,
+                )
+            else:
+                # Pre-set empty results for non-US states
+                fetch_results["eia_fuel"] = (pd.DataFrame(), None)
+                fetch_results["drought"] = pd.DataFrame()
+                fetch_results["storm"] = pd.DataFrame()
+
+            # Political, crime, misinformation, social cohesion (if US state)
+            if is_us_state:
+                add_task(
+                    "political",
+                    self.political_fetcher.calculate_political_stress,
+                    region_name,
+                    days_back,
+                )
+                add_task(
+                    "crime",
+                    self.crime_fetcher.calculate_crime_stress,
+                    region_name,
+                    days_back,
+                )
+                add_task(
+                    "misinformation",
+                    self.misinformation_fetcher.calculate_misinformation_stress,
+                    region_name,
+                    days_back,
+                )
+                add_task(
+                    "social_cohesion",
+                    self.social_cohesion_fetcher.calculate_social_cohesion_stress,
+                    region_name,
+                    days_back,
+                )
+            else:
+                # Pre-set empty results for non-US states
+                fetch_results["political"] = pd.DataFrame()
+                fetch_results["crime"] = pd.DataFrame()
+                fetch_results["misinformation"] = pd.DataFrame()
+                fetch_results["social_cohesion"] = pd.DataFrame()
+
+            # Core sources are submitted first and get the most budget
+            fetched, fetch_report = self.fetch_orchestrator.run(tasks, scope=cache_key)
+            fetch_results.update(fetched)
+
+            for key, report in fetch_report.items():
+                if report["outcome"] in ("ok", "stale"):
+                    continue
+                if report["outcome"] == "error":
+                    logger.warning(
+                        "Failed to fetch data source",
+                        source=key,
+                        error=report["error"],
                     )
-                ] = "legislative"
-                futures[
-                    executor.submit(
-                        self.gdelt_fetcher.fetch_enforcement_attention,
-                        region_name,
-                        days_back,
+                error_type = (
+                    "exception" if report["outcome"] == "error" else "deadline_exceeded"
+                )
+                error_detail = report.get("error", "Missed forecast fetch deadline")
+                # Return appropriate empty value based on expected return type
+                if key in [
+                    "search",
+                    "gdelt",
+                    "openfema",
+                    "openstates",
+                    "nws_alerts",
+                    "cisa_kev",
+                ]:
+                    from app.services.ingestion.gdelt_events import SourceStatus
+
+                    fetch_results[key] = (
+                        pd.DataFrame(),
+                        SourceStatus(
+                            provider=key,
+                            ok=False,
+                            error_type=error_type,
+                            error_detail=error_detail[:100],
+                            fetched_at=datetime.now().isoformat(),
+                            rows=0,
+                            query_window_days=days_back,
+                        ),
                     )
-                ] = "enforcement"
-
-                # State-specific fetchers (if US state)
-                if is_us_state and state_code:
-                    futures[
-                        executor.submit(
-                            self.eia_fuel_fetcher.fetch_fuel_stress_index,
-                            state_code,
-                            days_back,
-                        )
-                    ] = "eia_fuel"
-                    futures[
-                        executor.submit(
-                            self.drought_fetcher.fetch_drought_stress_index,
-                            state_code,
-                            days_back,
-                        )
-                    ] = "drought"
-                    futures[
-                        executor.submit(
-                            self.storm_fetcher.fetch_storm_stress_indices,
-                            region_name,
-                            days_back,
-                        )
-                    ] = "storm"
                 else:
-                    # Pre-set empty results for non-US states
-                    fetch_results["eia_fuel"] = (pd.DataFrame(), None)
-                    fetch_results["drought"] = pd.DataFrame()
-                    fetch_results["storm"] = pd.DataFrame()
-
-                # Political, crime, misinformation, social cohesion (if US state)
-                if is_us_state:
-                    futures[
-                        executor.submit(
-                            self.political_fetcher.calculate_political_stress,
-                            region_name,
-                            days_back,
-                        )
-                    ] = "political"
-                    futures[
-                        executor.submit(
-                            self.crime_fetcher.calculate_crime_stress,
-                            region_name,
-                            days_back,
-                        )
-                    ] = "crime"
-                    futures[
-                        executor.submit(
-                            self.misinformation_fetcher.calculate_misinformation_stress,
-                            region_name,
-                            days_back,
-                        )
-                    ] = "misinformation"
-                    futures[
-                        executor.submit(
-                            self.social_cohesion_fetcher.calculate_social_cohesion_stress,
-                            region_name,
-                            days_back,
-                        )
-                    ] = "social_cohesion"
-                else:
-                    # Pre-set empty results for non-US states
-                    fetch_results["political"] = pd.DataFrame()
-                    fetch_results["crime"] = pd.DataFrame()
-                    fetch_results["misinformation"] = pd.DataFrame()
-                    fetch_results["social_cohesion"] = pd.DataFrame()
-
-                # Collect results as they complete
-                for future in as_completed(futures):
-                    key = futures[future]
-                    try:
-                        result = future.result()
-                        fetch_results[key] = result
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to fetch data source",
-                            source=key,
-                            error=str(e)[:200],
-                        )
-                        # Return appropriate empty value based on expected return type
-                        if key in [
-                            "search",
-                            "gdelt",
-                            "openfema",
-                            "openstates",
-                            "nws_alerts",
-                            "cisa_kev",
-                        ]:
-                            from app.services.ingestion.gdelt_events import SourceStatus
-
-                            fetch_results[key] = (
-                                pd.DataFrame(),
-                                SourceStatus(
-                                    provider=key,
-                                    ok=False,
-                                    error_type="exception",
-                                    error_detail=str(e)[:100],
-                                    fetched_at=datetime.now().isoformat(),
-                                    rows=0,
-                                    query_window_days=days_back,
-                                ),
-                            )
-                        else:
-                            fetch_results[key] = pd.DataFrame()
+                    fetch_results[key] = pd.DataFrame()
 
             # Extract results
             market_data = fetch_results.get("market", pd.DataFrame())
@@ -875,6 +1099,7 @@ class BehavioralForecaster:
                     },
                 }
 
+            profiler.checkpoint("fetch")
             harmonized = self.harmonizer.harmonize(
                 market_data=market_data,
                 fred_consumer_sentiment=fred_consumer_sentiment,
@@ -903,6 +1128,7 @@ class BehavioralForecaster:
                 storm_data=storm_data if not storm_data.empty else None,
             )
 
+            profiler.checkpoint("harmonize")
             if harmonized.empty or "behavior_index" not in harmonized.columns:
                 logger.warning("Harmonized data is empty or missing behavior_index")
                 return {
@@ -1020,7 +1246,7 @@ class BehavioralForecaster:
                 # Recompute behavior_index to reflect adjusted stress values
                 harmonized = (
                     self.harmonizer.behavior_index_computer.compute_behavior_index(
-                        harmonized
+                        harmonized, inplace=self.memory_lean
                     )
                 )
 
@@ -1099,13 +1325,15 @@ class BehavioralForecaster:
 
                         # Recompute behavior_index to reflect adjusted stress values
                         harmonized = self.harmonizer.behavior_index_computer.compute_behavior_index(
-                            harmonized
+                            harmonized, inplace=self.memory_lean
                         )
                 except Exception as e:
                     logger.warning(
                         "Failed to apply shock multiplier to sub-indices", error=str(e)
                     )
 
+            profiler.checkpoint("behavior_index")
+
             # Prepare history data with sub-indices
             # Keep full harmonized DataFrame for component extraction
             # (store in metadata)
@@ -1125,16 +1353,25 @@ class BehavioralForecaster:
                 col for col in sub_index_cols if col in harmonized.columns
             ]
             history = harmonized[history_cols].copy()
-
-            # Preserve the full harmonized DataFrame
-            # (with component metadata in attrs) for API extraction
-            # We'll attach it to metadata temporarily
-            harmonized_for_details = harmonized.copy()
+            if self.memory_lean:
+                # Sub-indices are only reported, so the cached history keeps
+                # them as float32; behavior_index stays float64 for the fit
+                lean_cols = history_cols[2:]
+                history[lean_cols] = history[lean_cols].astype("float32")
+
+            # Keep only the columns and component metadata (attrs) needed for
+            # API detail extraction, as a columnar bundle; the wide harmonized
+            # frame is not reused below. Lean mode stores values as float32
+            details_bundle = SubIndexDetailsBundle.from_frame(
+                harmonized, dtype="float32" if self.memory_lean else "float64"
+            )
+            del harmonized
             # Normalize timestamps to timezone-naive UTC
             history["timestamp"] = pd.to_datetime(history["timestamp"], utc=True)
             if history["timestamp"].dt.tz is not None:
                 history["timestamp"] = history["timestamp"].dt.tz_localize(None)
             history = history.sort_values("timestamp").reset_index(drop=True)
+            profiler.checkpoint("history")
 
             # Window integrity: Ensure we have enough data points for forecasting
             # MIN_HISTORY_DAYS defines the minimum viable history window for stable forecasts.
@@ -1249,9 +1486,21 @@ class BehavioralForecaster:
                     },
                 }
 
-            # Fit Exponential Smoothing (Holt-Winters) model
+            # Fit Exponential Smoothing (Holt-Winters) model. The fitted path is
+            # always projected to MAX_PROJECTION_HORIZON so that cached state
+            # can serve any shorter horizon without a refit.
+            projection_steps = max(forecast_horizon, MAX_PROJECTION_HORIZON)
             try:
-                if not HAS_STATSMODELS:
+                auto_selection = (
+                    self._forecast_auto(
+                        behavior_ts, projection_steps, region_id or region_name
+                    )
+                    if self.auto_select
+                    else None
+                )
+                if auto_selection is not None:
+                    forecast_result, std_error, auto_metadata = auto_selection
+                elif not HAS_STATSMODELS:
                     logger.warning(
                         "statsmodels not available, using simple moving average"
                     )
@@ -1298,7 +1547,7 @@ class BehavioralForecaster:
                             last_date = pd.Timestamp(last_date)
                         forecast_dates = pd.date_range(
                             start=last_date + pd.Timedelta(days=1),
-                            periods=forecast_horizon,
+                            periods=projection_steps,
                             freq="D",
                             tz=None,
                         )
@@ -1308,13 +1557,13 @@ class BehavioralForecaster:
                         )
                         forecast_dates = pd.date_range(
                             start=pd.Timestamp.now(),
-                            periods=forecast_horizon,
+                            periods=projection_steps,
                             freq="D",
                             tz=None,
                         )
 
                     forecast_values = []
-                    for i in range(1, forecast_horizon + 1):
+                    for i in range(1, projection_steps + 1):
                         value = last_value + trend * i
                         # Clamp to valid range
                         value = max(0.0, min(1.0, float(value)))
@@ -1350,7 +1599,7 @@ class BehavioralForecaster:
 
                     # Generate forecast with error handling
                     try:
-                        forecast_result = model.forecast(steps=forecast_horizon)
+                        forecast_result = model.forecast(steps=projection_steps)
                     except Exception as e:
                         logger.warning(
                             "Model forecast failed, using fallback", error=str(e)
@@ -1361,7 +1610,7 @@ class BehavioralForecaster:
                             if len(behavior_ts) > 0 and pd.notna(behavior_ts.iloc[-1])
                             else 0.5
                         )
-                        forecast_result = pd.Series([last_val] * forecast_horizon)
+                        forecast_result = pd.Series([last_val] * projection_steps)
 
                     # Validate forecast_result
                     if (
@@ -1374,7 +1623,7 @@ class BehavioralForecaster:
                             if len(behavior_ts) > 0 and pd.notna(behavior_ts.iloc[-1])
                             else 0.5
                         )
-                        forecast_result = pd.Series([last_val] * forecast_horizon)
+                        forecast_result = pd.Series([last_val] * projection_steps)
 
                     # Ensure forecast values are valid
                     forecast_result = pd.to_numeric(
@@ -1409,7 +1658,7 @@ class BehavioralForecaster:
                             last_date = pd.Timestamp(last_date)
                         forecast_dates = pd.date_range(
                             start=last_date + timedelta(days=1),
-                            periods=forecast_horizon,
+                            periods=projection_steps,
                             freq="D",
                             tz=None,
                         )
@@ -1417,19 +1666,19 @@ class BehavioralForecaster:
                     logger.warning("Failed to generate forecast dates", error=str(e))
                     forecast_dates = pd.date_range(
                         start=pd.Timestamp.now(),
-                        periods=forecast_horizon,
+                        periods=projection_steps,
                         freq="D",
                         tz=None,
                     )
 
                 # Ensure forecast_result has correct length
-                if len(forecast_result) != forecast_horizon:
+                if len(forecast_result) != projection_steps:
                     logger.warning(
-                        f"Forecast length mismatch: expected {forecast_horizon}, "
+                        f"Forecast length mismatch: expected {projection_steps}, "
                         f"got {len(forecast_result)}"
                     )
-                    if len(forecast_result) > forecast_horizon:
-                        forecast_result = forecast_result[:forecast_horizon]
+                    if len(forecast_result) > projection_steps:
+                        forecast_result = forecast_result[:projection_steps]
                     else:
                         last_val = (
                             float(forecast_result.iloc[-1])
@@ -1441,7 +1690,7 @@ class BehavioralForecaster:
                                 forecast_result,
                                 pd.Series(
                                     [last_val]
-                                    * (forecast_horizon - len(forecast_result))
+                                    * (projection_steps - len(forecast_result))
                                 ),
                             ]
                         )
@@ -1461,10 +1710,10 @@ class BehavioralForecaster:
                     # Fallback: create minimal forecast
                     forecast_df = pd.DataFrame(
                         {
-                            "timestamp": forecast_dates[:forecast_horizon],
-                            "prediction": [0.5] * forecast_horizon,
-                            "lower_bound": [0.4] * forecast_horizon,
-                            "upper_bound": [0.6] * forecast_horizon,
+                            "timestamp": forecast_dates[:projection_steps],
+                            "prediction": [0.5] * projection_steps,
+                            "lower_bound": [0.4] * projection_steps,
+                            "upper_bound": [0.6] * projection_steps,
                         }
                     )
 
@@ -1490,13 +1739,16 @@ class BehavioralForecaster:
                 forecast_df = forecast_df.sort_values("timestamp").reset_index(
                     drop=True
                 )
+                forecast_path_df = forecast_df
+                forecast_df = self._project_forecast(forecast_path_df, forecast_horizon)
 
                 # Prepare metadata
-                model_type = (
-                    "Moving Average + Trend"
-                    if not HAS_STATSMODELS
-                    else "ExponentialSmoothing (Holt-Winters)"
-                )
+                if auto_selection is not None:
+                    model_type = f"Auto-selected ({auto_metadata['model']})"
+                elif not HAS_STATSMODELS:
+                    model_type = "Moving Average + Trend"
+                else:
+                    model_type = "ExponentialSmoothing (Holt-Winters)"
                 metadata = {
                     "region_name": region_name,
                     "latitude": latitude,
@@ -1507,8 +1759,10 @@ class BehavioralForecaster:
                     "model_type": model_type,
                     "confidence_level": 0.95,
                     "sources": sources,
-                    "_harmonized_df": harmonized_for_details,  # Store for extraction
+                    "_details_bundle": details_bundle,  # Store for extraction
                 }
+                if auto_selection is not None:
+                    metadata["auto_select"] = auto_metadata
                 # Add source status metadata
                 sources_status_dict = {
                     "gdelt": gdelt_status.to_dict(),
@@ -1532,20 +1786,34 @@ class BehavioralForecaster:
                     sources_status_dict["gdelt_enforcement"] = (
                         enforcement_status.to_dict()
                     )
-                    metadata["sources_status"] = sources_status_dict
-
-                    # Guardrail: Detect if behavior_index is suspiciously all zeros when sources have data
-                    # This indicates a pipeline bug, not real-world conditions
-                    max_bi = (
-                        float(history["behavior_index"].max())
-                        if not history.empty and "behavior_index" in history.columns
-                        else 0.0
+                # Flag sources that missed the fetch deadline
+                for key, report in fetch_report.items():
+                    if report["outcome"] not in ("stale", "missing"):
+                        continue
+                    status_key = FETCH_STATUS_KEYS.get(key, key)
+                    entry = sources_status_dict.setdefault(
+                        status_key,
+                        {"provider": key, "ok": report["outcome"] == "stale"},
                     )
-                    has_source_data = any(
-                        status.get("ok", False) and status.get("rows", 0) > 0
-                        for status in sources_status_dict.values()
-                        if isinstance(status, dict)
+                    entry["deadline_exceeded"] = True
+                    entry["served_from"] = (
+                        "last_good" if report["outcome"] == "stale" else "empty"
                     )
+                    entry["last_good_at"] = report.get("last_good_at")
+                metadata["sources_status"] = sources_status_dict
+
+                # Guardrail: Detect if behavior_index is suspiciously all zeros when sources have data
+                # This indicates a pipeline bug, not real-world conditions
+                max_bi = (
+                    float(history["behavior_index"].max())
+                    if not history.empty and "behavior_index" in history.columns
+                    else 0.0
+                )
+                has_source_data = any(
+                    status.get("ok", False) and status.get("rows", 0) > 0
+                    for status in sources_status_dict.values()
+                    if isinstance(status, dict)
+                )
 
                 if (
                     max_bi == 0.0
@@ -1654,19 +1922,6 @@ class BehavioralForecaster:
                         "enforcement_attention"
                     ] = max_enforcement_attention
 
-                # Cache result with LRU eviction
-                with self._cache_lock:
-                    self._cache[cache_key] = (history, forecast_df, metadata)
-
-                    # Enforce cache size limit (LRU eviction)
-                    if (
-                        self._max_cache_size is not None
-                        and len(self._cache) > self._max_cache_size
-                    ):
-                        # Remove oldest entry (first key in dict)
-                        oldest_key = next(iter(self._cache))
-                        del self._cache[oldest_key]
-
                 logger.info(
                     "Forecast generated successfully",
                     region_name=region_name,
@@ -1677,31 +1932,48 @@ class BehavioralForecaster:
                     ),
                 )
 
-                # Convert timestamps to ISO strings for API response
-                history_dict = history.copy()
-                history_dict["timestamp"] = history_dict["timestamp"].dt.strftime(
-                    "%Y-%m-%dT%H:%M:%S"
-                )
-                forecast_dict = forecast_df.copy()
-                forecast_dict["timestamp"] = forecast_dict["timestamp"].dt.strftime(
-                    "%Y-%m-%dT%H:%M:%S"
-                )
-
-                # Store harmonized DataFrame (with component metadata) for extraction
-                # Attach to metadata so API can extract component details
-                # Note: This will be removed in the API layer before JSON serialization
-                metadata["_harmonized_df"] = harmonized_for_details
+                profiler.checkpoint("model")
 
                 # Intelligence Layer Analysis
-                intelligence_data = self._analyze_intelligence(
-                    history, harmonized_for_details
-                )
+                intelligence_data = self._analyze_intelligence(history, details_bundle)
 
+                # Cache result (LRU eviction within the byte/entry budget); the
+                # intelligence output depends only on history, so hits reuse a
+                # copy kept apart from the one returned below
+                with self._cache_lock:
+                    self._cache.put(
+                        cache_key,
+                        (
+                            history,
+                            forecast_path_df,
+                            metadata,
+                            copy.deepcopy(intelligence_data),
+                        ),
+                        ttl_seconds=self._forecast_cache_ttl(fetch_report),
+                    )
+
+                # Convert timestamps to ISO strings for API response
+                history_records = self._to_api_records(history)
+                forecast_records = self._to_api_records(forecast_df)
+                profiler.checkpoint("response")
+
+                # The details bundle stays in metadata so the API can extract
+                # component details; the API layer pops it before serialization,
+                # so return a copy to keep it in the cached entry
+                response_metadata = dict(metadata)
+                if profiler.enabled:
+                    # Only this run's response carries its profile, not the
+                    # cached entry that later hits are served from
+                    response_metadata["memory_profile"] = profiler.stop()
+                    if self._memory_profile_hook is not None:
+                        self._memory_profile_hook(
+                            region_name, response_metadata["memory_profile"]
+                        )
                 return {
-                    "history": history_dict.to_dict("records"),
-                    "forecast": forecast_dict.to_dict("records"),
+                    "history": history_records,
+                    "forecast": forecast_records,
                     "sources": sources,
-                    "metadata": metadata,
+                    "metadata": response_metadata,
                     **intelligence_data,  # Add intelligence layer data
                 }
 
@@ -1742,9 +2014,326 @@ class BehavioralForecaster:
                 },
                 **self._empty_intelligence_data(),  # Add empty intelligence data
             }
+        finally:
+            profiler.stop()
+
+    @staticmethod
+    def _forecast_auto(
+        behavior_ts: pd.Series, steps: int, region_key: str
+    ) -> Optional[Tuple[pd.Series, float, Dict[str, Any]]]:
+        """
+        Forecast the behavior index with the region's auto-selected model.
+
+        Args:
+            behavior_ts: Behavior index series indexed by timestamp
+            steps: Number of days to project
+            region_key: Region identifier for the selection cache and the
+                winner's per-region fitted state
+
+        Returns:
+            Tuple of (forecast series, std error, auto-select metadata with the
+            winning model name and, for stateful models, its fit mode), or
+            None if selection or the fit failed (the caller then fits the
+            default model)
+        """
+        from app.core.model_registry import get_registry
+
+        try:
+            result = get_registry().forecast_auto(behavior_ts, steps, region_key)
+        except Exception as e:
+            logger.warning(
+                "Auto-selected forecast failed, using default model",
+                region=region_key,
+                error=str(e)[:200],
+            )
+            return None
+        metadata = result.get("metadata", {})
+        std_error = result.get("std_error")
+        if std_error is None or pd.isna(std_error) or std_error <= 0:
+            std_error = 0.1
+        auto_metadata = {
+            "model": metadata.get("model"),
+            **metadata.get("auto_select", {}),
+        }
+        if "fit_mode" in metadata:
+            auto_metadata["fit_mode"] = metadata["fit_mode"]
+        return (
+            pd.Series(result["prediction"]),
+            max(0.01, min(0.5, float(std_error))),
+            auto_metadata,
+        )
+
+    @staticmethod
+    def _to_api_records(df: pd.DataFrame) -> List[Dict]:
+        """
+        Convert a frame to API records with ISO timestamp strings.
+
+        Formats only the timestamp column rather than copying the frame, so
+        cached frames are serialized without extra DataFrame copies.
+
+        Args:
+            df: History or forecast frame
+
+        Returns:
+            List of record dictionaries
+        """
+        if df.empty:
+            return []
+        records = df.to_dict("records")
+        if "timestamp" in df.columns:
+            timestamps = df["timestamp"].dt.strftime("%Y-%m-%dT%H:%M:%S")
+            for record, timestamp in zip(records, timestamps):
+                record["timestamp"] = timestamp
+        return records
+
+    @staticmethod
+    def _project_forecast(forecast_path: pd.DataFrame, horizon: int) -> pd.DataFrame:
+        """
+        Project a cached forecast path to the requested horizon.
+
+        Holt-Winters and trend forecasts for h steps are the first h steps of
+        any longer forecast from the same fit, so a stored path serves every
+        shorter horizon.
+
+        Args:
+            forecast_path: Forecast DataFrame of at least `horizon` rows
+            horizon: Number of days to return
+
+        Returns:
+            Forecast DataFrame with `horizon` rows
+        """
+        return forecast_path.iloc[:horizon].reset_index(drop=True)
+
+    def forecast_many(
+        self,
+        requests: Dict[str, Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate forecasts for several regions concurrently.
+
+        Regions run on a bounded thread pool so an N-region request takes
+        roughly the slowest region's latency instead of the sum. Each region
+        gets its own timeout, measured from when its forecast starts running;
+        regions that exceed it are reported as timed out and the remaining
+        results are returned (partial results). Batch preparation runs first
+        under a small separate budget, so the whole batch stays close to one
+        region timeout.
+
+        Args:
+            requests: Mapping of caller-chosen key (e.g. region_id) to keyword
+                arguments for forecast() (latitude, longitude, region_name, ...)
+            max_workers: Maximum concurrent forecasts
+                (default: FORECAST_MULTI_MAX_WORKERS or 4)
+            timeout_seconds: Per-region timeout in seconds
+                (default: FORECAST_REGION_TIMEOUT_SECONDS or 60)
+
+        Returns:
+            Dictionary containing:
+            - results: key -> forecast() result for regions that completed
+            - errors: key -> error message for regions that raised
+            - timed_out: keys of regions that exceeded the timeout
+            - elapsed_seconds: wall-clock time for the whole batch
+        """
+        max_workers = max_workers or MULTI_FORECAST_MAX_WORKERS
+        timeout_seconds = (
+            timeout_seconds
+            if timeout_seconds is not None
+            else MULTI_FORECAST_TIMEOUT_SECONDS
+        )
+
+        results: Dict[str, Dict] = {}
+        errors: Dict[str, str] = {}
+        timed_out = []
+        batch_start = time.monotonic()
+
+        if not requests:
+            return {
+                "results": results,
+                "errors": errors,
+                "timed_out": timed_out,
+                "elapsed_seconds": 0.0,
+            }
+
+        # Preparation only warms caches, so a slow Open-Meteo batch or GDELT
+        # plan gets a small budget instead of holding every region back
+        self._run_with_timeout(
+            "prepare",
+            self._prepare_batch,
+            requests,
+            min(MULTI_FORECAST_PREPARE_TIMEOUT_SECONDS, timeout_seconds / 4),
+        )
+        started_at: Dict[str, float] = {}
+
+        def _run(key: str, kwargs: Dict[str, Any]) -> Dict:
+            started_at[key] = time.monotonic()
+            return self.forecast(**kwargs)
+
+        # Not used as a context manager: exiting would block on timed-out
+        # forecasts, which is exactly what this helper must avoid.
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(requests))),
+            thread_name_prefix="forecast-many",
+        )
+        try:
+            pending = {
+                executor.submit(_run, key, kwargs): key
+                for key, kwargs in requests.items()
+            }
+            while pending:
+                now = time.monotonic()
+                # Only running forecasts consume their timeout budget
+                deadlines = [
+                    started_at[key] + timeout_seconds
+                    for key in pending.values()
+                    if key in started_at
+                ]
+                wait_for = (
+                    max(0.0, min(deadlines) - now) if deadlines else timeout_seconds
+                )
+                if any(key not in started_at for key in pending.values()):
+                    # Queued forecasts start when a worker frees up; re-check
+                    # soon so their timeout is tracked from the real start.
+                    wait_for = min(wait_for, 0.1)
+                done, _ = wait(
+                    list(pending), timeout=wait_for, return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    key = pending.pop(future)
+                    try:
+                        results[key] = future.result()
+                    except Exception as e:
+                        logger.warning(
+                            "Region forecast failed", key=key, error=str(e)[:200]
+                        )
+                        errors[key] = str(e)
+
+                now = time.monotonic()
+                for future, key in list(pending.items()):
+                    start = started_at.get(key)
+                    if start is not None and now - start >= timeout_seconds:
+                        pending.pop(future)
+                        future.cancel()
+                        timed_out.append(key)
+                        logger.warning(
+                            "Region forecast timed out",
+                            key=key,
+                            timeout_seconds=timeout_seconds,
+                        )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        elapsed = time.monotonic() - batch_start
+        logger.info(
+            "Multi-region forecast completed",
+            regions=len(requests),
+            completed=len(results),
+            failed=len(errors),
+            timed_out=len(timed_out),
+            elapsed_seconds=round(elapsed, 3),
+        )
+        return {
+            "results": results,
+            "errors": errors,
+            "timed_out": timed_out,
+            "elapsed_seconds": elapsed,
+        }
+
+    @staticmethod
+    def _run_with_timeout(
+        name: str, fn: Callable[[Any], None], arg: Any, timeout_seconds: float
+    ) -> None:
+        """
+        Run a best-effort batch step, giving up on it after a timeout.
+
+        The step keeps running in the background when it times out (its
+        results only warm caches), but the caller no longer waits for it.
+
+        Args:
+            name: Step name for logs
+            fn: Step callable taking one argument
+            arg: Argument for fn
+            timeout_seconds: Maximum seconds to wait
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"forecast-{name}"
+        )
+        try:
+            executor.submit(fn, arg).result(timeout=timeout_seconds)
+        except FutureTimeoutError:
+            logger.warning(
+                "Batch step timed out", step=name, timeout_seconds=timeout_seconds
+            )
+        finally:
+            executor.shutdown(wait=False)
+
+    def _prepare_batch(self, requests: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Plan GDELT timelines, then warm the weather cache, for a batch.
+
+        Args:
+            requests: forecast_many requests
+        """
+        self._plan_gdelt(requests)
+        self._prefetch_weather(requests)
+
+    def _prefetch_weather(self, requests: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Warm the weather cache for a multi-region batch.
+
+        Regions are sent to Open-Meteo as coordinate lists (one request per
+        days_back value and WEATHER_BATCH_MAX_LOCATIONS regions), so each
+        region's forecast then reads its weather from the cache instead of
+        issuing its own request. Failures are left to the per-region fetch.
+
+        Args:
+            requests: forecast_many requests (latitude, longitude, days_back)
+        """
+        locations_by_days: Dict[int, List[Tuple[float, float]]] = {}
+        for kwargs in requests.values():
+            if kwargs.get("latitude") is None or kwargs.get("longitude") is None:
+                continue
+            locations_by_days.setdefault(kwargs.get("days_back", 30), []).append(
+                (kwargs["latitude"], kwargs["longitude"])
+            )
+        for days_back, locations in locations_by_days.items():
+            if len(locations) < 2:
+                continue
+            try:
+                self.weather_fetcher.fetch_regional_comfort_batch(
+                    locations, days_back=days_back
+                )
+            except Exception as e:
+                logger.warning("Weather prefetch failed", error=str(e)[:200])
+
+    def _plan_gdelt(self, requests: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Register a multi-region batch's GDELT timelines with the query planner.
+
+        Regions share the global tone timeline and may repeat region names or
+        windows; the planner merges those into one request per timeline for
+        the widest window, which the regions' forecasts then slice.
+
+        Args:
+            requests: forecast_many requests (region_name, days_back)
+        """
+        try:
+            planned = self.gdelt_fetcher.plan_cycle(
+                (kwargs.get("region_name"), kwargs.get("days_back", 30))
+                for kwargs in requests.values()
+            )
+            logger.debug(
+                "GDELT requests planned", regions=len(requests), requests=planned
+            )
+        except Exception as e:
+            logger.warning("GDELT planning failed", error=str(e)[:200])
 
     def _analyze_intelligence(
-        self, history_df: pd.DataFrame, harmonized_df: pd.DataFrame
+        self,
+        history_df: pd.DataFrame,
+        details_bundle: Optional[SubIndexDetailsBundle] = None,
     ) -> Dict:
         """Run intelligence layer analysis on historical data."""
         try:
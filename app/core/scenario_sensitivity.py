@@ -4,8 +4,9 @@
 This module computes factor elasticity (Δoutput / Δinput) and enables safe
 what-if scenario analysis without changing numerical outputs.
 """
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import structlog
 
 logger = structlog.get_logger("core.scenario_sensitivity")
@@ -157,22 +158,183 @@ def detect_non_linear_threshold(
     if len(elasticities) < 2:
         return None
 
-    # Find point where elasticity changes by >50%
-    for i in range(1, len(elasticities)):
-        prev_elasticity = abs(elasticities[i - 1]["elasticity"])
-        curr_elasticity = abs(elasticities[i]["elasticity"])
-
-        if prev_elasticity > 0:
-            change_ratio = abs(curr_elasticity - prev_elasticity) / prev_elasticity
-            if change_ratio > 0.5:
-                return {
-                    "factor_id": factor_id,
-                    "threshold_value": elasticities[i]["value"],
-                    "threshold_elasticity": elasticities[i]["elasticity"],
-                    "pre_threshold_elasticity": elasticities[i - 1]["elasticity"],
-                }
-
-    return None
+    elasticity_row = np.array([[e["elasticity"] for e in elasticities]])
+    i = int(_first_threshold_positions(elasticity_row)[0])
+    if i < 0:
+        return None
+
+    return {
+        "factor_id": factor_id,
+        "threshold_value": elasticities[i]["value"],
+        "threshold_elasticity": elasticities[i]["elasticity"],
+        "pre_threshold_elasticity": elasticities[i - 1]["elasticity"],
+    }
+
+
+def _first_threshold_positions(
+    elasticity_matrix: np.ndarray, change_ratio: float = 0.5
+) -> np.ndarray:
+    """
+    Find the first point per row where elasticity changes by more than 50%.
+
+    Args:
+        elasticity_matrix: (factors, points) elasticities in test order
+        change_ratio: Relative change that marks a threshold
+
+    Returns:
+        Column position of the threshold per row, or -1 when none is found
+    """
+    magnitude = np.abs(elasticity_matrix)
+    prev = magnitude[:, :-1]
+    curr = magnitude[:, 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(prev > 0, np.abs(curr - prev) / prev, 0.0)
+    hit = ratio > change_ratio
+    return np.where(hit.any(axis=1), hit.argmax(axis=1) + 1, -1)
+
+
+def weighted_sum_index_fn(
+    weights: Sequence[float],
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build a vectorized behavior index function from factor weights.
+
+    Args:
+        weights: Factor weights in matrix column order (normalized to sum to 1)
+
+    Returns:
+        Function mapping a (points, factors) matrix to (points,) index values
+    """
+    weight_vector = np.asarray(weights, dtype=float)
+    total = weight_vector.sum()
+    if total > 0:
+        weight_vector = weight_vector / total
+
+    def compute(factor_matrix: np.ndarray) -> np.ndarray:
+        return np.clip(factor_matrix @ weight_vector, 0.0, 1.0)
+
+    return compute
+
+
+def batch_sensitivity_analysis(
+    base_factors: Dict[str, float],
+    factor_weights: Dict[str, float],
+    perturbations: Sequence[float],
+    compute_behavior_index_batch_fn: Optional[
+        Callable[[np.ndarray], np.ndarray]
+    ] = None,
+    min_value: float = 0.0,
+    max_value: float = 1.0,
+    tolerance: float = 1e-10,
+) -> Dict[str, Any]:
+    """
+    Run a full sensitivity analysis over all factors in one array evaluation.
+
+    Every (factor, perturbation) point is laid out as a row of a single
+    matrix: the base factor vector with one factor perturbed. The whole matrix
+    is scored by a vectorized behavior index function, then elasticities,
+    rankings and non-linear thresholds are derived for every factor with
+    array operations, replacing factors x points calls to a scalar function.
+
+    Args:
+        base_factors: Base factor values (defines the matrix column order)
+        factor_weights: Weight of each factor in the aggregation
+        perturbations: Perturbation amounts applied to each factor, in the
+            order used for threshold detection
+        compute_behavior_index_batch_fn: Function mapping a (points, factors)
+            matrix to (points,) behavior index values (default: weighted sum
+            of factor_weights)
+        min_value: Lower bound for perturbed factor values
+        max_value: Upper bound for perturbed factor values
+        tolerance: Numerical tolerance for zero input deltas
+
+    Returns:
+        compose_sensitivity_analysis() output, plus:
+        - thresholds: factor_id -> threshold info (as detect_non_linear_threshold)
+        - metadata.evaluations: Number of points evaluated
+    """
+    factor_ids = list(base_factors)
+    if not factor_ids:
+        raise ValueError("At least one factor must be provided")
+    offsets = np.asarray(perturbations, dtype=float)
+    if offsets.size == 0:
+        raise ValueError("At least one perturbation must be provided")
+
+    n_factors = len(factor_ids)
+    n_points = offsets.size
+    base = np.array([float(base_factors[f]) for f in factor_ids])
+    weights = np.array([float(factor_weights.get(f, 0.0)) for f in factor_ids])
+
+    if compute_behavior_index_batch_fn is None:
+        compute_behavior_index_batch_fn = weighted_sum_index_fn(weights)
+
+    # (factors, points) perturbed values of the factor being varied
+    perturbed_values = np.clip(base[:, None] + offsets[None, :], min_value, max_value)
+
+    # One row per point, plus the base vector as the final row
+    points = np.tile(base, (n_factors * n_points + 1, 1))
+    rows = np.arange(n_factors * n_points)
+    points[rows, np.repeat(np.arange(n_factors), n_points)] = perturbed_values.ravel()
+
+    scores = np.asarray(compute_behavior_index_batch_fn(points), dtype=float)
+    base_index = float(scores[-1])
+    output_delta = scores[:-1].reshape(n_factors, n_points) - base_index
+    input_delta = perturbed_values - base[:, None]
+
+    valid = np.abs(input_delta) >= tolerance
+    with np.errstate(divide="ignore", invalid="ignore"):
+        elasticity = np.where(valid, output_delta / input_delta * weights[:, None], 0.0)
+
+    # Summary elasticity per factor: mean over points with a real input change
+    valid_counts = valid.sum(axis=1)
+    summary = np.where(
+        valid_counts > 0, elasticity.sum(axis=1) / np.maximum(valid_counts, 1), 0.0
+    )
+    threshold_positions = (
+        _first_threshold_positions(elasticity)
+        if n_points >= 2
+        else np.full(n_factors, -1)
+    )
+
+    factor_elasticities: Dict[str, Dict[str, Any]] = {}
+    thresholds: Dict[str, Dict[str, Any]] = {}
+    for i, factor_id in enumerate(factor_ids):
+        abs_elasticity = abs(summary[i])
+        if valid_counts[i] == 0:
+            classification = "none"
+        elif abs_elasticity > 0.5:
+            classification = "high"
+        elif abs_elasticity > 0.2:
+            classification = "medium"
+        else:
+            classification = "low"
+
+        position = int(threshold_positions[i])
+        if position > 0:
+            thresholds[factor_id] = {
+                "factor_id": factor_id,
+                "threshold_value": float(perturbed_values[i, position]),
+                "threshold_elasticity": float(elasticity[i, position]),
+                "pre_threshold_elasticity": float(elasticity[i, position - 1]),
+            }
+
+        factor_elasticities[factor_id] = {
+            "elasticity": float(summary[i]),
+            "output_delta": float(output_delta[i].mean()),
+            "input_delta": float(input_delta[i].mean()),
+            "sensitivity_classification": classification,
+            "is_non_linear": bool(abs_elasticity > 0.7 or position > 0),
+            "curve": [
+                {"value": float(v), "elasticity": float(e)}
+                for v, e in zip(perturbed_values[i], elasticity[i])
+            ],
+        }
+
+    analysis = compose_sensitivity_analysis(base_index, factor_elasticities)
+    analysis["thresholds"] = thresholds
+    analysis["metadata"]["evaluations"] = int(points.shape[0])
+    analysis["metadata"]["perturbations"] = [float(o) for o in offsets]
+    return analysis
 
 
 def validate_scenario_bounds(
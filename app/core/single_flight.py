@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Single-flight coalescing of concurrent identical calls.
+
+The first caller for a key (the leader) runs the work; callers arriving while
+it is in flight (followers) wait on the leader's future and receive the same
+result or exception instead of repeating the work.
+"""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger("core.single_flight")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = None
+
+if PROMETHEUS_AVAILABLE:
+    single_flight_calls_counter = Counter(
+        "single_flight_calls_total",
+        "Single-flight calls by role (leader ran the work, follower coalesced)",
+        ["flight", "role"],
+    )
+else:
+    single_flight_calls_counter = None
+
+
+class SingleFlight:
+    """
+    Per-key in-flight de-duplication.
+
+    Thread-safe; the leader runs the callable in its own thread, so no extra
+    worker threads are created.
+    """
+
+    def __init__(self, name: str = "default"):
+        """
+        Initialize single-flight group.
+
+        Args:
+            name: Label for metrics and logs
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._stats = {"leaders": 0, "followers": 0}
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        timeout: Optional[float] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Run fn once per key across concurrent callers.
+
+        Args:
+            key: Identity of the call (same key = same work)
+            fn: Zero-argument callable doing the work
+            timeout: Seconds a follower waits for the leader (None = no limit)
+
+        Returns:
+            Tuple of (result, is_leader). Followers share the leader's result
+            object, so copy it before mutating.
+
+        Raises:
+            Exception: Whatever fn raised (re-raised in leader and followers)
+            concurrent.futures.TimeoutError: Follower waited longer than timeout
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+            self._count("leaders" if is_leader else "followers")
+
+        if not is_leader:
+            logger.debug("Joining in-flight call", flight=self.name, key=key)
+            return future.result(timeout=timeout), False
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result, True
+
+    def in_flight(self) -> int:
+        """Number of keys currently being computed."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def stats(self) -> Dict[str, int]:
+        """Return leader/follower counts."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _finish(self, key: str) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def _count(self, role: str) -> None:
+        self._stats[role] += 1
+        if single_flight_calls_counter is not None:
+            single_flight_calls_counter.labels(
+                flight=self.name, role=role.rstrip("s")
+            ).inc()
+
+
+# Process-wide groups, one per name, so callers on separate instances coalesce
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Get or create the shared single-flight group for a name.
+
+    Args:
+        name: Group name (also the metrics label)
+
+    Returns:
+        SingleFlight shared by every caller in the process
+    """
+    with _flights_lock:
+        flight = _flights.get(name)
+        if flight is None:
+            flight = SingleFlight(name=name)
+            _flights[name] = flight
+        return flight
+
+
+def reset_single_flights() -> None:
+    """Drop all shared groups (their stats restart at zero)."""
+    with _flights_lock:
+        _flights.clear()
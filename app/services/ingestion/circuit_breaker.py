@@ -0,0 +1,296 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Per-source circuit breakers for upstream HTTP calls.
+
+A breaker is closed while its source is healthy. When the failure rate over a
+rolling window of recent requests crosses the source's threshold it opens:
+requests fail fast (no retries, no timeouts) so fetchers fall back at once.
+After a cool-down one half-open trial request is let through; success closes
+the breaker, failure re-opens it. State changes are persisted to the source
+health table.
+"""
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Deque, Dict, Optional
+
+import requests
+import structlog
+
+from app.services.ingestion.source_registry import (
+    get_http_policy,
+    record_source_health,
+)
+
+logger = structlog.get_logger("ingestion.circuit_breaker")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter, Gauge
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = Gauge = None
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Source health status written for each breaker state
+HEALTH_STATUS_BY_STATE = {
+    STATE_CLOSED: "Active",
+    STATE_HALF_OPEN: "Degraded",
+    STATE_OPEN: "Disabled",
+}
+_STATE_VALUES = {STATE_CLOSED: 0, STATE_HALF_OPEN: 1, STATE_OPEN: 2}
+
+if PROMETHEUS_AVAILABLE:
+    circuit_state_gauge = Gauge(
+        "ingestion_circuit_state",
+        "Circuit breaker state per source (0=closed, 1=half_open, 2=open)",
+        ["source"],
+    )
+    circuit_rejections_counter = Counter(
+        "ingestion_circuit_rejections_total",
+        "Requests rejected without a network call because the circuit was open",
+        ["source"],
+    )
+else:
+    circuit_state_gauge = None
+    circuit_rejections_counter = None
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while a source's circuit is open."""
+
+
+def is_failure_status(http_status: Optional[int]) -> bool:
+    """Whether a response status indicates an unhealthy upstream."""
+    if http_status is None:
+        return True
+    if not isinstance(http_status, int):
+        return False
+    return http_status >= 500 or http_status == 429
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker for one source.
+
+    Thread-safe. Callers ask allow() before a request and must report the
+    outcome with record_success() or record_failure() (or release() if the
+    request was not sent after all).
+    """
+
+    def __init__(
+        self,
+        source_id: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window: int = 20,
+        open_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        on_state_change: Optional[Callable[["CircuitBreaker"], None]] = None,
+    ):
+        """
+        Initialize breaker.
+
+        Args:
+            source_id: Source registry id
+            failure_rate: Failure fraction of the window that opens the breaker
+            min_calls: Outcomes required in the window before it can open
+            window: Number of recent outcomes considered
+            open_seconds: Fail-fast period before a half-open trial
+            clock: Monotonic time source (injectable for tests)
+            on_state_change: Callback invoked (outside the lock) after a
+                state transition
+        """
+        self.source_id = source_id
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._on_state_change = on_state_change
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True = failure
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.success_count = 0
+        self.error_count = 0
+        self.last_success_at: Optional[datetime] = None
+        self.last_attempt_at: Optional[datetime] = None
+
+    @property
+    def state(self) -> str:
+        """Current state (an open breaker past its cool-down reads half_open)."""
+        with self._lock:
+            if (
+                self._state == STATE_OPEN
+                and self._clock() - self._opened_at >= self.open_seconds
+            ):
+                return STATE_HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        Whether a request may be sent now.
+
+        Returns:
+            True if closed, or if this caller gets the single half-open trial
+        """
+        changed = False
+        with self._lock:
+            if self._state == STATE_OPEN:
+                if self._clock() - self._opened_at < self.open_seconds:
+                    allowed = False
+                else:
+                    self._state = STATE_HALF_OPEN
+                    changed = True
+            if self._state == STATE_HALF_OPEN:
+                allowed = not self._trial_in_flight
+                self._trial_in_flight = True
+            elif self._state == STATE_CLOSED:
+                allowed = True
+        if changed:
+            self._state_changed()
+        if not allowed and circuit_rejections_counter is not None:
+            circuit_rejections_counter.labels(source=self.source_id).inc()
+        return allowed
+
+    def record_success(self) -> None:
+        """Report a healthy upstream response."""
+        self._record(failure=False)
+
+    def record_failure(self) -> None:
+        """Report a failed request (timeout, connection error, 5xx, 429)."""
+        self._record(failure=True)
+
+    def release(self) -> None:
+        """Report that an allowed request was never sent (no outcome)."""
+        with self._lock:
+            if self._state == STATE_HALF_OPEN:
+                self._trial_in_flight = False
+
+    def snapshot(self) -> Dict[str, object]:
+        """State and counters for diagnostics."""
+        with self._lock:
+            failures = sum(self._outcomes)
+            return {
+                "source_id": self.source_id,
+                "state": self._state,
+                "window_calls": len(self._outcomes),
+                "window_failure_rate": (
+                    failures / len(self._outcomes) if self._outcomes else 0.0
+                ),
+                "success_count": self.success_count,
+                "error_count": self.error_count,
+            }
+
+    def _record(self, failure: bool) -> None:
+        now = datetime.now(timezone.utc)
+        changed = False
+        with self._lock:
+            self.last_attempt_at = now
+            if failure:
+                self.error_count += 1
+            else:
+                self.success_count += 1
+                self.last_success_at = now
+
+            if self._state == STATE_HALF_OPEN:
+                self._trial_in_flight = False
+                self._outcomes.clear()
+                if failure:
+                    self._state = STATE_OPEN
+                    self._opened_at = self._clock()
+                else:
+                    self._state = STATE_CLOSED
+                changed = True
+            elif self._state == STATE_CLOSED:
+                self._outcomes.append(failure)
+                failures = sum(self._outcomes)
+                if (
+                    len(self._outcomes) >= self.min_calls
+                    and failures / len(self._outcomes) >= self.failure_rate
+                ):
+                    self._state = STATE_OPEN
+                    self._opened_at = self._clock()
+                    self._outcomes.clear()
+                    changed = True
+        if changed:
+            self._state_changed()
+
+    def _state_changed(self) -> None:
+        state = self.state
+        if state == STATE_OPEN:
+            logger.warning(
+                "Circuit opened, failing fast",
+                source=self.source_id,
+                open_seconds=self.open_seconds,
+            )
+        else:
+            logger.info("Circuit state changed", source=self.source_id, state=state)
+        if circuit_state_gauge is not None:
+            circuit_state_gauge.labels(source=self.source_id).set(_STATE_VALUES[state])
+        if self._on_state_change is not None:
+            self._on_state_change(self)
+
+
+def _persist_breaker_state(breaker: CircuitBreaker) -> None:
+    """Write a breaker transition to the source health table."""
+    total = breaker.success_count + breaker.error_count
+    record_source_health(
+        breaker.source_id,
+        HEALTH_STATUS_BY_STATE[breaker.state],
+        last_success_at=breaker.last_success_at,
+        last_attempt_at=breaker.last_attempt_at,
+        error_rate=breaker.error_count / total if total else None,
+        error_count=breaker.error_count,
+        success_count=breaker.success_count,
+    )
+
+
+# Breakers by source id (created on first use from the source's HTTPPolicy)
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(source_id: str) -> CircuitBreaker:
+    """
+    Get or create the breaker for a source.
+
+    Args:
+        source_id: Source registry id
+
+    Returns:
+        CircuitBreaker configured from the source's HTTPPolicy
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(source_id)
+        if breaker is None:
+            policy = get_http_policy(source_id)
+            breaker = CircuitBreaker(
+                source_id,
+                failure_rate=policy.breaker_failure_rate,
+                min_calls=policy.breaker_min_calls,
+                window=policy.breaker_window,
+                open_seconds=policy.breaker_open_seconds,
+                on_state_change=_persist_breaker_state,
+            )
+            _breakers[source_id] = breaker
+        return breaker
+
+
+def get_circuit_states() -> Dict[str, Dict[str, object]]:
+    """Snapshots of all breakers created so far."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.source_id: breaker.snapshot() for breaker in breakers}
+
+
+def reset_circuit_breakers() -> None:
+    """Drop all breakers (they restart closed)."""
+    with _breakers_lock:
+        _breakers.clear()
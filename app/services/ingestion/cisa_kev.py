@@ -1,26 +1,25 @@
 # SPDX-License-Identifier: PROPRIETARY
 """CISA KEV (Known Exploited Vulnerabilities) API connector."""
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Tuple
 
 import json
 import pandas as pd
-import requests
 import structlog
-import time
 
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.conditional_fetch import get_validator_cache
+from app.services.ingestion.source_registry import get_http_policy
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.cisa_kev")
 
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "cyber_risk"
+
 # CISA KEV API
 CISA_KEV_URL = "https://www.cisa.gov/sites/default/files/feeds/known_exploited_vulnerabilities.json"
 
-# Retry configuration
-MAX_RETRIES = 3
-INITIAL_BACKOFF = 1.0
-MAX_BACKOFF = 10.0
-
 
 class CISAKEVFetcher:
     """
@@ -43,62 +42,6 @@ class CISAKEVFetcher:
         self.cache_duration_minutes = cache_duration_minutes
         self._cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
 
-    def _make_request_with_retries(
-        self, url: str, timeout: Tuple[float, float] = (10.0, 60.0)
-    ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
-        """Make HTTP request with exponential backoff retries."""
-        backoff = INITIAL_BACKOFF
-        headers = {"User-Agent": "HumanBehaviourConvergence/1.0"}
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-                if response.status_code == 200:
-                    return response, None, 200
-                else:
-                    error_type = "http_error"
-                    http_status = response.status_code
-                    if attempt < MAX_RETRIES - 1:
-                        logger.warning(
-                            "CISA KEV API returned non-200 status, retrying",
-                            status_code=http_status,
-                            attempt=attempt + 1,
-                        )
-                        time.sleep(backoff)
-                        backoff = min(backoff * 2, MAX_BACKOFF)
-                        continue
-                    return response, error_type, http_status
-            except requests.exceptions.Timeout:
-                error_type = "timeout"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "CISA KEV API timeout, retrying", attempt=attempt + 1
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except requests.exceptions.RequestException as e:
-                error_type = "http_error"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "CISA KEV API request exception, retrying", error=str(e)[:100]
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except Exception as e:
-                error_type = "other"
-                logger.error(
-                    "Unexpected error in CISA KEV request",
-                    error=str(e)[:200],
-                    exc_info=True,
-                )
-                return None, error_type, None
-
-        return None, "other", None
-
     def fetch_kev_catalog(
         self,
         days_back: int = 30,
@@ -123,7 +66,13 @@ class CISAKEVFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_kev_catalog(days_back, use_cache=False),
+            ):
                 logger.info("Using cached CISA KEV data", age_minutes=age_minutes)
                 status = SourceStatus(
                     provider="CISA KEV",
@@ -137,18 +86,18 @@ class CISAKEVFetcher:
 
         logger.info("Fetching CISA KEV catalog")
 
-        # Make request with retries
-        response, request_error_type, http_status = self._make_request_with_retries(
-            CISA_KEV_URL
-        )
+        # Revalidate the stored catalog (ETag / Last-Modified) with retries
+        result = get_validator_cache().fetch(CISA_KEV_URL, source_id=SOURCE_ID)
+        http_status = result.http_status
 
-        if response is None:
-            error_detail = f"Request failed after {MAX_RETRIES} retries"
+        if result.content is None:
+            retries = get_http_policy(SOURCE_ID).max_retries
+            error_detail = f"Request failed after {retries} retries"
             status = SourceStatus(
                 provider="CISA KEV",
                 ok=False,
                 http_status=http_status,
-                error_type=request_error_type or "other",
+                error_type=result.error_type or "other",
                 error_detail=error_detail,
                 fetched_at=fetched_at,
                 rows=0,
@@ -157,9 +106,24 @@ class CISAKEVFetcher:
             logger.error("CISA KEV request failed", error_type=status.error_type)
             return pd.DataFrame(columns=["timestamp", "kev_count", "signal"]), status
 
+        # Unchanged catalog: keep the parsed signal, only refresh its timestamp
+        if result.not_modified and cache_key in self._cache:
+            df, _ = self._cache[cache_key]
+            self._cache[cache_key] = (df, datetime.now())
+            logger.info("CISA KEV catalog not modified, reusing parsed data")
+            status = SourceStatus(
+                provider="CISA KEV",
+                ok=True,
+                http_status=http_status,
+                fetched_at=fetched_at,
+                rows=len(df),
+                query_window_days=days_back,
+            )
+            return df.copy(), status
+
         # Parse JSON
         try:
-            data = response.json()
+            data = json.loads(result.content)
         except json.JSONDecodeError as e:
             status = SourceStatus(
                 provider="CISA KEV",
@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Validator-aware (ETag / Last-Modified) downloads of large static datasets.
+
+The payload of each URL is kept on disk next to its ETag and Last-Modified
+validators. Later requests send If-None-Match / If-Modified-Since; on 304 Not
+Modified the disk payload is reused and only its timestamp is refreshed, so an
+unchanged multi-MB file costs one round trip instead of a full download.
+"""
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import structlog
+
+from app.services.ingestion.http_transport import get_http_transport
+
+logger = structlog.get_logger("ingestion.conditional_fetch")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = None
+
+HTTP_VALIDATOR_CACHE_DIR = os.getenv(
+    "HTTP_VALIDATOR_CACHE_DIR", ".cache/http_validators"
+)
+
+if PROMETHEUS_AVAILABLE:
+    conditional_requests_counter = Counter(
+        "ingestion_conditional_requests_total",
+        "Validator-aware dataset downloads by result",
+        ["source", "result"],
+    )
+else:
+    conditional_requests_counter = None
+
+
+@dataclass
+class ConditionalResponse:
+    """Outcome of a validator-aware download."""
+
+    content: Optional[bytes]  # Payload (fresh or reused from disk); None on error
+    http_status: Optional[int]
+    error_type: Optional[str] = None  # timeout, http_error, other
+    not_modified: bool = False  # True if the server answered 304
+    fetched_at: Optional[str] = None  # When the payload was last confirmed current
+
+    @property
+    def text(self) -> str:
+        """Payload decoded as UTF-8."""
+        return (self.content or b"").decode("utf-8", errors="replace")
+
+
+class ValidatorCache:
+    """
+    Disk store of dataset payloads and their HTTP validators.
+
+    Each URL maps to <sha256>.body (raw payload) and <sha256>.json
+    (url, etag, last_modified, fetched_at). Files are replaced atomically.
+    """
+
+    def __init__(self, cache_dir: str = HTTP_VALIDATOR_CACHE_DIR):
+        """
+        Initialize validator cache.
+
+        Args:
+            cache_dir: Directory holding payloads and validator metadata
+        """
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+
+    def fetch(
+        self,
+        url: str,
+        source_id: Optional[str] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+    ) -> ConditionalResponse:
+        """
+        Download a URL, revalidating any stored copy.
+
+        Args:
+            url: Dataset URL
+            source_id: Source registry id (HTTP policy and metrics label)
+            timeout: Timeout override (default: the source's policy)
+
+        Returns:
+            ConditionalResponse (content is None on error)
+        """
+        source = source_id or urlsplit(url).netloc
+        body_path, meta_path = self._paths(url)
+        meta = self._read_meta(meta_path) if os.path.exists(body_path) else {}
+
+        headers: Dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        response, error_type, http_status = get_http_transport().get_with_retries(
+            url, source_id=source_id, headers=headers or None, timeout=timeout
+        )
+        fetched_at = datetime.now().isoformat()
+
+        if response is not None and http_status == 304 and headers:
+            content = self._read_body(body_path)
+            if content is not None:
+                meta["fetched_at"] = fetched_at
+                self._write(meta_path, json.dumps(meta).encode("utf-8"))
+                self._count(source, "not_modified")
+                logger.info("Dataset not modified, reusing stored copy", url=url)
+                return ConditionalResponse(
+                    content=content,
+                    http_status=304,
+                    not_modified=True,
+                    fetched_at=fetched_at,
+                )
+            error_type = "other"
+
+        if response is None or error_type is not None:
+            self._count(source, "error")
+            return ConditionalResponse(
+                content=None, http_status=http_status, error_type=error_type or "other"
+            )
+
+        content = response.content
+        new_meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": fetched_at,
+        }
+        if new_meta["etag"] or new_meta["last_modified"]:
+            self._write(body_path, content)
+            self._write(meta_path, json.dumps(new_meta).encode("utf-8"))
+        self._count(source, "modified")
+        return ConditionalResponse(
+            content=content, http_status=http_status, fetched_at=fetched_at
+        )
+
+    def clear(self) -> None:
+        """Delete all stored payloads and validators."""
+        with self._lock:
+            if not os.path.isdir(self.cache_dir):
+                return
+            for name in os.listdir(self.cache_dir):
+                if name.endswith((".body", ".json")):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, digest)
+        return f"{base}.body", f"{base}.json"
+
+    @staticmethod
+    def _read_meta(path: str) -> Dict[str, Optional[str]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _read_body(path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, path: str, data: bytes) -> None:
+        """Atomically replace a cache file (failures only disable revalidation)."""
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with self._lock:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(
+                "Failed to write validator cache", path=path, error=str(e)[:200]
+            )
+
+    @staticmethod
+    def _count(source: str, result: str) -> None:
+        if conditional_requests_counter is not None:
+            conditional_requests_counter.labels(source=source, result=result).inc()
+
+
+# Global instance (singleton pattern)
+_validator_cache_instance: Optional[ValidatorCache] = None
+_validator_cache_lock = threading.Lock()
+
+
+def get_validator_cache() -> ValidatorCache:
+    """Get or create the global ValidatorCache instance."""
+    global _validator_cache_instance
+    with _validator_cache_lock:
+        if _validator_cache_instance is None:
+            _validator_cache_instance = ValidatorCache()
+        return _validator_cache_instance
+
+
+def reset_validator_cache() -> None:
+    """Reset the global ValidatorCache singleton instance (files are kept)."""
+    global _validator_cache_instance
+    with _validator_cache_lock:
+        _validator_cache_instance = None
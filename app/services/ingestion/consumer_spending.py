@@ -12,9 +12,13 @@ from app.services.ingestion.ci_offline_data import (
     is_ci_offline_mode,
 )
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.consumer_spending")
 
+# Source registry id (selects the staleness grace)
+SOURCE_ID = "consumer_spending"
+
 # FRED API base URL
 FRED_API_BASE = "https://api.stlouisfed.org/fred/series/observations"
 
@@ -127,7 +131,13 @@ class ConsumerSpendingFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_retail_sales_stress(days_back, use_cache=False),
+            ):
                 logger.info("Using cached FRED retail sales data")
                 status = SourceStatus(
                     provider="FRED_Retail_Cached",
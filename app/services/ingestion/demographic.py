@@ -12,9 +12,13 @@ from app.services.ingestion.ci_offline_data import (
     is_ci_offline_mode,
 )
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.demographic")
 
+# Source registry id (selects the staleness grace)
+SOURCE_ID = "demographic_data"
+
 # US Census Bureau API base URL
 CENSUS_API_BASE = "https://api.census.gov/data"
 
@@ -181,7 +185,13 @@ class DemographicFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_demographic_stress_index(state, use_cache=False),
+            ):
                 logger.info("Using cached Census data", state=state_code)
                 status = SourceStatus(
                     provider="Census_Cached",
@@ -11,9 +11,13 @@ from app.services.ingestion.ci_offline_data import (
     get_ci_drought_monitor_data,
 )
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.drought_monitor")
 
+# Source registry id (selects the staleness grace)
+SOURCE_ID = "drought_monitor"
+
 # U.S. Drought Monitor base URL
 DROUGHT_MONITOR_BASE = "https://droughtmonitor.unl.edu"
 
@@ -180,7 +184,15 @@ class DroughtMonitorFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_drought_stress_index(
+                    state, days_back, use_cache=False
+                ),
+            ):
                 logger.info(
                     "Using cached drought monitor data",
                     state=state_code,
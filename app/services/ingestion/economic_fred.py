@@ -9,13 +9,19 @@ import pandas as pd
 import requests
 import structlog
 
+from app.core.single_flight import get_single_flight
 from app.services.ingestion.ci_offline_data import (
     is_ci_offline_mode,
     get_ci_economic_data,
 )
+from app.services.ingestion.http_transport import get_http_transport
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.economic_fred")
 
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "fred_economic"
+
 # FRED API base URL
 FRED_API_BASE = "https://api.stlouisfed.org/fred/series/observations"
 
@@ -52,6 +58,9 @@ class FREDEconomicFetcher:
         self.api_key = api_key or os.getenv("FRED_API_KEY")
         self.cache_duration_minutes = cache_duration_minutes
         self._cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
+        # Concurrent requests for the same series share one API call, across
+        # fetcher instances
+        self._inflight = get_single_flight("fred")
 
         if not self.api_key:
             logger.warning(
@@ -90,10 +99,35 @@ class FREDEconomicFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_series(series_id, days_back, use_cache=False),
+            ):
                 logger.info("Using cached FRED data", series_id=series_id)
                 return df.copy()
 
+        df, is_leader = self._inflight.do(
+            cache_key, lambda: self._request_series(series_id, days_back, cache_key)
+        )
+        return df if is_leader else df.copy()
+
+    def _request_series(
+        self, series_id: str, days_back: int, cache_key: str
+    ) -> pd.DataFrame:
+        """
+        Request a FRED series from the API and cache the parsed result.
+
+        Args:
+            series_id: FRED series ID
+            days_back: Number of days of historical data to fetch
+            cache_key: Cache key for the parsed series
+
+        Returns:
+            DataFrame with columns: ['timestamp', 'value'] (empty on error)
+        """
         # Calculate date range
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
@@ -110,7 +144,9 @@ class FREDEconomicFetcher:
             }
 
             logger.info("Fetching FRED data", series_id=series_id, days_back=days_back)
-            response = requests.get(FRED_API_BASE, params=params, timeout=30)
+            response = get_http_transport().get(
+                FRED_API_BASE, source_id=SOURCE_ID, params=params
+            )
             response.raise_for_status()
 
             data = response.json()
@@ -12,12 +12,16 @@ from app.services.ingestion.ci_offline_data import (
     is_ci_offline_mode,
     get_ci_energy_data,
 )
+from app.services.ingestion.stale_refresh import serve_stale
 
 if TYPE_CHECKING:
     from app.services.ingestion.gdelt_events import SourceStatus
 
 logger = structlog.get_logger("ingestion.eia_energy")
 
+# Source registry id (selects the staleness grace)
+SOURCE_ID = "eia_energy"
+
 # EIA API base URL (v2)
 EIA_API_BASE = "https://api.eia.gov/v2"
 
@@ -99,7 +103,13 @@ class EIAEnergyFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_series(series_id, days_back, use_cache=False),
+            ):
                 logger.info("Using cached EIA data", series_id=series_id)
                 status = SourceStatus(
                     provider="EIA",
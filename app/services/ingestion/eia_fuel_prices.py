@@ -2,7 +2,7 @@
 """EIA (Energy Information Administration) state-level gasoline prices connector."""
 import os
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 import pandas as pd
 import requests
@@ -13,9 +13,19 @@ from app.services.ingestion.ci_offline_data import (
     get_ci_fuel_prices_data,
 )
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.http_transport import get_http_transport
+from app.services.ingestion.national_feed import (
+    NATIONAL_FEED_MODE_ENABLED,
+    StateIndex,
+    get_national_feed,
+)
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.eia_fuel_prices")
 
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "eia_fuel_prices"
+
 # EIA API base URL (v2)
 EIA_API_BASE = "https://api.eia.gov/v2"
 
@@ -74,6 +84,24 @@ STATE_FIPS = {
     "DC": "11",
 }
 
+# Index key of the unadjusted national average (states without a multiplier)
+NATIONAL_KEY = "US"
+
+# State-specific adjustment of the national price (simulated regional variance)
+# In production, this would fetch actual state-level series
+STATE_PRICE_MULTIPLIERS = {
+    "CA": 1.15,
+    "NY": 1.10,
+    "IL": 1.05,
+    "TX": 0.95,
+    "FL": 1.00,
+    "AZ": 0.98,
+    "CO": 1.02,
+    "GA": 0.97,
+    "MA": 1.08,
+    "LA": 0.96,
+}
+
 
 class EIAFuelPricesFetcher:
     """
@@ -101,6 +129,8 @@ class EIAFuelPricesFetcher:
         self.api_key = api_key or os.getenv("EIA_API_KEY")
         self.cache_duration_minutes = cache_duration_minutes
         self._cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
+        # National price series turned into per-state frames, per days_back
+        self._national_feed = get_national_feed(SOURCE_ID, cache_duration_minutes)
 
     def _normalize_state_code(self, state: str) -> str:
         """
@@ -200,7 +230,13 @@ class EIAFuelPricesFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_fuel_stress_index(state, days_back, use_cache=False),
+            ):
                 logger.info(
                     "Using cached EIA fuel prices",
                     state=state_code,
@@ -216,52 +252,20 @@ class EIAFuelPricesFetcher:
                 )
                 return df.copy(), status
 
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-
         try:
-            # EIA API v2: State-level gasoline prices
-            # Series ID format: PET.EER_EPD2DXL0_PTE_R{STATE_FIPS}_MBBL.A
-            # For now, use a simplified approach: fetch national average and simulate state variance
-            # TODO: Find exact EIA API v2 series ID for state-level prices
-            # For MVP, we'll use a proxy: national price with state-specific adjustment
-
-            # Fetch national average gasoline price
-            national_series_id = "PET.EER_EPD2DXL0_PTE_R10D_MBBL.A"  # National average
-
-            url = f"{EIA_API_BASE}/data"
-            params = {
-                "data[0]": national_series_id,
-                "data[1]": start_date.strftime("%Y-%m-%d"),
-                "data[2]": end_date.strftime("%Y-%m-%d"),
-                "sort[0][column]": "period",
-                "sort[0][direction]": "asc",
-                "length": 5000,
-            }
-
-            if self.api_key:
-                params["api_key"] = self.api_key
-
-            logger.info("Fetching EIA fuel prices", state=state_code, url=url)
-
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-
-            if "response" not in data or "data" not in data["response"]:
-                logger.warning("Unexpected EIA response structure", state=state_code)
-                status = SourceStatus(
-                    provider="EIA_Fuel",
-                    ok=False,
-                    http_status=response.status_code,
-                    error_type="non_json",
-                    error_detail="Unexpected response structure",
-                    fetched_at=datetime.now().isoformat(),
-                    rows=0,
-                    query_window_days=days_back,
+            if NATIONAL_FEED_MODE_ENABLED:
+                index, status = self._national_feed.get(
+                    days_back,
+                    lambda: self._load_state_prices(days_back),
+                    use_cache,
                 )
+            else:
+                index, status = self._load_state_prices(days_back, [state_code])
+
+            if index is None:
+                if status.error_type in ("empty", "timeout", "http_error", "other"):
+                    # Fallback to national average with state adjustment
+                    return self._fallback_fuel_data(state_code, days_back)
                 return (
                     pd.DataFrame(
                         columns=["timestamp", "fuel_stress_index", "fuel_price"]
@@ -269,47 +273,7 @@ class EIAFuelPricesFetcher:
                     status,
                 )
 
-            records = data["response"]["data"]
-
-            if not records:
-                logger.warning("EIA returned empty data", state=state_code)
-                # Fallback to national average with state adjustment
-                return self._fallback_fuel_data(state_code, days_back)
-
-            # Convert to DataFrame
-            df = pd.DataFrame(records)
-            df = df.rename(columns={"period": "timestamp", "value": "national_price"})
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
-            df = df.sort_values("timestamp").reset_index(drop=True)
-            df = df[df["timestamp"] >= start_date].copy()
-
-            # Apply state-specific adjustment (simulated regional variance)
-            # In production, this would fetch actual state-level series
-            # For MVP: use state-specific multiplier based on known regional patterns
-            state_multipliers = {
-                "CA": 1.15,
-                "NY": 1.10,
-                "IL": 1.05,
-                "TX": 0.95,
-                "FL": 1.00,
-                "AZ": 0.98,
-                "CO": 1.02,
-                "GA": 0.97,
-                "MA": 1.08,
-                "LA": 0.96,
-            }
-            multiplier = state_multipliers.get(state_code, 1.0)
-
-            df["fuel_price"] = df["national_price"] * multiplier
-            national_avg = df["national_price"].mean()
-
-            # Compute fuel stress index: deviation from national average, normalized
-            df["deviation"] = (df["fuel_price"] - national_avg) / national_avg
-            # Normalize to 0-1: sigmoid-like transformation
-            df["fuel_stress_index"] = 0.5 + (df["deviation"] * 2.5)
-            df["fuel_stress_index"] = df["fuel_stress_index"].clip(0.0, 1.0)
-
-            result_df = df[["timestamp", "fuel_stress_index", "fuel_price"]].copy()
+            result_df = index.get(state_code, index[NATIONAL_KEY]).copy()
 
             # Cache the result
             self._cache[cache_key] = (result_df.copy(), datetime.now())
@@ -317,7 +281,7 @@ class EIAFuelPricesFetcher:
             status = SourceStatus(
                 provider="EIA_Fuel",
                 ok=True,
-                http_status=response.status_code,
+                http_status=status.http_status,
                 fetched_at=datetime.now().isoformat(),
                 rows=len(result_df),
                 query_window_days=days_back,
@@ -332,18 +296,6 @@ class EIAFuelPricesFetcher:
 
             return result_df, status
 
-        except requests.exceptions.Timeout:
-            logger.error("EIA API timeout", state=state_code)
-            return self._fallback_fuel_data(state_code, days_back)
-
-        except requests.exceptions.HTTPError as e:
-            logger.error(
-                "EIA API HTTP error",
-                state=state_code,
-                status_code=e.response.status_code,
-            )
-            return self._fallback_fuel_data(state_code, days_back)
-
         except Exception as e:
             logger.error("EIA API error", state=state_code, error=str(e), exc_info=True)
             return self._fallback_fuel_data(state_code, days_back)
@@ -405,3 +357,144 @@ class EIAFuelPricesFetcher:
         )
 
         return df, status
+
+    def _load_state_prices(
+        self, days_back: int, states: Optional[Iterable[str]] = None
+    ) -> Tuple[Optional[StateIndex], SourceStatus]:
+        """
+        Fetch the national price series and derive per-state fuel stress.
+
+        Args:
+            days_back: Number of days of historical data to fetch
+            states: State codes to index (default: all states)
+
+        Returns:
+            Tuple of (state code -> DataFrame with columns timestamp,
+            fuel_stress_index, fuel_price, plus NATIONAL_KEY for states
+            without an adjustment; or None if the response was unusable;
+            SourceStatus). error_type "empty", or "timeout", "http_error" or
+            "other" for a failed request, means the caller should fall back.
+            Request failures are returned rather than raised so the national
+            feed remembers them.
+        """
+        # Calculate date range
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days_back)
+
+        # EIA API v2: State-level gasoline prices
+        # Series ID format: PET.EER_EPD2DXL0_PTE_R{STATE_FIPS}_MBBL.A
+        # For now, use a simplified approach: fetch national average and simulate state variance
+        # TODO: Find exact EIA API v2 series ID for state-level prices
+        # For MVP, we'll use a proxy: national price with state-specific adjustment
+
+        # Fetch national average gasoline price
+        national_series_id = "PET.EER_EPD2DXL0_PTE_R10D_MBBL.A"  # National average
+
+        url = f"{EIA_API_BASE}/data"
+        params = {
+            "data[0]": national_series_id,
+            "data[1]": start_date.strftime("%Y-%m-%d"),
+            "data[2]": end_date.strftime("%Y-%m-%d"),
+            "sort[0][column]": "period",
+            "sort[0][direction]": "asc",
+            "length": 5000,
+        }
+
+        if self.api_key:
+            params["api_key"] = self.api_key
+
+        logger.info("Fetching EIA national fuel prices", url=url, days_back=days_back)
+
+        def failed(
+            error_type: str, error_detail: str, http_status: Optional[int] = None
+        ) -> Tuple[None, SourceStatus]:
+            return None, SourceStatus(
+                provider="EIA_Fuel",
+                ok=False,
+                http_status=http_status,
+                error_type=error_type,
+                error_detail=error_detail,
+                fetched_at=datetime.now().isoformat(),
+                rows=0,
+                query_window_days=days_back,
+            )
+
+        try:
+            response = get_http_transport().get(
+                url, source_id=SOURCE_ID, params=params
+            )
+            response.raise_for_status()
+        except requests.exceptions.Timeout:
+            logger.error("EIA API timeout", days_back=days_back)
+            return failed("timeout", "Request timed out")
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            logger.error("EIA API HTTP error", status_code=status_code)
+            return failed("http_error", f"HTTP {status_code}", status_code)
+        except requests.exceptions.RequestException as e:
+            logger.error("EIA API request failed", error=str(e))
+            return failed("other", str(e))
+
+        data = response.json()
+
+        if "response" not in data or "data" not in data["response"]:
+            logger.warning("Unexpected EIA response structure")
+            status = SourceStatus(
+                provider="EIA_Fuel",
+                ok=False,
+                http_status=response.status_code,
+                error_type="non_json",
+                error_detail="Unexpected response structure",
+                fetched_at=datetime.now().isoformat(),
+                rows=0,
+                query_window_days=days_back,
+            )
+            return None, status
+
+        records = data["response"]["data"]
+
+        if not records:
+            logger.warning("EIA returned empty data")
+            status = SourceStatus(
+                provider="EIA_Fuel",
+                ok=False,
+                http_status=response.status_code,
+                error_type="empty",
+                error_detail="No price records returned",
+                fetched_at=datetime.now().isoformat(),
+                rows=0,
+                query_window_days=days_back,
+            )
+            return None, status
+
+        # Convert to DataFrame
+        df = pd.DataFrame(records)
+        df = df.rename(columns={"period": "timestamp", "value": "national_price"})
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        df = df.sort_values("timestamp").reset_index(drop=True)
+        df = df[df["timestamp"] >= start_date].copy()
+        national_avg = df["national_price"].mean()
+
+        index: Dict[str, pd.DataFrame] = {}
+        for state_code in [NATIONAL_KEY, *(states or STATE_FIPS)]:
+            multiplier = STATE_PRICE_MULTIPLIERS.get(state_code, 1.0)
+            state_df = df[["timestamp"]].copy()
+            state_df["fuel_price"] = df["national_price"] * multiplier
+
+            # Compute fuel stress index: deviation from national average, normalized
+            deviation = (state_df["fuel_price"] - national_avg) / national_avg
+            # Normalize to 0-1: sigmoid-like transformation
+            state_df["fuel_stress_index"] = (0.5 + (deviation * 2.5)).clip(0.0, 1.0)
+            index[state_code] = state_df[
+                ["timestamp", "fuel_stress_index", "fuel_price"]
+            ].reset_index(drop=True)
+
+        status = SourceStatus(
+            provider="EIA_Fuel",
+            ok=True,
+            http_status=response.status_code,
+            fetched_at=datetime.now().isoformat(),
+            rows=len(df),
+            query_window_days=days_back,
+        )
+        return index, status
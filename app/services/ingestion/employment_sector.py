@@ -12,9 +12,13 @@ from app.services.ingestion.ci_offline_data import (
     is_ci_offline_mode,
 )
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.employment_sector")
 
+# Source registry id (selects the staleness grace)
+SOURCE_ID = "employment_sector"
+
 # BLS API base URL
 BLS_API_BASE = "https://api.bls.gov/publicAPI/v2/timeseries/data"
 
@@ -137,7 +141,15 @@ class EmploymentSectorFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_sector_employment_stress(
+                    sector, days_back, use_cache=False
+                ),
+            ):
                 logger.info("Using cached BLS employment data", sector=sector)
                 status = SourceStatus(
                     provider="BLS_Cached",
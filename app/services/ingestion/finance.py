@@ -7,8 +7,13 @@ import pandas as pd
 import structlog
 import yfinance as yf
 
+from app.services.ingestion.stale_refresh import serve_stale
+
 logger = structlog.get_logger("ingestion.finance")
 
+# Source registry id (selects the staleness grace)
+SOURCE_ID = "economic_indicators"
+
 
 class MarketSentimentFetcher:
     """
@@ -47,7 +52,13 @@ class MarketSentimentFetcher:
         # Check cache validity
         if use_cache and self._cache is not None and self._cache_timestamp is not None:
             age_minutes = (datetime.now() - self._cache_timestamp).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                "market_sentiment",
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_stress_index(days_back, use_cache=False),
+            ):
                 logger.info(
                     "Using cached market sentiment data", age_minutes=age_minutes
                 )
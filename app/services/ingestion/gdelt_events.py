@@ -1,10 +1,9 @@
 # SPDX-License-Identifier: PROPRIETARY
 """GDELT Events API connector for global event and crisis signals."""
 import json
-import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
 
 import pandas as pd
 import requests
@@ -14,16 +13,27 @@ from app.services.ingestion.ci_offline_data import (
     is_ci_offline_mode,
     get_ci_event_data,
 )
+from app.services.ingestion.gdelt_query_planner import (
+    GDELT_API_BASE,  # noqa: F401 (re-exported)
+    THEME_ENFORCEMENT,
+    THEME_EVENTS,
+    THEME_LEGISLATIVE,
+    THEME_TONE,
+    TimelineQuery,
+    TimelineResult,
+    get_gdelt_planner,
+    timeline_query,
+)
+from app.services.ingestion.http_transport import get_http_transport
+from app.services.ingestion.source_registry import get_http_policy
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.gdelt_events")
 
-# GDELT API base URL
-GDELT_API_BASE = "https://api.gdeltproject.org/api/v2/doc/doc"
-
-# Retry configuration
-MAX_RETRIES = 3
-INITIAL_BACKOFF = 1.0  # seconds
-MAX_BACKOFF = 10.0  # seconds
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "gdelt_events"
+# Enforcement attention is registered as its own source
+ENFORCEMENT_SOURCE_ID = "gdelt_enforcement"
 
 
 @dataclass
@@ -79,80 +89,30 @@ class GDELTEventsFetcher:
         """
         self.cache_duration_minutes = cache_duration_minutes
         self._cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
+        # Raw timelines shared by all fetch_* methods and fetchers (merged
+        # per cycle)
+        self._planner = get_gdelt_planner(cache_duration_minutes)
 
     def _make_request_with_retries(
-        self, url: str, timeout: Tuple[float, float] = (10.0, 30.0)
+        self, url: str, timeout: Optional[Tuple[float, float]] = None
     ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
         """
-        Make HTTP request with exponential backoff retries.
+        Make HTTP request over the pooled transport with the source's retry policy.
 
         Args:
             url: URL to request
-            timeout: (connect_timeout, read_timeout) tuple
+            timeout: (connect_timeout, read_timeout) override (default: source
+                policy)
 
         Returns:
             Tuple of (response, error_type, http_status)
             error_type: None if success, else one of: timeout, http_error, other
         """
-        backoff = INITIAL_BACKOFF
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(url, timeout=timeout)
-                # Explicit status code check
-                if response.status_code == 200:
-                    return response, None, 200
-                else:
-                    error_type = "http_error"
-                    http_status = response.status_code
-                    if attempt < MAX_RETRIES - 1:
-                        # Retry on non-200 status
-                        logger.warning(
-                            "GDELT API returned non-200 status, retrying",
-                            status_code=http_status,
-                            attempt=attempt + 1,
-                            max_retries=MAX_RETRIES,
-                        )
-                        time.sleep(backoff)
-                        backoff = min(backoff * 2, MAX_BACKOFF)
-                        continue
-                    return response, error_type, http_status
-            except requests.exceptions.Timeout:
-                error_type = "timeout"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "GDELT API timeout, retrying",
-                        attempt=attempt + 1,
-                        max_retries=MAX_RETRIES,
-                        backoff=backoff,
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except requests.exceptions.RequestException as e:
-                error_type = "http_error"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "GDELT API request exception, retrying",
-                        error=str(e)[:100],
-                        attempt=attempt + 1,
-                        max_retries=MAX_RETRIES,
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except Exception as e:
-                error_type = "other"
-                logger.error(
-                    "Unexpected error in GDELT request",
-                    error=str(e)[:200],
-                    exc_info=True,
-                )
-                return None, error_type, None
-
-        return None, "other", None
+        return get_http_transport().get_with_retries(
+            url,
+            source_id=SOURCE_ID,
+            timeout=timeout,
+        )
 
     def _validate_response(
         self, response: requests.Response
@@ -200,6 +160,83 @@ class GDELTEventsFetcher:
 
         return True, None, None
 
+    def _request_timeline(self, query: TimelineQuery) -> TimelineResult:
+        """
+        Send one DOC API timeline request and parse the response.
+
+        Args:
+            query: Timeline and window to request
+
+        Returns:
+            TimelineResult (data is None on failure, with error_type:
+            timeout, http_error, non_json, empty, decode_error, other)
+        """
+        url = query.url(datetime.now())
+        response, request_error_type, http_status = self._make_request_with_retries(url)
+
+        def failed(error_type: Optional[str], error_detail: str) -> TimelineResult:
+            return TimelineResult(
+                data=None,
+                http_status=http_status,
+                error_type=error_type,
+                error_detail=error_detail,
+                days_back=query.days_back,
+            )
+
+        if response is None:
+            retries = get_http_policy(SOURCE_ID).max_retries
+            return failed(
+                request_error_type or "other",
+                f"Request failed after {retries} retries",
+            )
+
+        # Check HTTP status - if not 200, return error immediately
+        if http_status != 200:
+            return failed("http_error", f"HTTP {http_status} error")
+
+        is_valid, validation_error_type, validation_error_detail = (
+            self._validate_response(response)
+        )
+        if not is_valid:
+            return failed(validation_error_type, validation_error_detail)
+
+        try:
+            data = response.json()
+        except json.JSONDecodeError as e:
+            return failed("decode_error", f"JSON decode error: {str(e)[:100]}")
+        # Ensure data is a dict (handle Mock objects in tests)
+        if not isinstance(data, dict):
+            if hasattr(data, "return_value") and isinstance(data.return_value, dict):
+                data = data.return_value
+            else:
+                data = {}
+
+        return TimelineResult(
+            data=data, http_status=http_status, days_back=query.days_back
+        )
+
+    def plan_cycle(self, regions: Iterable[Tuple[Optional[str], int]]) -> int:
+        """
+        Register the GDELT timelines a refresh cycle will need.
+
+        Each region's forecast reads the global tone timeline plus its
+        legislative and enforcement timelines. Needs for the same timeline
+        are merged into one request for the widest window, fetched by the
+        first consumer and sliced for the rest.
+
+        Args:
+            regions: (region_name, days_back) per region in the cycle
+
+        Returns:
+            Number of DOC API requests the cycle will send
+        """
+        needs = []
+        for region_name, days_back in regions:
+            needs.append(timeline_query(THEME_TONE, days_back))
+            needs.append(timeline_query(THEME_LEGISLATIVE, days_back, region_name))
+            needs.append(timeline_query(THEME_ENFORCEMENT, days_back, region_name))
+        return len(self._planner.plan(needs))
+
     def fetch_event_tone(
         self,
         days_back: int = 30,
@@ -242,7 +279,13 @@ class GDELTEventsFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_event_tone(days_back, use_cache=False),
+            ):
                 logger.info("Using cached GDELT tone data")
                 status = SourceStatus(
                     provider="GDELT",
@@ -254,113 +297,33 @@ class GDELTEventsFetcher:
                 )
                 return df.copy(), status
 
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-
-        # GDELT query for average tone by date
-        # Use STARTDATETIME/ENDDATETIME without TIMESPAN (they are mutually exclusive)
-        # Query parameter is required (minimal filter: sourcelang:english)
-        query = (
-            f"mode=timelinetone&format=json&"
-            f"query=sourcelang:english&"
-            f"startdatetime={start_date.strftime('%Y%m%d%H%M%S')}&"
-            f"enddatetime={end_date.strftime('%Y%m%d%H%M%S')}"
-        )
-
         logger.info("Fetching GDELT tone data", days_back=days_back)
-        url = f"{GDELT_API_BASE}?{query}"
-
-        # Make request with retries
-        response, request_error_type, http_status = self._make_request_with_retries(url)
-
-        if response is None:
-            # Request failed
-            error_detail = f"Request failed after {MAX_RETRIES} retries"
-            status = SourceStatus(
-                provider="GDELT",
-                ok=False,
-                http_status=http_status,
-                error_type=request_error_type or "other",
-                error_detail=error_detail,
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
-            )
-            logger.error(
-                "GDELT request failed",
-                error_type=status.error_type,
-                error_detail=error_detail,
-            )
-            return pd.DataFrame(columns=["timestamp", "tone_score"]), status
-
-        # Check HTTP status - if not 200, return error immediately
-        if http_status != 200:
-            status = SourceStatus(
-                provider="GDELT",
-                ok=False,
-                http_status=http_status,
-                error_type="http_error",
-                error_detail=f"HTTP {http_status} error",
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
-            )
-            logger.error(
-                "GDELT HTTP error",
-                http_status=http_status,
-            )
-            return pd.DataFrame(columns=["timestamp", "tone_score"]), status
-
-        # Validate response
-        is_valid, validation_error_type, validation_error_detail = (
-            self._validate_response(response)
+        result = self._planner.timeline(
+            timeline_query(THEME_TONE, days_back),
+            self._request_timeline,
+            use_cache=use_cache,
         )
+        http_status = result.http_status
 
-        if not is_valid:
+        if result.data is None:
             status = SourceStatus(
                 provider="GDELT",
                 ok=False,
                 http_status=http_status,
-                error_type=validation_error_type,
-                error_detail=validation_error_detail,
+                error_type=result.error_type,
+                error_detail=result.error_detail,
                 fetched_at=fetched_at,
                 rows=0,
                 query_window_days=days_back,
             )
             logger.error(
-                "GDELT response validation failed",
+                "GDELT request failed",
                 error_type=status.error_type,
                 error_detail=status.error_detail,
                 http_status=http_status,
             )
             return pd.DataFrame(columns=["timestamp", "tone_score"]), status
-
-        # Parse JSON
-        try:
-            data = response.json()
-            # Ensure data is a dict (handle Mock objects in tests)
-            if not isinstance(data, dict):
-                # If response.json() returns a Mock or non-dict, try to extract value
-                if hasattr(data, "return_value"):
-                    data = (
-                        data.return_value if isinstance(data.return_value, dict) else {}
-                    )
-                else:
-                    data = {}
-        except json.JSONDecodeError as e:
-            status = SourceStatus(
-                provider="GDELT",
-                ok=False,
-                http_status=http_status,
-                error_type="decode_error",
-                error_detail=f"JSON decode error: {str(e)[:100]}",
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
-            )
-            logger.error("GDELT JSON decode failed", error=str(e)[:200])
-            return pd.DataFrame(columns=["timestamp", "tone_score"]), status
+        data = result.data
 
         # Parse timeline data
         if "timeline" not in data or not data["timeline"]:
@@ -536,7 +499,6 @@ class GDELTEventsFetcher:
             legislative_attention is normalized to [0.0, 1.0] where 1.0 = high legislative activity
         """
         import math
-        import urllib.parse
 
         fetched_at = datetime.now().isoformat()
         cache_key = f"gdelt_legislative_{region_name or 'global'}_{days_back}"
@@ -545,7 +507,15 @@ class GDELTEventsFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_legislative_attention(
+                    region_name, days_back, use_cache=False
+                ),
+            ):
                 logger.info("Using cached GDELT legislative data")
                 status = SourceStatus(
                     provider="GDELT Legislative Events",
@@ -557,99 +527,36 @@ class GDELTEventsFetcher:
                 )
                 return df.copy(), status
 
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-
-        # Build GDELT query for legislative/governance-related events
-        # Keywords: legislature, legislative, bill, bills, law, laws, state house, state senate,
-        # state legislature, governor, executive order, policy change
-        base_query = (
-            "sourcelang:english AND (legislature OR legislative OR bill OR bills OR "
-            'law OR laws OR "state house" OR "state senate" OR "state legislature" OR '
-            'governor OR "executive order" OR "policy change")'
-        )
-
-        # Add region filter if provided
-        if region_name:
-            base_query = f'{base_query} AND "{region_name}"'
-
-        # URL encode the query
-        encoded_query = urllib.parse.quote(base_query, safe="")
-
-        # GDELT query for event volume timeline
-        query = (
-            f"mode=timelinevol&format=json&"
-            f"query={encoded_query}&"
-            f"startdatetime={start_date.strftime('%Y%m%d%H%M%S')}&"
-            f"enddatetime={end_date.strftime('%Y%m%d%H%M%S')}"
-        )
-
         logger.info(
             "Fetching GDELT legislative events",
             region_name=region_name,
             days_back=days_back,
         )
-        url = f"{GDELT_API_BASE}?{query}"
-
-        # Make request with retries
-        response, request_error_type, http_status = self._make_request_with_retries(url)
-
-        if response is None:
-            error_detail = f"Request failed after {MAX_RETRIES} retries"
-            status = SourceStatus(
-                provider="GDELT Legislative Events",
-                ok=False,
-                http_status=http_status,
-                error_type=request_error_type or "other",
-                error_detail=error_detail,
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
-            )
-            logger.error(
-                "GDELT legislative request failed", error_type=status.error_type
-            )
-            return pd.DataFrame(columns=["timestamp", "legislative_attention"]), status
-
-        # Validate response
-        is_valid, validation_error_type, validation_error_detail = (
-            self._validate_response(response)
+        result = self._planner.timeline(
+            timeline_query(THEME_LEGISLATIVE, days_back, region_name),
+            self._request_timeline,
+            use_cache=use_cache,
         )
-        if not is_valid:
+        http_status = result.http_status
+
+        if result.data is None:
             status = SourceStatus(
                 provider="GDELT Legislative Events",
                 ok=False,
                 http_status=http_status,
-                error_type=validation_error_type,
-                error_detail=validation_error_detail,
+                error_type=result.error_type,
+                error_detail=result.error_detail,
                 fetched_at=fetched_at,
                 rows=0,
                 query_window_days=days_back,
             )
             logger.error(
-                "GDELT legislative response validation failed",
+                "GDELT legislative request failed",
                 error_type=status.error_type,
-                error_detail=validation_error_detail,
-            )
-            return pd.DataFrame(columns=["timestamp", "legislative_attention"]), status
-
-        # Parse JSON
-        try:
-            data = response.json()
-        except json.JSONDecodeError as e:
-            status = SourceStatus(
-                provider="GDELT Legislative Events",
-                ok=False,
-                http_status=http_status,
-                error_type="decode_error",
-                error_detail=f"JSON decode error: {str(e)[:100]}",
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
+                error_detail=status.error_detail,
             )
-            logger.error("GDELT legislative JSON decode failed", error=str(e)[:200])
             return pd.DataFrame(columns=["timestamp", "legislative_attention"]), status
+        data = result.data
 
         # Parse timeline data
         if "timeline" not in data or not data["timeline"]:
@@ -774,7 +681,15 @@ class GDELTEventsFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                ENFORCEMENT_SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_enforcement_attention(
+                    region_name, days_back, use_cache=False
+                ),
+            ):
                 logger.info("Using cached GDELT enforcement data")
                 status = SourceStatus(
                     provider="GDELT Enforcement Events",
@@ -786,98 +701,36 @@ class GDELTEventsFetcher:
                 )
                 return df.copy(), status
 
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-
-        # Build GDELT query for enforcement-related events
-        # Keywords: ICE, immigration enforcement, deportation, removal, raid, detention
-        # Use OR logic: (ICE OR "immigration enforcement" OR deportation OR removal OR raid OR "detention center")
-        base_query = 'sourcelang:english AND (ICE OR "immigration enforcement" OR deportation OR removal OR raid OR "detention center")'
-
-        # Add region filter if provided (simple keyword-based approach)
-        # Note: More sophisticated geo filtering could use GDELT's location:state or location:country filters
-        if region_name:
-            base_query = f'{base_query} AND "{region_name}"'
-
-        # URL encode the query
-        import urllib.parse
-
-        encoded_query = urllib.parse.quote(base_query, safe="")
-
-        # GDELT query for event volume timeline
-        query = (
-            f"mode=timelinevol&format=json&"
-            f"query={encoded_query}&"
-            f"startdatetime={start_date.strftime('%Y%m%d%H%M%S')}&"
-            f"enddatetime={end_date.strftime('%Y%m%d%H%M%S')}"
-        )
-
         logger.info(
             "Fetching GDELT enforcement events",
             region_name=region_name,
             days_back=days_back,
         )
-        url = f"{GDELT_API_BASE}?{query}"
-
-        # Make request with retries
-        response, request_error_type, http_status = self._make_request_with_retries(url)
-
-        if response is None:
-            error_detail = f"Request failed after {MAX_RETRIES} retries"
-            status = SourceStatus(
-                provider="GDELT Enforcement Events",
-                ok=False,
-                http_status=http_status,
-                error_type=request_error_type or "other",
-                error_detail=error_detail,
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
-            )
-            logger.error(
-                "GDELT enforcement request failed", error_type=status.error_type
-            )
-            return pd.DataFrame(columns=["timestamp", "enforcement_attention"]), status
-
-        # Validate response
-        is_valid, validation_error_type, validation_error_detail = (
-            self._validate_response(response)
+        result = self._planner.timeline(
+            timeline_query(THEME_ENFORCEMENT, days_back, region_name),
+            self._request_timeline,
+            use_cache=use_cache,
         )
-        if not is_valid:
+        http_status = result.http_status
+
+        if result.data is None:
             status = SourceStatus(
                 provider="GDELT Enforcement Events",
                 ok=False,
                 http_status=http_status,
-                error_type=validation_error_type,
-                error_detail=validation_error_detail,
+                error_type=result.error_type,
+                error_detail=result.error_detail,
                 fetched_at=fetched_at,
                 rows=0,
                 query_window_days=days_back,
             )
             logger.error(
-                "GDELT enforcement response validation failed",
+                "GDELT enforcement request failed",
                 error_type=status.error_type,
-                error_detail=validation_error_detail,
-            )
-            return pd.DataFrame(columns=["timestamp", "enforcement_attention"]), status
-
-        # Parse JSON
-        try:
-            data = response.json()
-        except json.JSONDecodeError as e:
-            status = SourceStatus(
-                provider="GDELT Enforcement Events",
-                ok=False,
-                http_status=http_status,
-                error_type="decode_error",
-                error_detail=f"JSON decode error: {str(e)[:100]}",
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
+                error_detail=status.error_detail,
             )
-            logger.error("GDELT enforcement JSON decode failed", error=str(e)[:200])
             return pd.DataFrame(columns=["timestamp", "enforcement_attention"]), status
+        data = result.data
 
         # Parse timeline data
         if "timeline" not in data or not data["timeline"]:
@@ -1002,34 +855,36 @@ class GDELTEventsFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_event_count(days_back, event_type, use_cache=False),
+            ):
                 logger.info("Using cached GDELT event count data")
                 return df.copy()
 
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-
         try:
-            # GDELT query for event counts by date
-            # Using simplified query (GDELT API can be complex)
-            query = (
-                f"mode=timelinevol&format=json&timespan=1d&"
-                f"startdatetime={start_date.strftime('%Y%m%d%H%M%S')}&"
-                f"enddatetime={end_date.strftime('%Y%m%d%H%M%S')}"
-            )
-
             logger.info(
                 "Fetching GDELT event count data",
                 days_back=days_back,
                 event_type=event_type,
             )
-            url = f"{GDELT_API_BASE}?{query}"
-
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            result = self._planner.timeline(
+                timeline_query(THEME_EVENTS, days_back),
+                self._request_timeline,
+                use_cache=use_cache,
+            )
+            if result.data is None:
+                logger.error(
+                    "Error fetching GDELT event count data",
+                    error_type=result.error_type,
+                    error_detail=result.error_detail,
+                )
+                return pd.DataFrame(columns=["timestamp", "event_count"])
 
-            data = response.json()
+            data = result.data
 
             # Parse timeline data
             if "timeline" not in data or not data["timeline"]:
@@ -1095,14 +950,6 @@ class GDELTEventsFetcher:
 
             return df
 
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                "Error fetching GDELT event count data",
-                error=str(e),
-                exc_info=True,
-            )
-            return pd.DataFrame(columns=["timestamp", "event_count"])
-
         except Exception as e:
             logger.error(
                 "Unexpected error fetching GDELT event count data",
@@ -0,0 +1,363 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Query planning for GDELT DOC API timelines.
+
+Tone, event volume, legislative and enforcement signals are all DOC API
+timelines identified by (mode, query). Within a refresh cycle many consumers
+ask for the same timeline with different windows (days_back) and at the same
+time (concurrent region forecasts). The planner merges those needs: a cycle
+registers what it will need, the first consumer of each timeline fetches the
+widest planned window once, and every other consumer is served a slice of that
+parsed response. GDELT is the slowest and flakiest upstream, so each request
+saved matters.
+"""
+import threading
+import urllib.parse
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger("ingestion.gdelt_query_planner")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = None
+
+# GDELT API base URL
+GDELT_API_BASE = "https://api.gdeltproject.org/api/v2/doc/doc"
+
+THEME_TONE = "tone"
+THEME_EVENTS = "events"
+THEME_LEGISLATIVE = "legislative"
+THEME_ENFORCEMENT = "enforcement"
+
+# Theme -> (DOC API mode, base query). Query parameter is required (minimal
+# filter: sourcelang:english).
+THEMES: Dict[str, Tuple[str, str]] = {
+    THEME_TONE: ("timelinetone", "sourcelang:english"),
+    THEME_EVENTS: ("timelinevol", "sourcelang:english"),
+    # Keywords: legislature, legislative, bill, bills, law, laws, state house,
+    # state senate, state legislature, governor, executive order, policy change
+    THEME_LEGISLATIVE: (
+        "timelinevol",
+        "sourcelang:english AND (legislature OR legislative OR bill OR bills OR "
+        'law OR laws OR "state house" OR "state senate" OR "state legislature" OR '
+        'governor OR "executive order" OR "policy change")',
+    ),
+    # Keywords: ICE, immigration enforcement, deportation, removal, raid, detention
+    THEME_ENFORCEMENT: (
+        "timelinevol",
+        'sourcelang:english AND (ICE OR "immigration enforcement" OR deportation '
+        'OR removal OR raid OR "detention center")',
+    ),
+}
+
+if PROMETHEUS_AVAILABLE:
+    gdelt_timeline_lookups_counter = Counter(
+        "ingestion_gdelt_timeline_lookups_total",
+        "GDELT timeline lookups by whether they sent a DOC API request",
+        ["theme", "result"],
+    )
+else:
+    gdelt_timeline_lookups_counter = None
+
+
+@dataclass(frozen=True)
+class TimelineQuery:
+    """One DOC API timeline a consumer needs."""
+
+    theme: str
+    mode: str
+    query: str  # Unencoded DOC API query
+    days_back: int
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Identity of the timeline, independent of the window."""
+        return self.mode, self.query
+
+    def url(self, end_date: datetime) -> str:
+        """DOC API URL for this timeline's window ending at end_date."""
+        start_date = end_date - timedelta(days=self.days_back)
+        # Use STARTDATETIME/ENDDATETIME without TIMESPAN (mutually exclusive)
+        return (
+            f"{GDELT_API_BASE}?mode={self.mode}&format=json&"
+            f"query={urllib.parse.quote(self.query, safe='')}&"
+            f"startdatetime={start_date.strftime('%Y%m%d%H%M%S')}&"
+            f"enddatetime={end_date.strftime('%Y%m%d%H%M%S')}"
+        )
+
+
+@dataclass
+class TimelineResult:
+    """A parsed DOC API timeline response, or why there is none."""
+
+    data: Optional[Dict]  # Parsed JSON body; None on failure
+    http_status: Optional[int]
+    error_type: Optional[str] = None  # timeout, http_error, non_json, ...
+    error_detail: Optional[str] = None
+    days_back: int = 0  # Window the response covers
+
+
+def timeline_query(
+    theme: str, days_back: int, region_name: Optional[str] = None
+) -> TimelineQuery:
+    """
+    Build the timeline query for a theme.
+
+    Args:
+        theme: One of THEMES
+        days_back: Window in days
+        region_name: Optional region name (state/country) keyword filter
+
+    Returns:
+        TimelineQuery
+    """
+    mode, query = THEMES[theme]
+    if region_name:
+        query = f'{query} AND "{region_name}"'
+    return TimelineQuery(theme=theme, mode=mode, query=query, days_back=days_back)
+
+
+def _entry_day(date_str: object) -> Optional[datetime]:
+    """Day of a timeline entry (YYYYMMDDTHHMMSSZ or YYYYMMDDHHMMSS)."""
+    if not isinstance(date_str, str):
+        return None
+    try:
+        return datetime.strptime(date_str.split("T")[0].replace("-", "")[:8], "%Y%m%d")
+    except ValueError:
+        return None
+
+
+def slice_timeline(data: Dict, since: datetime) -> Dict:
+    """
+    Drop timeline entries dated before since's day.
+
+    Handles both timeline shapes the DOC API returns: series items holding a
+    data list ({series, data: [{date, value}]}) and flat entries
+    ({datetime, ...}). Entries without a parseable date are kept.
+
+    Args:
+        data: Parsed DOC API response
+        since: Start of the window to keep
+
+    Returns:
+        Copy of data with the timeline trimmed
+    """
+    first_day = since.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def keep(date_str: object) -> bool:
+        day = _entry_day(date_str)
+        return day is None or day >= first_day
+
+    timeline = []
+    for item in data.get("timeline") or []:
+        if not isinstance(item, dict):
+            timeline.append(item)
+        elif isinstance(item.get("data"), list):
+            points = [p for p in item["data"] if keep(p.get("date"))]
+            timeline.append({**item, "data": points})
+        elif keep(item.get("datetime")):
+            timeline.append(item)
+    return {**data, "timeline": timeline}
+
+
+Fetch = Callable[[TimelineQuery], TimelineResult]
+
+
+class GDELTQueryPlanner:
+    """
+    Shared, window-merging store of DOC API timelines.
+
+    plan() registers a cycle's needs so the first fetch of each timeline uses
+    the widest window any consumer will ask for. timeline() serves narrower
+    windows by slicing a cached response, and concurrent misses for the same
+    timeline wait for one request (single-flight). One planner is shared by
+    every GDELTEventsFetcher in the process (see get_gdelt_planner).
+    """
+
+    def __init__(self, cache_duration_minutes: float = 60):
+        """
+        Initialize planner.
+
+        Args:
+            cache_duration_minutes: How long fetched timelines and planned
+                windows are kept
+        """
+        self.cache_duration_minutes = cache_duration_minutes
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        # key -> (result, window end)
+        self._timelines: Dict[Tuple[str, str], Tuple[TimelineResult, datetime]] = {}
+        # key -> (widest planned window, planned at)
+        self._planned: Dict[Tuple[str, str], Tuple[int, datetime]] = {}
+
+    def plan(self, needs: Iterable[TimelineQuery]) -> List[TimelineQuery]:
+        """
+        Merge a cycle's timeline needs into the fewest DOC API requests.
+
+        Needs for the same timeline collapse into one request for their
+        widest window. Timelines already cached for that window need no
+        request.
+
+        Args:
+            needs: Timelines the cycle's consumers will ask for
+
+        Returns:
+            The requests the cycle will send (one per timeline still missing)
+        """
+        merged: Dict[Tuple[str, str], TimelineQuery] = {}
+        for need in needs:
+            current = merged.get(need.key)
+            if current is None or need.days_back > current.days_back:
+                merged[need.key] = need
+
+        now = datetime.now()
+        requests = []
+        with self._lock:
+            for key, query in merged.items():
+                planned = self._planned_window(key, now)
+                if planned is None or query.days_back > planned:
+                    self._planned[key] = (query.days_back, now)
+                if self._cached(key, query.days_back, now) is None:
+                    requests.append(query)
+        logger.info(
+            "Planned GDELT timelines", needs=len(merged), requests=len(requests)
+        )
+        return requests
+
+    def timeline(
+        self, query: TimelineQuery, fetch: Fetch, use_cache: bool = True
+    ) -> TimelineResult:
+        """
+        Return a timeline for a query's window.
+
+        Args:
+            query: Timeline and window needed
+            fetch: Sends one DOC API request and parses the response (only
+                called on a miss)
+            use_cache: Whether a cached (wider) response may be reused
+
+        Returns:
+            TimelineResult (data is None on failure)
+        """
+        if use_cache:
+            cached = self._lookup(query)
+            if cached is not None:
+                self._count(query.theme, "reused")
+                return cached
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(query.key, threading.Lock())
+        with fetch_lock:
+            # Another consumer may have fetched it while we waited
+            if use_cache:
+                cached = self._lookup(query)
+                if cached is not None:
+                    self._count(query.theme, "reused")
+                    return cached
+
+            with self._lock:
+                planned = self._planned_window(query.key, datetime.now())
+            request = query
+            if planned is not None and planned > query.days_back:
+                request = replace(query, days_back=planned)
+            end_date = datetime.now()
+            result = fetch(request)
+            self._count(query.theme, "fetched")
+            if result.data is None:
+                return result
+            with self._lock:
+                self._timelines[query.key] = (result, end_date)
+            return self._window(result, end_date, query.days_back)
+
+    def clear(self) -> None:
+        """Drop cached timelines and planned windows."""
+        with self._lock:
+            self._timelines.clear()
+            self._planned.clear()
+
+    def _lookup(self, query: TimelineQuery) -> Optional[TimelineResult]:
+        with self._lock:
+            entry = self._cached(query.key, query.days_back, datetime.now())
+        if entry is None:
+            return None
+        result, end_date = entry
+        return self._window(result, end_date, query.days_back)
+
+    def _cached(
+        self, key: Tuple[str, str], days_back: int, now: datetime
+    ) -> Optional[Tuple[TimelineResult, datetime]]:
+        """Fresh cached response covering days_back (caller holds the lock)."""
+        entry = self._timelines.get(key)
+        if entry is None:
+            return None
+        result, end_date = entry
+        age_minutes = (now - end_date).total_seconds() / 60
+        if age_minutes >= self.cache_duration_minutes or result.days_back < days_back:
+            return None
+        return entry
+
+    def _planned_window(self, key: Tuple[str, str], now: datetime) -> Optional[int]:
+        """Widest window planned for key this cycle (caller holds the lock)."""
+        entry = self._planned.get(key)
+        if entry is None:
+            return None
+        days_back, planned_at = entry
+        if (now - planned_at).total_seconds() / 60 >= self.cache_duration_minutes:
+            return None
+        return days_back
+
+    @staticmethod
+    def _window(
+        result: TimelineResult, end_date: datetime, days_back: int
+    ) -> TimelineResult:
+        if result.days_back <= days_back:
+            return result
+        return replace(
+            result,
+            data=slice_timeline(result.data, end_date - timedelta(days=days_back)),
+            days_back=days_back,
+        )
+
+    @staticmethod
+    def _count(theme: str, result: str) -> None:
+        if gdelt_timeline_lookups_counter is not None:
+            gdelt_timeline_lookups_counter.labels(theme=theme, result=result).inc()
+
+
+# Process-wide planners, one per cache duration, shared by all fetchers
+_planners: Dict[float, GDELTQueryPlanner] = {}
+_planners_lock = threading.Lock()
+
+
+def get_gdelt_planner(cache_duration_minutes: float = 60) -> GDELTQueryPlanner:
+    """
+    Get or create the shared planner for a cache duration.
+
+    Args:
+        cache_duration_minutes: How long fetched timelines are kept
+
+    Returns:
+        GDELTQueryPlanner shared by every fetcher with that cache duration
+    """
+    with _planners_lock:
+        planner = _planners.get(cache_duration_minutes)
+        if planner is None:
+            planner = GDELTQueryPlanner(cache_duration_minutes)
+            _planners[cache_duration_minutes] = planner
+        return planner
+
+
+def reset_gdelt_planners() -> None:
+    """Drop all shared planners and their cached timelines."""
+    with _planners_lock:
+        for planner in _planners.values():
+            planner.clear()
+        _planners.clear()
@@ -1,15 +1,19 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Our World in Data (OWID) connector for public health indicators."""
 from datetime import datetime, timedelta
+from io import BytesIO
 
 import pandas as pd
-import requests
 import structlog
 
+from app.services.ingestion.conditional_fetch import get_validator_cache
+
 logger = structlog.get_logger("ingestion.health_owid")
 
 # OWID data repository base URL
 OWID_CSV_BASE = "https://raw.githubusercontent.com/owid/owid-datasets/master/datasets"
+# (connect, read) timeout for the multi-MB dataset CSVs
+OWID_TIMEOUT = (10.0, 60.0)
 
 
 class OWIDHealthFetcher:
@@ -84,13 +88,25 @@ class OWIDHealthFetcher:
                 days_back=days_back,
             )
 
-            response = requests.get(url, timeout=60)
-            response.raise_for_status()
+            # Revalidate the stored CSV (ETag / Last-Modified) with retries
+            result = get_validator_cache().fetch(url, timeout=OWID_TIMEOUT)
+            if result.content is None:
+                logger.error(
+                    "Error fetching OWID excess mortality data",
+                    error_type=result.error_type,
+                    http_status=result.http_status,
+                )
+                return pd.DataFrame(columns=["timestamp", "excess_mortality"])
+
+            # Unchanged dataset: keep the parsed series, only refresh its timestamp
+            if result.not_modified and cache_key in self._cache:
+                cached_df, _ = self._cache[cache_key]
+                self._cache[cache_key] = (cached_df, datetime.now())
+                logger.info("OWID excess mortality data not modified")
+                return cached_df.copy()
 
             # Read CSV
-            from io import StringIO
-
-            df = pd.read_csv(StringIO(response.text))
+            df = pd.read_csv(BytesIO(result.content))
 
             # Filter by country and date range
             if "Entity" in df.columns:
@@ -174,14 +190,6 @@ class OWIDHealthFetcher:
 
             return result_df
 
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                "Error fetching OWID excess mortality data",
-                error=str(e),
-                exc_info=True,
-            )
-            return pd.DataFrame(columns=["timestamp", "excess_mortality"])
-
         except Exception as e:
             logger.error(
                 "Unexpected error fetching OWID excess mortality data",
@@ -0,0 +1,361 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Pooled keep-alive HTTP transport shared by ingestion fetchers.
+
+One requests.Session per host keeps TCP/TLS connections alive across calls,
+and the retry/backoff/timeout loop that fetchers used to duplicate lives here,
+driven by each source's HTTPPolicy in the source registry. Every request
+first takes a token from the host's rate limit bucket (see rate_limiter).
+"""
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+import structlog
+from requests.adapters import HTTPAdapter
+
+from app.services.ingestion.circuit_breaker import (
+    CircuitOpenError,
+    get_circuit_breaker,
+    is_failure_status,
+)
+from app.services.ingestion.rate_limiter import RateLimitTimeout, get_rate_limiter
+from app.services.ingestion.source_registry import get_http_policy
+
+logger = structlog.get_logger("ingestion.http_transport")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter, Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = Histogram = None
+
+# Connections kept open per host (also the number of concurrent requests
+# to one host that can each hold a live connection)
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))
+DEFAULT_USER_AGENT = "HumanBehaviourConvergence/1.0"
+
+if PROMETHEUS_AVAILABLE:
+    http_request_duration_histogram = Histogram(
+        "ingestion_http_request_duration_seconds",
+        "Latency of upstream HTTP requests per host",
+        ["host"],
+    )
+    http_response_bytes_counter = Counter(
+        "ingestion_http_response_bytes_total",
+        "Response body bytes received per host",
+        ["host"],
+    )
+    http_connections_counter = Counter(
+        "ingestion_http_requests_by_connection_total",
+        "Upstream HTTP requests by whether a pooled connection was reused",
+        ["host", "reused"],
+    )
+else:
+    http_request_duration_histogram = None
+    http_response_bytes_counter = None
+    http_connections_counter = None
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class HTTPTransport:
+    """
+    Per-host pooled sessions with centralized retry policy.
+
+    Sessions are created lazily per scheme+host and reused for the life of
+    the transport. urllib3-level retries are disabled; get_with_retries owns
+    retries so that backoff and error classification are uniform.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            pool_maxsize: Connections kept alive per host
+            user_agent: Default User-Agent header
+        """
+        self.pool_maxsize = pool_maxsize
+        self.user_agent = user_agent
+        self._sessions: Dict[str, requests.Session] = {}
+        self._connections_seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        """
+        Return the pooled session for a URL's host.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            requests.Session shared by all requests to that host
+        """
+        base = self._base_url(url)
+        with self._lock:
+            session = self._sessions.get(base)
+            if session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=0
+                )
+                session = requests.Session()
+                session.headers["User-Agent"] = self.user_agent
+                session.mount(base, adapter)
+                self._sessions[base] = session
+            return session
+
+    def get(
+        self,
+        url: str,
+        source_id: Optional[str] = None,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> requests.Response:
+        """
+        Issue a single GET over the host's pooled connection.
+
+        Args:
+            url: Request URL
+            source_id: Source registry id (for the default timeout)
+            params: Query parameters
+            headers: Extra headers (merged over session defaults)
+            timeout: Timeout override (default: the source's policy)
+
+        Returns:
+            requests.Response
+
+        Raises:
+            CircuitOpenError: If the source's circuit breaker is open
+            RateLimitTimeout: If no rate limit token was available in time
+            requests.exceptions.RequestException: On transport errors
+        """
+        breaker = get_circuit_breaker(source_id) if source_id else None
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for source {source_id}")
+        try:
+            response = self._send(url, source_id, params, headers, timeout)
+        except RateLimitTimeout:
+            if breaker is not None:
+                breaker.release()
+            raise
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            if is_failure_status(response.status_code):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return response
+
+    def get_with_retries(
+        self,
+        url: str,
+        source_id: Optional[str] = None,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
+        """
+        GET with exponential backoff retries per the source's policy.
+
+        Args:
+            url: Request URL
+            source_id: Source registry id (selects the HTTPPolicy)
+            params: Query parameters
+            headers: Extra headers
+            timeout: Timeout override (default: the source's policy)
+
+        Returns:
+            Tuple of (response, error_type, http_status)
+            error_type: None if success (200, or 304 for conditional requests),
+            else one of: timeout, http_error, other, circuit_open (returned
+            immediately, without a request, while the source's circuit is open),
+            rate_limited (no rate limit token was available in time)
+        """
+        breaker = get_circuit_breaker(source_id) if source_id else None
+        if breaker is not None and not breaker.allow():
+            logger.info("Circuit open, skipping upstream request", source=source_id)
+            return None, "circuit_open", None
+
+        response, error_type, http_status = self._retry(
+            url, source_id, params, headers, timeout
+        )
+        if breaker is not None:
+            if error_type == "rate_limited":
+                breaker.release()
+            elif response is None or is_failure_status(http_status):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return response, error_type, http_status
+
+    def close(self) -> None:
+        """Close all pooled sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._connections_seen.clear()
+
+    def _send(
+        self,
+        url: str,
+        source_id: Optional[str],
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        timeout: Optional[Timeout],
+    ) -> requests.Response:
+        """One rate-limited GET with metrics, bypassing the circuit breaker."""
+        if not get_rate_limiter().acquire(url, source_id):
+            raise RateLimitTimeout(f"No rate limit token for {urlsplit(url).netloc}")
+        if timeout is None:
+            timeout = get_http_policy(source_id).timeout
+        session = self.session_for(url)
+        host = urlsplit(url).netloc
+        start = time.perf_counter()
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+        self._record(host, time.perf_counter() - start, response)
+        return response
+
+    def _retry(
+        self,
+        url: str,
+        source_id: Optional[str],
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        timeout: Optional[Timeout],
+    ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
+        """Backoff retry loop of get_with_retries (one breaker outcome)."""
+        policy = get_http_policy(source_id)
+        backoff = policy.initial_backoff
+        source = source_id or urlsplit(url).netloc
+
+        for attempt in range(policy.max_retries):
+            last_attempt = attempt >= policy.max_retries - 1
+            try:
+                response = self._send(url, source_id, params, headers, timeout)
+                if response.status_code == 200:
+                    return response, None, 200
+                if response.status_code == 304:
+                    # Only sent for conditional requests (see conditional_fetch)
+                    return response, None, 304
+                http_status = response.status_code
+                if last_attempt or not policy.should_retry(http_status):
+                    return response, "http_error", http_status
+                logger.warning(
+                    "Upstream returned non-200 status, retrying",
+                    source=source,
+                    status_code=http_status,
+                    attempt=attempt + 1,
+                    max_retries=policy.max_retries,
+                )
+            except RateLimitTimeout:
+                # Retrying would only queue behind the same bucket
+                return None, "rate_limited", None
+            except requests.exceptions.Timeout:
+                if last_attempt:
+                    return None, "timeout", None
+                logger.warning(
+                    "Upstream timeout, retrying",
+                    source=source,
+                    attempt=attempt + 1,
+                    max_retries=policy.max_retries,
+                    backoff=backoff,
+                )
+            except requests.exceptions.RequestException as e:
+                if last_attempt:
+                    return None, "http_error", None
+                logger.warning(
+                    "Upstream request exception, retrying",
+                    source=source,
+                    error=str(e)[:100],
+                    attempt=attempt + 1,
+                    max_retries=policy.max_retries,
+                )
+            except Exception as e:
+                logger.error(
+                    "Unexpected error in upstream request",
+                    source=source,
+                    error=str(e)[:200],
+                    exc_info=True,
+                )
+                return None, "other", None
+            time.sleep(backoff)
+            backoff = min(backoff * 2, policy.max_backoff)
+
+        return None, "other", None
+
+    @staticmethod
+    def _base_url(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _connection_reused(
+        self, host: str, response: requests.Response
+    ) -> Optional[bool]:
+        """
+        Whether the response came over an already-open connection.
+
+        Compares the serving pool's count of opened connections with the
+        count seen on the previous response from that host, so no pool
+        locks are taken (approximate under concurrent requests).
+        """
+        pool = getattr(getattr(response, "raw", None), "_pool", None)
+        opened = getattr(pool, "num_connections", None)
+        if not isinstance(opened, int):
+            return None
+        with self._lock:
+            previous = self._connections_seen.get(host)
+            self._connections_seen[host] = opened
+        return previous is not None and opened == previous
+
+    def _record(self, host: str, elapsed: float, response: requests.Response) -> None:
+        """Record latency, bytes and connection reuse for one request."""
+        if http_request_duration_histogram is None:
+            return
+        http_request_duration_histogram.labels(host=host).observe(elapsed)
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray)):
+            http_response_bytes_counter.labels(host=host).inc(len(content))
+        reused = self._connection_reused(host, response)
+        if reused is not None:
+            http_connections_counter.labels(
+                host=host, reused="true" if reused else "false"
+            ).inc()
+
+
+# Global instance (singleton pattern)
+_http_transport_instance: Optional[HTTPTransport] = None
+_http_transport_lock = threading.Lock()
+
+
+def get_http_transport() -> HTTPTransport:
+    """Get or create the global HTTPTransport instance."""
+    global _http_transport_instance
+    with _http_transport_lock:
+        if _http_transport_instance is None:
+            _http_transport_instance = HTTPTransport()
+        return _http_transport_instance
+
+
+def reset_http_transport() -> None:
+    """Close and reset the global HTTPTransport singleton instance."""
+    global _http_transport_instance
+    with _http_transport_lock:
+        if _http_transport_instance is not None:
+            _http_transport_instance.close()
+        _http_transport_instance = None
@@ -1,6 +1,5 @@
 # SPDX-LICENSE-IDENTIFIER: PROPRIETARY
 """Mobility data ingestion using public APIs for activity pattern analysis."""
-import time
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
@@ -13,9 +12,15 @@ from app.services.ingestion.ci_offline_data import (
     get_ci_mobility_data,
 )
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.http_transport import get_http_transport
+from app.services.ingestion.source_registry import get_http_policy
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.mobility")
 
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "mobility_patterns"
+
 # Import SourceStatus from gdelt_events (reuse pattern)
 
 # TSA passenger throughput (public dataset)
@@ -27,11 +32,6 @@ TSA_DATA_URLS = [
 # Fallback: Use a simple public mobility proxy if TSA unavailable
 # We'll use a deterministic signal based on day-of-week patterns as fallback
 
-# Retry configuration
-MAX_RETRIES = 3
-INITIAL_BACKOFF = 1.0
-MAX_BACKOFF = 10.0
-
 
 class MobilityFetcher:
     """
@@ -54,56 +54,25 @@ class MobilityFetcher:
         self._cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
 
     def _make_request_with_retries(
-        self, url: str, timeout: Tuple[float, float] = (10.0, 60.0)
+        self, url: str, timeout: Optional[Tuple[float, float]] = None
     ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
-        """Make HTTP request with exponential backoff retries."""
-        backoff = INITIAL_BACKOFF
-        headers = {"User-Agent": "HumanBehaviourConvergence/1.0"}
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-                if response.status_code == 200:
-                    return response, None, 200
-                else:
-                    error_type = "http_error"
-                    http_status = response.status_code
-                    if attempt < MAX_RETRIES - 1:
-                        logger.warning(
-                            "TSA API returned non-200 status, retrying",
-                            status_code=http_status,
-                            attempt=attempt + 1,
-                        )
-                        time.sleep(backoff)
-                        backoff = min(backoff * 2, MAX_BACKOFF)
-                        continue
-                    return response, error_type, http_status
-            except requests.exceptions.Timeout:
-                error_type = "timeout"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning("TSA API timeout, retrying", attempt=attempt + 1)
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except requests.exceptions.RequestException as e:
-                error_type = "http_error"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "TSA API request exception, retrying", error=str(e)[:100]
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except Exception as e:
-                error_type = "other"
-                logger.error(
-                    "Unexpected error in TSA request", error=str(e)[:200], exc_info=True
-                )
-                return None, error_type, None
+        """
+        Make HTTP request over the pooled transport with the source's retry policy.
 
-        return None, "other", None
+        Args:
+            url: URL to request
+            timeout: (connect_timeout, read_timeout) override (default: source
+                policy)
+
+        Returns:
+            Tuple of (response, error_type, http_status)
+            error_type: None if success, else one of: timeout, http_error, other
+        """
+        return get_http_transport().get_with_retries(
+            url,
+            source_id=SOURCE_ID,
+            timeout=timeout,
+        )
 
     def fetch_mobility_index(
         self,
@@ -188,7 +157,15 @@ class MobilityFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self._fetch_mobility_index_with_status(
+                    region_code, latitude, longitude, days_back, use_cache=False
+                ),
+            ):
                 logger.info("Using cached TSA mobility data", age_minutes=age_minutes)
                 status = SourceStatus(
                     provider="TSA Passenger Throughput",
@@ -264,7 +241,8 @@ class MobilityFetcher:
 
         # This should not be reached if fallback was used, but keep as safety check
         if response is None:
-            error_detail = f"Request failed after {MAX_RETRIES} retries"
+            retries = get_http_policy(SOURCE_ID).max_retries
+            error_detail = f"Request failed after {retries} retries"
             status = SourceStatus(
                 provider="TSA Passenger Throughput",
                 ok=False,
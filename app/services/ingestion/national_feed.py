@@ -0,0 +1,209 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Nationwide datasets fetched once and indexed by state.
+
+Per-state fetchers (NWS alerts, OpenFEMA declarations, EIA fuel prices) used
+to query their upstream once per state. In national feed mode each source
+pulls the nationwide dataset once per TTL into a process-wide feed indexed by
+two-letter state code, so per-region calls become dictionary lookups: a
+warm-up over all state regions costs one upstream call per source instead of
+one per state, however many fetcher instances take part.
+"""
+import os
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import structlog
+
+from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.stale_refresh import serve_stale
+
+logger = structlog.get_logger("ingestion.national_feed")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = None
+
+NATIONAL_FEED_MODE_ENABLED = (
+    os.getenv("NATIONAL_FEED_MODE_ENABLED", "true").lower() == "true"
+)
+
+# How long a failed load is reported to later callers before retrying, so an
+# outage costs one failed load per window rather than one per state
+NATIONAL_FEED_FAILURE_TTL_SECONDS = float(
+    os.getenv("NATIONAL_FEED_FAILURE_TTL_SECONDS", "60")
+)
+
+if PROMETHEUS_AVAILABLE:
+    national_feed_loads_counter = Counter(
+        "ingestion_national_feed_loads_total",
+        "Nationwide dataset downloads by outcome",
+        ["source", "outcome"],
+    )
+else:
+    national_feed_loads_counter = None
+
+StateIndex = Dict[str, Any]
+Loader = Callable[[], Tuple[Optional[StateIndex], SourceStatus]]
+
+
+class NationalFeed:
+    """
+    A source's nationwide dataset, indexed by state code, per query window.
+
+    Loads are single-flight per window: concurrent callers for a missing or
+    expired window wait for one upstream request instead of each sending
+    their own. Expired indexes are served stale (with a background reload)
+    within the source's staleness grace, like fetcher cache entries. Failed
+    loads are remembered for NATIONAL_FEED_FAILURE_TTL_SECONDS so callers
+    queued behind one return its failure instead of each reloading.
+    """
+
+    def __init__(self, source_id: str, ttl_minutes: float):
+        """
+        Initialize feed.
+
+        Args:
+            source_id: Source registry id (metrics label and staleness grace)
+            ttl_minutes: How long a loaded index is served before reloading
+        """
+        self.source_id = source_id
+        self.ttl_minutes = ttl_minutes
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+        # window -> (index, status, loaded at)
+        self._indexes: Dict[Hashable, Tuple[StateIndex, SourceStatus, datetime]] = {}
+        # window -> (status, failed at)
+        self._failures: Dict[Hashable, Tuple[SourceStatus, datetime]] = {}
+
+    def get(
+        self, window: Hashable, loader: Loader, use_cache: bool = True
+    ) -> Tuple[Optional[StateIndex], SourceStatus]:
+        """
+        Return the state index for a query window, loading it if needed.
+
+        Args:
+            window: Query window the index was built for (e.g. days_back)
+            loader: Downloads the nationwide dataset and returns
+                (index by state code, status); index is None on failure
+            use_cache: Whether a loaded index may be reused
+
+        Returns:
+            Tuple of (index by state code or None on failure, SourceStatus of
+            the load that produced it)
+        """
+        if use_cache:
+            cached = self._cached(window, loader)
+            if cached is not None:
+                return cached
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(window, threading.Lock())
+        with load_lock:
+            # Another caller may have loaded it while we waited
+            if use_cache:
+                cached = self._cached(window, loader, allow_stale=False)
+                if cached is not None:
+                    return cached
+                failure = self._recent_failure(window)
+                if failure is not None:
+                    return None, failure
+            index, status = loader()
+            with self._lock:
+                if index is not None:
+                    self._indexes[window] = (index, status, datetime.now())
+                    self._failures.pop(window, None)
+                else:
+                    self._failures[window] = (status, datetime.now())
+            self._count("ok" if index is not None else "error")
+            logger.info(
+                "Loaded national feed",
+                source=self.source_id,
+                window=window,
+                states=len(index) if index is not None else 0,
+                ok=index is not None,
+            )
+            return index, status
+
+    def clear(self) -> None:
+        """Drop all loaded indexes and remembered failures."""
+        with self._lock:
+            self._indexes.clear()
+            self._failures.clear()
+
+    def _recent_failure(self, window: Hashable) -> Optional[SourceStatus]:
+        with self._lock:
+            entry = self._failures.get(window)
+        if entry is None:
+            return None
+        status, failed_at = entry
+        age_seconds = (datetime.now() - failed_at).total_seconds()
+        if age_seconds < NATIONAL_FEED_FAILURE_TTL_SECONDS:
+            return status
+        return None
+
+    def _cached(
+        self, window: Hashable, loader: Loader, allow_stale: bool = True
+    ) -> Optional[Tuple[StateIndex, SourceStatus]]:
+        with self._lock:
+            entry = self._indexes.get(window)
+        if entry is None:
+            return None
+        index, status, loaded_at = entry
+        age_minutes = (datetime.now() - loaded_at).total_seconds() / 60
+        if age_minutes < self.ttl_minutes or (
+            allow_stale
+            and serve_stale(
+                self.source_id,
+                f"national_{window}",
+                age_minutes,
+                self.ttl_minutes,
+                lambda: self.get(window, loader, use_cache=False),
+            )
+        ):
+            return index, status
+        return None
+
+    def _count(self, outcome: str) -> None:
+        if national_feed_loads_counter is not None:
+            national_feed_loads_counter.labels(
+                source=self.source_id, outcome=outcome
+            ).inc()
+
+
+# Process-wide feeds, one per source. Forecasters build their own fetchers, so
+# per-instance feeds would each download the nationwide dataset.
+_feeds: Dict[str, NationalFeed] = {}
+_feeds_lock = threading.Lock()
+
+
+def get_national_feed(source_id: str, ttl_minutes: float) -> NationalFeed:
+    """
+    Get or create the shared feed for a source.
+
+    Args:
+        source_id: Source registry id
+        ttl_minutes: Index TTL, used when the feed is first created
+
+    Returns:
+        NationalFeed shared by every fetcher of the source
+    """
+    with _feeds_lock:
+        feed = _feeds.get(source_id)
+        if feed is None:
+            feed = NationalFeed(source_id, ttl_minutes)
+            _feeds[source_id] = feed
+        return feed
+
+
+def reset_national_feeds() -> None:
+    """Drop all shared feeds and their loaded indexes."""
+    with _feeds_lock:
+        for feed in _feeds.values():
+            feed.clear()
+        _feeds.clear()
@@ -11,9 +11,13 @@ from app.services.ingestion.ci_offline_data import (
     get_ci_storm_events_data,
 )
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.noaa_storm_events")
 
+# Source registry id (selects the staleness grace)
+SOURCE_ID = "noaa_storm_events"
+
 # NOAA Storm Events base URL
 NOAA_STORM_EVENTS_BASE = "https://www.ncei.noaa.gov/stormevents"
 
@@ -183,7 +187,15 @@ class NOAAStormEventsFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_storm_stress_indices(
+                    state, days_back, use_cache=False
+                ),
+            ):
                 logger.info(
                     "Using cached NOAA storm events",
                     state=state_code,
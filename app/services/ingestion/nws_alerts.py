@@ -1,27 +1,33 @@
 # SPDX-License-Identifier: PROPRIETARY
 """NWS Weather Alerts API connector."""
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import json
 import pandas as pd
 import requests
 import structlog
-import time
 
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.http_transport import get_http_transport
+from app.services.ingestion.national_feed import (
+    NATIONAL_FEED_MODE_ENABLED,
+    StateIndex,
+    get_national_feed,
+)
+from app.services.ingestion.source_registry import get_http_policy
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.nws_alerts")
 
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "weather_alerts"
+
 # NWS API base URLs
 NWS_API_BASE = "https://api.weather.gov"
 NWS_USER_AGENT = "HumanBehaviourConvergence/1.0 (contact: your-email@example.com)"
 
-# Retry configuration
-MAX_RETRIES = 3
-INITIAL_BACKOFF = 1.0  # seconds
-MAX_BACKOFF = 10.0  # seconds
-
 
 class NWSAlertsFetcher:
     """
@@ -46,79 +52,30 @@ class NWSAlertsFetcher:
         """
         self.cache_duration_minutes = cache_duration_minutes
         self._cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
+        # Nationwide active alerts indexed by state (national feed mode)
+        self._national_feed = get_national_feed(SOURCE_ID, cache_duration_minutes)
 
     def _make_request_with_retries(
-        self, url: str, timeout: Tuple[float, float] = (10.0, 30.0)
+        self, url: str, timeout: Optional[Tuple[float, float]] = None
     ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
         """
-        Make HTTP request with exponential backoff retries.
+        Make HTTP request over the pooled transport with the source's retry policy.
 
         Args:
             url: URL to request
-            timeout: (connect_timeout, read_timeout) tuple
+            timeout: (connect_timeout, read_timeout) override (default: source
+                policy)
 
         Returns:
             Tuple of (response, error_type, http_status)
             error_type: None if success, else one of: timeout, http_error, other
         """
-        backoff = INITIAL_BACKOFF
-        headers = {"User-Agent": NWS_USER_AGENT}
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-                if response.status_code == 200:
-                    return response, None, 200
-                else:
-                    error_type = "http_error"
-                    http_status = response.status_code
-                    if attempt < MAX_RETRIES - 1:
-                        logger.warning(
-                            "NWS API returned non-200 status, retrying",
-                            status_code=http_status,
-                            attempt=attempt + 1,
-                            max_retries=MAX_RETRIES,
-                        )
-                        time.sleep(backoff)
-                        backoff = min(backoff * 2, MAX_BACKOFF)
-                        continue
-                    return response, error_type, http_status
-            except requests.exceptions.Timeout:
-                error_type = "timeout"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "NWS API timeout, retrying",
-                        attempt=attempt + 1,
-                        max_retries=MAX_RETRIES,
-                        backoff=backoff,
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except requests.exceptions.RequestException as e:
-                error_type = "http_error"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "NWS API request exception, retrying",
-                        error=str(e)[:100],
-                        attempt=attempt + 1,
-                        max_retries=MAX_RETRIES,
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except Exception as e:
-                error_type = "other"
-                logger.error(
-                    "Unexpected error in NWS request",
-                    error=str(e)[:200],
-                    exc_info=True,
-                )
-                return None, error_type, None
-
-        return None, "other", None
+        return get_http_transport().get_with_retries(
+            url,
+            source_id=SOURCE_ID,
+            headers={"User-Agent": NWS_USER_AGENT},
+            timeout=timeout,
+        )
 
     def _validate_response(
         self, response: requests.Response
@@ -156,6 +113,7 @@ class NWSAlertsFetcher:
         longitude: float,
         days_back: int = 7,
         use_cache: bool = True,
+        state_code: Optional[str] = None,
     ) -> Tuple[pd.DataFrame, SourceStatus]:
         """
         Fetch active weather alerts from NWS for a location.
@@ -165,6 +123,9 @@ class NWSAlertsFetcher:
             longitude: Longitude coordinate
             days_back: Number of days to look back (NWS returns active alerts, this is for filtering)
             use_cache: Whether to use cached data if available
+            state_code: Two-letter state code of the region. In national feed
+                mode the state's alerts are looked up in the nationwide feed
+                instead of querying the point.
 
         Returns:
             Tuple of (DataFrame, SourceStatus)
@@ -172,13 +133,30 @@ class NWSAlertsFetcher:
             Returns empty DataFrame on error, with status.ok=False
         """
         fetched_at = datetime.now().isoformat()
-        cache_key = f"nws_alerts_{latitude}_{longitude}_{days_back}"
+        national = bool(state_code) and NATIONAL_FEED_MODE_ENABLED
+        if national:
+            state_code = state_code.upper()
+            cache_key = f"nws_alerts_state_{state_code}_{days_back}"
+        else:
+            cache_key = f"nws_alerts_{latitude}_{longitude}_{days_back}"
 
         # Check cache
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_weather_alerts(
+                    latitude,
+                    longitude,
+                    days_back,
+                    use_cache=False,
+                    state_code=state_code,
+                ),
+            ):
                 logger.info("Using cached NWS alerts data", age_minutes=age_minutes)
                 status = SourceStatus(
                     provider="NWS",
@@ -190,16 +168,65 @@ class NWSAlertsFetcher:
                 )
                 return df.copy(), status
 
-        # NWS alerts endpoint: /alerts/active?point={lat},{lon}
-        url = f"{NWS_API_BASE}/alerts/active?point={latitude},{longitude}"
+        if national:
+            index, status = self._national_feed.get(
+                "active", self._load_national_alerts, use_cache
+            )
+            features = index.get(state_code, []) if index is not None else None
+        else:
+            # NWS alerts endpoint: /alerts/active?point={lat},{lon}
+            url = f"{NWS_API_BASE}/alerts/active?point={latitude},{longitude}"
+            logger.info("Fetching NWS alerts", latitude=latitude, longitude=longitude)
+            features, status = self._request_alerts(url, fetched_at)
+
+        status = replace(status, query_window_days=days_back)
+        if features is None:
+            return pd.DataFrame(columns=["timestamp", "alert_count"]), status
+
+        if not features:
+            # No alerts is valid (ok=true, rows=0)
+            logger.info("NWS returned no active alerts")
+            return pd.DataFrame(columns=["timestamp", "alert_count"]), status
+
+        df = self._alerts_frame(features, days_back)
+        if df.empty:
+            logger.info("NWS alerts found but none in query window")
+            return df, status
+
+        # Cache result
+        self._cache[cache_key] = (df.copy(), datetime.now())
+
+        status = replace(status, rows=len(df))
+
+        logger.info(
+            "Successfully fetched NWS alerts",
+            rows=len(df),
+            latitude=latitude,
+            longitude=longitude,
+            state_code=state_code if national else None,
+        )
+
+        return df, status
+
+    def _request_alerts(
+        self, url: str, fetched_at: str
+    ) -> Tuple[Optional[List[Dict]], SourceStatus]:
+        """
+        Request an alerts endpoint and return its GeoJSON features.
 
-        logger.info("Fetching NWS alerts", latitude=latitude, longitude=longitude)
+        Args:
+            url: NWS alerts URL
+            fetched_at: Fetch timestamp for the status
 
+        Returns:
+            Tuple of (features or None on error, SourceStatus)
+        """
         # Make request with retries
         response, request_error_type, http_status = self._make_request_with_retries(url)
 
         if response is None:
-            error_detail = f"Request failed after {MAX_RETRIES} retries"
+            retries = get_http_policy(SOURCE_ID).max_retries
+            error_detail = f"Request failed after {retries} retries"
             status = SourceStatus(
                 provider="NWS",
                 ok=False,
@@ -208,10 +235,9 @@ class NWSAlertsFetcher:
                 error_detail=error_detail,
                 fetched_at=fetched_at,
                 rows=0,
-                query_window_days=days_back,
             )
             logger.error("NWS request failed", error_type=status.error_type)
-            return pd.DataFrame(columns=["timestamp", "alert_count"]), status
+            return None, status
 
         # Validate response
         is_valid, validation_error_type, validation_error_detail = (
@@ -227,7 +253,6 @@ class NWSAlertsFetcher:
                 error_detail=validation_error_detail,
                 fetched_at=fetched_at,
                 rows=0,
-                query_window_days=days_back,
             )
             logger.error(
                 "NWS response validation failed",
@@ -235,7 +260,7 @@ class NWSAlertsFetcher:
                 error_detail=status.error_detail,
                 http_status=http_status,
             )
-            return pd.DataFrame(columns=["timestamp", "alert_count"]), status
+            return None, status
 
         # Parse JSON
         try:
@@ -249,27 +274,59 @@ class NWSAlertsFetcher:
                 error_detail=f"JSON decode error: {str(e)[:100]}",
                 fetched_at=fetched_at,
                 rows=0,
-                query_window_days=days_back,
             )
             logger.error("NWS JSON decode failed", error=str(e)[:200])
-            return pd.DataFrame(columns=["timestamp", "alert_count"]), status
+            return None, status
 
         # NWS alerts response structure: { "@context": [...], "features": [...] }
         # Each feature has properties with sent, effective, expires, status, etc.
-        features = data.get("features", [])
-        if not features:
-            # No alerts is valid (ok=true, rows=0)
-            status = SourceStatus(
-                provider="NWS",
-                ok=True,
-                http_status=http_status,
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
-            )
-            logger.info("NWS returned no active alerts")
-            return pd.DataFrame(columns=["timestamp", "alert_count"]), status
+        status = SourceStatus(
+            provider="NWS",
+            ok=True,
+            http_status=http_status,
+            fetched_at=fetched_at,
+            rows=0,
+        )
+        return data.get("features", []), status
+
+    def _load_national_alerts(self) -> Tuple[Optional[StateIndex], SourceStatus]:
+        """
+        Fetch all active alerts nationwide and index them by state code.
+
+        An alert is listed under every state among its affected zones (UGC
+        codes such as "MNZ060" or "WIC001" start with the state code).
+
+        Returns:
+            Tuple of (state code -> features, or None on error; SourceStatus)
+        """
+        logger.info("Fetching nationwide NWS alerts")
+        features, status = self._request_alerts(
+            f"{NWS_API_BASE}/alerts/active", datetime.now().isoformat()
+        )
+        if features is None:
+            return None, status
 
+        index: Dict[str, List[Dict]] = {}
+        for feature in features:
+            geocode = feature.get("properties", {}).get("geocode") or {}
+            states = {ugc[:2] for ugc in geocode.get("UGC", []) if len(ugc) >= 2}
+            for state in states:
+                index.setdefault(state, []).append(feature)
+        return index, status
+
+    @staticmethod
+    def _alerts_frame(features: List[Dict], days_back: int) -> pd.DataFrame:
+        """
+        Aggregate alert features into daily alert counts.
+
+        Args:
+            features: NWS GeoJSON alert features
+            days_back: Query window in days
+
+        Returns:
+            DataFrame with columns timestamp, alert_count (empty if no alert
+            falls in the window)
+        """
         # Aggregate alerts by date
         alert_counts = {}
         cutoff_date = datetime.now() - timedelta(days=days_back)
@@ -289,16 +346,7 @@ class NWSAlertsFetcher:
                     continue
 
         if not alert_counts:
-            status = SourceStatus(
-                provider="NWS",
-                ok=True,
-                http_status=http_status,
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
-            )
-            logger.info("NWS alerts found but none in query window")
-            return pd.DataFrame(columns=["timestamp", "alert_count"]), status
+            return pd.DataFrame(columns=["timestamp", "alert_count"])
 
         # Create DataFrame
         records = [
@@ -310,25 +358,4 @@ class NWSAlertsFetcher:
         ]
         df = pd.DataFrame(records)
         df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df = df.sort_values("timestamp").reset_index(drop=True)
-
-        # Cache result
-        self._cache[cache_key] = (df.copy(), datetime.now())
-
-        status = SourceStatus(
-            provider="NWS",
-            ok=True,
-            http_status=http_status,
-            fetched_at=fetched_at,
-            rows=len(df),
-            query_window_days=days_back,
-        )
-
-        logger.info(
-            "Successfully fetched NWS alerts",
-            rows=len(df),
-            latitude=latitude,
-            longitude=longitude,
-        )
-
-        return df, status
+        return df.sort_values("timestamp").reset_index(drop=True)
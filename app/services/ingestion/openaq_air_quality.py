@@ -1,6 +1,5 @@
 # SPDX-License-Identifier: PROPRIETARY
 """OpenAQ API connector for air quality data."""
-import time
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
@@ -13,17 +12,16 @@ from app.services.ingestion.ci_offline_data import (
     get_ci_air_quality_data,
 )
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.http_transport import get_http_transport
 
 logger = structlog.get_logger("ingestion.openaq_air_quality")
 
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "openaq_air_quality"
+
 # OpenAQ API base URL (v2)
 OPENAQ_API_BASE = "https://api.openaq.org/v2"
 
-# Retry configuration
-MAX_RETRIES = 3
-INITIAL_BACKOFF = 1.0
-MAX_BACKOFF = 10.0
-
 
 class OpenAQAirQualityFetcher:
     """
@@ -49,54 +47,27 @@ class OpenAQAirQualityFetcher:
         self.last_status: Optional[SourceStatus] = None
 
     def _make_request_with_retries(
-        self, url: str, params: dict, timeout: Tuple[float, float] = (10.0, 30.0)
+        self, url: str, params: dict, timeout: Optional[Tuple[float, float]] = None
     ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
         """
-        Make HTTP request with exponential backoff retries.
+        Make HTTP request over the pooled transport with the source's retry policy.
 
         Args:
             url: URL to request
             params: Query parameters
-            timeout: (connect_timeout, read_timeout) tuple
+            timeout: (connect_timeout, read_timeout) override (default: source
+                policy)
 
         Returns:
             Tuple of (response, error_type, http_status)
+            error_type: None if success, else one of: timeout, http_error, other
         """
-        backoff = INITIAL_BACKOFF
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(url, params=params, timeout=timeout)
-                if response.status_code == 200:
-                    return response, None, 200
-                elif response.status_code in [429, 503]:
-                    # Rate limit or service unavailable - retry with backoff
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep(backoff)
-                        backoff = min(backoff * 2, MAX_BACKOFF)
-                        continue
-                    return response, "http_error", response.status_code
-                else:
-                    return response, "http_error", response.status_code
-            except requests.exceptions.Timeout:
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, "timeout", None
-            except Exception as e:
-                logger.warning(
-                    "Unexpected error in OpenAQ request",
-                    error=str(e),
-                    attempt=attempt + 1,
-                )
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, "other", None
-
-        return None, "other", None
+        return get_http_transport().get_with_retries(
+            url,
+            source_id=SOURCE_ID,
+            params=params,
+            timeout=timeout,
+        )
 
     def fetch_air_quality(
         self,
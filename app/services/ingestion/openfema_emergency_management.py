@@ -1,25 +1,32 @@
 # SPDX-License-Identifier: PROPRIETARY
 """OpenFEMA Emergency Management API connector for disaster declarations."""
 import json
-import time
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import requests
 import structlog
 
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.http_transport import get_http_transport
+from app.services.ingestion.national_feed import (
+    NATIONAL_FEED_MODE_ENABLED,
+    StateIndex,
+    get_national_feed,
+)
+from app.services.ingestion.source_registry import get_http_policy
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.openfema")
 
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "emergency_management"
+
 # OpenFEMA API base URL
 OPENFEMA_API_BASE = "https://www.fema.gov/api/open/v2/DisasterDeclarationsSummaries"
-
-# Retry configuration
-MAX_RETRIES = 3
-INITIAL_BACKOFF = 1.0  # seconds
-MAX_BACKOFF = 10.0  # seconds
+# Page size of nationwide requests (OpenFEMA default is 1000, maximum 10000)
+OPENFEMA_NATIONAL_TOP = 10000
 
 
 # State name to abbreviation mapping (common US states)
@@ -102,80 +109,29 @@ class OpenFEMAEmergencyManagementFetcher:
         """
         self.cache_duration_minutes = cache_duration_minutes
         self._cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
+        # Nationwide declarations indexed by state, per days_back window
+        self._national_feed = get_national_feed(SOURCE_ID, cache_duration_minutes)
 
     def _make_request_with_retries(
-        self, url: str, timeout: Tuple[float, float] = (10.0, 30.0)
+        self, url: str, timeout: Optional[Tuple[float, float]] = None
     ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
         """
-        Make HTTP request with exponential backoff retries.
+        Make HTTP request over the pooled transport with the source's retry policy.
 
         Args:
             url: URL to request
-            timeout: (connect_timeout, read_timeout) tuple
+            timeout: (connect_timeout, read_timeout) override (default: source
+                policy)
 
         Returns:
             Tuple of (response, error_type, http_status)
             error_type: None if success, else one of: timeout, http_error, other
         """
-        backoff = INITIAL_BACKOFF
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(url, timeout=timeout)
-                # Explicit status code check
-                if response.status_code == 200:
-                    return response, None, 200
-                else:
-                    error_type = "http_error"
-                    http_status = response.status_code
-                    if attempt < MAX_RETRIES - 1:
-                        # Retry on non-200 status
-                        logger.warning(
-                            "OpenFEMA API returned non-200 status, retrying",
-                            status_code=http_status,
-                            attempt=attempt + 1,
-                            max_retries=MAX_RETRIES,
-                        )
-                        time.sleep(backoff)
-                        backoff = min(backoff * 2, MAX_BACKOFF)
-                        continue
-                    return response, error_type, http_status
-            except requests.exceptions.Timeout:
-                error_type = "timeout"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "OpenFEMA API timeout, retrying",
-                        attempt=attempt + 1,
-                        max_retries=MAX_RETRIES,
-                        backoff=backoff,
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except requests.exceptions.RequestException as e:
-                error_type = "http_error"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "OpenFEMA API request exception, retrying",
-                        error=str(e)[:100],
-                        attempt=attempt + 1,
-                        max_retries=MAX_RETRIES,
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except Exception as e:
-                error_type = "other"
-                logger.error(
-                    "Unexpected error in OpenFEMA request",
-                    error=str(e)[:200],
-                    exc_info=True,
-                )
-                return None, error_type, None
-
-        return None, "other", None
+        return get_http_transport().get_with_retries(
+            url,
+            source_id=SOURCE_ID,
+            timeout=timeout,
+        )
 
     def _validate_response(
         self, response: requests.Response
@@ -265,7 +221,15 @@ class OpenFEMAEmergencyManagementFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_disaster_declarations(
+                    region_name, days_back, use_cache=False
+                ),
+            ):
                 logger.info("Using cached OpenFEMA data")
                 status = SourceStatus(
                     provider="OpenFEMA",
@@ -282,6 +246,127 @@ class OpenFEMAEmergencyManagementFetcher:
         if region_name:
             state_abbrev = self._resolve_state_abbrev(region_name)
 
+        if state_abbrev and NATIONAL_FEED_MODE_ENABLED:
+            index, status = self._national_feed.get(
+                days_back,
+                lambda: self._load_national_declarations(days_back),
+                use_cache,
+            )
+            data = index.get(state_abbrev, []) if index is not None else None
+        else:
+            logger.info(
+                "Fetching OpenFEMA disaster declarations",
+                region_name=region_name,
+                state_abbrev=state_abbrev,
+                days_back=days_back,
+            )
+            data, status = self._request_declarations(
+                self._declarations_url(days_back, state_abbrev),
+                fetched_at,
+                days_back,
+            )
+        if data is None:
+            return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
+        http_status = status.http_status
+
+        if not data:
+            # Empty array is valid (no declarations in window)
+            status = SourceStatus(
+                provider="OpenFEMA",
+                ok=True,
+                http_status=http_status,
+                fetched_at=fetched_at,
+                rows=0,
+                query_window_days=days_back,
+            )
+            logger.info(
+                "OpenFEMA returned empty result (no declarations in window)",
+                state_abbrev=state_abbrev,
+            )
+            return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
+
+        # Parse records
+        records = []
+        for record in data:
+            declaration_date = record.get("declarationDate")
+            if not declaration_date:
+                continue
+
+            try:
+                # Parse date (format: YYYY-MM-DD)
+                timestamp = datetime.strptime(declaration_date, "%Y-%m-%d").date()
+                records.append(
+                    {
+                        "timestamp": timestamp,
+                        "declaration_count": 1,
+                    }
+                )
+            except (ValueError, TypeError) as e:
+                logger.debug(
+                    "Skipping invalid declaration entry",
+                    declaration_date=declaration_date,
+                    error=str(e),
+                )
+                continue
+
+        if not records:
+            status = SourceStatus(
+                provider="OpenFEMA",
+                ok=True,
+                http_status=http_status,
+                fetched_at=fetched_at,
+                rows=0,
+                query_window_days=days_back,
+            )
+            logger.info("OpenFEMA: No valid declarations after parsing")
+            return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
+
+        df = pd.DataFrame(records)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+
+        # Aggregate by date (count declarations per day)
+        df = df.groupby("timestamp")["declaration_count"].sum().reset_index()
+
+        # Filter to days_back window (already filtered by API, but ensure)
+        cutoff_date = datetime.now().date() - timedelta(days=days_back)
+        df = df[df["timestamp"].dt.date >= cutoff_date]
+
+        df = df.sort_values("timestamp").reset_index(drop=True)
+
+        # Cache result
+        self._cache[cache_key] = (df.copy(), datetime.now())
+
+        status = SourceStatus(
+            provider="OpenFEMA",
+            ok=True,
+            http_status=http_status,
+            fetched_at=fetched_at,
+            rows=len(df),
+            query_window_days=days_back,
+        )
+
+        logger.info(
+            "Successfully fetched OpenFEMA disaster declarations",
+            rows=len(df),
+            date_range=(
+                (df["timestamp"].min(), df["timestamp"].max()) if not df.empty else None
+            ),
+            status_ok=status.ok,
+        )
+
+        return df, status
+
+    def _declarations_url(self, days_back: int, state_abbrev: Optional[str]) -> str:
+        """
+        Build the declarations query URL for a window (optionally one state).
+
+        Args:
+            days_back: Number of days of declarations to request
+            state_abbrev: State filter (None = nationwide)
+
+        Returns:
+            OpenFEMA query URL
+        """
         # Build URL with filters
         # OpenFEMA API uses $filter for query parameters
         end_date = datetime.now().date()
@@ -301,20 +386,60 @@ class OpenFEMAEmergencyManagementFetcher:
 
         filter_expr = " and ".join(filter_parts)
         url = f"{OPENFEMA_API_BASE}?$filter={filter_expr}&$format=json"
+        if not state_abbrev:
+            url += f"&$top={OPENFEMA_NATIONAL_TOP}"
+        return url
 
-        logger.info(
-            "Fetching OpenFEMA disaster declarations",
-            region_name=region_name,
-            state_abbrev=state_abbrev,
-            days_back=days_back,
+    def _load_national_declarations(
+        self, days_back: int
+    ) -> Tuple[Optional[StateIndex], SourceStatus]:
+        """
+        Fetch nationwide declarations for a window and index them by state.
+
+        Args:
+            days_back: Number of days of declarations to request
+
+        Returns:
+            Tuple of (state code -> declaration records, or None on error;
+            SourceStatus)
+        """
+        logger.info("Fetching nationwide OpenFEMA declarations", days_back=days_back)
+        records, status = self._request_declarations(
+            self._declarations_url(days_back, None),
+            datetime.now().isoformat(),
+            days_back,
         )
+        if records is None:
+            return None, status
+
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            state = record.get("state") if isinstance(record, dict) else None
+            if state:
+                index.setdefault(state, []).append(record)
+        return index, status
+
+    def _request_declarations(
+        self, url: str, fetched_at: str, days_back: int
+    ) -> Tuple[Optional[List[Any]], SourceStatus]:
+        """
+        Request a declarations URL and extract its records array.
+
+        Args:
+            url: OpenFEMA query URL
+            fetched_at: Fetch timestamp for the status
+            days_back: Query window (for the status)
 
+        Returns:
+            Tuple of (records or None on error, SourceStatus)
+        """
         # Make request with retries
         response, request_error_type, http_status = self._make_request_with_retries(url)
 
         if response is None:
             # Request failed
-            error_detail = f"Request failed after {MAX_RETRIES} retries"
+            retries = get_http_policy(SOURCE_ID).max_retries
+            error_detail = f"Request failed after {retries} retries"
             status = SourceStatus(
                 provider="OpenFEMA",
                 ok=False,
@@ -330,7 +455,7 @@ class OpenFEMAEmergencyManagementFetcher:
                 error_type=status.error_type,
                 error_detail=error_detail,
             )
-            return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
+            return None, status
 
         # Validate response
         is_valid, validation_error_type, validation_error_detail = (
@@ -354,7 +479,7 @@ class OpenFEMAEmergencyManagementFetcher:
                 error_detail=status.error_detail,
                 http_status=http_status,
             )
-            return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
+            return None, status
 
         # Parse JSON
         try:
@@ -371,7 +496,7 @@ class OpenFEMAEmergencyManagementFetcher:
                 query_window_days=days_back,
             )
             logger.error("OpenFEMA JSON decode failed", error=str(e)[:200])
-            return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
+            return None, status
 
         # Parse OpenFEMA response (may be array or object-wrapped array)
         records_array = None
@@ -425,7 +550,7 @@ class OpenFEMAEmergencyManagementFetcher:
                     "OpenFEMA response is object but no array field found",
                     object_keys=list(data.keys())[:10],  # Log first 10 keys
                 )
-                return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
+                return None, status
         else:
             # Neither list nor dict - invalid format
             status = SourceStatus(
@@ -442,7 +567,7 @@ class OpenFEMAEmergencyManagementFetcher:
                 "OpenFEMA response is not array or object",
                 response_type=type(data).__name__,
             )
-            return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
+            return None, status
 
         # Log which format was used (if wrapper was detected)
         if wrapper_key:
@@ -452,91 +577,12 @@ class OpenFEMAEmergencyManagementFetcher:
                 array_length=len(records_array),
             )
 
-        data = records_array  # Use extracted array for rest of processing
-
-        if not data:
-            # Empty array is valid (no declarations in window)
-            status = SourceStatus(
-                provider="OpenFEMA",
-                ok=True,
-                http_status=http_status,
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
-            )
-            logger.info(
-                "OpenFEMA returned empty result (no declarations in window)",
-                wrapper_key=wrapper_key if wrapper_key else None,
-            )
-            return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
-
-        # Parse records
-        records = []
-        for record in data:
-            declaration_date = record.get("declarationDate")
-            if not declaration_date:
-                continue
-
-            try:
-                # Parse date (format: YYYY-MM-DD)
-                timestamp = datetime.strptime(declaration_date, "%Y-%m-%d").date()
-                records.append(
-                    {
-                        "timestamp": timestamp,
-                        "declaration_count": 1,
-                    }
-                )
-            except (ValueError, TypeError) as e:
-                logger.debug(
-                    "Skipping invalid declaration entry",
-                    declaration_date=declaration_date,
-                    error=str(e),
-                )
-                continue
-
-        if not records:
-            status = SourceStatus(
-                provider="OpenFEMA",
-                ok=True,
-                http_status=http_status,
-                fetched_at=fetched_at,
-                rows=0,
-                query_window_days=days_back,
-            )
-            logger.info("OpenFEMA: No valid declarations after parsing")
-            return pd.DataFrame(columns=["timestamp", "declaration_count"]), status
-
-        df = pd.DataFrame(records)
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-
-        # Aggregate by date (count declarations per day)
-        df = df.groupby("timestamp")["declaration_count"].sum().reset_index()
-
-        # Filter to days_back window (already filtered by API, but ensure)
-        cutoff_date = datetime.now().date() - timedelta(days=days_back)
-        df = df[df["timestamp"].dt.date >= cutoff_date]
-
-        df = df.sort_values("timestamp").reset_index(drop=True)
-
-        # Cache result
-        self._cache[cache_key] = (df.copy(), datetime.now())
-
         status = SourceStatus(
             provider="OpenFEMA",
             ok=True,
             http_status=http_status,
             fetched_at=fetched_at,
-            rows=len(df),
+            rows=0,
             query_window_days=days_back,
         )
-
-        logger.info(
-            "Successfully fetched OpenFEMA disaster declarations",
-            rows=len(df),
-            date_range=(
-                (df["timestamp"].min(), df["timestamp"].max()) if not df.empty else None
-            ),
-            status_ok=status.ok,
-        )
-
-        return df, status
+        return records_array, status
@@ -8,20 +8,20 @@ import os
 import pandas as pd
 import requests
 import structlog
-import time
 
 from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.http_transport import get_http_transport
+from app.services.ingestion.source_registry import get_http_policy
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.openstates")
 
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "legislative_activity"
+
 # OpenStates API base URL
 OPENSTATES_API_BASE = "https://v3.openstates.org"
 
-# Retry configuration
-MAX_RETRIES = 3
-INITIAL_BACKOFF = 1.0
-MAX_BACKOFF = 10.0
-
 
 class OpenStatesLegislativeFetcher:
     """
@@ -49,59 +49,27 @@ class OpenStatesLegislativeFetcher:
         self.api_key = os.getenv("OPENSTATES_API_KEY")
 
     def _make_request_with_retries(
-        self, url: str, headers: dict, timeout: Tuple[float, float] = (10.0, 30.0)
+        self, url: str, headers: dict, timeout: Optional[Tuple[float, float]] = None
     ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
-        """Make HTTP request with exponential backoff retries."""
-        backoff = INITIAL_BACKOFF
+        """
+        Make HTTP request over the pooled transport with the source's retry policy.
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-                if response.status_code == 200:
-                    return response, None, 200
-                else:
-                    error_type = "http_error"
-                    http_status = response.status_code
-                    if attempt < MAX_RETRIES - 1:
-                        logger.warning(
-                            "OpenStates API returned non-200 status, retrying",
-                            status_code=http_status,
-                            attempt=attempt + 1,
-                        )
-                        time.sleep(backoff)
-                        backoff = min(backoff * 2, MAX_BACKOFF)
-                        continue
-                    return response, error_type, http_status
-            except requests.exceptions.Timeout:
-                error_type = "timeout"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "OpenStates API timeout, retrying", attempt=attempt + 1
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except requests.exceptions.RequestException as e:
-                error_type = "http_error"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "OpenStates API request exception, retrying", error=str(e)[:100]
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except Exception as e:
-                error_type = "other"
-                logger.error(
-                    "Unexpected error in OpenStates request",
-                    error=str(e)[:200],
-                    exc_info=True,
-                )
-                return None, error_type, None
+        Args:
+            url: URL to request
+            headers: Request headers
+            timeout: (connect_timeout, read_timeout) override (default: source
+                policy)
 
-        return None, "other", None
+        Returns:
+            Tuple of (response, error_type, http_status)
+            error_type: None if success, else one of: timeout, http_error, other
+        """
+        return get_http_transport().get_with_retries(
+            url,
+            source_id=SOURCE_ID,
+            headers=headers,
+            timeout=timeout,
+        )
 
     def _map_region_to_state(self, region_name: Optional[str]) -> Optional[str]:
         """Map region name to US state abbreviation for OpenStates API."""
@@ -152,7 +120,15 @@ class OpenStatesLegislativeFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_legislative_activity(
+                    region_name, days_back, use_cache=False
+                ),
+            ):
                 logger.info("Using cached OpenStates data", age_minutes=age_minutes)
                 status = SourceStatus(
                     provider="OpenStates",
@@ -213,7 +189,8 @@ class OpenStatesLegislativeFetcher:
             )
 
             if response is None:
-                error_detail = f"Request failed after {MAX_RETRIES} retries"
+                retries = get_http_policy(SOURCE_ID).max_retries
+                error_detail = f"Request failed after {retries} retries"
                 status = SourceStatus(
                     provider="OpenStates",
                     ok=False,
@@ -13,9 +13,13 @@ from app.services.ingestion.ci_offline_data import (
     get_ci_public_health_data,
 )
 from app.services.ingestion.health_owid import OWIDHealthFetcher
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.public_health")
 
+# Source registry id (selects the staleness grace)
+SOURCE_ID = "public_health"
+
 
 class PublicHealthFetcher:
     """
@@ -85,7 +89,15 @@ class PublicHealthFetcher:
             and self._cache_timestamp is not None
         ):
             age_minutes = (datetime.now() - self._cache_timestamp).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_health_risk_index(
+                    region_code, days_back, use_cache=False
+                ),
+            ):
                 logger.info(
                     "Using cached public health data",
                     age_minutes=age_minutes,
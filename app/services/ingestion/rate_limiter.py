@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Process-wide per-host rate limiting for upstream HTTP calls.
+
+Each upstream host gets a token bucket sized from the rate limit declared in
+its source's HTTPPolicy (source registry). Every request takes one token, so
+concurrent forecasts, background population and live refresh threads share
+one budget per host instead of each racing into 429 responses. Hosts whose
+source declares no limit are not throttled.
+"""
+import asyncio
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+import structlog
+
+from app.services.ingestion.source_registry import get_http_policy
+
+logger = structlog.get_logger("ingestion.rate_limiter")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter, Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = Histogram = None
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# Longest a request waits for a token before giving up
+RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv("RATE_LIMIT_MAX_WAIT_SECONDS", "20"))
+
+if PROMETHEUS_AVAILABLE:
+    rate_limit_wait_histogram = Histogram(
+        "ingestion_rate_limit_wait_seconds",
+        "Time requests spent waiting for a rate limit token per host",
+        ["host"],
+        buckets=(0, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30),
+    )
+    rate_limit_timeouts_counter = Counter(
+        "ingestion_rate_limit_timeouts_total",
+        "Requests abandoned because no token was available before the deadline",
+        ["host"],
+    )
+else:
+    rate_limit_wait_histogram = None
+    rate_limit_timeouts_counter = None
+
+
+class RateLimitTimeout(requests.exceptions.Timeout):
+    """Raised when a request cannot get a rate limit token before its deadline."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with reservations.
+
+    A caller reserves the next token under the lock and then sleeps until it
+    is due outside the lock, so waiters are served in arrival order and no
+    thread spins.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve one token.
+
+        Args:
+            max_wait: Longest acceptable wait in seconds (None = unbounded)
+
+        Returns:
+            Seconds until the reserved token is due (0.0 if available now),
+            or None if it would not be due within max_wait (nothing reserved)
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            # May go negative: later callers queue behind this reservation
+            self._tokens -= 1
+            return wait
+
+    @property
+    def available(self) -> float:
+        """Tokens available now (negative while reservations are queued)."""
+        with self._lock:
+            elapsed = self._clock() - self._updated_at
+            return min(self.capacity, self._tokens + elapsed * self.rate)
+
+
+class RateLimiter:
+    """Token buckets keyed by upstream host."""
+
+    def __init__(self, enabled: bool = RATE_LIMIT_ENABLED):
+        """
+        Initialize rate limiter.
+
+        Args:
+            enabled: Throttle at all (False = acquire always succeeds at once)
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket_for(
+        self, url: str, source_id: Optional[str] = None
+    ) -> Optional[TokenBucket]:
+        """
+        Return the bucket for a URL's host, creating it on first use.
+
+        The bucket is sized from the HTTPPolicy of the first source that
+        declares a limit for the host; sources sharing a host should declare
+        the same limit.
+
+        Args:
+            url: Request URL
+            source_id: Source registry id (selects the HTTPPolicy)
+
+        Returns:
+            TokenBucket, or None if the host is not rate limited
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                policy = get_http_policy(source_id)
+                if not policy.rate_limit_per_second:
+                    return None
+                bucket = TokenBucket(
+                    rate=policy.rate_limit_per_second,
+                    capacity=max(policy.rate_limit_burst, 1),
+                )
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(
+        self,
+        url: str,
+        source_id: Optional[str] = None,
+        timeout: Optional[float] = RATE_LIMIT_MAX_WAIT_SECONDS,
+    ) -> bool:
+        """
+        Block until a token for the URL's host is available.
+
+        Args:
+            url: Request URL
+            source_id: Source registry id (selects the HTTPPolicy)
+            timeout: Longest wait in seconds (None = unbounded)
+
+        Returns:
+            True if a token was taken, False if none was due within timeout
+        """
+        wait = self._reserve(url, source_id, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(
+        self,
+        url: str,
+        source_id: Optional[str] = None,
+        timeout: Optional[float] = RATE_LIMIT_MAX_WAIT_SECONDS,
+    ) -> bool:
+        """
+        Async variant of acquire (waits without blocking the event loop).
+
+        Args:
+            url: Request URL
+            source_id: Source registry id (selects the HTTPPolicy)
+            timeout: Longest wait in seconds (None = unbounded)
+
+        Returns:
+            True if a token was taken, False if none was due within timeout
+        """
+        wait = self._reserve(url, source_id, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def reset(self) -> None:
+        """Drop all buckets (they restart full)."""
+        with self._lock:
+            self._buckets.clear()
+
+    def _reserve(
+        self, url: str, source_id: Optional[str], timeout: Optional[float]
+    ) -> Optional[float]:
+        if not self.enabled:
+            return 0.0
+        bucket = self.bucket_for(url, source_id)
+        if bucket is None:
+            return 0.0
+        host = urlsplit(url).netloc
+        wait = bucket.reserve(max_wait=timeout)
+        if wait is None:
+            logger.warning(
+                "Rate limit token not available before deadline",
+                host=host,
+                source=source_id,
+                timeout=timeout,
+            )
+            if rate_limit_timeouts_counter is not None:
+                rate_limit_timeouts_counter.labels(host=host).inc()
+            return None
+        if rate_limit_wait_histogram is not None:
+            rate_limit_wait_histogram.labels(host=host).observe(wait)
+        return wait
+
+
+# Global instance (singleton pattern)
+_rate_limiter_instance: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get or create the global RateLimiter instance."""
+    global _rate_limiter_instance
+    with _rate_limiter_lock:
+        if _rate_limiter_instance is None:
+            _rate_limiter_instance = RateLimiter()
+        return _rate_limiter_instance
+
+
+def reset_rate_limiter() -> None:
+    """Reset the global RateLimiter singleton instance."""
+    global _rate_limiter_instance
+    with _rate_limiter_lock:
+        _rate_limiter_instance = None
@@ -1,7 +1,6 @@
 # SPDX-LICENSE-IDENTIFIER: PROPRIETARY
 """Search trends data ingestion using public APIs for digital attention analysis."""
 import math
-import time
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
@@ -14,19 +13,19 @@ from app.services.ingestion.ci_offline_data import (
     is_ci_offline_mode,
     get_ci_search_trends_data,
 )
+from app.services.ingestion.http_transport import get_http_transport
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.search_trends")
 
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "search_trends"
+
 # Wikimedia Pageviews REST API (no key required)
 WIKIMEDIA_PAGEVIEWS_API = (
     "https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article"
 )
 
-# Retry configuration
-MAX_RETRIES = 3
-INITIAL_BACKOFF = 1.0
-MAX_BACKOFF = 10.0
-
 
 class SearchTrendsFetcher:
     """
@@ -48,60 +47,25 @@ class SearchTrendsFetcher:
         self._cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
 
     def _make_request_with_retries(
-        self, url: str, timeout: Tuple[float, float] = (10.0, 30.0)
+        self, url: str, timeout: Optional[Tuple[float, float]] = None
     ) -> Tuple[Optional[requests.Response], Optional[str], Optional[int]]:
-        """Make HTTP request with exponential backoff retries."""
-        backoff = INITIAL_BACKOFF
-        headers = {"User-Agent": "HumanBehaviourConvergence/1.0"}
+        """
+        Make HTTP request over the pooled transport with the source's retry policy.
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-                if response.status_code == 200:
-                    return response, None, 200
-                else:
-                    error_type = "http_error"
-                    http_status = response.status_code
-                    if attempt < MAX_RETRIES - 1:
-                        logger.warning(
-                            "Wikimedia API returned non-200 status, retrying",
-                            status_code=http_status,
-                            attempt=attempt + 1,
-                        )
-                        time.sleep(backoff)
-                        backoff = min(backoff * 2, MAX_BACKOFF)
-                        continue
-                    return response, error_type, http_status
-            except requests.exceptions.Timeout:
-                error_type = "timeout"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "Wikimedia API timeout, retrying", attempt=attempt + 1
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except requests.exceptions.RequestException as e:
-                error_type = "http_error"
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        "Wikimedia API request exception, retrying", error=str(e)[:100]
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                return None, error_type, None
-            except Exception as e:
-                error_type = "other"
-                logger.error(
-                    "Unexpected error in Wikimedia request",
-                    error=str(e)[:200],
-                    exc_info=True,
-                )
-                return None, error_type, None
+        Args:
+            url: URL to request
+            timeout: (connect_timeout, read_timeout) override (default: source
+                policy)
 
-        return None, "other", None
+        Returns:
+            Tuple of (response, error_type, http_status)
+            error_type: None if success, else one of: timeout, http_error, other
+        """
+        return get_http_transport().get_with_retries(
+            url,
+            source_id=SOURCE_ID,
+            timeout=timeout,
+        )
 
     def _get_region_keywords(self, region_name: Optional[str]) -> list[str]:
         """Get curated keyword set for a region."""
@@ -172,7 +136,15 @@ class SearchTrendsFetcher:
         if use_cache and cache_key in self._cache:
             df, cache_time = self._cache[cache_key]
             age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
+            if age_minutes < self.cache_duration_minutes or serve_stale(
+                SOURCE_ID,
+                cache_key,
+                age_minutes,
+                self.cache_duration_minutes,
+                lambda: self.fetch_search_interest(
+                    query, days_back, use_cache=False, region_name=region_name
+                ),
+            ):
                 logger.info("Using cached search trends data", age_minutes=age_minutes)
                 status = SourceStatus(
                     provider="Wikimedia Pageviews",
@@ -2,7 +2,7 @@
 """Single source of truth registry for data sources."""
 import os
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -33,6 +33,46 @@ except ImportError:
         return None
 
 
+@dataclass
+class HTTPPolicy:
+    """Retry, backoff and timeout policy for a source's upstream requests."""
+
+    max_retries: int = 3  # Total attempts per request
+    initial_backoff: float = 1.0  # seconds
+    max_backoff: float = 10.0  # seconds
+    connect_timeout: float = 10.0  # seconds
+    read_timeout: float = 30.0  # seconds
+    # HTTP statuses worth retrying (None = retry any non-200)
+    retry_statuses: Optional[Tuple[int, ...]] = None
+    # Circuit breaker: open when at least breaker_failure_rate of the last
+    # breaker_window requests failed (once breaker_min_calls were seen), then
+    # fail fast for breaker_open_seconds before a half-open trial request
+    breaker_failure_rate: float = 0.5
+    breaker_min_calls: int = 5
+    breaker_window: int = 20
+    breaker_open_seconds: float = 60.0
+    # Process-wide token bucket for the source's host (None = not throttled);
+    # burst is the number of requests that may go out back to back
+    rate_limit_per_second: Optional[float] = None
+    rate_limit_burst: int = 1
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """(connect_timeout, read_timeout) tuple for requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def should_retry(self, http_status: int) -> bool:
+        """Whether a non-200 status should be retried."""
+        return self.retry_statuses is None or http_status in self.retry_statuses
+
+
+DEFAULT_HTTP_POLICY = HTTPPolicy()
+
+# Staleness grace for sources without a registry entry: expired fetcher cache
+# entries are never served for them (0 = always refetch synchronously)
+DEFAULT_MAX_STALENESS_MINUTES = float(os.getenv("DEFAULT_MAX_STALENESS_MINUTES", "0"))
+
+
 @dataclass
 class SourceDefinition:
     """Definition of a data source in the registry."""
@@ -50,6 +90,10 @@ class SourceDefinition:
     healthcheck: Optional[Callable[[], Dict[str, Any]]] = (
         None  # Optional healthcheck function
     )
+    http_policy: HTTPPolicy = field(default_factory=HTTPPolicy)
+    # How long past its fetcher cache TTL an entry may still be served while a
+    # background refresh runs (stale-while-revalidate grace)
+    max_staleness_minutes: float = DEFAULT_MAX_STALENESS_MINUTES
 
 
 # Registry: single source of truth (in-memory cache)
@@ -243,6 +287,56 @@ def get_all_sources() -> Dict[str, SourceDefinition]:
     return SOURCE_REGISTRY.copy()
 
 
+def get_http_policy(source_id: Optional[str]) -> HTTPPolicy:
+    """
+    Get the HTTP retry/timeout policy for a source.
+
+    Args:
+        source_id: Registered source id (None or unknown ids get the default)
+
+    Returns:
+        HTTPPolicy for the source
+    """
+    source = SOURCE_REGISTRY.get(source_id) if source_id else None
+    return source.http_policy if source is not None else DEFAULT_HTTP_POLICY
+
+
+def get_max_staleness_minutes(source_id: Optional[str]) -> float:
+    """
+    Get how long past its cache TTL a source's data may be served stale.
+
+    Args:
+        source_id: Registered source id (None or unknown ids get the default)
+
+    Returns:
+        Staleness grace in minutes
+    """
+    source = SOURCE_REGISTRY.get(source_id) if source_id else None
+    if source is None:
+        return DEFAULT_MAX_STALENESS_MINUTES
+    return source.max_staleness_minutes
+
+
+def record_source_health(source_id: str, status: str, **metrics: Any) -> None:
+    """
+    Persist a source's health to SourceRegistryDB (no-op if unavailable).
+
+    Args:
+        source_id: Source identifier
+        status: Status (Active, Available, Degraded, Disabled, NotConfigured)
+        **metrics: Optional SourceRegistryDB.update_source_health fields
+    """
+    db = _get_registry_db()
+    if db is None:
+        return
+    try:
+        db.update_source_health(source_id=source_id, status=status, **metrics)
+    except Exception as e:
+        logger.warning(
+            "Failed to record source health", source_id=source_id, error=str(e)
+        )
+
+
 def get_source_statuses() -> Dict[str, Dict[str, Any]]:
     """Get computed status for all sources."""
     return {
@@ -263,6 +357,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Market sentiment indicators from public financial data (volatility index, market indices)",
+            max_staleness_minutes=30.0,
         )
     )
 
@@ -276,6 +371,9 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Federal Reserve Economic Data (FRED): GDP growth, unemployment rate, consumer sentiment, CPI inflation, jobless claims. Public data, no API key required.",
+            # FRED allows 120 requests/minute per key
+            http_policy=HTTPPolicy(rate_limit_per_second=2.0, rate_limit_burst=10),
+            max_staleness_minutes=1440.0,
         )
     )
 
@@ -289,6 +387,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Environmental data including temperature, precipitation, and wind patterns",
+            max_staleness_minutes=60.0,
         )
     )
 
@@ -302,6 +401,12 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Air quality measurements (PM2.5, PM10, AQI) from OpenAQ global monitoring network. Public data, no API key required.",
+            http_policy=HTTPPolicy(
+                retry_statuses=(429, 503),
+                rate_limit_per_second=1.0,  # 60 requests/minute
+                rate_limit_burst=5,
+            ),
+            max_staleness_minutes=120.0,
         )
     )
 
@@ -315,6 +420,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Energy Information Administration (EIA): Energy prices (gasoline, natural gas, crude oil), electricity demand, grid stress indicators. Public data, no API key required.",
+            max_staleness_minutes=1440.0,
         )
     )
 
@@ -328,6 +434,9 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Digital attention signals from Wikipedia Pageviews API (public, no key required)",
+            # Wikimedia REST API asks clients to stay well under 100 req/s
+            http_policy=HTTPPolicy(rate_limit_per_second=10.0, rate_limit_burst=10),
+            max_staleness_minutes=720.0,
         )
     )
 
@@ -341,6 +450,7 @@ def initialize_registry() -> None:
             required_env_vars=["PUBLIC_HEALTH_API_ENDPOINT"],
             can_run_without_key=True,
             description="Public health indicators from aggregated health statistics (requires API configuration for full functionality)",
+            max_staleness_minutes=1440.0,
         )
     )
 
@@ -354,6 +464,8 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Mobility and activity patterns from TSA daily passenger throughput (public dataset, no key required)",
+            http_policy=HTTPPolicy(read_timeout=60.0),
+            max_staleness_minutes=720.0,
         )
     )
 
@@ -367,6 +479,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Disaster declarations and emergency management data from OpenFEMA (official disaster declarations, emergency events, FEMA program activity)",
+            max_staleness_minutes=360.0,
         )
     )
 
@@ -380,6 +493,7 @@ def initialize_registry() -> None:
             required_env_vars=["OPENSTATES_API_KEY"],  # Optional for enhanced data
             can_run_without_key=True,
             description="Legislative/governance events from GDELT (no key required). Optional OpenStates enhancement when OPENSTATES_API_KEY is set.",
+            max_staleness_minutes=1440.0,
         )
     )
 
@@ -393,6 +507,9 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Global event and crisis signals from GDELT (Global Database of Events, Language, and Tone)",
+            # GDELT DOC API asks for at most one request every 5 seconds
+            http_policy=HTTPPolicy(rate_limit_per_second=0.2, rate_limit_burst=3),
+            max_staleness_minutes=180.0,
         )
     )
 
@@ -406,6 +523,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Enforcement/ICE/policing-related events from GDELT (normalized attention signal for political/social stress adjustment)",
+            max_staleness_minutes=180.0,
         )
     )
 
@@ -419,6 +537,9 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Active weather alerts from NWS (National Weather Service) - warnings, watches, and advisories",
+            # api.weather.gov throttles bursts with 429s (no published quota)
+            http_policy=HTTPPolicy(rate_limit_per_second=5.0, rate_limit_burst=10),
+            max_staleness_minutes=30.0,
         )
     )
 
@@ -432,6 +553,8 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Known Exploited Vulnerabilities from CISA (Cybersecurity and Infrastructure Security Agency)",
+            http_policy=HTTPPolicy(read_timeout=60.0),
+            max_staleness_minutes=1440.0,
         )
     )
 
@@ -445,6 +568,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="State-level gasoline prices from EIA (Energy Information Administration). Provides fuel stress index based on price deviation from national average. Public data, no API key required.",
+            max_staleness_minutes=1440.0,
         )
     )
 
@@ -458,6 +582,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="State-level drought severity from U.S. Drought Monitor (NDMC). Provides drought stress index based on DSCI (Drought Severity and Coverage Index, 0-500). Weekly updates. Public data, no API key required.",
+            max_staleness_minutes=4320.0,
         )
     )
 
@@ -471,6 +596,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="State-level storm events from NOAA Storm Events Database. Provides storm severity stress, heatwave stress, and flood risk stress indices. Monthly updates. Public data, no API key required.",
+            max_staleness_minutes=10080.0,
         )
     )
 
@@ -484,6 +610,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Demographic indicators from US Census Bureau API (population density, age distribution, gender distribution). Provides demographic stress index. Annual updates. Public data, no API key required.",
+            max_staleness_minutes=10080.0,
         )
     )
 
@@ -497,6 +624,7 @@ def initialize_registry() -> None:
             required_env_vars=["FRED_API_KEY"],
             can_run_without_key=True,
             description="Consumer spending indicators from FRED API (retail sales, personal consumption, credit utilization). Provides spending stress index. Monthly/weekly updates. Free API key required (available at fred.stlouisfed.org).",
+            max_staleness_minutes=1440.0,
         )
     )
 
@@ -510,6 +638,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Employment data by sector from Bureau of Labor Statistics (BLS) API. Provides sector-specific employment stress indices and job creation/destruction trends. Monthly updates. Public data, no API key required.",
+            max_staleness_minutes=1440.0,
         )
     )
 
@@ -523,6 +652,7 @@ def initialize_registry() -> None:
             required_env_vars=[],
             can_run_without_key=True,
             description="Energy consumption patterns from EIA API (electricity usage, fuel consumption, renewable energy adoption). Expands existing EIA energy data. Provides consumption stress indicators. Monthly/weekly updates. Public data, no API key required.",
+            max_staleness_minutes=1440.0,
         )
     )
 
@@ -536,6 +666,7 @@ def initialize_registry() -> None:
             required_env_vars=["PURPLEAIR_API_KEY", "AIRNOW_API_KEY"],
             can_run_without_key=True,
             description="Air quality data from PurpleAir (community sensors) and EPA AirNow (official government data). Provides AQI (Air Quality Index) normalized to air quality stress index. Real-time updates. API keys optional (can use fallback data).",
+            max_staleness_minutes=120.0,
         )
     )
 
@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Stale-while-revalidate support for fetcher caches.
+
+When a fetcher cache entry has passed its TTL but is still within the source's
+max_staleness_minutes (declared in the source registry), the caller serves the
+expired entry immediately and one background refresh is scheduled per cache
+key. Past the grace window the caller refetches synchronously as before.
+"""
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+
+from app.services.ingestion.source_registry import get_max_staleness_minutes
+
+logger = structlog.get_logger("ingestion.stale_refresh")
+
+# Prometheus client (optional dependency)
+try:
+    from prometheus_client import Counter
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    Counter = None
+
+STALE_WHILE_REVALIDATE_ENABLED = (
+    os.getenv("STALE_WHILE_REVALIDATE_ENABLED", "true").lower() == "true"
+)
+STALE_REFRESH_MAX_WORKERS = int(os.getenv("STALE_REFRESH_MAX_WORKERS", "4"))
+
+if PROMETHEUS_AVAILABLE:
+    stale_served_counter = Counter(
+        "ingestion_stale_served_total",
+        "Expired fetcher cache entries served while a refresh runs",
+        ["source"],
+    )
+    background_refresh_counter = Counter(
+        "ingestion_background_refresh_total",
+        "Background fetcher cache refreshes by outcome",
+        ["source", "outcome"],
+    )
+else:
+    stale_served_counter = None
+    background_refresh_counter = None
+
+
+class StaleRefresher:
+    """
+    Schedules at most one background refresh per fetcher cache key.
+
+    Refreshes run on a small shared worker pool so a burst of stale hits
+    cannot fan out into a burst of upstream requests.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = STALE_REFRESH_MAX_WORKERS,
+        enabled: bool = STALE_WHILE_REVALIDATE_ENABLED,
+    ):
+        """
+        Initialize refresher.
+
+        Args:
+            max_workers: Concurrent background refreshes
+            enabled: Serve stale entries at all (False = always refetch)
+        """
+        self.enabled = enabled
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="stale-refresh"
+        )
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    def serve_stale(
+        self,
+        source_id: Optional[str],
+        cache_key: str,
+        age_minutes: float,
+        ttl_minutes: float,
+        refresh: Callable[[], Any],
+    ) -> bool:
+        """
+        Decide whether an expired cache entry may be served.
+
+        Args:
+            source_id: Source registry id (selects the staleness grace)
+            cache_key: Fetcher cache key of the entry
+            age_minutes: Age of the entry
+            ttl_minutes: Fetcher cache TTL
+            refresh: Callable that refetches and repopulates the cache entry
+
+        Returns:
+            True if the caller should serve the entry (a refresh is running);
+            False if the caller must refetch synchronously
+        """
+        if not self.enabled:
+            return False
+        if age_minutes > ttl_minutes + get_max_staleness_minutes(source_id):
+            return False
+
+        key = f"{source_id}|{cache_key}"
+        future = None
+        with self._lock:
+            if key not in self._in_flight:
+                try:
+                    future = self._executor.submit(refresh)
+                except RuntimeError:
+                    # Executor shut down (interpreter exit / reset)
+                    return False
+                self._in_flight[key] = future
+        if future is not None:
+            # Registered outside the lock: runs inline if already finished
+            future.add_done_callback(lambda done: self._finish(key, source_id, done))
+            logger.info(
+                "Serving stale cache entry, refreshing in background",
+                source=source_id,
+                cache_key=cache_key,
+                age_minutes=round(age_minutes, 1),
+            )
+        if stale_served_counter is not None:
+            stale_served_counter.labels(source=source_id or "unknown").inc()
+        return True
+
+    def in_flight(self) -> List[str]:
+        """Keys with a background refresh currently running."""
+        with self._lock:
+            return list(self._in_flight)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting refreshes."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _finish(self, key: str, source_id: Optional[str], future: Future) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+        error = None if future.cancelled() else future.exception()
+        if error is not None:
+            logger.warning(
+                "Background cache refresh failed", key=key, error=str(error)[:200]
+            )
+        if background_refresh_counter is not None:
+            background_refresh_counter.labels(
+                source=source_id or "unknown",
+                outcome="error" if error is not None else "ok",
+            ).inc()
+
+
+# Global instance (singleton pattern)
+_stale_refresher_instance: Optional[StaleRefresher] = None
+_stale_refresher_lock = threading.Lock()
+
+
+def get_stale_refresher() -> StaleRefresher:
+    """Get or create the global StaleRefresher instance."""
+    global _stale_refresher_instance
+    with _stale_refresher_lock:
+        if _stale_refresher_instance is None:
+            _stale_refresher_instance = StaleRefresher()
+        return _stale_refresher_instance
+
+
+def reset_stale_refresher() -> None:
+    """Shut down and reset the global StaleRefresher singleton instance."""
+    global _stale_refresher_instance
+    with _stale_refresher_lock:
+        if _stale_refresher_instance is not None:
+            _stale_refresher_instance.shutdown()
+        _stale_refresher_instance = None
+
+
+def serve_stale(
+    source_id: Optional[str],
+    cache_key: str,
+    age_minutes: float,
+    ttl_minutes: float,
+    refresh: Callable[[], Any],
+) -> bool:
+    """Shortcut for get_stale_refresher().serve_stale (see StaleRefresher)."""
+    return get_stale_refresher().serve_stale(
+        source_id, cache_key, age_minutes, ttl_minutes, refresh
+    )
@@ -1,16 +1,189 @@
 # SPDX-License-Identifier: PROPRIETARY
-"""USGS Earthquake feed connector for environmental hazard signals."""
+"""USGS Earthquake feed connector for environmental hazard signals.
+
+The global GeoJSON summary feed is downloaded once per TTL and kept as NumPy
+arrays (latitude, longitude, magnitude, time). Every window length, magnitude
+threshold and region radius is then answered by filtering those arrays, so
+region forecasts never trigger extra USGS calls.
+"""
+import os
+import threading
+import time
 from datetime import datetime, timedelta
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 import requests
 import structlog
 
+from app.services.ingestion.http_transport import get_http_transport
+
 logger = structlog.get_logger("ingestion.usgs_earthquakes")
 
-# USGS Earthquake API base URL
+# Source registry id (selects the HTTP retry/timeout policy and staleness grace)
+SOURCE_ID = "usgs_earthquakes"
+
+# USGS Earthquake API base URL (windows longer than the summary feeds)
 USGS_API_BASE = "https://earthquake.usgs.gov/fdsnws/event/1/query"
 
+# Global GeoJSON summary feeds (past 30 days, refreshed every minute)
+USGS_SUMMARY_FEED_BASE = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary"
+USGS_SUMMARY_FEED_DAYS = 30
+# (minimum magnitude, feed name), highest first
+USGS_SUMMARY_FEED_LEVELS = ((4.5, "4.5"), (2.5, "2.5"), (1.0, "1.0"), (0.0, "all"))
+
+# Radius around a region's coordinates whose earthquakes count toward it
+USGS_REGION_RADIUS_KM = float(os.getenv("USGS_REGION_RADIUS_KM", "1000"))
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(
+    latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray
+) -> np.ndarray:
+    """
+    Great-circle distances from one point to many (vectorized).
+
+    Args:
+        latitude: Origin latitude in degrees
+        longitude: Origin longitude in degrees
+        latitudes: Target latitudes in degrees
+        longitudes: Target longitudes in degrees
+
+    Returns:
+        Distances in kilometers
+    """
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(latitudes)
+    dlat = lat2 - lat1
+    dlon = np.radians(longitudes - longitude)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class EarthquakeCatalog:
+    """Earthquake events held as parallel NumPy arrays."""
+
+    def __init__(
+        self,
+        latitude: np.ndarray,
+        longitude: np.ndarray,
+        magnitude: np.ndarray,
+        time_ms: np.ndarray,
+        covers_days: int,
+        min_magnitude: float,
+    ):
+        """
+        Initialize catalog.
+
+        Args:
+            latitude: Event latitudes in degrees
+            longitude: Event longitudes in degrees
+            magnitude: Event magnitudes
+            time_ms: Event times in epoch milliseconds
+            covers_days: Days before loading that the catalog is complete for
+            min_magnitude: Magnitude at or above which the catalog is complete
+        """
+        self.latitude = latitude
+        self.longitude = longitude
+        self.magnitude = magnitude
+        self.time_ms = time_ms
+        self.covers_days = covers_days
+        self.min_magnitude = min_magnitude
+        self.loaded_at = datetime.now()
+
+    def __len__(self) -> int:
+        return len(self.magnitude)
+
+    @classmethod
+    def from_geojson(
+        cls, data: Dict, covers_days: int, min_magnitude: float
+    ) -> "EarthquakeCatalog":
+        """
+        Build a catalog from a USGS GeoJSON FeatureCollection.
+
+        Features without a time, magnitude or coordinates are skipped.
+
+        Args:
+            data: Parsed GeoJSON
+            covers_days: Days the feed covers
+            min_magnitude: Magnitude threshold of the feed
+
+        Returns:
+            EarthquakeCatalog
+        """
+        rows = []
+        for feature in data.get("features") or []:
+            props = feature.get("properties") or {}
+            coordinates = (feature.get("geometry") or {}).get("coordinates") or []
+            try:
+                rows.append(
+                    (
+                        float(coordinates[1]),
+                        float(coordinates[0]),
+                        float(props["mag"]),
+                        float(props["time"]),
+                    )
+                )
+            except (IndexError, KeyError, TypeError, ValueError) as e:
+                logger.debug(
+                    "Skipping invalid earthquake entry",
+                    time=props.get("time"),
+                    magnitude=props.get("mag"),
+                    error=str(e),
+                )
+        events = np.array(rows, dtype=np.float64).reshape(-1, 4)
+        return cls(
+            latitude=events[:, 0],
+            longitude=events[:, 1],
+            magnitude=events[:, 2],
+            time_ms=events[:, 3],
+            covers_days=covers_days,
+            min_magnitude=min_magnitude,
+        )
+
+    def select(
+        self,
+        since_ms: float,
+        min_magnitude: float,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        radius_km: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Boolean mask of events in a window, above a magnitude and near a point.
+
+        Args:
+            since_ms: Window start in epoch milliseconds
+            min_magnitude: Minimum magnitude
+            latitude: Region latitude (None = worldwide)
+            longitude: Region longitude (None = worldwide)
+            radius_km: Region radius in kilometers
+
+        Returns:
+            Mask over the catalog's events
+        """
+        mask = (self.time_ms >= since_ms) & (self.magnitude >= min_magnitude)
+        if latitude is not None and longitude is not None and radius_km is not None:
+            mask &= (
+                haversine_km(latitude, longitude, self.latitude, self.longitude)
+                <= radius_km
+            )
+        return mask
+
+
+# Process-wide catalogs by the magnitude they were loaded at. Forecasters build
+# their own fetcher, so per-instance catalogs would each download the feed.
+_catalogs: Dict[float, EarthquakeCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def reset_earthquake_catalogs() -> None:
+    """Drop all shared catalogs (the next call downloads again)."""
+    with _catalogs_lock:
+        _catalogs.clear()
+
 
 class USGSEarthquakeFetcher:
     """
@@ -20,6 +193,7 @@ class USGSEarthquakeFetcher:
     No authentication required.
 
     Source: https://earthquake.usgs.gov/fdsnws/event/1/
+    Feeds: https://earthquake.usgs.gov/earthquakes/feed/v1.0/geojson.php
     """
 
     def __init__(self, cache_duration_minutes: int = 60):
@@ -31,128 +205,91 @@ class USGSEarthquakeFetcher:
                 (default: 60 minutes)
         """
         self.cache_duration_minutes = cache_duration_minutes
-        self._cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
 
     def fetch_earthquake_intensity(
         self,
         days_back: int = 30,
         min_magnitude: float = 4.0,
         use_cache: bool = True,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        radius_km: float = USGS_REGION_RADIUS_KM,
     ) -> pd.DataFrame:
         """
         Fetch daily earthquake intensity index from USGS.
 
         Aggregates earthquakes by date and computes normalized intensity score
-        based on magnitude and frequency.
+        based on magnitude and frequency. Without coordinates the index is
+        worldwide and min-max normalized over the window. With coordinates
+        only earthquakes within radius_km count, scaled by the window's
+        worldwide daily peak so regions are comparable; every day of the
+        window is present, with 0.0 on days without nearby earthquakes.
 
         Args:
             days_back: Number of days of historical data (default: 30)
             min_magnitude: Minimum earthquake magnitude to include (default: 4.0)
             use_cache: Whether to use cached data (default: True)
+            latitude: Region latitude (optional)
+            longitude: Region longitude (optional)
+            radius_km: Region radius in kilometers
+                (default: USGS_REGION_RADIUS_KM)
 
         Returns:
             DataFrame with columns: ['timestamp', 'earthquake_intensity']
             Values normalized to [0.0, 1.0] where 1.0 = maximum intensity
         """
-        cache_key = f"usgs_earthquakes_{days_back}_{min_magnitude}"
-
-        # Check cache
-        if use_cache and cache_key in self._cache:
-            df, cache_time = self._cache[cache_key]
-            age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
-                logger.info("Using cached USGS earthquake data")
-                return df.copy()
-
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-
         try:
-            # USGS API query
-            params = {
-                "format": "geojson",
-                "starttime": start_date.strftime("%Y-%m-%d"),
-                "endtime": end_date.strftime("%Y-%m-%d"),
-                "minmagnitude": min_magnitude,
-                "orderby": "time",
-            }
-
-            logger.info(
-                "Fetching USGS earthquake data",
-                days_back=days_back,
-                min_magnitude=min_magnitude,
-            )
-
-            response = requests.get(USGS_API_BASE, params=params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Parse GeoJSON features
-            if "features" not in data or not data["features"]:
-                logger.warning("No features in USGS response")
-                return pd.DataFrame(columns=["timestamp", "earthquake_intensity"])
-
-            features = data["features"]
-            records = []
-
-            for feature in features:
-                props = feature.get("properties", {})
-                time_ms = props.get("time")
-                magnitude = props.get("mag")
-
-                if time_ms is None or magnitude is None:
-                    continue
-
-                try:
-                    # Convert milliseconds to datetime
-                    date_obj = datetime.fromtimestamp(time_ms / 1000.0)
-                    date_obj = date_obj.replace(
-                        hour=0, minute=0, second=0, microsecond=0
-                    )
-                    records.append(
-                        {
-                            "timestamp": date_obj,
-                            "magnitude": float(magnitude),
-                        }
-                    )
-                except (ValueError, TypeError) as e:
-                    logger.debug(
-                        "Skipping invalid earthquake entry",
-                        time=time_ms,
-                        magnitude=magnitude,
-                        error=str(e),
-                    )
-                    continue
-
-            if not records:
-                logger.warning("No valid earthquake entries after parsing")
-                return pd.DataFrame(columns=["timestamp", "earthquake_intensity"])
-
-            df = pd.DataFrame(records)
-
-            # Aggregate by date: compute daily intensity
-            # Intensity = weighted sum of magnitudes (higher magnitude = more weight)
-            daily_intensity = (
-                df.groupby("timestamp")["magnitude"]
-                .apply(
-                    lambda x: (x**2).sum()
-                )  # Square magnitude for non-linear weighting
-                .reset_index()
-            )
-            daily_intensity.columns = ["timestamp", "raw_intensity"]
-
-            # Normalize to [0.0, 1.0]
-            min_intensity = daily_intensity["raw_intensity"].min()
-            max_intensity = daily_intensity["raw_intensity"].max()
-
-            if max_intensity > min_intensity:
+            catalog = self._catalog(days_back, min_magnitude, use_cache)
+            now_ms = time.time() * 1000
+            since_ms = now_ms - days_back * 86400 * 1000
+            window = catalog.select(since_ms, min_magnitude)
+            regional = latitude is not None and longitude is not None
+            if not window.any():
+                logger.warning(
+                    "No earthquakes in window",
+                    days_back=days_back,
+                    min_magnitude=min_magnitude,
+                )
+                if not regional:
+                    return pd.DataFrame(columns=["timestamp", "earthquake_intensity"])
+
+            # Intensity = daily sum of squared magnitudes (non-linear weighting)
+            global_intensity = self._daily_intensity(catalog, window)
+            if regional:
+                nearby = catalog.select(
+                    since_ms, min_magnitude, latitude, longitude, radius_km
+                )
+                # A quiet day near the region is a real zero; leaving it out
+                # would let the harmonizer interpolate across it
+                days = pd.date_range(
+                    pd.to_datetime(since_ms, unit="ms").floor("D"),
+                    pd.to_datetime(now_ms, unit="ms").floor("D"),
+                    freq="D",
+                    name="timestamp",
+                )
+                daily_intensity = (
+                    self._daily_intensity(catalog, nearby)
+                    .set_index("timestamp")
+                    .reindex(days, fill_value=0.0)
+                    .reset_index()
+                )
+                peak = global_intensity["raw_intensity"].max() if window.any() else 0
                 daily_intensity["earthquake_intensity"] = (
-                    daily_intensity["raw_intensity"] - min_intensity
-                ) / (max_intensity - min_intensity)
+                    (daily_intensity["raw_intensity"] / peak).clip(0.0, 1.0)
+                    if peak > 0
+                    else 0.0
+                )
             else:
-                daily_intensity["earthquake_intensity"] = 0.0
+                daily_intensity = global_intensity
+                # Normalize to [0.0, 1.0]
+                min_intensity = daily_intensity["raw_intensity"].min()
+                max_intensity = daily_intensity["raw_intensity"].max()
+                if max_intensity > min_intensity:
+                    daily_intensity["earthquake_intensity"] = (
+                        daily_intensity["raw_intensity"] - min_intensity
+                    ) / (max_intensity - min_intensity)
+                else:
+                    daily_intensity["earthquake_intensity"] = 0.0
 
             result_df = (
                 daily_intensity[["timestamp", "earthquake_intensity"]]
@@ -160,13 +297,11 @@ class USGSEarthquakeFetcher:
                 .reset_index(drop=True)
             )
 
-            # Cache result
-            self._cache[cache_key] = (result_df.copy(), datetime.now())
-
             logger.info(
-                "Successfully fetched USGS earthquake data",
+                "Computed USGS earthquake intensity",
                 rows=len(result_df),
-                date_range=(result_df["timestamp"].min(), result_df["timestamp"].max()),
+                regional=regional,
+                events=int((nearby if regional else window).sum()),
             )
 
             return result_df
@@ -186,3 +321,89 @@ class USGSEarthquakeFetcher:
                 exc_info=True,
             )
             return pd.DataFrame(columns=["timestamp", "earthquake_intensity"])
+
+    def _catalog(
+        self, days_back: int, min_magnitude: float, use_cache: bool
+    ) -> EarthquakeCatalog:
+        """
+        Return a catalog complete for the window and magnitude, loading if needed.
+
+        Catalogs are shared by all fetchers and loads are serialized, so
+        concurrent region forecasts share one download.
+        Summary feeds are loaded at the nearest feed level below min_magnitude;
+        event API queries request min_magnitude itself, since a long window at
+        a lower level can exceed the API's result limit.
+        """
+        with _catalogs_lock:
+            if use_cache:
+                for catalog in _catalogs.values():
+                    age_minutes = (
+                        datetime.now() - catalog.loaded_at
+                    ).total_seconds() / 60
+                    if (
+                        age_minutes < self.cache_duration_minutes
+                        and catalog.covers_days >= days_back
+                        and catalog.min_magnitude <= min_magnitude
+                    ):
+                        return catalog
+
+            if days_back <= USGS_SUMMARY_FEED_DAYS:
+                level, feed = next(
+                    (level, feed)
+                    for level, feed in USGS_SUMMARY_FEED_LEVELS
+                    if min_magnitude >= level
+                )
+                url = f"{USGS_SUMMARY_FEED_BASE}/{feed}_month.geojson"
+                params = None
+                covers_days = USGS_SUMMARY_FEED_DAYS
+            else:
+                # Longer windows than the summary feeds: query the event API
+                level = min_magnitude
+                url = USGS_API_BASE
+                params = {
+                    "format": "geojson",
+                    "starttime": (datetime.now() - timedelta(days=days_back)).strftime(
+                        "%Y-%m-%d"
+                    ),
+                    "minmagnitude": level,
+                    "orderby": "time",
+                }
+                covers_days = days_back
+
+            logger.info(
+                "Fetching USGS earthquake data",
+                days_back=covers_days,
+                min_magnitude=level,
+            )
+            response = get_http_transport().get(url, source_id=SOURCE_ID, params=params)
+            response.raise_for_status()
+
+            catalog = EarthquakeCatalog.from_geojson(
+                response.json(), covers_days=covers_days, min_magnitude=level
+            )
+            # Expired catalogs are never served again
+            for stale_level, stale in list(_catalogs.items()):
+                age_minutes = (datetime.now() - stale.loaded_at).total_seconds() / 60
+                if age_minutes >= self.cache_duration_minutes:
+                    del _catalogs[stale_level]
+            _catalogs[level] = catalog
+            logger.info(
+                "Loaded USGS earthquake catalog",
+                events=len(catalog),
+                days_back=covers_days,
+                min_magnitude=level,
+            )
+            return catalog
+
+    @staticmethod
+    def _daily_intensity(catalog: EarthquakeCatalog, mask: np.ndarray) -> pd.DataFrame:
+        """Daily sum of squared magnitudes of the masked events."""
+        days = pd.to_datetime(catalog.time_ms[mask], unit="ms").floor("D")
+        daily = (
+            pd.Series(catalog.magnitude[mask] ** 2, index=days)
+            .groupby(level=0)
+            .sum()
+            .reset_index()
+        )
+        daily.columns = ["timestamp", "raw_intensity"]
+        return daily
@@ -1,20 +1,81 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Environmental data ingestion using Open-Meteo API for weather impact analysis."""
+import os
+import threading
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import openmeteo_requests
 import pandas as pd
 import requests_cache
 import structlog
 
+from app.core.forecast_cache import ForecastCache
 from app.services.ingestion.ci_offline_data import (
     is_ci_offline_mode,
     get_ci_weather_data,
 )
+from app.services.ingestion.source_registry import get_max_staleness_minutes
+from app.services.ingestion.stale_refresh import serve_stale
 
 logger = structlog.get_logger("ingestion.weather")
 
+# Source registry id (selects the staleness grace)
+SOURCE_ID = "weather_patterns"
+
+OPEN_METEO_ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
+# Locations sent in one Open-Meteo request by fetch_regional_comfort_batch
+WEATHER_BATCH_MAX_LOCATIONS = int(os.getenv("WEATHER_BATCH_MAX_LOCATIONS", "50"))
+# Byte budget of the region cache shared by all fetchers
+WEATHER_CACHE_MAX_BYTES = int(
+    os.getenv("WEATHER_CACHE_MAX_BYTES", str(32 * 1024 * 1024))
+)
+
+WEATHER_COLUMNS = [
+    "timestamp",
+    "temperature",
+    "precipitation",
+    "windspeed",
+    "discomfort_score",
+]
+
+
+def _empty_weather_frame() -> pd.DataFrame:
+    return pd.DataFrame(columns=WEATHER_COLUMNS, dtype=float)
+
+
+# Process-wide region cache (created on first use). Forecasters build their
+# own fetcher, so a per-instance cache would be cold on every request.
+_weather_cache: Optional[ForecastCache] = None
+_weather_cache_lock = threading.Lock()
+
+
+def get_weather_cache() -> ForecastCache:
+    """
+    Get the region cache shared by all EnvironmentalImpactFetcher instances.
+
+    Returns:
+        Shared ForecastCache bounded by WEATHER_CACHE_MAX_BYTES
+    """
+    global _weather_cache
+    with _weather_cache_lock:
+        if _weather_cache is None:
+            _weather_cache = ForecastCache(
+                max_bytes=WEATHER_CACHE_MAX_BYTES,
+                default_ttl_seconds=None,
+                name="weather",
+            )
+        return _weather_cache
+
+
+def reset_weather_cache() -> None:
+    """Drop the shared region cache (recreated on next use)."""
+    global _weather_cache
+    with _weather_cache_lock:
+        if _weather_cache is not None:
+            _weather_cache.clear()
+        _weather_cache = None
+
 
 class EnvironmentalImpactFetcher:
     """
@@ -33,9 +94,9 @@ class EnvironmentalImpactFetcher:
                 (default: 30 minutes)
         """
         self.cache_duration_minutes = cache_duration_minutes
-        self._cache: Optional[pd.DataFrame] = None
-        self._cache_key: Optional[str] = None
-        self._cache_timestamp: Optional[datetime] = None
+        # Region-keyed: "lat,lon,days_back" -> (daily frame, fetched at);
+        # entries are dropped once past TTL plus the staleness grace
+        self._cache = get_weather_cache()
 
         # Setup requests session with caching
         self.session = requests_cache.CachedSession(
@@ -87,24 +148,115 @@ class EnvironmentalImpactFetcher:
             df["windspeed"] = 5.0
             return df.tail(days_back).copy()
 
-        cache_key = f"{latitude:.4f},{longitude:.4f},{days_back}"
+        cache_key = self._cache_key(latitude, longitude, days_back)
+        cached = self._cached(cache_key, latitude, longitude, days_back, use_cache)
+        if cached is not None:
+            return cached
+
+        return self._fetch_locations([(latitude, longitude)], days_back)[0]
+
+    def fetch_regional_comfort_batch(
+        self,
+        locations: List[Tuple[float, float]],
+        days_back: int = 30,
+        use_cache: bool = True,
+    ) -> List[pd.DataFrame]:
+        """
+        Fetch comfort scores for many locations with batched Open-Meteo calls.
+
+        Locations missing from the cache are sent as coordinate lists, up to
+        WEATHER_BATCH_MAX_LOCATIONS per request; each location's result is
+        cached exactly as fetch_regional_comfort would cache it, so a batch
+        call warms the cache for later per-region calls.
+
+        Args:
+            locations: (latitude, longitude) pairs
+            days_back: Number of days of historical data to fetch (default: 30)
+            use_cache: Whether to use cached data if available (default: True)
+
+        Returns:
+            One DataFrame per location, in input order (same columns as
+            fetch_regional_comfort; empty for locations that failed)
+        """
+        if is_ci_offline_mode():
+            return [
+                self.fetch_regional_comfort(lat, lon, days_back, use_cache)
+                for lat, lon in locations
+            ]
+
+        results: List[Optional[pd.DataFrame]] = [None] * len(locations)
+        missing: Dict[str, List[int]] = {}
+        for index, (latitude, longitude) in enumerate(locations):
+            if not (-90 <= latitude <= 90) or not (-180 <= longitude <= 180):
+                raise ValueError(f"Invalid coordinates: ({latitude}, {longitude})")
+            cache_key = self._cache_key(latitude, longitude, days_back)
+            cached = self._cached(cache_key, latitude, longitude, days_back, use_cache)
+            if cached is not None:
+                results[index] = cached
+            else:
+                # Duplicate locations share one slot in the request
+                missing.setdefault(cache_key, []).append(index)
+
+        pending = list(missing.values())
+        for start in range(0, len(pending), WEATHER_BATCH_MAX_LOCATIONS):
+            chunk = pending[start : start + WEATHER_BATCH_MAX_LOCATIONS]
+            frames = self._fetch_locations(
+                [locations[indexes[0]] for indexes in chunk], days_back
+            )
+            for indexes, df in zip(chunk, frames):
+                for index in indexes:
+                    results[index] = df.copy()
+
+        return results
+
+    @staticmethod
+    def _cache_key(latitude: float, longitude: float, days_back: int) -> str:
+        return f"{latitude:.4f},{longitude:.4f},{days_back}"
 
-        # Check cache validity
-        if (
-            use_cache
-            and self._cache is not None
-            and self._cache_key == cache_key
-            and self._cache_timestamp is not None
+    def _cached(
+        self,
+        cache_key: str,
+        latitude: float,
+        longitude: float,
+        days_back: int,
+        use_cache: bool,
+    ) -> Optional[pd.DataFrame]:
+        """Cached frame for a region if fresh (or servable stale), else None."""
+        cached = self._cache.get(cache_key) if use_cache else None
+        if cached is None:
+            return None
+        cached_df, cached_at = cached
+        age_minutes = (datetime.now() - cached_at).total_seconds() / 60
+        if age_minutes < self.cache_duration_minutes or serve_stale(
+            SOURCE_ID,
+            cache_key,
+            age_minutes,
+            self.cache_duration_minutes,
+            lambda: self.fetch_regional_comfort(
+                latitude, longitude, days_back, use_cache=False
+            ),
         ):
-            age_minutes = (datetime.now() - self._cache_timestamp).total_seconds() / 60
-            if age_minutes < self.cache_duration_minutes:
-                logger.info(
-                    "Using cached weather data",
-                    age_minutes=age_minutes,
-                    cache_key=cache_key,
-                )
-                return self._cache.copy()
+            logger.info(
+                "Using cached weather data",
+                age_minutes=age_minutes,
+                cache_key=cache_key,
+            )
+            return cached_df.copy()
+        return None
+
+    def _fetch_locations(
+        self, locations: List[Tuple[float, float]], days_back: int
+    ) -> List[pd.DataFrame]:
+        """
+        Fetch and score locations in one Open-Meteo request.
 
+        Args:
+            locations: (latitude, longitude) pairs
+            days_back: Number of days of historical data to fetch
+
+        Returns:
+            One daily DataFrame per location (empty on error)
+        """
         try:
             # Calculate date range
             end_date = datetime.now()
@@ -112,41 +264,87 @@ class EnvironmentalImpactFetcher:
 
             logger.info(
                 "Fetching weather data",
-                latitude=latitude,
-                longitude=longitude,
+                locations=len(locations),
+                latitude=locations[0][0],
+                longitude=locations[0][1],
                 start_date=start_date.date().isoformat(),
                 end_date=end_date.date().isoformat(),
             )
 
-            # Open-Meteo API URL and parameters
-            url = "https://archive-api.open-meteo.com/v1/archive"
+            # Open-Meteo accepts coordinate lists and answers one response
+            # per location, in request order
             params = {
-                "latitude": latitude,
-                "longitude": longitude,
+                "latitude": [lat for lat, _ in locations],
+                "longitude": [lon for _, lon in locations],
                 "start_date": start_date.date().isoformat(),
                 "end_date": end_date.date().isoformat(),
                 "hourly": ["temperature_2m", "precipitation", "windspeed_10m"],
                 "timezone": "UTC",
             }
+            if len(locations) == 1:
+                params["latitude"], params["longitude"] = locations[0]
 
             # Make API request
-            responses = self.openmeteo.weather_api(url, params=params)
+            responses = self.openmeteo.weather_api(
+                OPEN_METEO_ARCHIVE_URL, params=params
+            )
 
             if not responses or len(responses) == 0:
                 logger.warning("Empty response from Open-Meteo API")
-                return pd.DataFrame(
-                    columns=[
-                        "timestamp",
-                        "temperature",
-                        "precipitation",
-                        "windspeed",
-                        "discomfort_score",
-                    ],
-                    dtype=float,
+                return [_empty_weather_frame() for _ in locations]
+        except Exception as e:
+            logger.error(
+                "Error fetching weather data",
+                error=str(e),
+                latitude=locations[0][0],
+                longitude=locations[0][1],
+                locations=len(locations),
+                exc_info=True,
+            )
+            # Return empty DataFrames with correct structure on error
+            return [_empty_weather_frame() for _ in locations]
+
+        frames = []
+        for index, (latitude, longitude) in enumerate(locations):
+            if index >= len(responses):
+                logger.warning(
+                    "Missing Open-Meteo response for location",
+                    latitude=latitude,
+                    longitude=longitude,
+                )
+                frames.append(_empty_weather_frame())
+                continue
+            daily_df = self._daily_comfort(responses[index], latitude, longitude)
+            if not daily_df.empty:
+                # Update cache; past TTL plus grace it could never be served
+                self._cache.put(
+                    self._cache_key(latitude, longitude, days_back),
+                    (daily_df.copy(), datetime.now()),
+                    ttl_seconds=(
+                        self.cache_duration_minutes
+                        + get_max_staleness_minutes(SOURCE_ID)
+                    )
+                    * 60,
                 )
+            frames.append(daily_df)
+        return frames
 
-            response = responses[0]
+    def _daily_comfort(
+        self, response, latitude: float, longitude: float
+    ) -> pd.DataFrame:
+        """
+        Turn one location's hourly Open-Meteo response into daily comfort scores.
+
+        Args:
+            response: Open-Meteo response for the location
+            latitude: Latitude (for logging)
+            longitude: Longitude (for logging)
 
+        Returns:
+            Daily DataFrame (empty if the response holds no valid data or
+            cannot be parsed)
+        """
+        try:
             # Extract hourly data
             hourly = response.Hourly()
             hourly_temperature_2m = hourly.Variables(0).ValuesAsNumpy()
@@ -177,17 +375,12 @@ class EnvironmentalImpactFetcher:
             df = df.dropna()
 
             if df.empty:
-                logger.warning("No valid weather data returned from Open-Meteo API")
-                return pd.DataFrame(
-                    columns=[
-                        "timestamp",
-                        "temperature",
-                        "precipitation",
-                        "windspeed",
-                        "discomfort_score",
-                    ],
-                    dtype=float,
+                logger.warning(
+                    "No valid weather data returned from Open-Meteo API",
+                    latitude=latitude,
+                    longitude=longitude,
                 )
+                return _empty_weather_frame()
 
             # Calculate discomfort score
             # Ideal temperature: 20C
@@ -235,14 +428,11 @@ class EnvironmentalImpactFetcher:
             # Sort by timestamp
             daily_df = daily_df.sort_values("timestamp").reset_index(drop=True)
 
-            # Update cache
-            self._cache = daily_df.copy()
-            self._cache_key = cache_key
-            self._cache_timestamp = datetime.now()
-
             logger.info(
                 "Weather data fetched successfully",
                 rows=len(daily_df),
+                latitude=latitude,
+                longitude=longitude,
                 discomfort_score_range=(
                     daily_df["discomfort_score"].min(),
                     daily_df["discomfort_score"].max(),
@@ -253,20 +443,10 @@ class EnvironmentalImpactFetcher:
 
         except Exception as e:
             logger.error(
-                "Error fetching weather data",
+                "Error parsing weather data",
                 error=str(e),
                 latitude=latitude,
                 longitude=longitude,
                 exc_info=True,
             )
-            # Return empty DataFrame with correct structure on error
-            return pd.DataFrame(
-                columns=[
-                    "timestamp",
-                    "temperature",
-                    "precipitation",
-                    "windspeed",
-                    "discomfort_score",
-                ],
-                dtype=float,
-            )
+            return _empty_weather_frame()
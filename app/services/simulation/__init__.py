@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Scenario Simulation Engine."""
-from .engine import SimulationEngine
+from .engine import ScenarioBaseline, SimulationEngine
 
-__all__ = ["SimulationEngine"]
+__all__ = ["ScenarioBaseline", "SimulationEngine"]
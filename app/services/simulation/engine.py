@@ -2,9 +2,24 @@
 """Scenario Simulation Engine.
 
 Allows hypothetical scenario testing by modifying index values.
+
+A scenario only changes the latest row, so the engine caches a baseline per
+history frame (the latest sub-index vector and its behavior index weights) and
+evaluates sub-index scenarios (single or Monte-Carlo) against it instead of
+re-running the full pipeline.
+
+Raw-input scenarios are deliberately not incremental: they run the sub-index
+pipeline once over the whole modified frame. The pipeline does not decompose
+into a bounded tail window. Several steps use whole-series statistics (series
+maxima, mean fills), window lengths depend on the frame length, and the EWMA
+smoothing is recursive over every row. A tail-only recompute would therefore
+diverge from a full pass.
 """
-from typing import Dict
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -12,79 +27,223 @@ from app.core.behavior_index import BehaviorIndexComputer
 
 logger = structlog.get_logger("simulation.engine")
 
+# Sub-indices combined into the behavior index, with the computer weight
+# attribute each one uses
+SUB_INDEX_WEIGHTS = {
+    "economic_stress": "economic_weight",
+    "environmental_stress": "environmental_weight",
+    "mobility_activity": "mobility_weight",
+    "digital_attention": "digital_attention_weight",
+    "public_health_stress": "health_weight",
+    "political_stress": "political_weight",
+    "crime_stress": "crime_weight",
+    "misinformation_stress": "misinformation_weight",
+    "social_cohesion_stress": "social_cohesion_weight",
+}
+
+# Activity sub-indices contribute inversely (lower activity = more disruption)
+INVERTED_SUB_INDICES = {"mobility_activity"}
+
+# Number of baselines kept per engine
+BASELINE_CACHE_MAX_SIZE = 32
+
+
+class ScenarioBaseline:
+    """Cached state needed to evaluate scenarios for one history frame."""
+
+    def __init__(
+        self,
+        sub_index_names: List[str],
+        latest: np.ndarray,
+        coefficients: np.ndarray,
+        intercept: float,
+        base_behavior_index: float,
+        input_df: pd.DataFrame,
+        input_sub_indices: np.ndarray,
+    ):
+        """
+        Initialize a scenario baseline.
+
+        Args:
+            sub_index_names: Sub-index names in vector order
+            latest: Latest sub-index values (NaN filled with 0.5)
+            coefficients: Signed behavior index weight per sub-index
+            intercept: Constant term from inverted sub-indices
+            base_behavior_index: Behavior index of the unmodified latest row
+            input_df: Input rows the pipeline runs on for raw-input scenarios
+            input_sub_indices: Sub-indices recomputed from input_df (latest row)
+        """
+        self.sub_index_names = sub_index_names
+        self.latest = latest
+        self.coefficients = coefficients
+        self.intercept = intercept
+        self.base_behavior_index = base_behavior_index
+        self.input_df = input_df
+        self.input_sub_indices = input_sub_indices
+        self.column_positions = {name: i for i, name in enumerate(sub_index_names)}
+
+    def behavior_index(self, sub_index_matrix: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the behavior index for one or many sub-index vectors.
+
+        Args:
+            sub_index_matrix: Array of shape (sub_indices,) or (n, sub_indices)
+
+        Returns:
+            Behavior index values clipped to [0.0, 1.0]
+        """
+        return np.clip(self.intercept + sub_index_matrix @ self.coefficients, 0.0, 1.0)
+
 
 class SimulationEngine:
     """Simulates scenarios with modified index values."""
 
     def __init__(self):
         """Initialize simulation engine."""
-        pass
+        self._computer = BehaviorIndexComputer()
+        self._baselines: "OrderedDict[Tuple, ScenarioBaseline]" = OrderedDict()
+
+    def prepare_baseline(self, base_history_df: pd.DataFrame) -> ScenarioBaseline:
+        """
+        Build (or fetch from cache) the scenario baseline for a history frame.
+
+        The sub-index pipeline runs once over the frame. Sub-index values
+        already present in the frame take precedence over recomputed ones.
+        Baselines are cached by frame content, so a frame mutated in place is
+        not served a stale baseline.
+
+        Args:
+            base_history_df: Base historical data
+
+        Returns:
+            ScenarioBaseline for the frame
+        """
+        cache_key = self._fingerprint(base_history_df)
+        baseline = self._baselines.get(cache_key) if cache_key else None
+        if baseline is not None:
+            self._baselines.move_to_end(cache_key)
+            return baseline
+
+        names = list(SUB_INDEX_WEIGHTS)
+        input_sub_indices = self._latest_sub_indices(base_history_df)
+
+        latest = input_sub_indices.copy()
+        if len(base_history_df) > 0:
+            last_row = base_history_df.iloc[-1]
+            for i, name in enumerate(names):
+                value = last_row.get(name)
+                if value is not None and not pd.isna(value):
+                    latest[i] = float(value)
+
+        coefficients = np.array(
+            [getattr(self._computer, SUB_INDEX_WEIGHTS[name]) for name in names]
+        )
+        inverted = np.array([name in INVERTED_SUB_INDICES for name in names])
+        intercept = float(coefficients[inverted].sum())
+        coefficients = np.where(inverted, -coefficients, coefficients)
+
+        stored_bi = None
+        if len(base_history_df) > 0 and "behavior_index" in base_history_df.columns:
+            stored_bi = base_history_df["behavior_index"].iloc[-1]
+        if stored_bi is None or pd.isna(stored_bi):
+            base_behavior_index = float(
+                np.clip(intercept + latest @ coefficients, 0.0, 1.0)
+            )
+        else:
+            base_behavior_index = float(stored_bi)
+
+        baseline = ScenarioBaseline(
+            sub_index_names=names,
+            latest=latest,
+            coefficients=coefficients,
+            intercept=intercept,
+            base_behavior_index=base_behavior_index,
+            input_df=base_history_df,
+            input_sub_indices=input_sub_indices,
+        )
+
+        if cache_key:
+            self._baselines[cache_key] = baseline
+            if len(self._baselines) > BASELINE_CACHE_MAX_SIZE:
+                self._baselines.popitem(last=False)
+
+        return baseline
 
     def simulate_scenario(
         self,
         base_history_df: pd.DataFrame,
         index_modifiers: Dict[str, float],
         region_name: str,
+        baseline: Optional[ScenarioBaseline] = None,
     ) -> Dict:
         """
         Simulate a scenario with modified index values.
 
+        Modifiers on sub-indices are applied to the cached latest sub-index
+        vector and re-weighted directly. Modifiers on raw input columns
+        re-run the sub-index pipeline once over the modified frame.
+
         Args:
             base_history_df: Base historical data
             index_modifiers: Dictionary mapping index names to modification factors
                             (e.g., 1.2 = 20% increase, 0.8 = 20% decrease)
             region_name: Region name for the simulation
+            baseline: Optional pre-built baseline (see prepare_baseline)
 
         Returns:
             Dictionary with simulation results
         """
-        # Create modified DataFrame
-        modified_df = base_history_df.copy()
-
-        # Apply modifiers to latest values
-        for index_name, modifier in index_modifiers.items():
-            if index_name in modified_df.columns:
-                # Apply modifier to latest value
-                if len(modified_df) > 0:
-                    latest_idx = modified_df.index[-1]
-                    current_value = modified_df.loc[latest_idx, index_name]
-                    if not pd.isna(current_value):
-                        new_value = current_value * modifier
-                        # Clip to valid range
-                        new_value = max(0.0, min(1.0, new_value))
-                        modified_df.loc[latest_idx, index_name] = new_value
-
-        # Recalculate behavior index with modified values
-        index_computer = BehaviorIndexComputer()
-        result_df = index_computer.compute_behavior_index(modified_df)
-
-        # Get projected behavior index
-        if len(result_df) > 0:
-            projected_behavior_index = float(result_df["behavior_index"].iloc[-1])
-        else:
-            projected_behavior_index = 0.5
+        if baseline is None:
+            baseline = self.prepare_baseline(base_history_df)
 
-        # Calculate changes
-        if len(base_history_df) > 0 and len(result_df) > 0:
-            base_behavior_index = float(
-                base_history_df.get("behavior_index", pd.Series([0.5])).iloc[-1]
-            )
-            behavior_index_change = projected_behavior_index - base_behavior_index
-        else:
-            base_behavior_index = 0.5
-            behavior_index_change = 0.0
+        modified = baseline.latest.copy()
+        modified_values: Dict[str, float] = {}
+
+        # Raw input columns: one pipeline pass over the modified frame
+        raw_modifiers = {
+            name: modifier
+            for name, modifier in index_modifiers.items()
+            if name not in baseline.column_positions
+            and name in baseline.input_df.columns
+        }
+        if raw_modifiers and len(baseline.input_df) > 0:
+            input_df = baseline.input_df.copy()
+            latest_idx = input_df.index[-1]
+            for name, modifier in raw_modifiers.items():
+                current_value = input_df.loc[latest_idx, name]
+                if not pd.isna(current_value):
+                    input_df.loc[latest_idx, name] = max(
+                        0.0, min(1.0, current_value * modifier)
+                    )
+                modified_values[name] = float(input_df.loc[latest_idx, name])
+            modified += self._latest_sub_indices(input_df) - baseline.input_sub_indices
+
+        # Sub-index modifiers: applied to the latest vector directly
+        for name, modifier in index_modifiers.items():
+            position = baseline.column_positions.get(name)
+            if position is not None:
+                modified[position] = modified[position] * modifier
+        modified = np.clip(modified, 0.0, 1.0)
+        for name in index_modifiers:
+            position = baseline.column_positions.get(name)
+            if position is not None:
+                modified_values[name] = float(modified[position])
+
+        behavior_index_change = float(
+            baseline.behavior_index(modified) - baseline.behavior_index(baseline.latest)
+        )
+        projected_behavior_index = float(
+            np.clip(baseline.base_behavior_index + behavior_index_change, 0.0, 1.0)
+        )
 
         result = {
             "region_name": region_name,
             "modified_indices": index_modifiers,
-            "base_behavior_index": float(base_behavior_index),
-            "projected_behavior_index": float(projected_behavior_index),
-            "behavior_index_change": float(behavior_index_change),
-            "modified_values": {
-                idx: float(modified_df[idx].iloc[-1])
-                for idx in index_modifiers.keys()
-                if idx in modified_df.columns
-            },
+            "base_behavior_index": float(baseline.base_behavior_index),
+            "projected_behavior_index": projected_behavior_index,
+            "behavior_index_change": projected_behavior_index
+            - baseline.base_behavior_index,
+            "modified_values": modified_values,
         }
 
         logger.info(
@@ -95,3 +254,122 @@ class SimulationEngine:
         )
 
         return result
+
+    def simulate_monte_carlo(
+        self,
+        base_history_df: pd.DataFrame,
+        modifier_ranges: Dict[str, Tuple[float, float]],
+        region_name: str,
+        n_samples: int = 10000,
+        seed: Optional[int] = None,
+        baseline: Optional[ScenarioBaseline] = None,
+        return_samples: bool = False,
+    ) -> Dict:
+        """
+        Simulate many random scenarios in one vectorized evaluation.
+
+        Each sample draws an independent uniform modifier per sub-index from
+        its range; all samples are evaluated as a single matrix product.
+
+        Args:
+            base_history_df: Base historical data
+            modifier_ranges: Sub-index name -> (min_modifier, max_modifier)
+            region_name: Region name for the simulation
+            n_samples: Number of modifier vectors to draw
+            seed: Optional random seed for reproducibility
+            baseline: Optional pre-built baseline (see prepare_baseline)
+            return_samples: Include the drawn modifiers and outcomes
+
+        Returns:
+            Dictionary with the distribution of projected behavior index values
+        """
+        if n_samples < 1:
+            raise ValueError("n_samples must be at least 1")
+        if baseline is None:
+            baseline = self.prepare_baseline(base_history_df)
+
+        unknown = [n for n in modifier_ranges if n not in baseline.column_positions]
+        if unknown:
+            raise ValueError(
+                f"Monte-Carlo modifiers must target sub-indices, got: {unknown}"
+            )
+
+        names = list(modifier_ranges)
+        positions = np.array(
+            [baseline.column_positions[n] for n in names], dtype=np.intp
+        )
+        low = np.array([min(modifier_ranges[n]) for n in names], dtype=float)
+        high = np.array([max(modifier_ranges[n]) for n in names], dtype=float)
+
+        rng = np.random.default_rng(seed)
+        modifiers = rng.uniform(low, high, size=(n_samples, len(names)))
+
+        matrix = np.tile(baseline.latest, (n_samples, 1))
+        matrix[:, positions] = np.clip(baseline.latest[positions] * modifiers, 0.0, 1.0)
+
+        changes = baseline.behavior_index(matrix) - baseline.behavior_index(
+            baseline.latest
+        )
+        projected = np.clip(baseline.base_behavior_index + changes, 0.0, 1.0)
+        p5, p50, p95 = np.percentile(projected, [5, 50, 95])
+
+        result = {
+            "region_name": region_name,
+            "modifier_ranges": {
+                n: [float(lo), float(hi)] for n, lo, hi in zip(names, low, high)
+            },
+            "n_samples": int(n_samples),
+            "base_behavior_index": float(baseline.base_behavior_index),
+            "projected_behavior_index": {
+                "mean": float(projected.mean()),
+                "std": float(projected.std()),
+                "min": float(projected.min()),
+                "max": float(projected.max()),
+                "p5": float(p5),
+                "p50": float(p50),
+                "p95": float(p95),
+            },
+            "probability_increase": float(
+                (projected > baseline.base_behavior_index).mean()
+            ),
+        }
+        if return_samples:
+            result["samples"] = {"modifiers": modifiers, "projected": projected}
+
+        logger.info(
+            "Monte-Carlo simulation completed",
+            region=region_name,
+            n_samples=n_samples,
+            mean_bi=result["projected_behavior_index"]["mean"],
+        )
+
+        return result
+
+    def _latest_sub_indices(self, input_df: pd.DataFrame) -> np.ndarray:
+        """Run the sub-index pipeline on a frame and return the latest vector."""
+        names = list(SUB_INDEX_WEIGHTS)
+        if len(input_df) == 0:
+            return np.full(len(names), 0.5)
+        sub_df = self._computer.compute_sub_indices(input_df)
+        last_row = sub_df.iloc[-1]
+        values = np.array(
+            [pd.to_numeric(last_row.get(name), errors="coerce") for name in names],
+            dtype=float,
+        )
+        return np.where(np.isnan(values), 0.5, values)
+
+    @staticmethod
+    def _fingerprint(df: pd.DataFrame) -> Optional[Tuple]:
+        """
+        Content hash of a history frame (None if it cannot be hashed).
+
+        Hashes every row, so equal frames share a baseline and a frame
+        mutated in place gets a new one.
+        """
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=True).values
+        except TypeError:
+            # Unhashable cells (lists, dicts): do not cache
+            return None
+        digest = hashlib.sha1(row_hashes.tobytes()).hexdigest()
+        return (df.shape, tuple(df.columns), digest)
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Shared pytest fixtures."""
+import pytest
+
+from app.core.fetch_orchestrator import reset_fetch_fallback_cache
+from app.core.forecast_cache import reset_forecast_cache
+from app.core.single_flight import reset_single_flights
+from app.services.ingestion.circuit_breaker import reset_circuit_breakers
+from app.services.ingestion.gdelt_query_planner import reset_gdelt_planners
+from app.services.ingestion.national_feed import reset_national_feeds
+from app.services.ingestion.rate_limiter import reset_rate_limiter
+from app.services.ingestion.usgs_earthquakes import reset_earthquake_catalogs
+from app.services.ingestion.weather import reset_weather_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_state():
+    """Start every test with closed circuit breakers, full rate limit buckets,
+    empty forecast, fetch fallback and weather caches, no national feeds,
+    earthquake catalogs or GDELT timelines and fresh single-flight groups.
+
+    All are process-wide, so failures in one test (including real network
+    errors in offline runs) would otherwise fail later tests fast, tokens
+    spent in one test would throttle the next, fits, last good values and
+    fetched data cached by one test would be served to the next, and
+    follower counts would carry over.
+    """
+    reset_circuit_breakers()
+    reset_rate_limiter()
+    reset_forecast_cache()
+    reset_fetch_fallback_cache()
+    reset_single_flights()
+    reset_weather_cache()
+    reset_national_feeds()
+    reset_earthquake_catalogs()
+    reset_gdelt_planners()
+    yield
+    reset_circuit_breakers()
+    reset_rate_limiter()
+    reset_forecast_cache()
+    reset_fetch_fallback_cache()
+    reset_single_flights()
+    reset_weather_cache()
+    reset_national_feeds()
+    reset_earthquake_catalogs()
+    reset_gdelt_planners()
@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for per-source circuit breakers."""
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from app.services.ingestion.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+)
+from app.services.ingestion.http_transport import HTTPTransport
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(status_code):
+    response = Mock()
+    response.status_code = status_code
+    response.content = b"{}"
+    return response
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_at_failure_rate_after_min_calls(self):
+        """Test that the breaker opens only once min_calls outcomes are seen."""
+        breaker = CircuitBreaker("src", failure_rate=0.5, min_calls=4, window=10)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+
+        breaker.record_success()
+        assert breaker.state == STATE_OPEN
+        assert not breaker.allow()
+
+    def test_half_open_trial_closes_on_success(self):
+        """Test that one trial is allowed after the cool-down and closes it."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("src", min_calls=1, open_seconds=30, clock=clock)
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        clock.now = 31
+        assert breaker.state == STATE_HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # only one trial in flight
+
+        breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+        assert breaker.allow()
+
+    def test_half_open_trial_failure_reopens(self):
+        """Test that a failed trial restarts the cool-down."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("src", min_calls=1, open_seconds=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        clock.now = 50
+        assert not breaker.allow()
+
+    def test_transitions_persist_source_health(self):
+        """Test that state changes are written to the source health table."""
+        with patch(
+            "app.services.ingestion.circuit_breaker.record_source_health"
+        ) as mock_record:
+            breaker = get_circuit_breaker("cyber_risk")
+            for _ in range(breaker.min_calls):
+                breaker.record_failure()
+
+        mock_record.assert_called_once()
+        args, kwargs = mock_record.call_args
+        assert args == ("cyber_risk", "Disabled")
+        assert kwargs["error_count"] == breaker.min_calls
+
+
+class TestTransportIntegration:
+    """Test that the shared transport consults the breaker."""
+
+    def _trip(self, source_id):
+        breaker = get_circuit_breaker(source_id)
+        with patch("app.services.ingestion.circuit_breaker.record_source_health"):
+            for _ in range(breaker.min_calls):
+                breaker.record_failure()
+        return breaker
+
+    def test_open_circuit_fails_fast_without_request(self):
+        """Test that get_with_retries returns circuit_open with no network call."""
+        self._trip("cyber_risk")
+        transport = HTTPTransport()
+        with patch("requests.Session.get") as mock_get:
+            response, error_type, status = transport.get_with_retries(
+                "https://www.cisa.gov/feed.json", source_id="cyber_risk"
+            )
+
+        assert (response, error_type, status) == (None, "circuit_open", None)
+        mock_get.assert_not_called()
+
+    def test_get_raises_connection_error_subclass(self):
+        """Test that get raises CircuitOpenError for callers using requests errors."""
+        self._trip("cyber_risk")
+        transport = HTTPTransport()
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.get("https://www.cisa.gov/feed.json", source_id="cyber_risk")
+        assert issubclass(CircuitOpenError, requests.exceptions.RequestException)
+
+    def test_retry_loop_records_one_outcome(self):
+        """Test that a request with retries counts once toward the breaker."""
+        transport = HTTPTransport()
+        with (
+            patch("requests.Session.get", side_effect=[_response(503), _response(200)]),
+            patch("time.sleep"),
+        ):
+            transport.get_with_retries(
+                "https://api.example.com/data", source_id="cyber_risk"
+            )
+
+        snapshot = get_circuit_breaker("cyber_risk").snapshot()
+        assert (snapshot["success_count"], snapshot["error_count"]) == (1, 0)
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for validator-aware (ETag / Last-Modified) dataset downloads."""
+import json
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.services.ingestion import conditional_fetch
+from app.services.ingestion.cisa_kev import CISAKEVFetcher
+from app.services.ingestion.conditional_fetch import ValidatorCache
+
+URL = "https://data.example.com/catalog.json"
+
+
+def _response(status_code, content=b"", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+class TestValidatorCache:
+    """Test ValidatorCache revalidation."""
+
+    def test_not_modified_reuses_stored_payload(self, tmp_path):
+        """Test that a 304 serves the stored body and sends validators."""
+        cache = ValidatorCache(str(tmp_path))
+        first = _response(
+            200,
+            b'{"v": 1}',
+            {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+        with patch(
+            "requests.Session.get", side_effect=[first, _response(304)]
+        ) as mock_get:
+            fresh = cache.fetch(URL)
+            revalidated = cache.fetch(URL)
+
+        assert fresh.content == b'{"v": 1}' and not fresh.not_modified
+        assert revalidated.not_modified
+        assert revalidated.http_status == 304
+        assert revalidated.content == b'{"v": 1}'
+        headers = mock_get.call_args_list[1].kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+        assert headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def test_no_validators_means_unconditional(self, tmp_path):
+        """Test that responses without validators are not stored."""
+        cache = ValidatorCache(str(tmp_path))
+        with patch(
+            "requests.Session.get",
+            side_effect=[_response(200, b"a"), _response(200, b"b")],
+        ) as mock_get:
+            cache.fetch(URL)
+            second = cache.fetch(URL)
+
+        assert second.content == b"b"
+        assert mock_get.call_args_list[1].kwargs["headers"] is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_error_returns_no_content(self, tmp_path):
+        """Test that upstream errors surface as content=None."""
+        cache = ValidatorCache(str(tmp_path))
+        with (
+            patch("requests.Session.get", return_value=_response(404)),
+            patch("time.sleep"),
+        ):
+            result = cache.fetch(URL)
+        assert result.content is None
+        assert (result.error_type, result.http_status) == ("http_error", 404)
+
+
+class TestCISAKEVRevalidation:
+    """Test that an unchanged KEV catalog is not re-parsed."""
+
+    @pytest.fixture(autouse=True)
+    def _validator_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            conditional_fetch,
+            "_validator_cache_instance",
+            ValidatorCache(str(tmp_path)),
+        )
+
+    def test_not_modified_refreshes_timestamp_only(self):
+        """Test that a 304 reuses the parsed signal and bumps its timestamp."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        catalog = json.dumps(
+            {"vulnerabilities": [{"cveID": "CVE-1", "dateAdded": today}]}
+        ).encode("utf-8")
+        fetcher = CISAKEVFetcher()
+
+        with patch(
+            "requests.Session.get",
+            side_effect=[_response(200, catalog, {"ETag": '"v1"'}), _response(304)],
+        ):
+            df, status = fetcher.fetch_kev_catalog(days_back=30)
+            _, first_time = fetcher._cache["cisa_kev_30"]
+            with patch("app.services.ingestion.cisa_kev.json") as mock_json:
+                revalidated, revalidated_status = fetcher.fetch_kev_catalog(
+                    days_back=30, use_cache=False
+                )
+
+        assert status.ok and revalidated_status.ok
+        assert revalidated_status.http_status == 304
+        assert not mock_json.loads.called
+        assert revalidated.equals(df)
+        assert fetcher._cache["cisa_kev_30"][1] >= first_time
@@ -23,7 +23,7 @@ class TestFREDEconomicFetcher:
         assert fetcher is not None
         assert fetcher.api_key == "test_key"
 
-    @patch("app.services.ingestion.economic_fred.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_series_success(self, mock_get):
         """Test successful FRED series fetch."""
         # Mock API response
@@ -47,7 +47,7 @@ class TestFREDEconomicFetcher:
         assert len(df) == 2  # Missing value skipped
         assert mock_get.called
 
-    @patch("app.services.ingestion.economic_fred.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_series_no_api_key(self, mock_get):
         """Test that fetch returns empty DataFrame when API key not set."""
         fetcher = FREDEconomicFetcher(api_key=None)
@@ -57,7 +57,7 @@ class TestFREDEconomicFetcher:
         assert df.empty
         assert not mock_get.called
 
-    @patch("app.services.ingestion.economic_fred.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_series_http_error(self, mock_get):
         """Test that HTTP errors are handled gracefully."""
         import requests
@@ -70,7 +70,7 @@ class TestFREDEconomicFetcher:
         assert isinstance(df, pd.DataFrame)
         assert df.empty
 
-    @patch("app.services.ingestion.economic_fred.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_consumer_sentiment(self, mock_get):
         """Test consumer sentiment fetch and normalization."""
         mock_response = Mock()
@@ -92,7 +92,7 @@ class TestFREDEconomicFetcher:
         assert "consumer_sentiment" in df.columns
         assert all(0.0 <= val <= 1.0 for val in df["consumer_sentiment"])
 
-    @patch("app.services.ingestion.economic_fred.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_unemployment_rate(self, mock_get):
         """Test unemployment rate fetch and normalization."""
         mock_response = Mock()
@@ -113,7 +113,7 @@ class TestFREDEconomicFetcher:
         assert "unemployment_rate" in df.columns
         assert all(0.0 <= val <= 1.0 for val in df["unemployment_rate"])
 
-    @patch("app.services.ingestion.economic_fred.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_jobless_claims(self, mock_get):
         """Test jobless claims fetch and normalization."""
         mock_response = Mock()
@@ -0,0 +1,202 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for the deadline-bounded fetch orchestrator."""
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+
+from app.core.fetch_orchestrator import (
+    PRIORITY_CORE,
+    PRIORITY_OPTIONAL,
+    FetchOrchestrator,
+    FetchTask,
+    has_data,
+)
+from app.core.prediction import BehavioralForecaster
+from app.services.ingestion.gdelt_events import SourceStatus
+
+
+def _frame(value=1.0):
+    return pd.DataFrame({"timestamp": [pd.Timestamp("2025-01-01")], "value": [value]})
+
+
+class TestFetchOrchestrator:
+    """Test FetchOrchestrator outcomes and deadlines."""
+
+    def test_ok_and_error_outcomes(self):
+        """Test that results and exceptions are reported per source."""
+
+        def failing():
+            raise RuntimeError("boom")
+
+        orchestrator = FetchOrchestrator(deadline_seconds=5)
+        results, report = orchestrator.run(
+            [FetchTask("good", _frame), FetchTask("bad", failing)]
+        )
+
+        assert list(results) == ["good"]
+        assert report["good"]["outcome"] == "ok"
+        assert report["bad"] == {
+            "outcome": "error",
+            "error": "boom",
+            "priority": report["bad"]["priority"],
+            "elapsed_seconds": report["bad"]["elapsed_seconds"],
+        }
+
+    def test_slow_source_is_bounded_by_deadline(self):
+        """Test that a slow source does not hold the run past the deadline."""
+        release = threading.Event()
+        orchestrator = FetchOrchestrator(deadline_seconds=0.2)
+
+        start = time.monotonic()
+        results, report = orchestrator.run(
+            [FetchTask("slow", lambda: release.wait(5)), FetchTask("fast", _frame)]
+        )
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert elapsed < 2
+        assert report["slow"]["outcome"] == "missing"
+        assert "slow" not in results
+        assert report["fast"]["outcome"] == "ok"
+
+    def test_deadline_miss_serves_last_good_value(self):
+        """Test that a late source falls back to its last good result."""
+        orchestrator = FetchOrchestrator(deadline_seconds=0.2)
+        orchestrator.run([FetchTask("fred", lambda: _frame(42.0))], scope="us_mn")
+
+        release = threading.Event()
+        results, report = orchestrator.run(
+            [FetchTask("fred", lambda: release.wait(5))], scope="us_mn"
+        )
+        release.set()
+
+        assert report["fred"]["outcome"] == "stale"
+        assert report["fred"]["last_good_at"] is not None
+        assert results["fred"]["value"].iloc[0] == 42.0
+
+    def test_last_good_values_are_scoped(self):
+        """Test that fallbacks are not shared across scopes."""
+        orchestrator = FetchOrchestrator(deadline_seconds=0.2)
+        orchestrator.run([FetchTask("fred", _frame)], scope="us_mn")
+
+        release = threading.Event()
+        _, report = orchestrator.run(
+            [FetchTask("fred", lambda: release.wait(5))], scope="us_ca"
+        )
+        release.set()
+        assert report["fred"]["outcome"] == "missing"
+
+    def test_last_good_values_are_shared_across_instances(self):
+        """Test that a fresh orchestrator serves values another one fetched."""
+        FetchOrchestrator(deadline_seconds=0.2).run(
+            [FetchTask("fred", lambda: _frame(7.0))], scope="us_mn"
+        )
+
+        release = threading.Event()
+        results, report = FetchOrchestrator(deadline_seconds=0.2).run(
+            [FetchTask("fred", lambda: release.wait(5))], scope="us_mn"
+        )
+        release.set()
+
+        assert report["fred"]["outcome"] == "stale"
+        assert results["fred"]["value"].iloc[0] == 7.0
+
+    def test_optional_sources_give_up_before_core(self):
+        """Test that optional sources get a smaller share of the deadline."""
+        release = threading.Event()
+
+        def slow_frame():
+            release.wait(0.3)
+            return _frame()
+
+        def quick_frame():
+            time.sleep(0.15)
+            return _frame()
+
+        orchestrator = FetchOrchestrator(
+            deadline_seconds=1.0,
+            priority_fractions={PRIORITY_CORE: 1.0, PRIORITY_OPTIONAL: 0.1},
+        )
+        _, report = orchestrator.run(
+            [
+                FetchTask("optional", slow_frame, PRIORITY_OPTIONAL),
+                FetchTask("core", quick_frame, PRIORITY_CORE),
+            ]
+        )
+        release.set()
+
+        assert report["core"]["outcome"] == "ok"
+        assert report["optional"]["outcome"] == "missing"
+
+    def test_run_inside_running_event_loop(self):
+        """Test that run works when called from async code."""
+        orchestrator = FetchOrchestrator(deadline_seconds=5)
+
+        async def caller():
+            return orchestrator.run([FetchTask("good", _frame)])
+
+        results, report = asyncio.run(caller())
+        assert report["good"]["outcome"] == "ok"
+        assert not results["good"].empty
+
+
+class TestHasData:
+    """Test has_data."""
+
+    def test_empty_and_failed_results_are_not_kept(self):
+        """Test which results qualify as last good values."""
+
+        class Status:
+            ok = False
+
+        assert has_data(_frame())
+        assert not has_data(pd.DataFrame())
+        assert not has_data((_frame(), Status()))
+        assert has_data((_frame(), None))
+
+
+class TestForecastDeadlineStatus:
+    """Test deadline flags in forecast metadata."""
+
+    def test_late_sources_are_flagged_in_sources_status(self):
+        """Test that stale and missing sources are reported per source."""
+        weather = pd.DataFrame(
+            {
+                "timestamp": pd.date_range(
+                    end=pd.Timestamp.now().normalize(), periods=60, freq="D"
+                ),
+                "discomfort_score": np.linspace(0.2, 0.6, 60),
+            }
+        )
+
+        def run(tasks, scope=None):
+            report = {
+                task.key: {"outcome": "error", "error": "offline"}
+                for task in tasks
+                if task.key not in ("weather", "fred_unemployment", "search")
+            }
+            report["fred_unemployment"] = {
+                "outcome": "stale",
+                "last_good_at": "2025-01-01T00:00:00",
+            }
+            report["search"] = {"outcome": "missing", "last_good_at": None}
+            return {"weather": weather}, report
+
+        orchestrator = Mock()
+        orchestrator.run.side_effect = run
+        forecaster = BehavioralForecaster(fetch_orchestrator=orchestrator)
+        forecaster.mobility_fetcher.last_status = SourceStatus(
+            provider="mobility", ok=False
+        )
+
+        result = forecaster.forecast(44.9, -93.1, "Minnesota", forecast_horizon=7)
+        status = result["metadata"]["sources_status"]
+
+        assert status["fred_unemployment"]["served_from"] == "last_good"
+        assert status["fred_unemployment"]["last_good_at"] == "2025-01-01T00:00:00"
+        assert status["search_trends"]["deadline_exceeded"] is True
+        assert status["search_trends"]["served_from"] == "empty"
@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for the byte-bounded TTL forecast cache."""
+import numpy as np
+import pandas as pd
+
+from app.core.forecast_cache import (
+    FORECAST_CACHE_MIN_TTL_SECONDS,
+    ForecastCache,
+    estimate_nbytes,
+    source_freshness_ttl,
+)
+from app.core.prediction import BehavioralForecaster
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _payload(nbytes):
+    return np.zeros(nbytes // 8, dtype=np.float64)
+
+
+class TestEstimateNbytes:
+    """Test estimate_nbytes."""
+
+    def test_sizes_frames_arrays_and_containers(self):
+        """Test that nested forecast tuples are sized by their contents."""
+        frame = pd.DataFrame({"a": np.zeros(1000)})
+        array = np.zeros(500)
+        total = estimate_nbytes((frame, array, {"sources": ["x"]}))
+
+        assert estimate_nbytes(array) == array.nbytes
+        assert total >= frame.memory_usage(deep=True).sum() + array.nbytes
+
+
+class TestForecastCache:
+    """Test ForecastCache eviction and expiry."""
+
+    def test_byte_budget_evicts_lru(self):
+        """Test that inserts beyond the byte budget evict the oldest entries."""
+        cache = ForecastCache(max_bytes=3000)
+        for key in ("a", "b", "c"):
+            cache.put(key, _payload(1000))
+        cache.get("a")
+        cache.put("d", _payload(1000))
+
+        assert cache.keys() == ["c", "a", "d"]
+        assert cache.nbytes <= 3000
+        assert cache.stats()["evictions"] == 1
+
+    def test_oversize_value_is_not_cached(self):
+        """Test that a value larger than the whole budget is rejected."""
+        cache = ForecastCache(max_bytes=100)
+        assert cache.put("big", _payload(1000)) is False
+        assert "big" not in cache
+        assert cache.nbytes == 0
+
+    def test_entries_expire_after_ttl(self):
+        """Test that an entry is dropped once its TTL elapses."""
+        clock = FakeClock()
+        cache = ForecastCache(max_bytes=10_000, clock=clock)
+        cache.put("a", _payload(80), ttl_seconds=60)
+
+        clock.now = 59
+        assert cache.get("a") is not None
+        clock.now = 60
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.stats()["expired"] == 1
+
+    def test_purge_expired(self):
+        """Test that purge_expired removes only expired entries."""
+        clock = FakeClock()
+        cache = ForecastCache(max_bytes=10_000, clock=clock)
+        cache.put("short", 1, ttl_seconds=10)
+        cache.put("long", 2, ttl_seconds=100)
+        clock.now = 50
+
+        assert cache.purge_expired() == 1
+        assert cache.keys() == ["long"]
+
+    def test_lowering_max_entries_evicts(self):
+        """Test that shrinking the entry limit evicts immediately."""
+        cache = ForecastCache(max_bytes=10_000)
+        for key in ("a", "b", "c"):
+            cache[key] = key
+        cache.max_entries = 1
+        assert cache.keys() == ["c"]
+
+    def test_hit_miss_stats(self):
+        """Test hit and miss counters."""
+        cache = ForecastCache(max_bytes=10_000)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("missing")
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+class TestSourceFreshnessTtl:
+    """Test source_freshness_ttl."""
+
+    def test_uses_shortest_source_duration_within_bounds(self):
+        """Test that the freshest source sets the TTL, clamped to bounds."""
+        assert source_freshness_ttl([60, 1440], 300, 7200) == 3600
+        assert source_freshness_ttl([1, 60], 300, 7200) == 300
+        assert source_freshness_ttl([], 300, 7200) == 7200
+
+
+class TestForecasterCacheIntegration:
+    """Test BehavioralForecaster wiring of the forecast cache."""
+
+    def test_max_cache_size_maps_to_entry_limit(self):
+        """Test that _max_cache_size is the cache entry limit."""
+        forecaster = BehavioralForecaster()
+        forecaster._max_cache_size = 2
+        assert forecaster._cache.max_entries == 2
+
+    def test_ttl_follows_fetcher_freshness(self):
+        """Test that the forecast TTL tracks the shortest fetcher cache."""
+        forecaster = BehavioralForecaster()
+        for fetcher in vars(forecaster).values():
+            if hasattr(fetcher, "cache_duration_minutes"):
+                fetcher.cache_duration_minutes = 120
+        forecaster.fred_fetcher.cache_duration_minutes = 30
+        assert forecaster._forecast_cache_ttl() == 30 * 60
+
+    def test_degraded_fetch_uses_minimum_ttl(self):
+        """Test that a source past the fetch deadline shortens the TTL."""
+        forecaster = BehavioralForecaster()
+        for fetcher in vars(forecaster).values():
+            if hasattr(fetcher, "cache_duration_minutes"):
+                fetcher.cache_duration_minutes = 120
+        healthy = {"weather": {"outcome": "ok"}, "fred": {"outcome": "error"}}
+        degraded = {
+            "weather": {"outcome": "ok"},
+            "fred": {"outcome": "stale", "served_from": "fallback"},
+        }
+        missing = {"weather": {"outcome": "missing"}}
+        assert forecaster._forecast_cache_ttl(healthy) == 120 * 60
+        assert forecaster._forecast_cache_ttl(degraded) == (
+            FORECAST_CACHE_MIN_TTL_SECONDS
+        )
+        assert forecaster._forecast_cache_ttl(missing) == (
+            FORECAST_CACHE_MIN_TTL_SECONDS
+        )
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for the horizon-independent forecaster cache."""
+import pandas as pd
+
+from app.core.forecast_cache import ForecastCache, get_forecast_cache
+from app.core.prediction import MAX_PROJECTION_HORIZON, BehavioralForecaster
+
+
+def _cached_entry(path_length=MAX_PROJECTION_HORIZON):
+    history = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-01-01", periods=30, freq="D"),
+            "behavior_index": [0.5] * 30,
+        }
+    )
+    forecast_path = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-01-31", periods=path_length, freq="D"),
+            "prediction": [0.5 + i * 0.001 for i in range(path_length)],
+            "lower_bound": [0.4] * path_length,
+            "upper_bound": [0.6] * path_length,
+        }
+    )
+    metadata = {"region_name": "Minnesota", "forecast_horizon": 7, "sources": []}
+    intelligence = {
+        "shock_events": [{"index": "behavior_index", "severity": "moderate"}],
+        "risk_tier": {"tier": "elevated", "risk_score": 0.7},
+    }
+    return history, forecast_path, metadata, intelligence
+
+
+class TestForecastProjectionCache:
+    """Test that cached fits serve any horizon without re-running the pipeline."""
+
+    def _seeded_forecaster(self, monkeypatch, path_length=MAX_PROJECTION_HORIZON):
+        forecaster = BehavioralForecaster()
+        forecaster._cache["46.7296,-94.6859,Minnesota,30,"] = _cached_entry(path_length)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pipeline should not run on a cache hit")
+
+        monkeypatch.setattr(forecaster.market_fetcher, "fetch_stress_index", fail)
+        return forecaster
+
+    def test_cache_key_excludes_horizon(self, monkeypatch):
+        """Test that different horizons are served from one cached fit."""
+        forecaster = self._seeded_forecaster(monkeypatch)
+
+        for horizon in (1, 7, 14, MAX_PROJECTION_HORIZON):
+            result = forecaster.forecast(
+                latitude=46.7296,
+                longitude=-94.6859,
+                region_name="Minnesota",
+                days_back=30,
+                forecast_horizon=horizon,
+            )
+            assert len(result["forecast"]) == horizon
+            assert result["metadata"]["forecast_horizon"] == horizon
+
+        assert len(forecaster._cache) == 1
+
+    def test_projection_is_prefix_of_cached_path(self, monkeypatch):
+        """Test that a shorter horizon is the head of the cached path."""
+        forecaster = self._seeded_forecaster(monkeypatch)
+        result = forecaster.forecast(
+            latitude=46.7296,
+            longitude=-94.6859,
+            region_name="Minnesota",
+            days_back=30,
+            forecast_horizon=3,
+        )
+        assert [row["prediction"] for row in result["forecast"]] == [
+            0.5,
+            0.501,
+            0.502,
+        ]
+        assert result["forecast"][0]["timestamp"] == "2025-01-31T00:00:00"
+
+    def test_cached_metadata_not_mutated(self, monkeypatch):
+        """Test that per-request metadata does not leak into the cache."""
+        forecaster = self._seeded_forecaster(monkeypatch)
+        result = forecaster.forecast(
+            latitude=46.7296,
+            longitude=-94.6859,
+            region_name="Minnesota",
+            days_back=30,
+            forecast_horizon=21,
+        )
+        result["metadata"].pop("sources")
+        _, _, cached_metadata, _ = forecaster._cache["46.7296,-94.6859,Minnesota,30,"]
+        assert cached_metadata["forecast_horizon"] == 7
+        assert "sources" in cached_metadata
+
+    def test_hits_keep_intelligence_data(self, monkeypatch):
+        """Test that cache hits carry the cached intelligence layer output."""
+        forecaster = self._seeded_forecaster(monkeypatch)
+        kwargs = dict(
+            latitude=46.7296,
+            longitude=-94.6859,
+            region_name="Minnesota",
+            days_back=30,
+            forecast_horizon=7,
+        )
+        result = forecaster.forecast(**kwargs)
+        assert result["risk_tier"]["tier"] == "elevated"
+        result["shock_events"].clear()
+
+        again = forecaster.forecast(**kwargs)
+        assert len(again["shock_events"]) == 1
+
+    def test_cache_key_includes_region_id(self, monkeypatch):
+        """Test that a fit without region_id is not served for a state id."""
+        forecaster = self._seeded_forecaster(monkeypatch)
+        calls = []
+
+        def fake_generate(cache_key, *args):
+            calls.append(cache_key)
+            return {"history": [], "forecast": [], "sources": [], "metadata": {}}
+
+        monkeypatch.setattr(forecaster, "_generate_forecast", fake_generate)
+        forecaster.forecast(
+            latitude=46.7296,
+            longitude=-94.6859,
+            region_name="Minnesota",
+            days_back=30,
+            region_id="us_mn",
+        )
+        assert calls == ["46.7296,-94.6859,Minnesota,30,us_mn"]
+
+    def test_new_forecaster_serves_cached_fit(self, monkeypatch):
+        """Test that per-request forecasters share one process-wide cache."""
+        self._seeded_forecaster(monkeypatch)
+        forecaster = BehavioralForecaster()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pipeline should not run on a cache hit")
+
+        monkeypatch.setattr(forecaster.market_fetcher, "fetch_stress_index", fail)
+        result = forecaster.forecast(
+            latitude=46.7296,
+            longitude=-94.6859,
+            region_name="Minnesota",
+            days_back=30,
+            forecast_horizon=14,
+        )
+        assert len(result["forecast"]) == 14
+
+    def test_injected_empty_cache_is_kept(self):
+        """Test that an empty injected cache is used instead of the shared one."""
+        cache = ForecastCache(name="test")
+        forecaster = BehavioralForecaster(forecast_cache=cache)
+        assert forecaster._cache is cache
+        assert forecaster._cache is not get_forecast_cache()
+
+    def test_project_forecast_resets_index(self):
+        """Test the projection helper slices and re-indexes the path."""
+        _, path, _, _ = _cached_entry()
+        projected = BehavioralForecaster._project_forecast(path.iloc[5:], 4)
+        assert list(projected.index) == [0, 1, 2, 3]
+        assert len(projected) == 4
@@ -36,7 +36,7 @@ class TestGDELTEventsFetcher:
         def mock_get(*args, **kwargs):
             return mock_response
 
-        with patch("requests.get", side_effect=mock_get):
+        with patch("requests.Session.get", side_effect=mock_get):
             fetcher = GDELTEventsFetcher()
             df, status = fetcher.fetch_event_tone(days_back=7, use_cache=False)
 
@@ -60,7 +60,7 @@ class TestGDELTEventsFetcher:
         def mock_get(*args, **kwargs):
             return mock_response
 
-        with patch("requests.get", side_effect=mock_get):
+        with patch("requests.Session.get", side_effect=mock_get):
             fetcher = GDELTEventsFetcher()
             df, status = fetcher.fetch_event_tone(days_back=7, use_cache=False)
 
@@ -82,7 +82,7 @@ class TestGDELTEventsFetcher:
         def mock_get(*args, **kwargs):
             return mock_response
 
-        with patch("requests.get", side_effect=mock_get):
+        with patch("requests.Session.get", side_effect=mock_get):
             fetcher = GDELTEventsFetcher()
             df, status = fetcher.fetch_event_tone(days_back=7, use_cache=False)
 
@@ -105,7 +105,7 @@ class TestGDELTEventsFetcher:
         def mock_get(*args, **kwargs):
             return mock_response
 
-        with patch("requests.get", side_effect=mock_get):
+        with patch("requests.Session.get", side_effect=mock_get):
             fetcher = GDELTEventsFetcher()
             df, status = fetcher.fetch_event_tone(days_back=7, use_cache=False)
 
@@ -122,7 +122,7 @@ class TestGDELTEventsFetcher:
         def mock_get(*args, **kwargs):
             raise requests.exceptions.Timeout("Request timed out")
 
-        with patch("requests.get", side_effect=mock_get):
+        with patch("requests.Session.get", side_effect=mock_get):
             fetcher = GDELTEventsFetcher()
             df, status = fetcher.fetch_event_tone(days_back=7, use_cache=False)
 
@@ -144,7 +144,7 @@ class TestGDELTEventsFetcher:
         def mock_get(*args, **kwargs):
             return mock_response
 
-        with patch("requests.get", side_effect=mock_get):
+        with patch("requests.Session.get", side_effect=mock_get):
             fetcher = GDELTEventsFetcher()
             df, status = fetcher.fetch_event_tone(days_back=7, use_cache=False)
 
@@ -167,7 +167,7 @@ class TestGDELTEventsFetcher:
         def mock_get(*args, **kwargs):
             return mock_response
 
-        with patch("requests.get", side_effect=mock_get):
+        with patch("requests.Session.get", side_effect=mock_get):
             fetcher = GDELTEventsFetcher()
             df, status = fetcher.fetch_event_tone(days_back=7, use_cache=False)
 
@@ -238,7 +238,7 @@ class TestGDELTEventsFetcher:
             }
             return mock_response
 
-        with patch("requests.get", side_effect=mock_get), patch("time.sleep"):
+        with patch("requests.Session.get", side_effect=mock_get), patch("time.sleep"):
             fetcher = GDELTEventsFetcher()
             df, status = fetcher.fetch_event_tone(days_back=7, use_cache=False)
 
@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for the GDELT DOC API query planner."""
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from app.services.ingestion.gdelt_events import GDELTEventsFetcher
+from app.services.ingestion.gdelt_query_planner import (
+    THEME_ENFORCEMENT,
+    THEME_LEGISLATIVE,
+    THEME_TONE,
+    GDELTQueryPlanner,
+    TimelineResult,
+    get_gdelt_planner,
+    slice_timeline,
+    timeline_query,
+)
+
+
+def _day(days_ago):
+    return (datetime.now() - timedelta(days=days_ago)).strftime("%Y%m%d%H%M%S")
+
+
+def _volume_timeline(days):
+    return {"timeline": [{"datetime": _day(i), "volume": 10 + i} for i in range(days)]}
+
+
+def _ok_fetch(query):
+    return TimelineResult(
+        data=_volume_timeline(query.days_back),
+        http_status=200,
+        days_back=query.days_back,
+    )
+
+
+class TestTimelineQuery:
+    """Test timeline query construction."""
+
+    def test_region_filter_changes_key_not_mode(self):
+        """Test that region filters produce distinct timelines per region."""
+        mn = timeline_query(THEME_LEGISLATIVE, 30, "Minnesota")
+        tx = timeline_query(THEME_LEGISLATIVE, 7, "Texas")
+
+        assert mn.mode == tx.mode == "timelinevol"
+        assert mn.key != tx.key
+        assert mn.key == timeline_query(THEME_LEGISLATIVE, 7, "Minnesota").key
+
+    def test_url_encodes_query_and_window(self):
+        """Test that the URL carries the encoded query and start/end dates."""
+        query = timeline_query(THEME_TONE, 7)
+        url = query.url(datetime(2024, 1, 8))
+
+        assert "mode=timelinetone" in url
+        assert "query=sourcelang%3Aenglish" in url
+        assert "startdatetime=20240101000000" in url
+        assert "enddatetime=20240108000000" in url
+
+
+class TestSliceTimeline:
+    """Test trimming a wide timeline to a narrower window."""
+
+    def test_flat_and_series_shapes(self):
+        """Test that both DOC API timeline shapes are trimmed by date."""
+        data = {
+            "timeline": [
+                {"datetime": "20240101000000", "volume": 1},
+                {"datetime": "20240110000000", "volume": 2},
+                {
+                    "series": "Average Tone",
+                    "data": [
+                        {"date": "20240101T000000Z", "value": -1.0},
+                        {"date": "20240110T000000Z", "value": -2.0},
+                    ],
+                },
+            ]
+        }
+
+        sliced = slice_timeline(data, datetime(2024, 1, 5, 12))
+
+        assert sliced["timeline"][0] == {"datetime": "20240110000000", "volume": 2}
+        assert sliced["timeline"][1]["data"] == [
+            {"date": "20240110T000000Z", "value": -2.0}
+        ]
+        assert len(data["timeline"]) == 3
+
+
+class TestGDELTQueryPlanner:
+    """Test window merging, reuse and single-flight fetches."""
+
+    def test_plan_merges_needs_to_widest_window(self):
+        """Test that a cycle's needs collapse to one request per timeline."""
+        fetch = Mock(side_effect=_ok_fetch)
+        planner = GDELTQueryPlanner()
+
+        requests = planner.plan(
+            [
+                timeline_query(THEME_TONE, 7),
+                timeline_query(THEME_TONE, 30),
+                timeline_query(THEME_LEGISLATIVE, 14, "Minnesota"),
+                timeline_query(THEME_LEGISLATIVE, 30, "Minnesota"),
+            ]
+        )
+
+        assert sorted((q.theme, q.days_back) for q in requests) == [
+            (THEME_LEGISLATIVE, 30),
+            (THEME_TONE, 30),
+        ]
+        fetch.assert_not_called()
+
+    def test_first_consumer_fetches_planned_window(self):
+        """Test that narrower consumers are served slices of one request."""
+        fetch = Mock(side_effect=_ok_fetch)
+        planner = GDELTQueryPlanner()
+        planner.plan([timeline_query(THEME_TONE, 30)])
+
+        narrow = planner.timeline(timeline_query(THEME_TONE, 7), fetch)
+        wide = planner.timeline(timeline_query(THEME_TONE, 30), fetch)
+
+        fetch.assert_called_once()
+        assert fetch.call_args[0][0].days_back == 30
+        assert narrow.days_back == 7 and len(narrow.data["timeline"]) == 8
+        assert len(wide.data["timeline"]) == 30
+        assert planner.plan([timeline_query(THEME_TONE, 14)]) == []
+
+    def test_wider_window_than_cached_is_fetched(self):
+        """Test that a cached narrow window does not serve a wider one."""
+        fetch = Mock(side_effect=_ok_fetch)
+        planner = GDELTQueryPlanner()
+
+        planner.timeline(timeline_query(THEME_TONE, 7), fetch)
+        planner.timeline(timeline_query(THEME_TONE, 30), fetch)
+
+        assert [c[0][0].days_back for c in fetch.call_args_list] == [7, 30]
+
+    def test_concurrent_consumers_share_one_request(self):
+        """Test that simultaneous misses wait for a single request."""
+
+        def slow_fetch(query):
+            time.sleep(0.1)
+            return _ok_fetch(query)
+
+        fetch = Mock(side_effect=slow_fetch)
+        planner = GDELTQueryPlanner()
+        query = timeline_query(THEME_ENFORCEMENT, 30, "Texas")
+        threads = [
+            threading.Thread(target=planner.timeline, args=(query, fetch))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        fetch.assert_called_once()
+
+    def test_failures_are_not_cached(self):
+        """Test that a failed request is retried by the next consumer."""
+        failed = TimelineResult(data=None, http_status=None, error_type="timeout")
+        fetch = Mock(side_effect=[failed, _ok_fetch(timeline_query(THEME_TONE, 7))])
+        planner = GDELTQueryPlanner()
+
+        query = timeline_query(THEME_TONE, 7)
+        assert planner.timeline(query, fetch).error_type == "timeout"
+        assert planner.timeline(query, fetch).data is not None
+        assert fetch.call_count == 2
+
+    def test_use_cache_false_refetches(self):
+        """Test that forced refreshes bypass cached timelines."""
+        fetch = Mock(side_effect=_ok_fetch)
+        planner = GDELTQueryPlanner()
+
+        planner.timeline(timeline_query(THEME_TONE, 7), fetch)
+        planner.timeline(timeline_query(THEME_TONE, 7), fetch, use_cache=False)
+
+        assert fetch.call_count == 2
+
+
+class TestFetcherPlanning:
+    """Test GDELTEventsFetcher consumers sharing planned timelines."""
+
+    def test_cycle_sends_one_request_per_timeline(self):
+        """Test that a multi-region cycle merges windows and shared timelines."""
+        response = Mock()
+        response.status_code = 200
+        payload = _volume_timeline(30)
+        response.content = b"{}"
+        response.text = "{}"
+        response.json.return_value = payload
+        fetcher = GDELTEventsFetcher()
+
+        with patch.object(
+            fetcher,
+            "_make_request_with_retries",
+            return_value=(response, None, 200),
+        ) as mock_request:
+            planned = fetcher.plan_cycle([("Minnesota", 7), ("Minnesota", 30)])
+            short, short_status = fetcher.fetch_legislative_attention("Minnesota", 7)
+            wide, _ = fetcher.fetch_legislative_attention("Minnesota", 30)
+            fetcher.fetch_enforcement_attention("Minnesota", 7)
+            fetcher.fetch_enforcement_attention("Minnesota", 30)
+
+        assert planned == 3  # tone, legislative, enforcement
+        assert mock_request.call_count == 2
+        assert all("startdatetime" in c[0][0] for c in mock_request.call_args_list)
+        assert short_status.ok and short_status.query_window_days == 7
+        assert len(short) == 8 and len(wide) == 30
+
+    def test_fetchers_share_one_planner(self):
+        """Test that a timeline fetched by one fetcher is reused by another."""
+        response = Mock()
+        response.status_code = 200
+        response.content = b"{}"
+        response.text = "{}"
+        response.json.return_value = _volume_timeline(30)
+        first, second = GDELTEventsFetcher(), GDELTEventsFetcher()
+
+        with patch.object(
+            first, "_make_request_with_retries", return_value=(response, None, 200)
+        ) as first_request, patch.object(
+            second, "_make_request_with_retries", return_value=(response, None, 200)
+        ) as second_request:
+            first.fetch_legislative_attention("Texas", 30)
+            data, status = second.fetch_legislative_attention("Texas", 14)
+
+        assert first._planner is second._planner is get_gdelt_planner()
+        assert first_request.call_count == 1
+        second_request.assert_not_called()
+        assert status.ok and len(data) == 15
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for the materialized heatmap snapshot."""
+import math
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.backend.app.main import app
+from app.core.heatmap_store import (
+    HEATMAP_INDICES,
+    HeatmapStore,
+    get_heatmap_store,
+    reset_heatmap_store,
+)
+from app.core.regions import get_all_regions
+
+client = TestClient(app)
+
+
+class TestHeatmapStore:
+    """Test HeatmapStore behavior."""
+
+    def test_covers_all_states_and_cities(self):
+        """Test that the default store allocates a row for every region."""
+        store = HeatmapStore()
+        snapshot = store.snapshot()
+        region_ids = set(snapshot.region_ids)
+        us_states = [r for r in get_all_regions() if r.region_group == "US_STATES"]
+        assert len(us_states) == 51
+        assert {r.id for r in us_states} <= region_ids
+        assert "city_nyc" in region_ids
+        assert snapshot.values.shape == (len(region_ids), len(HEATMAP_INDICES))
+        assert snapshot.values.dtype == np.float32
+        assert snapshot.populated_count == 0
+
+    def test_update_region_bumps_version(self):
+        """Test that row updates are visible and versioned."""
+        store = HeatmapStore()
+        assert store.update_region("us_mn", {"behavior_index": 0.6}) is True
+        assert store.update_region("unknown_region", {"behavior_index": 0.6}) is False
+
+        snapshot = store.snapshot()
+        assert snapshot.version == 1
+        assert snapshot.updated_at is not None
+        state_data = snapshot.to_state_data()
+        assert list(state_data) == ["Minnesota"]
+        assert math.isclose(
+            state_data["Minnesota"]["behavior_index"], 0.6, rel_tol=1e-6
+        )
+        assert state_data["Minnesota"]["political_stress"] is None
+
+    def test_snapshot_is_isolated_from_updates(self):
+        """Test that snapshots are not mutated by later writes."""
+        store = HeatmapStore()
+        store.update_region("us_ca", {"behavior_index": 0.3})
+        snapshot = store.snapshot()
+        store.update_region("us_ca", {"behavior_index": 0.9})
+        rows = snapshot.select_rows(region_ids=["us_ca"])
+        assert math.isclose(
+            snapshot.to_state_data(rows)["California"]["behavior_index"],
+            0.3,
+            rel_tol=1e-6,
+        )
+
+    def test_select_rows_filters(self):
+        """Test region filtering by id, name and group."""
+        store = HeatmapStore()
+        store.update_region("us_ca", {"behavior_index": 0.3})
+        store.update_region("city_london", {"behavior_index": 0.4})
+        snapshot = store.snapshot()
+
+        assert len(snapshot.select_rows()) == 2
+        assert len(snapshot.select_rows(region_group="US_STATES")) == 1
+        assert len(snapshot.select_rows(region_name="London")) == 1
+        assert len(snapshot.select_rows(region_ids=["us_tx"])) == 0
+
+    def test_non_finite_values_stored_as_missing(self):
+        """Test that NaN/invalid values become None in output."""
+        store = HeatmapStore()
+        store.update_region(
+            "us_tx", {"behavior_index": float("inf"), "economic_stress": "bad"}
+        )
+        data = store.snapshot().to_state_data()["Texas"]
+        assert data["behavior_index"] is None
+        assert data["economic_stress"] is None
+
+
+class TestHeatmapEndpoint:
+    """Test the heatmap endpoint reading from the store."""
+
+    def setup_method(self):
+        reset_heatmap_store()
+
+    def teardown_method(self):
+        reset_heatmap_store()
+
+    def test_empty_store_returns_404(self):
+        """Test that the endpoint reports missing data before the first refresh."""
+        response = client.get("/api/visual/heatmap")
+        assert response.status_code == 404
+
+    def test_reads_snapshot_with_filters(self):
+        """Test that the endpoint serves materialized rows with filtering."""
+        store = get_heatmap_store()
+        store.update_region("us_mn", {"behavior_index": 0.5, "political_stress": 0.44})
+        store.update_region("city_tokyo", {"behavior_index": 0.2})
+
+        response = client.get("/api/visual/heatmap")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["metadata"]["states_count"] == 2
+        assert data["metadata"]["snapshot_version"] == 2
+        assert "Minnesota" in data["heatmap"]["overall_behavior"]
+
+        response = client.get(
+            "/api/visual/heatmap", params={"region_group": "US_STATES"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data["heatmap"]["overall_behavior"]) == ["Minnesota"]
+        assert math.isclose(
+            data["heatmap"]["political_stress"]["Minnesota"], 0.44, rel_tol=1e-6
+        )
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for the pooled HTTP transport and source HTTP policies."""
+from unittest.mock import Mock, patch
+
+import requests
+
+from app.services.ingestion.http_transport import (
+    HTTPTransport,
+    get_http_transport,
+    reset_http_transport,
+)
+from app.services.ingestion.source_registry import (
+    DEFAULT_HTTP_POLICY,
+    get_http_policy,
+)
+
+
+def _response(status_code):
+    response = Mock()
+    response.status_code = status_code
+    response.content = b"{}"
+    return response
+
+
+class TestHTTPPolicy:
+    """Test per-source HTTP policies from the source registry."""
+
+    def test_unknown_source_gets_default(self):
+        """Test that unregistered sources fall back to the default policy."""
+        assert get_http_policy(None) is DEFAULT_HTTP_POLICY
+        assert get_http_policy("not_a_source") is DEFAULT_HTTP_POLICY
+
+    def test_registered_overrides(self):
+        """Test that registry entries carry source-specific policies."""
+        assert get_http_policy("cyber_risk").timeout == (10.0, 60.0)
+        assert not get_http_policy("openaq_air_quality").should_retry(404)
+        assert get_http_policy("openaq_air_quality").should_retry(429)
+        assert DEFAULT_HTTP_POLICY.should_retry(500)
+
+
+class TestHTTPTransport:
+    """Test HTTPTransport pooling and retries."""
+
+    def test_one_session_per_host(self):
+        """Test that requests to the same host share a pooled session."""
+        transport = HTTPTransport()
+        first = transport.session_for("https://api.example.com/a?x=1")
+        assert transport.session_for("https://api.example.com/b") is first
+        assert transport.session_for("https://other.example.com/") is not first
+        transport.close()
+
+    def test_retries_then_succeeds(self):
+        """Test that retryable statuses back off and retry."""
+        transport = HTTPTransport()
+        responses = [_response(503), _response(200)]
+        with (
+            patch("requests.Session.get", side_effect=responses) as mock_get,
+            patch("time.sleep") as mock_sleep,
+        ):
+            response, error_type, status = transport.get_with_retries(
+                "https://api.example.com/data"
+            )
+
+        assert (error_type, status) == (None, 200)
+        assert response is responses[1]
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once_with(DEFAULT_HTTP_POLICY.initial_backoff)
+
+    def test_non_retryable_status_returns_immediately(self):
+        """Test that statuses outside retry_statuses are not retried."""
+        transport = HTTPTransport()
+        with (
+            patch("requests.Session.get", return_value=_response(404)) as mock_get,
+            patch("time.sleep"),
+        ):
+            _, error_type, status = transport.get_with_retries(
+                "https://api.openaq.org/v2/latest", source_id="openaq_air_quality"
+            )
+
+        assert (error_type, status) == ("http_error", 404)
+        assert mock_get.call_count == 1
+
+    def test_timeouts_exhaust_retries(self):
+        """Test that repeated timeouts are classified as timeout."""
+        transport = HTTPTransport()
+        with (
+            patch(
+                "requests.Session.get", side_effect=requests.exceptions.Timeout()
+            ) as mock_get,
+            patch("time.sleep"),
+        ):
+            response, error_type, status = transport.get_with_retries(
+                "https://api.example.com/slow"
+            )
+
+        assert (response, error_type, status) == (None, "timeout", None)
+        assert mock_get.call_count == DEFAULT_HTTP_POLICY.max_retries
+
+    def test_policy_timeout_is_default(self):
+        """Test that the source policy supplies the request timeout."""
+        transport = HTTPTransport()
+        with patch("requests.Session.get", return_value=_response(200)) as mock_get:
+            transport.get("https://www.cisa.gov/kev.json", source_id="cyber_risk")
+        assert mock_get.call_args.kwargs["timeout"] == (10.0, 60.0)
+
+    def test_connection_reuse_detection(self):
+        """Test that reuse is inferred from the pool's opened-connection count."""
+        transport = HTTPTransport()
+        response = _response(200)
+        response.raw._pool.num_connections = 1
+        assert transport._connection_reused("api.example.com", response) is False
+        assert transport._connection_reused("api.example.com", response) is True
+        response.raw._pool.num_connections = 2
+        assert transport._connection_reused("api.example.com", response) is False
+
+    def test_singleton_reset(self):
+        """Test that reset drops the shared transport."""
+        transport = get_http_transport()
+        assert get_http_transport() is transport
+        reset_http_transport()
+        assert get_http_transport() is not transport
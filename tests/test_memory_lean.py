@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for the memory-lean forecast pipeline pieces."""
+import tracemalloc
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.behavior_index import (
+    BehaviorIndexComputer,
+    SubIndexDetailsBundle,
+    compact_detail_frame,
+    get_detail_columns,
+)
+from app.core.memory_profile import MemoryProfiler
+from app.core.prediction import BehavioralForecaster
+from app.services.ingestion.gdelt_events import SourceStatus
+
+
+def _harmonized(periods=40):
+    rng = np.random.default_rng(3)
+    frame = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-01-01", periods=periods, freq="D"),
+            "stress_index": rng.uniform(0.3, 0.7, periods),
+            "discomfort_score": rng.uniform(0.2, 0.6, periods),
+            "mobility_index": rng.uniform(0.4, 0.8, periods),
+            "fred_unemployment": rng.uniform(0.3, 0.5, periods),
+        }
+    )
+    for i in range(30):
+        frame[f"raw_signal_{i}"] = rng.uniform(0, 1, periods)
+    return frame
+
+
+class TestInPlaceComputation:
+    """Test BehaviorIndexComputer in-place mode."""
+
+    def test_inplace_matches_copy(self):
+        """Test that in-place computation gives the same frame without copying."""
+        computer = BehaviorIndexComputer()
+        expected = computer.compute_behavior_index(_harmonized())
+
+        owned = _harmonized()
+        result = computer.compute_behavior_index(owned, inplace=True)
+
+        assert result is owned
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_default_leaves_input_untouched(self):
+        """Test that the default mode does not add columns to the input."""
+        data = _harmonized()
+        BehaviorIndexComputer().compute_behavior_index(data)
+        assert "behavior_index" not in data.columns
+
+
+class TestCompactDetailFrame:
+    """Test compact_detail_frame."""
+
+    def test_keeps_detail_columns_as_float32(self):
+        """Test that only detail columns survive, stored as float32."""
+        full = BehaviorIndexComputer().compute_behavior_index(_harmonized())
+        compact = compact_detail_frame(full)
+
+        assert not any(col.startswith("raw_signal_") for col in compact.columns)
+        assert list(compact.columns) == get_detail_columns(full.columns)
+        assert compact["economic_stress"].dtype == np.float32
+        assert compact.attrs == full.attrs
+        assert compact.memory_usage(deep=True).sum() < (
+            full.memory_usage(deep=True).sum() / 2
+        )
+
+    def test_details_match_full_frame(self):
+        """Test that component details extracted from the compact frame agree."""
+        computer = BehaviorIndexComputer()
+        full = computer.compute_behavior_index(_harmonized())
+        compact = compact_detail_frame(full)
+
+        expected = computer.get_subindex_details(full, len(full) - 1)
+        actual = computer.get_subindex_details(compact, len(compact) - 1)
+
+        assert actual.keys() == expected.keys()
+        for name, detail in expected.items():
+            assert actual[name]["value"] == pytest.approx(detail["value"], abs=1e-6)
+            assert [c["id"] for c in actual[name]["components"]] == [
+                c["id"] for c in detail["components"]
+            ]
+
+
+class TestSubIndexDetailsBundle:
+    """Test the columnar details bundle."""
+
+    def test_round_trip_preserves_details(self):
+        """Test that float64 bundles reproduce details exactly."""
+        computer = BehaviorIndexComputer()
+        full = computer.compute_behavior_index(_harmonized())
+        bundle = SubIndexDetailsBundle.from_frame(full)
+
+        assert len(bundle) == len(full)
+        assert bundle.attrs == full.attrs
+        assert computer.get_subindex_details(
+            bundle.to_frame(), 5
+        ) == computer.get_subindex_details(full, 5)
+
+    def test_row_works_with_sub_indices_dict(self):
+        """Test that a bundle row feeds get_sub_indices_dict like a frame row."""
+        computer = BehaviorIndexComputer()
+        full = computer.compute_behavior_index(_harmonized())
+        bundle = SubIndexDetailsBundle.from_frame(full)
+
+        assert computer.get_sub_indices_dict(
+            bundle.row(-1)
+        ) == computer.get_sub_indices_dict(full.iloc[-1])
+
+    def test_bundle_is_smaller_than_frame(self):
+        """Test that the bundle drops unused columns."""
+        full = BehaviorIndexComputer().compute_behavior_index(_harmonized())
+        bundle = SubIndexDetailsBundle.from_frame(full, dtype="float32")
+        assert "raw_signal_0" not in bundle.columns
+        assert bundle.nbytes < full.memory_usage(deep=True).sum() / 2
+
+
+class TestMemoryProfiler:
+    """Test the tracemalloc profiling hook."""
+
+    def test_checkpoint_attributes_allocations(self):
+        """Test that allocations land in the stage that made them."""
+        was_tracing = tracemalloc.is_tracing()
+        profiler = MemoryProfiler()
+        payload = np.ones(500_000)
+        profiler.checkpoint("allocate")
+        profiler.checkpoint("idle")
+        report = profiler.stop()
+
+        assert report["allocate"]["allocated_bytes"] >= payload.nbytes
+        assert report["idle"]["allocated_bytes"] < payload.nbytes
+        assert tracemalloc.is_tracing() == was_tracing
+
+    def test_overlapping_profilers_share_tracing(self):
+        """Test that stopping one profiler does not end another's tracing."""
+        was_tracing = tracemalloc.is_tracing()
+        first, second = MemoryProfiler(), MemoryProfiler()
+        first.stop()
+
+        assert tracemalloc.is_tracing()
+        assert second.checkpoint("stage") is not None
+        second.stop()
+        second.stop()
+        assert tracemalloc.is_tracing() == was_tracing
+
+    def test_disabled_profiler_is_noop(self):
+        """Test that a disabled profiler records nothing."""
+        profiler = MemoryProfiler(enabled=False)
+        assert profiler.checkpoint("stage") is None
+        assert profiler.stop() == {}
+
+    def test_profile_stays_out_of_cached_metadata(self):
+        """Test that only the profiled run's response carries the profile."""
+        weather = pd.DataFrame(
+            {
+                "timestamp": pd.date_range(
+                    end=pd.Timestamp.now().normalize(), periods=60, freq="D"
+                ),
+                "discomfort_score": np.linspace(0.2, 0.6, 60),
+            }
+        )
+
+        def run(tasks, scope=None):
+            report = {
+                task.key: {"outcome": "error", "error": "offline"}
+                for task in tasks
+                if task.key != "weather"
+            }
+            return {"weather": weather}, report
+
+        orchestrator = Mock()
+        orchestrator.run.side_effect = run
+        profiles = []
+        forecaster = BehavioralForecaster(
+            fetch_orchestrator=orchestrator,
+            memory_profile_hook=lambda region, profile: profiles.append(profile),
+        )
+        forecaster.mobility_fetcher.last_status = SourceStatus(
+            provider="mobility", ok=False
+        )
+
+        first = forecaster.forecast(44.9, -93.1, "Minnesota", forecast_horizon=7)
+        second = forecaster.forecast(44.9, -93.1, "Minnesota", forecast_horizon=7)
+
+        assert first["forecast"]
+        assert first["metadata"]["memory_profile"] == profiles[0]
+        assert "memory_profile" not in second["metadata"]
+        assert len(profiles) == 1
+
+
+    def test_lean_history_caches_float32_sub_indices(self):
+        """Test that lean mode narrows cached sub-index columns only."""
+        weather = pd.DataFrame(
+            {
+                "timestamp": pd.date_range(
+                    end=pd.Timestamp.now().normalize(), periods=60, freq="D"
+                ),
+                "discomfort_score": np.linspace(0.2, 0.6, 60),
+            }
+        )
+
+        def run(tasks, scope=None):
+            report = {
+                task.key: {"outcome": "error", "error": "offline"}
+                for task in tasks
+                if task.key != "weather"
+            }
+            return {"weather": weather}, report
+
+        orchestrator = Mock()
+        orchestrator.run.side_effect = run
+        forecaster = BehavioralForecaster(
+            fetch_orchestrator=orchestrator, memory_lean=True
+        )
+        forecaster.mobility_fetcher.last_status = SourceStatus(
+            provider="mobility", ok=False
+        )
+
+        result = forecaster.forecast(44.9, -93.1, "Minnesota", forecast_horizon=7)
+        (key,) = forecaster._cache.keys()
+        history = forecaster._cache.get(key)[0]
+
+        assert result["forecast"]
+        assert history["behavior_index"].dtype == np.float64
+        assert history["environmental_stress"].dtype == np.float32
+        assert isinstance(result["history"][0]["environmental_stress"], float)
+
+
+class TestApiRecords:
+    """Test BehavioralForecaster._to_api_records."""
+
+    def test_formats_timestamps_without_mutating(self):
+        """Test ISO timestamps in records while the source frame is unchanged."""
+        frame = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2025-01-01", periods=3, freq="D"),
+                "behavior_index": [0.4, 0.5, 0.6],
+            }
+        )
+        records = BehavioralForecaster._to_api_records(frame)
+
+        assert records[0] == {"timestamp": "2025-01-01T00:00:00", "behavior_index": 0.4}
+        assert pd.api.types.is_datetime64_any_dtype(frame["timestamp"])
+        assert BehavioralForecaster._to_api_records(frame.iloc[:0]) == []
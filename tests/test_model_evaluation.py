@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for rolling-origin backtesting."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.model_evaluation import (
+    RollingOriginBacktester,
+    compute_mae,
+    compute_smape,
+    compute_window_metrics,
+    generate_origins,
+)
+
+
+def _series(periods=60, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(periods)
+    values = 0.5 + 0.05 * np.sin(2 * np.pi * t / 7) + rng.normal(0, 0.01, periods)
+    index = pd.date_range("2025-01-01", periods=periods, freq="D")
+    return pd.Series(values, index=index)
+
+
+class TestRollingOriginHelpers:
+    """Test origin generation and array metrics."""
+
+    def test_generate_origins_leave_room_for_horizon(self):
+        """Test that every origin has a full horizon of actuals."""
+        origins = generate_origins(50, min_train_size=30, max_horizon=7, step=2)
+        assert origins[0] == 30
+        assert origins[-1] + 7 <= 50
+        assert np.all(np.diff(origins) == 2)
+
+    def test_generate_origins_keeps_most_recent(self):
+        """Test that max_origins keeps the latest origins."""
+        origins = generate_origins(50, 30, 7, max_origins=3)
+        assert list(origins) == [41, 42, 43]
+
+    def test_window_metrics_match_series_functions(self):
+        """Test that array metrics agree with the Series metric functions."""
+        actual = np.array([0.5, 0.6, 0.7, 0.4])
+        predicted = np.array([0.55, 0.5, 0.65, 0.45])
+        metrics = compute_window_metrics(
+            actual, predicted, predicted - 0.06, predicted + 0.06
+        )
+        assert metrics["mae"] == pytest.approx(
+            compute_mae(pd.Series(actual), pd.Series(predicted))
+        )
+        assert metrics["smape"] == pytest.approx(
+            compute_smape(pd.Series(actual), pd.Series(predicted))
+        )
+        assert metrics["interval_coverage"] == pytest.approx(75.0)
+
+
+class TestRollingOriginBacktester:
+    """Test RollingOriginBacktester runs."""
+
+    def test_in_process_rows_and_warm_start(self):
+        """Test rows per (origin, horizon) and warm starts inside chunks."""
+        backtester = RollingOriginBacktester(
+            horizons=(1, 7), min_train_size=40, max_workers=0, chunk_size=4
+        )
+        result = backtester.run({"us_mn": _series()}, ["naive", "batch_ets"])
+
+        origins = generate_origins(60, 40, 7)
+        assert result["rows_written"] == len(origins) * 2 * 2
+        assert result["tasks_failed"] == 0
+        assert result["budget_exhausted"] is False
+
+        rows = pd.DataFrame(result["rows"])
+        ets = rows[(rows["model"] == "batch_ets") & (rows["horizon"] == 7)]
+        assert ets["warm_started"].sum() == len(origins) - int(
+            np.ceil(len(origins) / 4)
+        )
+        assert {(s["model"], s["horizon"]) for s in result["summary"]} == {
+            ("batch_ets", 1),
+            ("batch_ets", 7),
+            ("naive", 1),
+            ("naive", 7),
+        }
+
+    def test_process_pool_streams_parquet(self, tmp_path):
+        """Test that pooled runs stream rows to a Parquet file."""
+        output_path = tmp_path / "backtest.parquet"
+        backtester = RollingOriginBacktester(
+            horizons=(7,), min_train_size=40, max_origins=6, max_workers=2
+        )
+        frame = pd.DataFrame(
+            {"timestamp": _series(seed=1).index, "behavior_index": _series(seed=1)}
+        )
+        result = backtester.run(
+            {"us_mn": _series(), "us_ca": frame},
+            ["naive", "seasonal_naive"],
+            output_path=str(output_path),
+        )
+
+        written = pd.read_parquet(output_path)
+        assert "rows" not in result
+        assert len(written) == result["rows_written"] == 2 * 2 * 6
+        assert set(written["region_id"]) == {"us_mn", "us_ca"}
+        assert written["mae"].notna().all()
+
+    def test_time_budget_skips_remaining_tasks(self):
+        """Test that an exhausted budget stops scheduling work."""
+        backtester = RollingOriginBacktester(
+            min_train_size=40, max_workers=0, time_budget_seconds=0.0
+        )
+        result = backtester.run({"us_mn": _series()}, ["naive"])
+        assert result["budget_exhausted"] is True
+        assert result["tasks_completed"] == 0
+        assert result["tasks_skipped"] == result["tasks_total"]
+
+    def test_unknown_model_counts_as_failure(self):
+        """Test that failing chunks are reported, not raised."""
+        backtester = RollingOriginBacktester(
+            min_train_size=50, max_workers=0, chunk_size=100
+        )
+        result = backtester.run({"us_mn": _series()}, ["missing_model"])
+        assert result["tasks_failed"] == 1
+        assert result["rows_written"] == 0
@@ -1,11 +1,13 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Tests for model registry."""
+import numpy as np
 import pandas as pd
 import pytest
 
 from app.core.model_registry import (
     ARIMAModel,
     BaseModel,
+    BatchETSModel,
     ExponentialSmoothingModel,
     ModelRegistry,
     NaiveModel,
@@ -217,3 +219,394 @@ class TestModelRegistry:
             # Verify intervals are valid
             assert all(result["lower_bound"] <= result["prediction"])
             assert all(result["upper_bound"] >= result["prediction"])
+
+
+class TestBatchETSModel:
+    """Test the batched NumPy ETS engine."""
+
+    def _weekly_series(self, n_series=4, periods=63):
+        rng = np.random.default_rng(0)
+        t = np.arange(periods)
+        pattern = 0.05 * np.sin(2 * np.pi * t / 7)
+        return (
+            0.4
+            + 0.002 * t
+            + pattern[np.newaxis, :] * rng.uniform(0.5, 1.5, (n_series, 1))
+            + rng.normal(0, 0.005, (n_series, periods))
+        )
+
+    def test_registered_as_fast_model(self):
+        """Test that the batch model is always registered."""
+        registry = ModelRegistry()
+        assert isinstance(registry.get("batch_ets"), BatchETSModel)
+
+    def test_forecast_batch_shapes(self):
+        """Test that batched output arrays are aligned per series."""
+        values = self._weekly_series()
+        result = BatchETSModel().forecast_batch(values, horizon=7)
+
+        assert result["prediction"].shape == (4, 7)
+        assert result["lower_bound"].shape == (4, 7)
+        assert result["std_error"].shape == (4,)
+        assert result["params"]["alpha"].shape == (4,)
+        assert result["seasonal_periods"] == 7
+        assert np.all(result["lower_bound"] <= result["prediction"])
+        assert np.all(result["upper_bound"] >= result["prediction"])
+
+    def test_tracks_trend_and_season(self):
+        """Test that forecasts follow the weekly pattern and trend."""
+        values = self._weekly_series(n_series=1, periods=70)
+        result = BatchETSModel().forecast_batch(values, horizon=7)
+
+        t = np.arange(70, 77)
+        expected = 0.4 + 0.002 * t
+        # Season amplitude is ~0.05; forecast should be much closer than that
+        assert np.abs(result["prediction"][0] - expected).max() < 0.1
+        assert (
+            np.corrcoef(result["prediction"][0] - expected, np.sin(2 * np.pi * t / 7))[
+                0, 1
+            ]
+            > 0.9
+        )
+        assert result["std_error"][0] < 0.05
+
+    def test_batch_matches_single_series(self):
+        """Test that series are fitted independently of their batch mates."""
+        values = self._weekly_series(n_series=3)
+        model = BatchETSModel()
+        batch = model.forecast_batch(values, horizon=5)
+        single = model.forecast_batch(values[1:2], horizon=5)
+        np.testing.assert_allclose(batch["prediction"][1], single["prediction"][0])
+
+    def test_short_and_missing_values(self):
+        """Test short series skip the season and NaNs are filled."""
+        values = np.array([[0.5, np.nan, 0.55, 0.6, 0.58], [np.nan] * 5])
+        result = BatchETSModel().forecast_batch(values, horizon=3)
+        assert result["seasonal_periods"] is None
+        assert np.all(np.isfinite(result["prediction"]))
+        np.testing.assert_allclose(result["prediction"][1], 0.5)
+
+    def test_single_series_forecast_interface(self):
+        """Test the BaseModel interface returns dated series."""
+        history = pd.Series(
+            self._weekly_series(n_series=1)[0],
+            index=pd.date_range("2025-01-01", periods=63, freq="D"),
+        )
+        result = BatchETSModel().forecast(history, horizon=7)
+        assert len(result["prediction"]) == 7
+        assert result["prediction"].index[0] == pd.Timestamp("2025-03-05")
+        assert result["metadata"]["model"] == "batch_ets"
+
+    def test_accepts_numpy_grids(self):
+        """Test that parameter grids may be given as NumPy arrays."""
+        values = self._weekly_series(n_series=2)
+        result = BatchETSModel().forecast_batch(
+            values,
+            horizon=3,
+            alpha_grid=np.array([0.2, 0.5]),
+            beta_grid=np.array([0.0, 0.1]),
+            gamma_grid=np.array([0.1]),
+        )
+        assert result["prediction"].shape == (2, 3)
+        assert np.all(np.isfinite(result["prediction"]))
+
+    def test_rejects_one_dimensional_input(self):
+        """Test that the batch API requires a 2-D array."""
+        with pytest.raises(ValueError):
+            BatchETSModel().forecast_batch(np.array([0.5, 0.6, 0.7]), horizon=3)
+
+
+class TestAutoSelect:
+    """Test ModelRegistry.auto_select."""
+
+    def _seasonal_history(self, periods=70):
+        t = np.arange(periods)
+        values = 0.5 + 0.15 * np.sin(2 * np.pi * t / 7)
+        return pd.Series(
+            values, index=pd.date_range("2025-01-01", periods=periods, freq="D")
+        )
+
+    def test_selects_seasonal_model_and_drops_losers(self):
+        """Test that a seasonal series picks a seasonal model and prunes naive."""
+        registry = ModelRegistry()
+        selection = registry.auto_select(
+            self._seasonal_history(),
+            region_id="us_mn",
+            candidates=["naive", "seasonal_naive", "batch_ets"],
+            use_process_pool=False,
+        )
+
+        assert selection["model"] in ("seasonal_naive", "batch_ets")
+        assert "naive" in selection["eliminated"]
+        assert selection["scores"]["naive"] > selection["scores"][selection["model"]]
+        assert selection["selection_seconds"] >= 0
+        assert selection["cached"] is False
+
+    def test_selection_cached_with_ttl(self):
+        """Test that repeated selections are cached until the TTL expires."""
+        registry = ModelRegistry()
+        history = self._seasonal_history()
+        kwargs = {"candidates": ["naive", "seasonal_naive"], "use_process_pool": False}
+
+        first = registry.auto_select(history, "us_mn", **kwargs)
+        second = registry.auto_select(history, "us_mn", **kwargs)
+        expired = registry.auto_select(history, "us_mn", ttl_seconds=0, **kwargs)
+
+        assert second["cached"] is True
+        assert second["model"] == first["model"]
+        assert expired["cached"] is False
+
+    def test_selection_cache_keyed_by_horizon_and_candidates(self):
+        """Test that a selection is not reused for another horizon or candidates."""
+        registry = ModelRegistry()
+        history = self._seasonal_history()
+        kwargs = {"use_process_pool": False}
+
+        registry.auto_select(
+            history, "us_mn", horizon=7, candidates=["naive"], **kwargs
+        )
+        other_horizon = registry.auto_select(
+            history, "us_mn", horizon=14, candidates=["naive"], **kwargs
+        )
+        other_candidates = registry.auto_select(
+            history, "us_mn", horizon=7, candidates=["seasonal_naive"], **kwargs
+        )
+        same = registry.auto_select(
+            history, "us_mn", horizon=7, candidates=["naive"], **kwargs
+        )
+
+        assert other_horizon["cached"] is False
+        assert other_candidates["cached"] is False
+        assert other_candidates["model"] == "seasonal_naive"
+        assert same["cached"] is True
+
+    def test_failing_candidate_is_eliminated(self):
+        """Test that a candidate raising during fit does not win."""
+
+        class BrokenModel(BaseModel):
+            def forecast(self, history, horizon, **kwargs):
+                raise RuntimeError("fit failed")
+
+        registry = ModelRegistry()
+        registry.register(BrokenModel("broken"))
+        selection = registry.auto_select(
+            self._seasonal_history(),
+            "us_ca",
+            candidates=["broken", "seasonal_naive"],
+            use_process_pool=False,
+        )
+        assert selection["model"] == "seasonal_naive"
+        assert "broken" in selection["eliminated"]
+
+    def test_short_history_keeps_default(self):
+        """Test that too-short history skips holdout fitting."""
+        registry = ModelRegistry()
+        history = self._seasonal_history(periods=10)
+        selection = registry.auto_select(
+            history, "us_tx", candidates=["naive", "seasonal_naive"]
+        )
+        assert selection["model"] == "naive"
+        assert selection["splits_evaluated"] == 0
+
+    def test_forecast_auto_scores_short_history_for_long_horizon(self):
+        """Test that a 30-day projection still scores candidates on 30 days."""
+        registry = ModelRegistry()
+        result = registry.forecast_auto(
+            self._seasonal_history(periods=30),
+            horizon=30,
+            region_id="us_wa",
+            candidates=["naive", "seasonal_naive"],
+        )
+        auto = result["metadata"]["auto_select"]
+        assert len(result["prediction"]) == 30
+        assert auto["holdout_horizon"] == 7
+        assert auto["splits_evaluated"] >= 1
+        assert set(auto["scores"]) == {"naive", "seasonal_naive"}
+
+    @pytest.mark.skipif(
+        "exponential_smoothing" not in ModelRegistry().list(),
+        reason="statsmodels not installed",
+    )
+    def test_process_pool_candidates_and_forecast_auto(self):
+        """Test statsmodels candidates in the process pool and forecast_auto."""
+        registry = ModelRegistry()
+        result = registry.forecast_auto(
+            self._seasonal_history(),
+            horizon=7,
+            region_id="us_ny",
+            candidates=["naive", "exponential_smoothing"],
+            max_workers=2,
+        )
+        assert len(result["prediction"]) == 7
+        assert "exponential_smoothing" in result["metadata"]["auto_select"]["scores"]
+
+    @pytest.mark.skipif(
+        "arima" not in ModelRegistry().list(), reason="statsmodels not installed"
+    )
+    def test_forecast_auto_passes_region_to_winner(self, monkeypatch):
+        """Test that the winning model is fitted with the region's state."""
+        registry = ModelRegistry()
+        # Keep the default order so both calls fit the same model
+        monkeypatch.setattr(
+            registry.get("arima"), "schedule_order_search", lambda *args: None
+        )
+        history = self._seasonal_history()
+
+        first = registry.forecast_auto(history, 7, "us_or", candidates=["arima"])
+        again = registry.forecast_auto(history, 7, "us_or", candidates=["arima"])
+
+        assert first["metadata"]["fit_mode"] == "full"
+        assert again["metadata"]["fit_mode"] == "cached"
+
+    def test_forecaster_auto_mode_uses_selected_model(self, monkeypatch):
+        """Test that the forecaster's auto-select mode forecasts via the registry."""
+        from app.core import model_registry
+        from app.core.prediction import BehavioralForecaster
+
+        registry = ModelRegistry()
+        monkeypatch.setattr(model_registry, "_registry", registry)
+        history = self._seasonal_history()
+
+        forecast, std_error, metadata = BehavioralForecaster._forecast_auto(
+            history, 30, "us_mn"
+        )
+        assert len(forecast) == 30
+        assert 0.01 <= std_error <= 0.5
+        assert metadata["model"] in registry.list()
+        assert metadata["holdout_horizon"] == 7
+        assert metadata["splits_evaluated"] > 0
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("selection failed")
+
+        monkeypatch.setattr(registry, "forecast_auto", fail)
+        assert BehavioralForecaster._forecast_auto(history, 30, "us_mn") is None
+
+
+@pytest.mark.skipif(
+    "arima" not in ModelRegistry().list(), reason="statsmodels not installed"
+)
+class TestARIMAState:
+    """Test ARIMA per-region state reuse and background order search."""
+
+    def _history(self, periods=60, start="2025-01-01"):
+        rng = np.random.default_rng(3)
+        values = 0.5 + np.cumsum(rng.normal(0, 0.01, periods))
+        return pd.Series(values, index=pd.date_range(start, periods=periods, freq="D"))
+
+    def test_refits_through_append_and_apply(self):
+        """Test cached, append and apply modes instead of full MLE fits."""
+        model = ARIMAModel()
+        full = self._history(70)
+        model._orders["us_mn"] = (1, 1, 1)
+
+        first = model.forecast(full.iloc[:60], 7, region_id="us_mn")
+        again = model.forecast(full.iloc[:60], 7, region_id="us_mn")
+        appended = model.forecast(full.iloc[:63], 7, region_id="us_mn")
+        rolled = model.forecast(full.iloc[5:65], 7, region_id="us_mn")
+
+        assert first["metadata"]["fit_mode"] == "full"
+        assert again["metadata"]["fit_mode"] == "cached"
+        assert appended["metadata"]["fit_mode"] == "append"
+        assert rolled["metadata"]["fit_mode"] == "apply"
+        # Parameters are carried over, not re-estimated
+        assert appended["metadata"]["params"] == first["metadata"]["params"]
+        assert len(appended["prediction"]) == 7
+
+    def test_full_refit_after_many_new_observations(self, monkeypatch):
+        """Test that a periodic full refit replaces long append chains."""
+        monkeypatch.setattr("app.core.model_registry.ARIMA_FULL_REFIT_OBSERVATIONS", 3)
+        model = ARIMAModel()
+        model._orders["us_ca"] = (1, 1, 1)
+        history = self._history(70)
+
+        model.forecast(history.iloc[:60], 7, region_id="us_ca")
+        result = model.forecast(history.iloc[:65], 7, region_id="us_ca")
+        assert result["metadata"]["fit_mode"] == "full"
+
+    def test_background_order_search(self):
+        """Test that the order search runs off the request path."""
+        model = ARIMAModel()
+        history = self._history(60)
+
+        result = model.forecast(history, 7, region_id="us_tx")
+        assert result["metadata"]["order"] == ARIMAModel.DEFAULT_ORDER
+
+        search = model.schedule_order_search("us_tx", history)
+        found = search.result(timeout=60)
+        assert found["orders_evaluated"] > 0
+        assert model.get_order("us_tx") == found["order"]
+        assert model.forecast(history, 7, region_id="us_tx")["metadata"][
+            "order"
+        ] == tuple(found["order"])
+
+    def test_forecaster_reuses_region_state(self, monkeypatch):
+        """Test that forecasts through BehavioralForecaster refit incrementally."""
+        from unittest.mock import Mock
+
+        from app.core import model_registry
+        from app.core.forecast_cache import reset_forecast_cache
+        from app.core.prediction import BehavioralForecaster
+        from app.services.ingestion.gdelt_events import SourceStatus
+
+        registry = ModelRegistry()
+        monkeypatch.setattr(model_registry, "_registry", registry)
+        select = registry.auto_select
+        monkeypatch.setattr(
+            registry,
+            "auto_select",
+            lambda history, region_id, **kwargs: select(
+                history, region_id, **{**kwargs, "candidates": ["arima"]}
+            ),
+        )
+        registry.get("arima")._orders["us_mn"] = (1, 1, 1)
+
+        rng = np.random.default_rng(5)
+        series = pd.Series(
+            0.4 + np.cumsum(rng.normal(0, 0.01, 61)),
+            index=pd.date_range(end=pd.Timestamp.now().normalize(), periods=61),
+        )
+
+        def run_for(days):
+            weather = pd.DataFrame(
+                {"timestamp": days, "discomfort_score": series[days].to_numpy()}
+            )
+
+            def run(tasks, scope=None):
+                report = {
+                    task.key: {"outcome": "error", "error": "offline"}
+                    for task in tasks
+                    if task.key != "weather"
+                }
+                return {"weather": weather}, report
+
+            return run
+
+        orchestrator = Mock()
+        forecaster = BehavioralForecaster(
+            fetch_orchestrator=orchestrator, auto_select=True
+        )
+        forecaster.mobility_fetcher.last_status = SourceStatus(
+            provider="mobility", ok=False
+        )
+        kwargs = dict(
+            latitude=44.95, longitude=-93.09, region_name="Minnesota", region_id="us_mn"
+        )
+
+        # A day later: one new observation, the window rolls forward
+        orchestrator.run.side_effect = run_for(series.index[:60])
+        first = forecaster.forecast(**kwargs)
+        reset_forecast_cache()
+        orchestrator.run.side_effect = run_for(series.index[1:])
+        second = forecaster.forecast(**kwargs)
+
+        assert first["metadata"]["auto_select"]["model"] == "arima"
+        assert first["metadata"]["auto_select"]["fit_mode"] == "full"
+        assert second["metadata"]["auto_select"]["fit_mode"] in ("append", "apply")
+
+    def test_search_respects_budget(self):
+        """Test that the bounded search stops once its budget is spent."""
+        found = ARIMAModel.search_order(
+            self._history(40).to_numpy(), max_p=2, max_q=2, budget_seconds=0.0
+        )
+        assert found["orders_evaluated"] == 1
@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for concurrent multi-region forecasting."""
+import threading
+import time
+from unittest.mock import Mock
+
+from fastapi.testclient import TestClient
+
+from app.backend.app.main import app
+from app.core import playground
+from app.core.prediction import BehavioralForecaster
+
+
+def _fake_forecast(delays, active=None, peak=None, lock=None):
+    """Build a forecast() stand-in that sleeps per region_name."""
+
+    def forecast(self, latitude, longitude, region_name, **kwargs):
+        if lock is not None:
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+        try:
+            delay = delays.get(region_name, 0.0)
+            if delay == "raise":
+                raise RuntimeError(f"boom {region_name}")
+            time.sleep(delay)
+            return {
+                "history": [{"behavior_index": 0.5}],
+                "forecast": [],
+                "sources": [],
+                "metadata": {"region_name": region_name},
+            }
+        finally:
+            if lock is not None:
+                with lock:
+                    active[0] -= 1
+
+    return forecast
+
+
+def _request(name):
+    return {"latitude": 0.0, "longitude": 0.0, "region_name": name}
+
+
+class TestForecastMany:
+    """Test BehavioralForecaster.forecast_many."""
+
+    def test_runs_regions_concurrently(self, monkeypatch):
+        """Test that total latency is close to the slowest region, not the sum."""
+        delays = {"A": 0.3, "B": 0.3, "C": 0.3}
+        monkeypatch.setattr(BehavioralForecaster, "forecast", _fake_forecast(delays))
+        forecaster = BehavioralForecaster()
+
+        start = time.monotonic()
+        batch = forecaster.forecast_many(
+            {name: _request(name) for name in delays}, max_workers=3
+        )
+        elapsed = time.monotonic() - start
+
+        assert set(batch["results"]) == {"A", "B", "C"}
+        assert batch["errors"] == {}
+        assert batch["timed_out"] == []
+        assert elapsed < 0.8
+
+    def test_bounded_parallelism(self, monkeypatch):
+        """Test that no more than max_workers forecasts run at once."""
+        delays = {name: 0.05 for name in "ABCDEF"}
+        active, peak, lock = [0], [0], threading.Lock()
+        monkeypatch.setattr(
+            BehavioralForecaster,
+            "forecast",
+            _fake_forecast(delays, active, peak, lock),
+        )
+        forecaster = BehavioralForecaster()
+
+        batch = forecaster.forecast_many(
+            {name: _request(name) for name in delays}, max_workers=2
+        )
+
+        assert len(batch["results"]) == 6
+        assert peak[0] <= 2
+
+    def test_partial_results_on_timeout_and_error(self, monkeypatch):
+        """Test that slow and failing regions do not block the others."""
+        delays = {"fast": 0.0, "slow": 2.0, "broken": "raise"}
+        monkeypatch.setattr(BehavioralForecaster, "forecast", _fake_forecast(delays))
+        forecaster = BehavioralForecaster()
+
+        start = time.monotonic()
+        batch = forecaster.forecast_many(
+            {name: _request(name) for name in delays},
+            max_workers=3,
+            timeout_seconds=0.3,
+        )
+        elapsed = time.monotonic() - start
+
+        assert list(batch["results"]) == ["fast"]
+        assert batch["timed_out"] == ["slow"]
+        assert "boom broken" in batch["errors"]["broken"]
+        assert elapsed < 1.5
+
+    def test_empty_requests(self):
+        """Test that an empty batch returns empty results."""
+        batch = BehavioralForecaster().forecast_many({})
+        assert batch["results"] == {}
+        assert batch["timed_out"] == []
+
+    def test_weather_prefetched_in_one_batch(self, monkeypatch):
+        """Test that regions' weather is requested together before forecasting."""
+        monkeypatch.setattr(BehavioralForecaster, "forecast", _fake_forecast({}))
+        forecaster = BehavioralForecaster()
+        forecaster.weather_fetcher = Mock()
+
+        forecaster.forecast_many(
+            {
+                "A": {"latitude": 1.0, "longitude": 2.0, "region_name": "A"},
+                "B": {"latitude": 3.0, "longitude": 4.0, "region_name": "B"},
+            }
+        )
+
+        forecaster.weather_fetcher.fetch_regional_comfort_batch.assert_called_once_with(
+            [(1.0, 2.0), (3.0, 4.0)], days_back=30
+        )
+
+    def test_slow_weather_prefetch_is_bounded(self, monkeypatch):
+        """Test that a hanging weather batch does not outlast the region timeout."""
+        monkeypatch.setattr(BehavioralForecaster, "forecast", _fake_forecast({}))
+        forecaster = BehavioralForecaster()
+        forecaster.weather_fetcher = Mock()
+        forecaster.weather_fetcher.fetch_regional_comfort_batch.side_effect = (
+            lambda *args, **kwargs: time.sleep(2.0)
+        )
+
+        start = time.monotonic()
+        batch = forecaster.forecast_many(
+            {
+                "A": {"latitude": 1.0, "longitude": 2.0, "region_name": "A"},
+                "B": {"latitude": 3.0, "longitude": 4.0, "region_name": "B"},
+            },
+            timeout_seconds=0.3,
+        )
+
+        assert set(batch["results"]) == {"A", "B"}
+        assert time.monotonic() - start < 1.5
+
+    def test_slow_preparation_keeps_batch_near_region_timeout(self, monkeypatch):
+        """Test that hanging GDELT planning and weather share a small budget."""
+        monkeypatch.setattr(
+            BehavioralForecaster, "forecast", _fake_forecast({"A": 0.3, "B": 0.3})
+        )
+        forecaster = BehavioralForecaster()
+        forecaster.gdelt_fetcher = Mock()
+        forecaster.gdelt_fetcher.plan_cycle.side_effect = lambda *args: time.sleep(2.0)
+        forecaster.weather_fetcher = Mock()
+        forecaster.weather_fetcher.fetch_regional_comfort_batch.side_effect = (
+            lambda *args, **kwargs: time.sleep(2.0)
+        )
+
+        start = time.monotonic()
+        batch = forecaster.forecast_many(
+            {
+                "A": {"latitude": 1.0, "longitude": 2.0, "region_name": "A"},
+                "B": {"latitude": 3.0, "longitude": 4.0, "region_name": "B"},
+            },
+            timeout_seconds=0.4,
+        )
+
+        assert set(batch["results"]) == {"A", "B"}
+        assert time.monotonic() - start < 0.8
+
+    def test_gdelt_timelines_planned_for_batch(self, monkeypatch):
+        """Test that the batch's GDELT needs are registered before forecasting."""
+        monkeypatch.setattr(BehavioralForecaster, "forecast", _fake_forecast({}))
+        forecaster = BehavioralForecaster()
+        forecaster.gdelt_fetcher = Mock()
+
+        forecaster.forecast_many(
+            {
+                "A": {"latitude": 1.0, "longitude": 2.0, "region_name": "A"},
+                "B": {"region_name": "B", "days_back": 7},
+            }
+        )
+
+        regions = forecaster.gdelt_fetcher.plan_cycle.call_args[0][0]
+        assert list(regions) == [("A", 30), ("B", 7)]
+
+
+class TestCompareRegionsConcurrency:
+    """Test compare_regions on top of forecast_many."""
+
+    def test_timed_out_region_reported_in_errors(self, monkeypatch):
+        """Test that a slow region becomes an error entry, others still return."""
+        delays = {"Minnesota": 2.0}
+        monkeypatch.setattr(BehavioralForecaster, "forecast", _fake_forecast(delays))
+
+        result = playground.compare_regions(
+            region_ids=["us_dc", "us_mn", "not_a_region"],
+            include_explanations=False,
+            region_timeout_seconds=0.3,
+        )
+
+        assert [r["region_id"] for r in result["results"]] == ["us_dc"]
+        errors = {e["region_id"]: e for e in result["errors"]}
+        assert errors["us_mn"]["timed_out"] is True
+        assert "Region not found" in errors["not_a_region"]["error"]
+
+
+class TestStateComparisonEndpoint:
+    """Test that state comparison reports upstream failures, not missing data."""
+
+    _params = {
+        "state_a_name": "Minnesota",
+        "state_a_lat": 44.95,
+        "state_a_lon": -93.09,
+        "state_b_name": "Texas",
+        "state_b_lat": 30.27,
+        "state_b_lon": -97.74,
+    }
+
+    def _get(self, monkeypatch, batch):
+        monkeypatch.setattr(
+            BehavioralForecaster, "forecast_many", lambda self, requests: batch
+        )
+        return TestClient(app).get("/api/visual/state-comparison", params=self._params)
+
+    def test_failed_region_returns_502(self, monkeypatch):
+        """Test that a region whose forecast raised yields 502 naming it only."""
+        response = self._get(
+            monkeypatch,
+            {"results": {}, "errors": {"b": "boom"}, "timed_out": []},
+        )
+
+        assert response.status_code == 502
+        assert "Texas" in response.json()["detail"]
+        assert "boom" not in response.json()["detail"]
+
+    def test_timed_out_region_returns_504(self, monkeypatch):
+        """Test that a region that timed out yields 504 naming the region."""
+        response = self._get(
+            monkeypatch,
+            {"results": {}, "errors": {}, "timed_out": ["a"]},
+        )
+
+        assert response.status_code == 504
+        assert "Minnesota" in response.json()["detail"]
@@ -0,0 +1,306 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for national feed mode (nationwide datasets indexed by state)."""
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from app.core.prediction import BehavioralForecaster
+from app.services.ingestion.eia_fuel_prices import EIAFuelPricesFetcher
+from app.services.ingestion.gdelt_events import SourceStatus
+from app.services.ingestion.national_feed import NationalFeed, get_national_feed
+from app.services.ingestion.nws_alerts import NWSAlertsFetcher
+from app.services.ingestion.openfema_emergency_management import (
+    OpenFEMAEmergencyManagementFetcher,
+)
+
+
+def _ok_status():
+    return SourceStatus(provider="test", ok=True, http_status=200)
+
+
+def _json_response(payload):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = payload
+    response.content = b"{}"
+    response.text = "{}"
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _online(monkeypatch):
+    monkeypatch.setattr(
+        "app.services.ingestion.eia_fuel_prices.is_ci_offline_mode", lambda: False
+    )
+
+
+class TestNationalFeed:
+    """Test NationalFeed caching and single-flight loads."""
+
+    def test_loads_once_per_window_within_ttl(self):
+        """Test that lookups within the TTL reuse the loaded index."""
+        feed = NationalFeed("test_source", ttl_minutes=60)
+        loader = Mock(return_value=({"MN": 1, "WI": 2}, _ok_status()))
+
+        assert feed.get(30, loader)[0]["MN"] == 1
+        assert feed.get(30, loader)[0]["WI"] == 2
+        assert loader.call_count == 1
+
+        feed.get(7, loader)
+        assert loader.call_count == 2
+
+    def test_concurrent_callers_share_one_load(self):
+        """Test that simultaneous misses wait for a single upstream load."""
+        feed = NationalFeed("test_source", ttl_minutes=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"MN": 1}, _ok_status()
+
+        threads = [
+            threading.Thread(target=feed.get, args=(30, loader)) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+
+    def test_failed_load_is_retried_after_failure_ttl(self, monkeypatch):
+        """Test that a failed load is reported until its TTL, then retried."""
+        feed = NationalFeed("test_source", ttl_minutes=60)
+        failed = SourceStatus(provider="test", ok=False, error_type="timeout")
+        loader = Mock(side_effect=[(None, failed), ({"MN": 1}, _ok_status())])
+
+        index, status = feed.get(30, loader)
+        assert index is None and status.error_type == "timeout"
+        index, status = feed.get(30, loader)
+        assert index is None and status.error_type == "timeout"
+        assert loader.call_count == 1
+
+        monkeypatch.setattr(
+            "app.services.ingestion.national_feed.NATIONAL_FEED_FAILURE_TTL_SECONDS",
+            0,
+        )
+        assert feed.get(30, loader)[0] == {"MN": 1}
+        assert loader.call_count == 2
+
+    def test_outage_costs_one_load_for_concurrent_callers(self):
+        """Test that callers queued behind a failed load do not reload."""
+        feed = NationalFeed("test_source", ttl_minutes=60)
+        failed = SourceStatus(provider="test", ok=False, error_type="timeout")
+        calls = []
+        results = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.1)
+            return None, failed
+
+        def get():
+            results.append(feed.get(30, loader))
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert all(index is None and not s.ok for index, s in results)
+
+    def test_expired_index_is_reloaded(self, monkeypatch):
+        """Test that an index past its TTL and grace is loaded again."""
+        monkeypatch.setattr(
+            "app.services.ingestion.national_feed.serve_stale", lambda *args: False
+        )
+        feed = NationalFeed("test_source", ttl_minutes=60)
+        loader = Mock(return_value=({"MN": 1}, _ok_status()))
+        feed.get(30, loader)
+        index, status, _ = feed._indexes[30]
+        feed._indexes[30] = (index, status, datetime.now() - timedelta(hours=2))
+
+        feed.get(30, loader)
+        assert loader.call_count == 2
+
+
+class TestSharedFeeds:
+    """Test that feeds are shared across fetcher instances."""
+
+    def test_one_feed_per_source(self):
+        """Test that get_national_feed returns the same feed per source."""
+        feed = get_national_feed("test_source", ttl_minutes=60)
+        assert get_national_feed("test_source", ttl_minutes=5) is feed
+        assert get_national_feed("other_source", ttl_minutes=60) is not feed
+
+    def test_separate_forecasters_share_one_upstream_call(self):
+        """Test that per-request forecasters read one nationwide download."""
+        effective = datetime.now().isoformat()
+        features = [
+            {"properties": {"effective": effective, "geocode": {"UGC": ["MNZ060"]}}},
+            {"properties": {"effective": effective, "geocode": {"UGC": ["WIZ001"]}}},
+        ]
+        with patch.object(
+            NWSAlertsFetcher,
+            "_make_request_with_retries",
+            return_value=(_json_response({"features": features}), None, 200),
+        ) as mock_request:
+            first, second = BehavioralForecaster(), BehavioralForecaster()
+            mn, _ = first.nws_alerts_fetcher.fetch_weather_alerts(
+                44.95, -93.09, days_back=7, state_code="MN"
+            )
+            wi, _ = second.nws_alerts_fetcher.fetch_weather_alerts(
+                43.07, -89.40, days_back=7, state_code="WI"
+            )
+
+        mock_request.assert_called_once()
+        assert mn["alert_count"].sum() == 1
+        assert wi["alert_count"].sum() == 1
+
+
+class TestNWSNationalMode:
+    """Test NWS alerts served from the nationwide feed."""
+
+    def test_states_read_one_nationwide_request(self):
+        """Test that alerts are indexed by the state of each affected zone."""
+        effective = datetime.now().isoformat()
+        features = [
+            {"properties": {"effective": effective, "geocode": {"UGC": ["MNZ060"]}}},
+            {
+                "properties": {
+                    "effective": effective,
+                    "geocode": {"UGC": ["MNC053", "WIZ001"]},
+                }
+            },
+        ]
+        fetcher = NWSAlertsFetcher()
+        with patch.object(
+            fetcher,
+            "_make_request_with_retries",
+            return_value=(_json_response({"features": features}), None, 200),
+        ) as mock_request:
+            mn, mn_status = fetcher.fetch_weather_alerts(
+                44.95, -93.09, days_back=7, state_code="MN"
+            )
+            wi, _ = fetcher.fetch_weather_alerts(
+                43.07, -89.40, days_back=7, state_code="wi"
+            )
+            tx, tx_status = fetcher.fetch_weather_alerts(
+                30.27, -97.74, days_back=7, state_code="TX"
+            )
+
+        mock_request.assert_called_once()
+        assert mock_request.call_args[0][0].endswith("/alerts/active")
+        assert mn["alert_count"].sum() == 2
+        assert wi["alert_count"].sum() == 1
+        assert mn_status.ok and mn_status.rows == len(mn)
+        assert tx.empty and tx_status.ok
+
+    def test_without_state_queries_point(self):
+        """Test that non-state regions still query their point."""
+        fetcher = NWSAlertsFetcher()
+        with patch.object(
+            fetcher,
+            "_make_request_with_retries",
+            return_value=(_json_response({"features": []}), None, 200),
+        ) as mock_request:
+            fetcher.fetch_weather_alerts(51.5, -0.12, days_back=7)
+
+        assert "point=51.5,-0.12" in mock_request.call_args[0][0]
+
+
+class TestOpenFEMANationalMode:
+    """Test OpenFEMA declarations served from the nationwide feed."""
+
+    def test_states_read_one_nationwide_request(self):
+        """Test that declarations are indexed by their state field."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        records = [
+            {"state": "MN", "declarationDate": today},
+            {"state": "MN", "declarationDate": today},
+            {"state": "TX", "declarationDate": today},
+        ]
+        fetcher = OpenFEMAEmergencyManagementFetcher()
+        with patch.object(
+            fetcher,
+            "_make_request_with_retries",
+            return_value=(
+                _json_response({"DisasterDeclarationsSummaries": records}),
+                None,
+                200,
+            ),
+        ) as mock_request:
+            mn, _ = fetcher.fetch_disaster_declarations("Minnesota", days_back=30)
+            tx, _ = fetcher.fetch_disaster_declarations("TX", days_back=30)
+            ca, ca_status = fetcher.fetch_disaster_declarations("CA", days_back=30)
+
+        mock_request.assert_called_once()
+        url = mock_request.call_args[0][0]
+        assert "state eq" not in url and "$top=" in url
+        assert mn["declaration_count"].sum() == 2
+        assert tx["declaration_count"].sum() == 1
+        assert ca.empty and ca_status.ok
+
+    def test_failed_nationwide_request_reports_error(self):
+        """Test that a failed nationwide request surfaces per region."""
+        fetcher = OpenFEMAEmergencyManagementFetcher()
+        with patch.object(
+            fetcher, "_make_request_with_retries", return_value=(None, "timeout", None)
+        ):
+            df, status = fetcher.fetch_disaster_declarations("MN", days_back=30)
+
+        assert df.empty
+        assert not status.ok and status.error_type == "timeout"
+
+
+class TestEIAFuelNationalMode:
+    """Test EIA fuel prices derived from one national series request."""
+
+    def test_states_share_one_request(self):
+        """Test that per-state frames come from one national price series."""
+        today = datetime.now()
+        records = [
+            {
+                "period": (today - timedelta(days=i)).strftime("%Y-%m-%d"),
+                "value": 3.0 + i * 0.01,
+            }
+            for i in range(5)
+        ]
+        fetcher = EIAFuelPricesFetcher()
+        transport = Mock()
+        transport.get.return_value = _json_response({"response": {"data": records}})
+        with patch(
+            "app.services.ingestion.eia_fuel_prices.get_http_transport",
+            return_value=transport,
+        ):
+            ca, ca_status = fetcher.fetch_fuel_stress_index("CA", days_back=30)
+            tx, _ = fetcher.fetch_fuel_stress_index("TX", days_back=30)
+            mn, _ = fetcher.fetch_fuel_stress_index("MN", days_back=30)
+
+        transport.get.assert_called_once()
+        assert ca_status.ok and len(ca) == 5
+        assert ca["fuel_price"].mean() > tx["fuel_price"].mean()
+        assert mn["fuel_stress_index"].mean() == pytest.approx(0.5)
+
+    def test_outage_costs_one_load_per_window(self):
+        """Test that a transport failure is remembered by the national feed."""
+        fetcher = EIAFuelPricesFetcher()
+        transport = Mock()
+        transport.get.side_effect = requests.exceptions.ConnectionError("down")
+        with patch(
+            "app.services.ingestion.eia_fuel_prices.get_http_transport",
+            return_value=transport,
+        ):
+            ca, ca_status = fetcher.fetch_fuel_stress_index("CA", days_back=30)
+            tx, _ = fetcher.fetch_fuel_stress_index("TX", days_back=30)
+
+        transport.get.assert_called_once()
+        assert not ca.empty and not tx.empty
+        assert ca_status.error_type == "fallback_national"
@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for online Holt-Winters state and live monitor online refreshes."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import app.core.live_monitor as live_monitor_module
+from app.core.live_monitor import LiveMonitor
+from app.core.model_registry import BatchETSModel
+from app.core.online_forecast import OnlineHoltWinters
+
+
+def _values(periods=45, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(periods)
+    return 0.5 + 0.05 * np.sin(2 * np.pi * t / 7) + rng.normal(0, 0.01, periods)
+
+
+def _history(values):
+    return [
+        {
+            "timestamp": f"2025-01-{i % 28 + 1:02d}T00:00:00",
+            "behavior_index": float(v),
+            "economic_stress": 0.4,
+        }
+        for i, v in enumerate(values)
+    ]
+
+
+class TestOnlineHoltWinters:
+    """Test OnlineHoltWinters updates and forecasts."""
+
+    def test_update_matches_batch_recursion(self):
+        """Test that one online update equals smoothing the extended series."""
+        values = _values()
+        online = OnlineHoltWinters.from_history(values[:-1])
+        online.update(values[-1])
+
+        params = np.array([[[online.alpha, online.beta, online.gamma]]])
+        batch = BatchETSModel._smooth(values[np.newaxis, :], params, 7)
+
+        assert online.level == pytest.approx(batch["level"][0, 0])
+        assert online.trend == pytest.approx(batch["trend"][0, 0])
+        np.testing.assert_allclose(online.season, batch["season"][0, 0])
+        assert online.observations == len(values)
+
+    def test_forecast_matches_batch_forecast(self):
+        """Test that the seeded state reproduces the batch point forecast."""
+        values = _values()
+        online = OnlineHoltWinters.from_history(values)
+        batch = BatchETSModel().forecast_batch(values[np.newaxis, :], 7)
+        np.testing.assert_allclose(
+            online.forecast(7)["prediction"], batch["prediction"][0]
+        )
+
+    def test_intervals_widen_with_horizon(self):
+        """Test that interval width grows with the forecast step."""
+        online = OnlineHoltWinters.from_history(_values())
+        path = online.forecast(7)
+        assert np.all(np.diff(path["std_error"]) > 0)
+        assert all(
+            lo <= p <= hi
+            for lo, p, hi in zip(
+                path["lower_bound"], path["prediction"], path["upper_bound"]
+            )
+        )
+
+    def test_nan_observation_is_ignored(self):
+        """Test that a missing observation leaves the state unchanged."""
+        online = OnlineHoltWinters.from_history(_values(periods=20))
+        level = online.level
+        assert online.update(float("nan")) == 0.0
+        assert online.level == level
+
+
+class TestLiveMonitorOnlineRefresh:
+    """Test LiveMonitor.refresh_region with online state."""
+
+    @pytest.fixture
+    def monitor(self, monkeypatch):
+        region = SimpleNamespace(
+            id="us_mn", name="Minnesota", latitude=46, longitude=-94
+        )
+        monkeypatch.setattr(
+            live_monitor_module, "get_region_by_id", lambda region_id: region
+        )
+        monitor = LiveMonitor()
+        calls = []
+        monitor.histories = [_history(_values())]
+
+        def fake_forecast(**kwargs):
+            calls.append(kwargs)
+            history = monitor.histories[min(len(calls), len(monitor.histories)) - 1]
+            return {"history": history, "sources": ["test"]}
+
+        monkeypatch.setattr(monitor._forecaster, "forecast", fake_forecast)
+        monitor.pipeline_calls = calls
+        return monitor
+
+    def test_refreshes_reuse_online_state(self, monitor):
+        """Test that only the first refresh refits the online state."""
+        first = monitor.refresh_region("us_mn")
+        model = monitor._online_states["us_mn"]["model"]
+        second = monitor.refresh_region("us_mn")
+        third = monitor.refresh_region("us_mn", observation={"behavior_index": 0.52})
+
+        assert len(monitor.pipeline_calls) == 2
+        assert monitor._online_states["us_mn"]["model"] is model
+        assert len(first.forecast["prediction"]) == 7
+        assert second.forecast == first.forecast
+        assert third.behavior_index == 0.52
+        assert third.forecast != first.forecast
+        assert model.observations == 46
+
+    def test_refresh_without_observation_absorbs_new_data(self, monitor):
+        """Test that a refresh between refits pulls and absorbs new records."""
+        values = _values(periods=46)
+        values[-1] = 0.9
+        monitor.histories.append(_history(values))
+
+        first = monitor.refresh_region("us_mn")
+        model = monitor._online_states["us_mn"]["model"]
+        second = monitor.refresh_region("us_mn")
+
+        assert monitor._online_states["us_mn"]["model"] is model
+        assert model.observations == 46
+        assert second.behavior_index == pytest.approx(0.9)
+        assert second.forecast != first.forecast
+
+    def test_pulled_records_feed_drift_detection(self, monitor):
+        """Test that pulled history runs drift detection without observations."""
+        values = list(_values())
+        monitor.refresh_region("us_mn")
+        for _ in range(live_monitor_module.LIVE_MONITOR_DRIFT_WINDOW):
+            values.append(0.95)
+            monitor.histories.append(_history(values))
+            monitor.refresh_region("us_mn")
+            if monitor._online_states["us_mn"]["drift_detected"]:
+                break
+
+        assert monitor._online_states["us_mn"]["drift_detected"] is True
+
+    def test_schedule_triggers_full_refit(self, monitor):
+        """Test that an elapsed refit interval reruns the pipeline."""
+        monitor.refresh_region("us_mn")
+        monitor._online_states["us_mn"]["refitted_at"] = datetime.now() - timedelta(
+            minutes=monitor.refit_interval_minutes
+        )
+        monitor.refresh_region("us_mn")
+        assert len(monitor.pipeline_calls) == 2
+
+    def test_drift_triggers_full_refit(self, monitor):
+        """Test that detected drift schedules a refit on the next refresh."""
+        monitor.refresh_region("us_mn")
+        for _ in range(live_monitor_module.LIVE_MONITOR_DRIFT_WINDOW):
+            monitor.refresh_region("us_mn", observation={"behavior_index": 0.95})
+            if monitor._online_states["us_mn"]["drift_detected"]:
+                break
+
+        assert monitor._online_states["us_mn"]["drift_detected"] is True
+        assert len(monitor.pipeline_calls) == 1
+        monitor.refresh_region("us_mn")
+        assert len(monitor.pipeline_calls) == 2
+        assert monitor._online_states["us_mn"]["drift_detected"] is False
+
+    def test_reset_clears_online_state(self, monitor):
+        """Test that reset drops online forecaster state."""
+        monitor.refresh_region("us_mn")
+        monitor.reset()
+        assert monitor._online_states == {}
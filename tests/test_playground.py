@@ -1,11 +1,15 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Tests for playground functionality."""
+import numpy as np
 import pytest
 
 from app.core.playground import (
     apply_scenario,
+    build_scenario_offsets,
     compare_regions,
+    recompute_behavior_index_batch,
     recompute_behavior_index_from_sub_indices,
+    sweep_scenarios,
 )
 
 
@@ -207,3 +211,92 @@ class TestCompareRegions:
         """Test that empty region list raises ValueError."""
         with pytest.raises(ValueError, match="At least one region_id"):
             compare_regions(region_ids=[])
+
+
+class TestScenarioSweep:
+    """Test the vectorized scenario sweep engine."""
+
+    BASE = {
+        "us_a": {
+            "economic_stress": 0.5,
+            "environmental_stress": 0.4,
+            "mobility_activity": 0.6,
+            "digital_attention": 0.5,
+            "public_health_stress": 0.5,
+        },
+        "us_b": {
+            "economic_stress": 0.9,
+            "environmental_stress": 0.1,
+            "mobility_activity": 0.2,
+            "digital_attention": 0.3,
+            "public_health_stress": 0.7,
+        },
+    }
+
+    def test_batch_matches_scalar_recompute(self):
+        """Test that the matrix product equals the scalar formula."""
+        for values in self.BASE.values():
+            vector = np.array(
+                [
+                    values["economic_stress"],
+                    values["environmental_stress"],
+                    values["mobility_activity"],
+                    values["digital_attention"],
+                    values["public_health_stress"],
+                ]
+            )
+            assert recompute_behavior_index_batch(vector) == pytest.approx(
+                recompute_behavior_index_from_sub_indices(values)
+            )
+
+    def test_grid_matches_single_scenarios(self):
+        """Test that every grid point equals apply_scenario + recompute."""
+        ranges = {"economic_stress": (-0.2, 0.2, 5), "digital_attention": (0, 0.3, 4)}
+        sweep = sweep_scenarios(self.BASE, ranges)
+
+        assert sweep["grid_shape"] == (5, 4)
+        assert sweep["behavior_index"].shape == (2, 20)
+        for row, region_id in enumerate(sweep["region_ids"]):
+            for col, (econ, digital) in enumerate(sweep["offsets"]):
+                scenario = {
+                    "economic_stress_offset": econ,
+                    "digital_attention_offset": digital,
+                }
+                expected = recompute_behavior_index_from_sub_indices(
+                    apply_scenario(self.BASE[region_id], scenario)
+                )
+                assert sweep["behavior_index"][row, col] == pytest.approx(expected)
+
+    def test_tier_boundaries(self):
+        """Test that boundaries point at the first tier-changing offset."""
+        sweep = sweep_scenarios(self.BASE, {"economic_stress": (-1.0, 1.0, 3)})
+        boundary = sweep["boundaries"][0]["economic_stress"]
+        # us_a baseline behavior index is 0.455 (elevated); +0.2 economic -> 0.505
+        assert sweep["baseline_tiers"][0] == 1
+        assert boundary["increase"]["to_tier"] == "high"
+        assert boundary["increase"]["offset"] == pytest.approx(0.18, abs=0.01)
+        # Even economic_stress=0.0 leaves us_a at 0.33 (still elevated)
+        assert boundary["decrease"] is None
+
+    def test_latin_hypercube_sample(self):
+        """Test that LHS places one sample per stratum on each axis."""
+        axes, offsets, grid_shape = build_scenario_offsets(
+            {"economic_stress": (0.0, 1.0), "public_health_stress": (-0.5, 0.5)},
+            method="lhs",
+            samples=10,
+            seed=7,
+        )
+        assert axes == ["economic_stress", "public_health_stress"]
+        assert grid_shape is None
+        assert offsets.shape == (10, 2)
+        strata = np.sort(np.floor(offsets[:, 0] * 10).astype(int))
+        assert strata.tolist() == list(range(10))
+
+    def test_invalid_sweep_inputs(self):
+        """Test that invalid designs raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown sub-index"):
+            build_scenario_offsets({"crime_stress": (0, 0.1, 2)})
+        with pytest.raises(ValueError, match="Unknown sweep method"):
+            build_scenario_offsets({"economic_stress": (0, 0.1, 2)}, method="x")
+        with pytest.raises(ValueError, match="maximum"):
+            build_scenario_offsets({name: (-1, 1, 101) for name in self.BASE["us_a"]})
@@ -3,6 +3,7 @@
 from fastapi.testclient import TestClient
 
 from app.backend.app.main import app
+from app.core.heatmap_store import get_heatmap_store, reset_heatmap_store
 
 client = TestClient(app)
 
@@ -133,3 +134,68 @@ class TestPlaygroundEndpoints:
             },
         )
         assert response.status_code == 422  # Validation error
+
+
+class TestPlaygroundSweepEndpoint:
+    """Test suite for the scenario sweep endpoint."""
+
+    def setup_method(self):
+        reset_heatmap_store()
+        get_heatmap_store().update_region(
+            "us_mn",
+            {
+                "behavior_index": 0.45,
+                "economic_stress": 0.5,
+                "environmental_stress": 0.4,
+                "mobility_activity": 0.6,
+                "digital_attention": 0.5,
+                "public_health_stress": 0.5,
+            },
+        )
+
+    def teardown_method(self):
+        reset_heatmap_store()
+
+    def test_sweep_grid_from_materialized_region(self):
+        """Test a grid sweep served from the heatmap snapshot."""
+        response = client.post(
+            "/api/playground/sweep",
+            json={
+                "regions": ["us_mn", "not_a_region"],
+                "offsets": {
+                    "economic_stress": {"min": -0.2, "max": 0.2, "steps": 5},
+                    "digital_attention": {"min": 0.0, "max": 0.3, "steps": 4},
+                },
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["axes"] == ["economic_stress", "digital_attention"]
+        assert data["grid_shape"] == [5, 4]
+        assert len(data["offsets"]) == 20
+        assert len(data["results"]) == 1
+        result = data["results"][0]
+        assert result["region_id"] == "us_mn"
+        assert len(result["behavior_index"]) == 20
+        assert result["baseline_tier"] == "elevated"
+        assert "economic_stress" in result["boundaries"]
+        assert data["errors"][0]["region_id"] == "not_a_region"
+
+    def test_sweep_rejects_unknown_sub_index(self):
+        """Test that unknown sub-index names are rejected."""
+        response = client.post(
+            "/api/playground/sweep",
+            json={"regions": ["us_mn"], "offsets": {"bogus": {"min": 0, "max": 1}}},
+        )
+        assert response.status_code == 400
+
+    def test_sweep_invalid_range(self):
+        """Test that out-of-range offsets fail validation."""
+        response = client.post(
+            "/api/playground/sweep",
+            json={
+                "regions": ["us_mn"],
+                "offsets": {"economic_stress": {"min": -2.0, "max": 0.1}},
+            },
+        )
+        assert response.status_code == 422
@@ -0,0 +1,173 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for the per-host token-bucket rate limiter."""
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.services.ingestion.circuit_breaker import STATE_HALF_OPEN, get_circuit_breaker
+from app.services.ingestion.http_transport import HTTPTransport
+from app.services.ingestion.rate_limiter import (
+    RateLimiter,
+    RateLimitTimeout,
+    TokenBucket,
+)
+
+GDELT_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(status_code):
+    response = Mock()
+    response.status_code = status_code
+    response.content = b"{}"
+    return response
+
+
+class TestTokenBucket:
+    """Test TokenBucket reservations."""
+
+    def test_burst_then_waits_in_arrival_order(self):
+        """Test that tokens beyond the burst are reserved at the refill rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refills_up_to_capacity(self):
+        """Test that idle time refills tokens without exceeding the burst."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=3, clock=clock)
+        for _ in range(3):
+            bucket.reserve()
+
+        clock.now = 100
+        assert bucket.available == 3
+
+    def test_max_wait_does_not_reserve(self):
+        """Test that a reservation beyond max_wait is refused and not queued."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0.2, capacity=1, clock=clock)
+        bucket.reserve()
+
+        assert bucket.reserve(max_wait=1.0) is None
+        assert bucket.reserve(max_wait=10.0) == pytest.approx(5.0)
+
+
+class TestRateLimiter:
+    """Test RateLimiter keyed by host."""
+
+    def test_unlimited_source_is_not_throttled(self):
+        """Test that hosts without a declared limit get no bucket."""
+        limiter = RateLimiter()
+        assert limiter.bucket_for("https://www.cisa.gov/x", "cyber_risk") is None
+        assert limiter.acquire("https://www.cisa.gov/x", "cyber_risk", timeout=0)
+
+    def test_bucket_shared_per_host_and_sized_from_policy(self):
+        """Test that one bucket per host is sized from the source's policy."""
+        limiter = RateLimiter()
+        bucket = limiter.bucket_for(GDELT_URL + "?query=a", "gdelt_events")
+
+        assert bucket is limiter.bucket_for(GDELT_URL + "?query=b", "gdelt_events")
+        assert (bucket.rate, bucket.capacity) == (0.2, 3)
+
+    def test_acquire_times_out_without_token(self):
+        """Test that acquire gives up when no token is due before the deadline."""
+        limiter = RateLimiter()
+        for _ in range(3):
+            assert limiter.acquire(GDELT_URL, "gdelt_events", timeout=0)
+        assert not limiter.acquire(GDELT_URL, "gdelt_events", timeout=0.1)
+
+    def test_acquire_async_waits_for_token(self):
+        """Test that the async variant sleeps until its reserved token is due."""
+        limiter = RateLimiter()
+        bucket = limiter.bucket_for("https://api.weather.gov/alerts", "weather_alerts")
+        for _ in range(int(bucket.capacity)):
+            bucket.reserve()
+
+        with patch("asyncio.sleep") as mock_sleep:
+            acquired = asyncio.run(
+                limiter.acquire_async(
+                    "https://api.weather.gov/alerts", "weather_alerts", timeout=5
+                )
+            )
+
+        assert acquired
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.2, abs=0.05)
+
+    def test_disabled_limiter_always_acquires(self):
+        """Test that RATE_LIMIT_ENABLED=false bypasses buckets."""
+        limiter = RateLimiter(enabled=False)
+        for _ in range(10):
+            assert limiter.acquire(GDELT_URL, "gdelt_events", timeout=0)
+
+
+class TestTransportRateLimiting:
+    """Test that the shared transport takes tokens before each request."""
+
+    def test_rate_limited_request_is_not_sent(self):
+        """Test that get_with_retries returns rate_limited without a request."""
+        transport = HTTPTransport()
+        with (
+            patch(
+                "app.services.ingestion.rate_limiter.RateLimiter.acquire",
+                return_value=False,
+            ),
+            patch("requests.Session.get") as mock_get,
+        ):
+            response, error_type, status = transport.get_with_retries(
+                GDELT_URL, source_id="gdelt_events"
+            )
+
+        assert (response, error_type, status) == (None, "rate_limited", None)
+        mock_get.assert_not_called()
+        assert get_circuit_breaker("gdelt_events").snapshot()["error_count"] == 0
+
+    def test_rate_limit_timeout_releases_half_open_trial(self):
+        """Test that an unsent trial request does not wedge a half-open breaker."""
+        breaker = get_circuit_breaker("gdelt_events")
+        with patch("app.services.ingestion.circuit_breaker.record_source_health"):
+            for _ in range(breaker.min_calls):
+                breaker.record_failure()
+            breaker._opened_at -= breaker.open_seconds
+
+            transport = HTTPTransport()
+            with patch(
+                "app.services.ingestion.rate_limiter.RateLimiter.acquire",
+                return_value=False,
+            ):
+                with pytest.raises(RateLimitTimeout):
+                    transport.get(GDELT_URL, source_id="gdelt_events")
+
+        assert breaker.state == STATE_HALF_OPEN
+        assert breaker.allow()
+
+    def test_each_attempt_takes_a_token(self):
+        """Test that retries are throttled like first attempts."""
+        transport = HTTPTransport()
+        with (
+            patch("requests.Session.get", side_effect=[_response(503), _response(200)]),
+            patch("time.sleep"),
+            patch(
+                "app.services.ingestion.rate_limiter.RateLimiter.acquire",
+                return_value=True,
+            ) as mock_acquire,
+        ):
+            _, error_type, _ = transport.get_with_retries(
+                GDELT_URL, source_id="gdelt_events"
+            )
+
+        assert error_type is None
+        assert mock_acquire.call_count == 2
@@ -1,15 +1,20 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Tests for scenario sensitivity and counterfactual analysis."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from app.core.behavior_index import BehaviorIndexComputer
 from app.core.scenario_sensitivity import (
+    batch_sensitivity_analysis,
     calculate_factor_elasticity,
     compose_sensitivity_analysis,
     compute_sensitivity_ranking,
+    detect_non_linear_threshold,
     generate_sensitivity_narrative,
     validate_scenario_bounds,
+    weighted_sum_index_fn,
 )
 from app.core.invariants import get_registry
 
@@ -373,3 +378,106 @@ class TestBackwardCompatibility:
         analysis = compose_sensitivity_analysis(base_index, factor_elasticities)
         assert analysis is not None
         assert "base_behavior_index" in analysis
+
+
+class TestBatchSensitivityAnalysis:
+    """Test the batched perturbation engine."""
+
+    def _base(self):
+        base = {"economic": 0.4, "environmental": 0.3, "digital": 0.6}
+        weights = {"economic": 0.5, "environmental": 0.3, "digital": 0.2}
+        return base, weights
+
+    def test_matches_per_point_elasticities(self):
+        """Test that batched elasticities equal per-point scalar calculations."""
+        base, weights = self._base()
+        perturbations = [-0.1, 0.05, 0.1]
+        index_fn = weighted_sum_index_fn([weights[f] for f in base])
+        result = batch_sensitivity_analysis(
+            base, weights, perturbations, compute_behavior_index_batch_fn=index_fn
+        )
+
+        base_vector = np.array(list(base.values()))
+        base_index = float(index_fn(base_vector[None, :])[0])
+        assert result["base_behavior_index"] == pytest.approx(base_index)
+
+        for col, factor_id in enumerate(base):
+            curve = result["factor_elasticities"][factor_id]["curve"]
+            for point, offset in zip(curve, perturbations):
+                perturbed = base_vector.copy()
+                perturbed[col] += offset
+                expected = calculate_factor_elasticity(
+                    base_index,
+                    float(index_fn(perturbed[None, :])[0]),
+                    base[factor_id],
+                    perturbed[col],
+                    weights[factor_id],
+                )
+                assert point["elasticity"] == pytest.approx(expected["elasticity"])
+
+    def test_single_evaluation_call(self):
+        """Test that all factors and points are scored in one function call."""
+        base, weights = self._base()
+        calls = []
+        index_fn = weighted_sum_index_fn([weights[f] for f in base])
+
+        def counting_fn(matrix):
+            calls.append(matrix.shape)
+            return index_fn(matrix)
+
+        result = batch_sensitivity_analysis(
+            base, weights, [0.05, 0.1], compute_behavior_index_batch_fn=counting_fn
+        )
+
+        assert calls == [(3 * 2 + 1, 3)]
+        assert result["metadata"]["evaluations"] == 7
+        assert [r["factor_id"] for r in result["sensitivity_rankings"]][0] == "economic"
+
+    def test_threshold_matches_scalar_detection(self):
+        """Test that thresholds agree with detect_non_linear_threshold."""
+        base = {"economic": 0.4, "digital": 0.5}
+        weights = {"economic": 0.5, "digital": 0.5}
+
+        def kinked_fn(matrix):
+            economic = matrix[:, 0]
+            return 0.5 * np.where(economic > 0.6, 3 * economic - 1.2, economic) + (
+                0.5 * matrix[:, 1]
+            )
+
+        perturbations = [0.1, 0.2, 0.3, 0.4]
+        result = batch_sensitivity_analysis(
+            base, weights, perturbations, compute_behavior_index_batch_fn=kinked_fn
+        )
+
+        base_index = float(kinked_fn(np.array([[0.4, 0.5]]))[0])
+        scalar = detect_non_linear_threshold(
+            "economic",
+            0.4,
+            base_index,
+            0.5,
+            [0.4 + p for p in perturbations],
+            lambda values: float(kinked_fn(np.array([[values["economic"], 0.5]]))[0]),
+        )
+
+        assert scalar is not None
+        batched = result["thresholds"]["economic"]
+        assert batched["threshold_value"] == pytest.approx(scalar["threshold_value"])
+        assert batched["threshold_elasticity"] == pytest.approx(
+            scalar["threshold_elasticity"]
+        )
+        assert "digital" not in result["thresholds"]
+        assert result["factor_elasticities"]["economic"]["is_non_linear"] is True
+
+    def test_clipped_points_have_no_elasticity(self):
+        """Test that perturbations clipped to the bound yield no input change."""
+        result = batch_sensitivity_analysis({"economic": 1.0}, {"economic": 1.0}, [0.1])
+        factor = result["factor_elasticities"]["economic"]
+        assert factor["elasticity"] == 0.0
+        assert factor["sensitivity_classification"] == "none"
+
+    def test_rejects_empty_inputs(self):
+        """Test that empty factors or perturbations raise ValueError."""
+        with pytest.raises(ValueError):
+            batch_sensitivity_analysis({}, {}, [0.1])
+        with pytest.raises(ValueError):
+            batch_sensitivity_analysis({"economic": 0.5}, {"economic": 1.0}, [])
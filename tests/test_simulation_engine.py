@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for incremental and Monte-Carlo scenario simulation."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.behavior_index import BehaviorIndexComputer
+from app.services.simulation.engine import SimulationEngine
+
+
+def _raw_history(periods: int = 60) -> pd.DataFrame:
+    """Harmonized raw inputs like the forecaster feeds the index pipeline."""
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=periods, freq="D"),
+            "stress_index": rng.uniform(0.3, 0.7, periods),
+            "discomfort_score": rng.uniform(0.2, 0.6, periods),
+            "mobility_index": rng.uniform(0.4, 0.8, periods),
+        }
+    )
+
+
+def _index_history(periods: int = 30) -> pd.DataFrame:
+    """History with computed sub-indices and behavior index."""
+    return BehaviorIndexComputer().compute_behavior_index(_raw_history(periods))
+
+
+class TestIncrementalSimulation:
+    """Test SimulationEngine.simulate_scenario on the incremental path."""
+
+    def test_no_modifiers_is_identity(self):
+        """Test that an empty scenario leaves the behavior index unchanged."""
+        df = _index_history()
+        result = SimulationEngine().simulate_scenario(df, {}, "Minnesota")
+        assert result["projected_behavior_index"] == pytest.approx(
+            df["behavior_index"].iloc[-1]
+        )
+        assert result["behavior_index_change"] == pytest.approx(0.0)
+
+    def test_sub_index_modifier_uses_weights(self):
+        """Test that a sub-index change moves the index by its weight."""
+        df = _index_history()
+        engine = SimulationEngine()
+        computer = BehaviorIndexComputer()
+        base_value = df["economic_stress"].iloc[-1]
+
+        result = engine.simulate_scenario(df, {"economic_stress": 1.2}, "Minnesota")
+
+        new_value = min(1.0, base_value * 1.2)
+        assert result["modified_values"]["economic_stress"] == pytest.approx(new_value)
+        assert result["behavior_index_change"] == pytest.approx(
+            (new_value - base_value) * computer.economic_weight
+        )
+
+    def test_mobility_modifier_is_inverted(self):
+        """Test that lower mobility raises the behavior index."""
+        df = _index_history()
+        result = SimulationEngine().simulate_scenario(
+            df, {"mobility_activity": 0.5}, "Minnesota"
+        )
+        assert result["behavior_index_change"] > 0
+
+    def test_raw_modifier_matches_full_recompute(self):
+        """Test that a raw-input scenario agrees with a full pipeline pass."""
+        raw = _raw_history(60)
+        computer = BehaviorIndexComputer()
+        base_bi = computer.compute_behavior_index(raw)["behavior_index"].iloc[-1]
+
+        modified = raw.copy()
+        modified.loc[modified.index[-1], "stress_index"] = min(
+            1.0, raw["stress_index"].iloc[-1] * 1.3
+        )
+        full_bi = computer.compute_behavior_index(modified)["behavior_index"].iloc[-1]
+
+        result = SimulationEngine().simulate_scenario(
+            raw, {"stress_index": 1.3}, "Minnesota"
+        )
+
+        assert result["base_behavior_index"] == pytest.approx(base_bi)
+        assert result["projected_behavior_index"] == pytest.approx(full_bi)
+
+    def test_baseline_is_cached(self, monkeypatch):
+        """Test that repeated scenarios reuse the baseline pipeline pass."""
+        df = _index_history()
+        engine = SimulationEngine()
+        calls = []
+        original = engine._computer.compute_sub_indices
+
+        def counting(frame):
+            calls.append(len(frame))
+            return original(frame)
+
+        monkeypatch.setattr(engine._computer, "compute_sub_indices", counting)
+        for modifier in (0.8, 1.0, 1.2):
+            engine.simulate_scenario(df, {"political_stress": modifier}, "Minnesota")
+
+        assert len(calls) == 1
+
+    def test_long_history_raw_modifier_matches_full_recompute(self, monkeypatch):
+        """Test that frames longer than any rolling window use every row."""
+        periods = 240
+        raw = _raw_history(periods)
+        rng = np.random.default_rng(11)
+        # Whole-series statistics: claims are normalized by their series max
+        # (set early) and unemployment gaps are mean-filled
+        raw["fred_jobless_claims"] = np.concatenate(
+            [rng.uniform(0.2, 0.9, 40), rng.uniform(0.2, 0.3, periods - 40)]
+        )
+        raw["fred_unemployment"] = np.where(
+            np.arange(periods) % 30 == 0, rng.uniform(0.3, 0.9, periods), np.nan
+        )
+        computer = BehaviorIndexComputer()
+        modified = raw.copy()
+        modified.loc[modified.index[-1], "fred_jobless_claims"] = min(
+            1.0, raw["fred_jobless_claims"].iloc[-1] * 1.3
+        )
+        full_bi = computer.compute_behavior_index(modified)["behavior_index"].iloc[-1]
+
+        engine = SimulationEngine()
+        calls = []
+        original = engine._computer.compute_sub_indices
+
+        def counting(frame):
+            calls.append(len(frame))
+            return original(frame)
+
+        monkeypatch.setattr(engine._computer, "compute_sub_indices", counting)
+        result = engine.simulate_scenario(
+            raw, {"fred_jobless_claims": 1.3}, "Minnesota"
+        )
+
+        assert result["projected_behavior_index"] == pytest.approx(full_bi)
+        assert calls == [periods, periods]
+
+    def test_in_place_mutation_invalidates_baseline(self):
+        """Test that the baseline cache is keyed by content, not identity."""
+        df = _index_history()
+        engine = SimulationEngine()
+        first = engine.simulate_scenario(df, {}, "Minnesota")
+
+        df.loc[df.index[-1], "economic_stress"] = 1.0
+        df.loc[df.index[-1], "behavior_index"] = 0.99
+        second = engine.simulate_scenario(df, {}, "Minnesota")
+
+        assert second["base_behavior_index"] != pytest.approx(
+            first["base_behavior_index"]
+        )
+
+
+class TestMonteCarloSimulation:
+    """Test SimulationEngine.simulate_monte_carlo."""
+
+    def test_distribution_bounds(self):
+        """Test that sampled outcomes stay within the modifier envelope."""
+        df = _index_history()
+        engine = SimulationEngine()
+        low = engine.simulate_scenario(df, {"economic_stress": 0.8}, "Minnesota")
+        high = engine.simulate_scenario(df, {"economic_stress": 1.2}, "Minnesota")
+
+        result = engine.simulate_monte_carlo(
+            df, {"economic_stress": (0.8, 1.2)}, "Minnesota", n_samples=5000, seed=1
+        )
+
+        projected = result["projected_behavior_index"]
+        assert result["n_samples"] == 5000
+        assert projected["min"] >= low["projected_behavior_index"] - 1e-9
+        assert projected["max"] <= high["projected_behavior_index"] + 1e-9
+        assert 0.3 < result["probability_increase"] < 0.7
+
+    def test_seed_reproducible_and_samples_returned(self):
+        """Test that a fixed seed reproduces samples."""
+        df = _index_history()
+        engine = SimulationEngine()
+        ranges = {"economic_stress": (0.9, 1.1), "mobility_activity": (0.5, 1.0)}
+        a = engine.simulate_monte_carlo(
+            df, ranges, "Minnesota", n_samples=100, seed=3, return_samples=True
+        )
+        b = engine.simulate_monte_carlo(
+            df, ranges, "Minnesota", n_samples=100, seed=3, return_samples=True
+        )
+        assert a["samples"]["modifiers"].shape == (100, 2)
+        np.testing.assert_array_equal(
+            a["samples"]["projected"], b["samples"]["projected"]
+        )
+
+    def test_rejects_non_sub_index_modifiers(self):
+        """Test that raw-input modifiers are rejected in Monte-Carlo mode."""
+        with pytest.raises(ValueError):
+            SimulationEngine().simulate_monte_carlo(
+                _raw_history(), {"stress_index": (0.9, 1.1)}, "Minnesota"
+            )
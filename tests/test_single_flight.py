@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for single-flight request coalescing."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pandas as pd
+import pytest
+
+from app.core.prediction import BehavioralForecaster
+from app.core.single_flight import SingleFlight, get_single_flight
+from app.services.ingestion.economic_fred import FREDEconomicFetcher
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """Test SingleFlight coalescing."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that followers receive the leader's result without rerunning."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            release.wait(5)
+            return "done"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(flight.do, "key", work, 5) for _ in range(4)]
+            _wait_for(lambda: flight.stats()["followers"] >= 3)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert sorted(is_leader for _, is_leader in results) == [
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert {value for value, _ in results} == {"done"}
+        assert flight.in_flight() == 0
+
+    def test_errors_propagate_to_followers(self):
+        """Test that the leader's exception is raised in every caller."""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def work():
+            release.wait(5)
+            raise ValueError("upstream failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(flight.do, "key", work, 5) for _ in range(2)]
+            _wait_for(lambda: flight.stats()["followers"] >= 1)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="upstream failed"):
+                    future.result()
+
+        assert flight.in_flight() == 0
+
+    def test_follower_times_out(self):
+        """Test that a follower gives up after its timeout."""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(flight.do, "key", lambda: release.wait(5))
+            _wait_for(lambda: flight.in_flight() > 0)
+            with pytest.raises(FutureTimeoutError):
+                flight.do("key", lambda: None, timeout=0.05)
+            release.set()
+            assert leader.result() == (True, True)
+
+    def test_sequential_calls_rerun(self):
+        """Test that completed flights are not memoized."""
+        flight = SingleFlight()
+        assert flight.do("key", lambda: 1) == (1, True)
+        assert flight.do("key", lambda: 2) == (2, True)
+
+
+class TestForecasterSingleFlight:
+    """Test BehavioralForecaster coalescing of identical forecasts."""
+
+    def test_identical_forecasts_run_pipeline_once(self, monkeypatch):
+        """Test that concurrent misses for one key run the pipeline once."""
+        forecaster = BehavioralForecaster()
+        release = threading.Event()
+        calls = []
+
+        def fake_generate(*args):
+            calls.append(args)
+            release.wait(5)
+            return {"history": [], "forecast": [], "sources": [], "metadata": {}}
+
+        monkeypatch.setattr(forecaster, "_generate_forecast", fake_generate)
+        kwargs = dict(latitude=46.7, longitude=-94.7, region_name="Minnesota")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(forecaster.forecast, **kwargs) for _ in range(3)]
+            _wait_for(lambda: forecaster._inflight.stats()["followers"] >= 2)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert len({id(result["metadata"]) for result in results}) == 3
+
+    def test_separate_instances_share_one_pipeline_run(self, monkeypatch):
+        """Test that per-request forecasters coalesce on the same key."""
+        release = threading.Event()
+        calls = []
+
+        def fake_generate(self, *args):
+            calls.append(args)
+            release.wait(5)
+            return {"history": [], "forecast": [], "sources": [], "metadata": {}}
+
+        monkeypatch.setattr(BehavioralForecaster, "_generate_forecast", fake_generate)
+        forecasters = [BehavioralForecaster(), BehavioralForecaster()]
+        kwargs = dict(latitude=46.7, longitude=-94.7, region_name="Minnesota")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(forecaster.forecast, **kwargs)
+                for forecaster in forecasters
+            ]
+            _wait_for(lambda: get_single_flight("forecast").stats()["followers"] >= 1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert results[0]["metadata"] is not results[1]["metadata"]
+
+
+class TestFredSingleFlight:
+    """Test FRED fetcher coalescing of identical series requests."""
+
+    def test_same_series_fetched_once(self, monkeypatch):
+        """Test that concurrent requests for one series make one API call."""
+        monkeypatch.delenv("HBC_CI_OFFLINE_DATA", raising=False)
+        fetcher = FREDEconomicFetcher(api_key="test")
+        release = threading.Event()
+        calls = []
+
+        def fake_request(series_id, days_back, cache_key):
+            calls.append(series_id)
+            release.wait(5)
+            return pd.DataFrame(
+                {"timestamp": [pd.Timestamp("2025-01-01")], "value": [1.0]}
+            )
+
+        monkeypatch.setattr(fetcher, "_request_series", fake_request)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(fetcher.fetch_series, "UNRATE") for _ in range(2)
+            ]
+            _wait_for(lambda: fetcher._inflight.stats()["followers"] >= 1)
+            release.set()
+            frames = [future.result() for future in futures]
+
+        assert calls == ["UNRATE"]
+        assert frames[0] is not frames[1]
+        pd.testing.assert_frame_equal(frames[0], frames[1])
+
+    def test_separate_fetchers_share_one_api_call(self, monkeypatch):
+        """Test that requests from different fetcher instances coalesce."""
+        monkeypatch.delenv("HBC_CI_OFFLINE_DATA", raising=False)
+        release = threading.Event()
+        calls = []
+
+        def fake_request(self, series_id, days_back, cache_key):
+            calls.append(series_id)
+            release.wait(5)
+            return pd.DataFrame(
+                {"timestamp": [pd.Timestamp("2025-01-01")], "value": [1.0]}
+            )
+
+        monkeypatch.setattr(FREDEconomicFetcher, "_request_series", fake_request)
+        fetchers = [FREDEconomicFetcher(api_key="test") for _ in range(2)]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(fetcher.fetch_series, "UNRATE") for fetcher in fetchers
+            ]
+            _wait_for(lambda: get_single_flight("fred").stats()["followers"] >= 1)
+            release.set()
+            frames = [future.result() for future in futures]
+
+        assert calls == ["UNRATE"]
+        pd.testing.assert_frame_equal(frames[0], frames[1])
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for stale-while-revalidate fetcher cache refreshes."""
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from app.services.ingestion import stale_refresh
+from app.services.ingestion.gdelt_events import GDELTEventsFetcher
+from app.services.ingestion.source_registry import (
+    DEFAULT_MAX_STALENESS_MINUTES,
+    SOURCE_REGISTRY,
+    get_max_staleness_minutes,
+)
+from app.services.ingestion.stale_refresh import StaleRefresher
+
+
+def _wait_idle(refresher, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while refresher.in_flight() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def refresher(monkeypatch):
+    instance = StaleRefresher(max_workers=2, enabled=True)
+    monkeypatch.setattr(stale_refresh, "_stale_refresher_instance", instance)
+    yield instance
+    instance.shutdown(wait=True)
+
+
+class TestStalenessRegistry:
+    """Test per-source staleness declarations."""
+
+    def test_every_source_declares_staleness(self):
+        """Test that all registered sources carry a staleness grace."""
+        for source_id, source in SOURCE_REGISTRY.items():
+            assert get_max_staleness_minutes(source_id) == (
+                source.max_staleness_minutes
+            )
+            assert source.max_staleness_minutes > 0, source_id
+
+    def test_unknown_source_gets_default(self):
+        """Test that unregistered sources use the default grace."""
+        assert get_max_staleness_minutes("not_a_source") == (
+            DEFAULT_MAX_STALENESS_MINUTES
+        )
+
+
+class TestStaleRefresher:
+    """Test StaleRefresher scheduling."""
+
+    def test_within_grace_serves_and_refreshes_once(self, refresher):
+        """Test that concurrent stale hits trigger a single refresh."""
+        release = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            release.wait(5)
+
+        for _ in range(5):
+            assert refresher.serve_stale("gdelt_events", "k", 90, 60, refresh)
+        assert refresher.in_flight() == ["gdelt_events|k"]
+        release.set()
+        _wait_idle(refresher)
+
+        assert calls == [1]
+        assert refresher.in_flight() == []
+
+    def test_past_grace_refetches_synchronously(self, refresher):
+        """Test that entries older than TTL plus grace are not served."""
+        grace = get_max_staleness_minutes("gdelt_events")
+        assert not refresher.serve_stale(
+            "gdelt_events", "k", 60 + grace + 1, 60, lambda: None
+        )
+        assert refresher.in_flight() == []
+
+    def test_disabled_never_serves_stale(self):
+        """Test that the feature flag turns stale serving off."""
+        refresher = StaleRefresher(enabled=False)
+        assert not refresher.serve_stale("gdelt_events", "k", 61, 60, lambda: None)
+
+    def test_failed_refresh_is_cleared(self, refresher):
+        """Test that a failing refresh does not block the next one."""
+
+        def refresh():
+            raise RuntimeError("upstream down")
+
+        assert refresher.serve_stale("gdelt_events", "k", 61, 60, refresh)
+        _wait_idle(refresher)
+        assert refresher.in_flight() == []
+
+
+class TestFetcherStaleWhileRevalidate:
+    """Test that fetchers serve expired entries without blocking."""
+
+    def test_expired_entry_served_while_refreshing(self, refresher):
+        """Test that an expired GDELT entry is returned and refetched behind."""
+        fetcher = GDELTEventsFetcher()
+        cached = pd.DataFrame(
+            {"timestamp": [pd.Timestamp("2025-01-01")], "event_count": [7]}
+        )
+        cache_key = "gdelt_events_30_all"
+        fetcher._cache[cache_key] = (
+            cached,
+            datetime.now() - timedelta(minutes=fetcher.cache_duration_minutes + 5),
+        )
+
+        with patch(
+            "requests.Session.get", side_effect=RuntimeError("offline")
+        ) as mock_get:
+            result = fetcher.fetch_event_count(days_back=30)
+            _wait_idle(refresher)
+
+        assert result["event_count"].tolist() == [7]
+        assert mock_get.called
@@ -1,10 +1,17 @@
 # SPDX-License-Identifier: PROPRIETARY
 """Tests for USGS Earthquake connector."""
+import time
+
+import numpy as np
 import pandas as pd
 import pytest
 import responses
 
-from app.services.ingestion.usgs_earthquakes import USGSEarthquakeFetcher
+from app.services.ingestion.usgs_earthquakes import (
+    EarthquakeCatalog,
+    USGSEarthquakeFetcher,
+    haversine_km,
+)
 
 
 class TestUSGSEarthquakeFetcher:
@@ -72,3 +79,202 @@ class TestUSGSEarthquakeFetcher:
 
         assert isinstance(df, pd.DataFrame)
         assert "timestamp" in df.columns or df.empty
+
+
+def _feature(days_ago, magnitude, latitude, longitude):
+    time_ms = (time.time() - days_ago * 86400) * 1000
+    return {
+        "type": "Feature",
+        "properties": {"time": time_ms, "mag": magnitude},
+        "geometry": {"type": "Point", "coordinates": [longitude, latitude, 10.0]},
+    }
+
+
+SUMMARY_FEED_URL = (
+    "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/2.5_month.geojson"
+)
+
+
+class TestEarthquakeCatalog:
+    """Test the array-backed global earthquake catalog."""
+
+    def test_haversine_km(self):
+        """Test vectorized great-circle distances against known values."""
+        distances = haversine_km(
+            37.77, -122.42, np.array([37.77, 34.05]), np.array([-122.42, -118.24])
+        )
+
+        assert distances[0] == pytest.approx(0.0)
+        assert distances[1] == pytest.approx(559, abs=5)  # San Francisco - LA
+
+    def test_from_geojson_skips_invalid_features(self):
+        """Test that features missing magnitude or coordinates are dropped."""
+        data = {
+            "features": [
+                _feature(1, 5.0, 35.0, 139.0),
+                {"properties": {"time": 1, "mag": None}, "geometry": None},
+                {"properties": {"time": 1, "mag": 4.0}, "geometry": {}},
+            ]
+        }
+
+        catalog = EarthquakeCatalog.from_geojson(data, 30, 2.5)
+
+        assert len(catalog) == 1
+        assert catalog.latitude[0] == 35.0 and catalog.longitude[0] == 139.0
+
+    def test_select_window_magnitude_and_radius(self):
+        """Test that masks combine window, magnitude and radius filters."""
+        catalog = EarthquakeCatalog.from_geojson(
+            {
+                "features": [
+                    _feature(2, 5.0, 35.0, 139.0),  # Tokyo
+                    _feature(20, 5.0, 35.5, 139.5),  # Tokyo, older
+                    _feature(2, 3.0, 35.0, 139.0),  # Tokyo, small
+                    _feature(2, 6.0, -33.4, -70.6),  # Santiago
+                ]
+            },
+            30,
+            2.5,
+        )
+        since_ms = (time.time() - 7 * 86400) * 1000
+
+        assert catalog.select(since_ms, 4.0).tolist() == [True, False, False, True]
+        assert catalog.select(since_ms, 4.0, 35.7, 139.7, 500).tolist() == [
+            True,
+            False,
+            False,
+            False,
+        ]
+
+
+class TestGlobalFeed:
+    """Test that every window and region is served from one feed download."""
+
+    @responses.activate
+    def test_windows_and_regions_share_one_download(self):
+        """Test one summary feed request for several windows and regions."""
+        responses.add(
+            responses.GET,
+            SUMMARY_FEED_URL,
+            json={
+                "features": [
+                    _feature(1, 6.0, 35.0, 139.0),
+                    _feature(3, 4.5, 35.2, 139.1),
+                    _feature(10, 5.0, -33.4, -70.6),
+                ]
+            },
+            status=200,
+        )
+        fetcher = USGSEarthquakeFetcher()
+
+        week = fetcher.fetch_earthquake_intensity(days_back=7)
+        month = fetcher.fetch_earthquake_intensity(days_back=30)
+        tokyo = fetcher.fetch_earthquake_intensity(
+            days_back=30, latitude=35.7, longitude=139.7
+        )
+        london = fetcher.fetch_earthquake_intensity(
+            days_back=30, latitude=51.5, longitude=-0.1
+        )
+
+        assert len(responses.calls) == 1
+        assert len(week) == 2 and len(month) == 3
+        quake_days = tokyo[tokyo["earthquake_intensity"] > 0]
+        assert len(quake_days) == 2
+        assert quake_days["earthquake_intensity"].max() == pytest.approx(1.0)
+        assert quake_days["earthquake_intensity"].min() == pytest.approx(
+            4.5**2 / 6.0**2
+        )
+        assert len(london) == len(tokyo) >= 30
+        assert (london["earthquake_intensity"] == 0.0).all()
+
+    @responses.activate
+    def test_regional_series_covers_every_day(self):
+        """Test that quiet days are zeros, not gaps for the harmonizer to fill."""
+        responses.add(
+            responses.GET,
+            SUMMARY_FEED_URL,
+            json={"features": [_feature(20, 5.0, 35.0, 139.0)]},
+            status=200,
+        )
+        df = USGSEarthquakeFetcher().fetch_earthquake_intensity(
+            days_back=30, latitude=35.7, longitude=139.7
+        )
+
+        assert df["timestamp"].diff().dropna().eq(pd.Timedelta(days=1)).all()
+        assert len(df) >= 30
+        assert (df["earthquake_intensity"] > 0).sum() == 1
+        assert df["earthquake_intensity"].iloc[-1] == 0.0
+
+    @responses.activate
+    def test_region_without_any_quakes_gets_zeros(self):
+        """Test that an empty window still yields a zero regional series."""
+        responses.add(
+            responses.GET, SUMMARY_FEED_URL, json={"features": []}, status=200
+        )
+        fetcher = USGSEarthquakeFetcher()
+
+        regional = fetcher.fetch_earthquake_intensity(
+            days_back=7, latitude=35.7, longitude=139.7
+        )
+        worldwide = fetcher.fetch_earthquake_intensity(days_back=7)
+
+        assert len(regional) >= 7
+        assert (regional["earthquake_intensity"] == 0.0).all()
+        assert worldwide.empty
+
+    @responses.activate
+    def test_long_window_queries_event_api(self):
+        """Test that windows beyond the summary feed use the event API once."""
+        responses.add(
+            responses.GET,
+            "https://earthquake.usgs.gov/fdsnws/event/1/query",
+            json={"features": [_feature(60, 5.0, 35.0, 139.0)]},
+            status=200,
+        )
+        fetcher = USGSEarthquakeFetcher()
+
+        quarter = fetcher.fetch_earthquake_intensity(days_back=90)
+        month = fetcher.fetch_earthquake_intensity(days_back=30)
+
+        assert len(responses.calls) == 1
+        assert "minmagnitude=4.0" in responses.calls[0].request.url
+        assert len(quarter) == 1 and month.empty
+
+    @responses.activate
+    def test_long_window_catalog_keyed_by_requested_magnitude(self):
+        """Test that event API catalogs serve only magnitudes they cover."""
+        responses.add(
+            responses.GET,
+            "https://earthquake.usgs.gov/fdsnws/event/1/query",
+            json={"features": [_feature(200, 5.0, 35.0, 139.0)]},
+            status=200,
+        )
+        fetcher = USGSEarthquakeFetcher()
+
+        fetcher.fetch_earthquake_intensity(days_back=365, min_magnitude=4.0)
+        fetcher.fetch_earthquake_intensity(days_back=365, min_magnitude=5.0)
+        fetcher.fetch_earthquake_intensity(days_back=90, min_magnitude=4.5)
+        assert len(responses.calls) == 1
+
+        fetcher.fetch_earthquake_intensity(days_back=365, min_magnitude=3.0)
+        assert len(responses.calls) == 2
+        assert "minmagnitude=3.0" in responses.calls[1].request.url
+
+    @responses.activate
+    def test_separate_fetchers_share_one_download(self):
+        """Test that per-request fetchers reuse one loaded catalog."""
+        responses.add(
+            responses.GET,
+            SUMMARY_FEED_URL,
+            json={"features": [_feature(1, 6.0, 35.0, 139.0)]},
+            status=200,
+        )
+
+        first = USGSEarthquakeFetcher().fetch_earthquake_intensity(days_back=7)
+        second = USGSEarthquakeFetcher().fetch_earthquake_intensity(
+            days_back=30, latitude=35.7, longitude=139.7
+        )
+
+        assert len(responses.calls) == 1
+        assert len(first) == 1
+        assert (second["earthquake_intensity"] > 0).sum() == 1
@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: PROPRIETARY
+"""Tests for the Open-Meteo weather fetcher cache and batch API."""
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from app.services.ingestion.weather import (
+    EnvironmentalImpactFetcher,
+    get_weather_cache,
+)
+
+START = int(datetime(2025, 1, 1).timestamp())
+HOURS = 48
+
+
+def _openmeteo_response(temperature):
+    """Fake Open-Meteo response with constant hourly values."""
+    variables = [
+        np.full(HOURS, temperature, dtype=float),
+        np.zeros(HOURS),
+        np.full(HOURS, 3.0),
+    ]
+    hourly = Mock()
+    hourly.Variables.side_effect = lambda i: Mock(
+        ValuesAsNumpy=Mock(return_value=variables[i])
+    )
+    hourly.Time.return_value = START
+    hourly.TimeEnd.return_value = START + HOURS * 3600
+    hourly.Interval.return_value = 3600
+    response = Mock()
+    response.Hourly.return_value = hourly
+    return response
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    monkeypatch.delenv("CI_OFFLINE_MODE", raising=False)
+    monkeypatch.setattr(
+        "app.services.ingestion.weather.is_ci_offline_mode", lambda: False
+    )
+    fetcher = EnvironmentalImpactFetcher()
+    fetcher.openmeteo = Mock()
+    return fetcher
+
+
+class TestRegionKeyedCache:
+    """Test that cache entries are kept per region."""
+
+    def test_alternating_regions_hit_cache(self, fetcher):
+        """Test that switching between two regions does not evict either."""
+        fetcher.openmeteo.weather_api.side_effect = [
+            [_openmeteo_response(10.0)],
+            [_openmeteo_response(30.0)],
+        ]
+
+        first = fetcher.fetch_regional_comfort(44.95, -93.09, days_back=2)
+        second = fetcher.fetch_regional_comfort(34.05, -118.24, days_back=2)
+        again = fetcher.fetch_regional_comfort(44.95, -93.09, days_back=2)
+
+        assert fetcher.openmeteo.weather_api.call_count == 2
+        assert again.equals(first)
+        assert second["temperature"].iloc[0] == 30.0
+
+    def test_expired_entry_is_refetched(self, fetcher, monkeypatch):
+        """Test that entries past TTL and staleness grace are refetched."""
+        monkeypatch.setattr(
+            "app.services.ingestion.weather.serve_stale", lambda *args: False
+        )
+        fetcher.openmeteo.weather_api.return_value = [_openmeteo_response(10.0)]
+        fetcher.fetch_regional_comfort(44.95, -93.09, days_back=2)
+        key = "44.9500,-93.0900,2"
+        df, _ = fetcher._cache[key]
+        fetcher._cache[key] = (df, datetime.now() - timedelta(hours=2))
+
+        fetcher.fetch_regional_comfort(44.95, -93.09, days_back=2)
+        assert fetcher.openmeteo.weather_api.call_count == 2
+
+    def test_new_fetcher_hits_shared_cache(self, fetcher):
+        """Test that per-request fetchers reuse each other's entries."""
+        fetcher.openmeteo.weather_api.return_value = [_openmeteo_response(10.0)]
+        fetcher.fetch_regional_comfort(44.95, -93.09, days_back=2)
+
+        other = EnvironmentalImpactFetcher()
+        other.openmeteo = Mock()
+        df = other.fetch_regional_comfort(44.95, -93.09, days_back=2)
+
+        other.openmeteo.weather_api.assert_not_called()
+        assert df["temperature"].iloc[0] == 10.0
+
+    def test_entries_expire_after_staleness_grace(self, fetcher, monkeypatch):
+        """Test that entries are evicted once they can no longer be served."""
+        monkeypatch.setattr(
+            "app.services.ingestion.weather.get_max_staleness_minutes",
+            lambda source_id: 0,
+        )
+        fetcher.cache_duration_minutes = 0
+        fetcher.openmeteo.weather_api.return_value = [_openmeteo_response(10.0)]
+        fetcher.fetch_regional_comfort(44.95, -93.09, days_back=2)
+
+        assert get_weather_cache().get("44.9500,-93.0900,2") is None
+
+
+class TestBatchFetch:
+    """Test fetch_regional_comfort_batch."""
+
+    def test_one_request_split_per_location(self, fetcher):
+        """Test that locations share one request and results keep input order."""
+        fetcher.openmeteo.weather_api.return_value = [
+            _openmeteo_response(10.0),
+            _openmeteo_response(30.0),
+        ]
+
+        frames = fetcher.fetch_regional_comfort_batch(
+            [(44.95, -93.09), (34.05, -118.24)], days_back=2
+        )
+
+        fetcher.openmeteo.weather_api.assert_called_once()
+        params = fetcher.openmeteo.weather_api.call_args.kwargs["params"]
+        assert params["latitude"] == [44.95, 34.05]
+        assert params["longitude"] == [-93.09, -118.24]
+        assert [df["temperature"].iloc[0] for df in frames] == [10.0, 30.0]
+
+    def test_batch_warms_per_region_cache(self, fetcher):
+        """Test that later single-region calls are served from the batch."""
+        fetcher.openmeteo.weather_api.return_value = [
+            _openmeteo_response(10.0),
+            _openmeteo_response(30.0),
+        ]
+        fetcher.fetch_regional_comfort_batch(
+            [(44.95, -93.09), (34.05, -118.24)], days_back=2
+        )
+
+        df = fetcher.fetch_regional_comfort(34.05, -118.24, days_back=2)
+        assert fetcher.openmeteo.weather_api.call_count == 1
+        assert df["temperature"].iloc[0] == 30.0
+
+    def test_only_uncached_locations_requested_in_chunks(self, fetcher, monkeypatch):
+        """Test that cached and duplicate locations are not re-requested."""
+        monkeypatch.setattr(
+            "app.services.ingestion.weather.WEATHER_BATCH_MAX_LOCATIONS", 1
+        )
+        fetcher.openmeteo.weather_api.side_effect = [
+            [_openmeteo_response(10.0)],
+            [_openmeteo_response(20.0)],
+            [_openmeteo_response(30.0)],
+        ]
+        fetcher.fetch_regional_comfort(44.95, -93.09, days_back=2)
+
+        frames = fetcher.fetch_regional_comfort_batch(
+            [(44.95, -93.09), (40.71, -74.01), (40.71, -74.01), (34.05, -118.24)],
+            days_back=2,
+        )
+
+        assert fetcher.openmeteo.weather_api.call_count == 3
+        assert [df["temperature"].iloc[0] for df in frames] == [10.0, 20.0, 20.0, 30.0]
+
+    def test_failed_request_returns_empty_frames(self, fetcher):
+        """Test that an API error yields empty frames and caches nothing."""
+        fetcher.openmeteo.weather_api.side_effect = RuntimeError("unavailable")
+
+        frames = fetcher.fetch_regional_comfort_batch(
+            [(44.95, -93.09), (34.05, -118.24)], days_back=2
+        )
+
+        assert len(frames) == 2
+        assert all(df.empty for df in frames)
+        assert "discomfort_score" in frames[0].columns
+        assert len(fetcher._cache) == 0